@@ -16,6 +16,9 @@ Usage:
     # Output to specific file
     python auto-claude/analyzer.py --index --output path/to/output.json
 
+    # Refresh an existing index, re-analyzing only changed services
+    python auto-claude/analyzer.py --index --incremental --output path/to/output.json
+
 The analyzer will:
 1. Detect if this is a monorepo or single project
 2. Find all services/packages and analyze each separately
@@ -77,6 +80,17 @@ def main():
         default=None,
         help="Output file for JSON results",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-analyze services that changed since the existing --output index",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of services to analyze concurrently (default: 1)",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -89,7 +103,9 @@ def main():
     if args.service:
         results = analyze_service(args.project_dir, args.service, args.output)
     else:
-        results = analyze_project(args.project_dir, args.output)
+        results = analyze_project(
+            args.project_dir, args.output, args.incremental, args.workers
+        )
 
     # Print results
     if not args.quiet or not args.output:
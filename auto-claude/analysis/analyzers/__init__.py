@@ -26,20 +26,36 @@ __all__ = [
 ]
 
 
-def analyze_project(project_dir: Path, output_file: Path | None = None) -> dict:
+def analyze_project(
+    project_dir: Path,
+    output_file: Path | None = None,
+    incremental: bool = False,
+    max_workers: int = 1,
+) -> dict:
     """
     Analyze a project and optionally save results.
 
     Args:
         project_dir: Path to the project root
         output_file: Optional path to save JSON output
+        incremental: Reuse the analysis of unchanged services from the
+            existing output_file, re-analyzing only services that changed
+        max_workers: Services analyzed concurrently (1 = sequential)
 
     Returns:
         Project index as a dictionary
     """
     import json
 
-    analyzer = ProjectAnalyzer(project_dir)
+    previous_index = None
+    if incremental and output_file and output_file.exists():
+        try:
+            with open(output_file) as f:
+                previous_index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            previous_index = None
+
+    analyzer = ProjectAnalyzer(project_dir, previous_index, max_workers)
     results = analyzer.analyze()
 
     if output_file:
@@ -5,9 +5,12 @@ Base Analyzer Module
 Provides common constants, utilities, and base functionality shared across all analyzers.
 """
 
-import json
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
+from .file_cache import AnalysisFileCache
+
 # Directories to skip during analysis
 SKIP_DIRS = {
     "node_modules",
@@ -87,8 +90,21 @@ SERVICE_ROOT_FILES = {
 class BaseAnalyzer:
     """Base class with common utilities for all analyzers."""
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
         self.path = path.resolve()
+        # Shared file listing; pass the same inventory to every analyzer in a run
+        self.inventory = inventory or FileInventory(self.path)
+        # Shared file contents and parse results; likewise one per run
+        self.file_cache = file_cache or AnalysisFileCache()
+
+    def _glob(self, pattern: str, base: Path | None = None) -> list[Path]:
+        """Glob files relative to base (default: the analyzer's path) via the inventory."""
+        return self.inventory.glob(pattern, base or self.path)
 
     def _exists(self, path: str) -> bool:
         """Check if a file exists relative to the analyzer's path."""
@@ -96,20 +112,27 @@ class BaseAnalyzer:
 
     def _read_file(self, path: str) -> str:
         """Read a file relative to the analyzer's path."""
-        try:
-            return (self.path / path).read_text()
-        except (OSError, UnicodeDecodeError):
-            return ""
+        return self.file_cache.read_text(self.path / path) or ""
 
     def _read_json(self, path: str) -> dict | None:
         """Read and parse a JSON file relative to the analyzer's path."""
-        content = self._read_file(path)
-        if content:
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return None
-        return None
+        return self.file_cache.read_json(self.path / path)
+
+    def _read_source(self, file_path: Path) -> str:
+        """
+        Read a source file through the shared cache.
+
+        Raises:
+            OSError: If the file cannot be read or decoded (like read_text())
+        """
+        content = self.file_cache.read_text(file_path)
+        if content is None:
+            raise OSError(f"Cannot read {file_path}")
+        return content
+
+    def _findall(self, path: str, pattern: str, flags: int = 0) -> list:
+        """Cached re.findall over a file relative to the analyzer's path."""
+        return self.file_cache.findall(self.path / path, pattern, flags)
 
     def _infer_env_var_type(self, value: str) -> str:
         """Infer the type of an environment variable from its value."""
@@ -11,14 +11,23 @@ Detects API documentation tools and configurations:
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from ..base import BaseAnalyzer
+from ..file_cache import AnalysisFileCache
 
 
 class ApiDocsDetector(BaseAnalyzer):
     """Detects API documentation setup."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect(self) -> None:
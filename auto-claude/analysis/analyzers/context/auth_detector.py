@@ -15,7 +15,10 @@ import re
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from ..base import BaseAnalyzer
+from ..file_cache import AnalysisFileCache
 
 
 class AuthDetector(BaseAnalyzer):
@@ -34,8 +37,14 @@ class AuthDetector(BaseAnalyzer):
         "src/models/user.ts",
     ]
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -76,8 +85,9 @@ class AuthDetector(BaseAnalyzer):
         all_deps = set()
 
         if self._exists("requirements.txt"):
-            content = self._read_file("requirements.txt")
-            all_deps.update(re.findall(r"^([a-zA-Z0-9_-]+)", content, re.MULTILINE))
+            all_deps.update(
+                self._findall("requirements.txt", r"^([a-zA-Z0-9_-]+)", re.MULTILINE)
+            )
 
         pkg = self._read_json("package.json")
         if pkg:
@@ -119,12 +129,12 @@ class AuthDetector(BaseAnalyzer):
     def _find_auth_middleware(self) -> list[str]:
         """Detect auth middleware and decorators from Python files."""
         # Limit to first 20 files for performance
-        all_py_files = list(self.path.glob("**/*.py"))[:20]
+        all_py_files = list(self._glob("**/*.py"))[:20]
         auth_decorators = set()
 
         for py_file in all_py_files:
             try:
-                content = py_file.read_text()
+                content = self._read_source(py_file)
                 # Find custom decorators
                 if (
                     "@require" in content
@@ -13,14 +13,23 @@ import re
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from ..base import BaseAnalyzer
+from ..file_cache import AnalysisFileCache
 
 
 class EnvironmentDetector(BaseAnalyzer):
     """Detects environment variables and their configurations."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect(self) -> None:
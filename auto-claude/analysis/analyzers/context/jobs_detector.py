@@ -13,14 +13,23 @@ import re
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from ..base import BaseAnalyzer
+from ..file_cache import AnalysisFileCache
 
 
 class JobsDetector(BaseAnalyzer):
     """Detects background job and task queue systems."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -41,8 +50,8 @@ class JobsDetector(BaseAnalyzer):
 
     def _detect_celery(self) -> dict[str, Any] | None:
         """Detect Celery (Python) task queue."""
-        celery_files = list(self.path.glob("**/celery.py")) + list(
-            self.path.glob("**/tasks.py")
+        celery_files = list(self._glob("**/celery.py")) + list(
+            self._glob("**/tasks.py")
         )
         if not celery_files:
             return None
@@ -50,7 +59,7 @@ class JobsDetector(BaseAnalyzer):
         tasks = []
         for task_file in celery_files:
             try:
-                content = task_file.read_text()
+                content = self._read_source(task_file)
                 # Find @celery.task or @shared_task decorators
                 task_pattern = r"@(?:celery\.task|shared_task|app\.task)\s*(?:\([^)]*\))?\s*def\s+(\w+)"
                 task_matches = re.findall(task_pattern, content)
@@ -13,14 +13,23 @@ Detects database migration tools and configurations:
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from ..base import BaseAnalyzer
+from ..file_cache import AnalysisFileCache
 
 
 class MigrationsDetector(BaseAnalyzer):
     """Detects database migration setup and tools."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -66,7 +75,7 @@ class MigrationsDetector(BaseAnalyzer):
         if not self._exists("manage.py"):
             return None
 
-        migration_dirs = list(self.path.glob("**/migrations"))
+        migration_dirs = list(self._glob("**/migrations"))
         if not migration_dirs:
             return None
 
@@ -12,14 +12,23 @@ Detects monitoring and observability setup:
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from ..base import BaseAnalyzer
+from ..file_cache import AnalysisFileCache
 
 
 class MonitoringDetector(BaseAnalyzer):
     """Detects monitoring and observability setup."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -65,9 +74,7 @@ class MonitoringDetector(BaseAnalyzer):
     def _detect_prometheus(self) -> dict[str, str] | None:
         """Detect Prometheus metrics endpoint."""
         # Look for actual Prometheus imports/usage, not just keywords
-        all_files = (
-            list(self.path.glob("**/*.py"))[:30] + list(self.path.glob("**/*.js"))[:30]
-        )
+        all_files = list(self._glob("**/*.py"))[:30] + list(self._glob("**/*.js"))[:30]
 
         for file_path in all_files:
             # Skip analyzer files to avoid self-detection
@@ -75,7 +82,7 @@ class MonitoringDetector(BaseAnalyzer):
                 continue
 
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
                 # Look for actual Prometheus imports or usage patterns
                 prometheus_patterns = [
                     "from prometheus_client import",
@@ -17,7 +17,10 @@ import re
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from ..base import BaseAnalyzer
+from ..file_cache import AnalysisFileCache
 
 
 class ServicesDetector(BaseAnalyzer):
@@ -95,8 +98,14 @@ class ServicesDetector(BaseAnalyzer):
         "pino": "logging",
     }
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -141,8 +150,9 @@ class ServicesDetector(BaseAnalyzer):
 
         # Python dependencies
         if self._exists("requirements.txt"):
-            content = self._read_file("requirements.txt")
-            all_deps.update(re.findall(r"^([a-zA-Z0-9_-]+)", content, re.MULTILINE))
+            all_deps.update(
+                self._findall("requirements.txt", r"^([a-zA-Z0-9_-]+)", re.MULTILINE)
+            )
 
         # Node.js dependencies
         pkg = self._read_json("package.json")
@@ -17,6 +17,8 @@ This module delegates to specialized detectors for clean separation of concerns.
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from .base import BaseAnalyzer
 from .context import (
     ApiDocsDetector,
@@ -27,13 +29,20 @@ from .context import (
     MonitoringDetector,
     ServicesDetector,
 )
+from .file_cache import AnalysisFileCache
 
 
 class ContextAnalyzer(BaseAnalyzer):
     """Orchestrates project context and configuration analysis."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect_environment_variables(self) -> None:
@@ -42,7 +51,9 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to EnvironmentDetector for actual detection logic.
         """
-        detector = EnvironmentDetector(self.path, self.analysis)
+        detector = EnvironmentDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         detector.detect()
 
     def detect_external_services(self) -> None:
@@ -51,7 +62,9 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to ServicesDetector for actual detection logic.
         """
-        detector = ServicesDetector(self.path, self.analysis)
+        detector = ServicesDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         detector.detect()
 
     def detect_auth_patterns(self) -> None:
@@ -60,7 +73,9 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to AuthDetector for actual detection logic.
         """
-        detector = AuthDetector(self.path, self.analysis)
+        detector = AuthDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         detector.detect()
 
     def detect_migrations(self) -> None:
@@ -69,7 +84,9 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to MigrationsDetector for actual detection logic.
         """
-        detector = MigrationsDetector(self.path, self.analysis)
+        detector = MigrationsDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         detector.detect()
 
     def detect_background_jobs(self) -> None:
@@ -78,7 +95,9 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to JobsDetector for actual detection logic.
         """
-        detector = JobsDetector(self.path, self.analysis)
+        detector = JobsDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         detector.detect()
 
     def detect_api_documentation(self) -> None:
@@ -87,7 +106,9 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to ApiDocsDetector for actual detection logic.
         """
-        detector = ApiDocsDetector(self.path, self.analysis)
+        detector = ApiDocsDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         detector.detect()
 
     def detect_monitoring(self) -> None:
@@ -96,5 +117,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to MonitoringDetector for actual detection logic.
         """
-        detector = MonitoringDetector(self.path, self.analysis)
+        detector = MonitoringDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         detector.detect()
@@ -10,14 +10,22 @@ Detects database models and schemas across different ORMs:
 import re
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
 from .base import BaseAnalyzer
+from .file_cache import AnalysisFileCache
 
 
 class DatabaseDetector(BaseAnalyzer):
     """Detects database models across multiple ORMs."""
 
-    def __init__(self, path: Path):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
 
     def detect_all_models(self) -> dict:
         """Detect all database models across different ORMs."""
@@ -46,11 +54,11 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_sqlalchemy_models(self) -> dict:
         """Detect SQLAlchemy models."""
         models = {}
-        py_files = list(self.path.glob("**/*.py"))
+        py_files = list(self._glob("**/*.py"))
 
         for file_path in py_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -111,13 +119,13 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_django_models(self) -> dict:
         """Detect Django models."""
         models = {}
-        model_files = list(self.path.glob("**/models.py")) + list(
-            self.path.glob("**/models/*.py")
+        model_files = list(self._glob("**/models.py")) + list(
+            self._glob("**/models/*.py")
         )
 
         for file_path in model_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -166,7 +174,7 @@ class DatabaseDetector(BaseAnalyzer):
             return models
 
         try:
-            content = schema_file.read_text()
+            content = self._read_source(schema_file)
         except (OSError, UnicodeDecodeError):
             return models
 
@@ -208,13 +216,13 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_typeorm_models(self) -> dict:
         """Detect TypeORM entities."""
         models = {}
-        ts_files = list(self.path.glob("**/*.entity.ts")) + list(
-            self.path.glob("**/entities/*.ts")
+        ts_files = list(self._glob("**/*.entity.ts")) + list(
+            self._glob("**/entities/*.ts")
         )
 
         for file_path in ts_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -257,13 +265,13 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_drizzle_models(self) -> dict:
         """Detect Drizzle ORM schemas."""
         models = {}
-        schema_files = list(self.path.glob("**/schema.ts")) + list(
-            self.path.glob("**/db/schema.ts")
+        schema_files = list(self._glob("**/schema.ts")) + list(
+            self._glob("**/db/schema.ts")
         )
 
         for file_path in schema_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -287,13 +295,13 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_mongoose_models(self) -> dict:
         """Detect Mongoose models."""
         models = {}
-        model_files = list(self.path.glob("**/models/*.js")) + list(
-            self.path.glob("**/models/*.ts")
+        model_files = list(self._glob("**/models/*.js")) + list(
+            self._glob("**/models/*.ts")
         )
 
         for file_path in model_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
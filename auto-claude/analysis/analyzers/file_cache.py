@@ -0,0 +1,127 @@
+"""
+Analysis File Cache
+===================
+
+Per-run cache of file contents and parse results shared by all analyzers.
+
+Framework, port, route, database and context detectors all look at the same
+handful of files (package.json, requirements.txt, pyproject.toml, entry
+points, docker-compose.yml). Passing one AnalysisFileCache through every
+analyzer in a run means each file is read from disk once, each JSON file is
+parsed once, and repeated regex scans of a file are computed once.
+
+Cached values are shared: treat returned dicts and lists as read-only.
+Hit/miss counters and per-path disk read counts are kept for verification.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+class AnalysisFileCache:
+    """Thread-safe cache of file text, parsed JSON and regex results."""
+
+    def __init__(self):
+        self._values: dict[tuple, Any] = {}
+        self._key_locks: dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Actual disk reads per path; every count should be 1
+        self.disk_reads: Counter[str] = Counter()
+
+    def read_text(self, path: Path) -> str | None:
+        """
+        Read a text file.
+
+        Args:
+            path: File to read
+
+        Returns:
+            File content, or None if it cannot be read or decoded
+        """
+        return self._get(("text", self._key(path)), lambda: self._load_text(path))
+
+    def read_json(self, path: Path) -> Any | None:
+        """Parse a JSON file (None if unreadable or invalid)."""
+
+        def load():
+            content = self.read_text(path)
+            if not content:
+                return None
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                return None
+
+        return self._get(("json", self._key(path)), load)
+
+    def findall(self, path: Path, pattern: str, flags: int = 0) -> list:
+        """
+        re.findall over a file's content (empty list if unreadable).
+
+        Args:
+            path: File to scan
+            pattern: Regular expression
+            flags: re flags
+
+        Returns:
+            Result of re.findall(pattern, content, flags)
+        """
+
+        def load():
+            content = self.read_text(path)
+            return re.findall(pattern, content, flags) if content else []
+
+        return self._get(("findall", self._key(path), pattern, flags), load)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and the paths read from disk more than once."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "files_read": len(self.disk_reads),
+                "reread": {p: n for p, n in self.disk_reads.items() if n > 1},
+            }
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(Path(path).resolve())
+
+    def _load_text(self, path: Path) -> str | None:
+        with self._lock:
+            self.disk_reads[self._key(path)] += 1
+        try:
+            return Path(path).read_text()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _get(self, key: tuple, load: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing it once if missing."""
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Per-key lock: concurrent analyzers wait for one load instead of
+        # repeating it, without serializing unrelated files
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+            value = load()
+            with self._lock:
+                self._values[key] = value
+                self.misses += 1
+                self._key_locks.pop(key, None)
+            return value
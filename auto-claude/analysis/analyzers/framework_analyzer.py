@@ -9,14 +9,23 @@ Supports Python, Node.js/TypeScript, Go, Rust, and Ruby frameworks.
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from .base import BaseAnalyzer
+from .file_cache import AnalysisFileCache
 
 
 class FrameworkAnalyzer(BaseAnalyzer):
     """Analyzes and detects programming languages and frameworks."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect_language_and_framework(self) -> None:
@@ -100,7 +109,9 @@ class FrameworkAnalyzer(BaseAnalyzer):
                 self.analysis["framework"] = info["name"]
                 self.analysis["type"] = info["type"]
                 # Try to detect actual port, fall back to default
-                port_detector = PortDetector(self.path, self.analysis)
+                port_detector = PortDetector(
+                    self.path, self.analysis, self.inventory, self.file_cache
+                )
                 detected_port = port_detector.detect_port_from_sources(info["port"])
                 self.analysis["default_port"] = detected_port
                 break
@@ -154,7 +165,9 @@ class FrameworkAnalyzer(BaseAnalyzer):
             "@nestjs/core": {"name": "NestJS", "type": "backend", "port": 3000},
         }
 
-        port_detector = PortDetector(self.path, self.analysis)
+        port_detector = PortDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
 
         # Check frontend first (Next.js includes React, etc.)
         for key, info in frontend_frameworks.items():
@@ -244,7 +257,9 @@ class FrameworkAnalyzer(BaseAnalyzer):
             if key in content:
                 self.analysis["framework"] = info["name"]
                 self.analysis["type"] = "backend"
-                port_detector = PortDetector(self.path, self.analysis)
+                port_detector = PortDetector(
+                    self.path, self.analysis, self.inventory, self.file_cache
+                )
                 detected_port = port_detector.detect_port_from_sources(info["port"])
                 self.analysis["default_port"] = detected_port
                 break
@@ -263,7 +278,9 @@ class FrameworkAnalyzer(BaseAnalyzer):
             if key in content:
                 self.analysis["framework"] = info["name"]
                 self.analysis["type"] = "backend"
-                port_detector = PortDetector(self.path, self.analysis)
+                port_detector = PortDetector(
+                    self.path, self.analysis, self.inventory, self.file_cache
+                )
                 detected_port = port_detector.detect_port_from_sources(info["port"])
                 self.analysis["default_port"] = detected_port
                 break
@@ -272,7 +289,9 @@ class FrameworkAnalyzer(BaseAnalyzer):
         """Detect Ruby framework."""
         from .port_detector import PortDetector
 
-        port_detector = PortDetector(self.path, self.analysis)
+        port_detector = PortDetector(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
 
         if "rails" in content.lower():
             self.analysis["framework"] = "Ruby on Rails"
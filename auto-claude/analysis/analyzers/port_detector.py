@@ -10,14 +10,23 @@ import re
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from .base import BaseAnalyzer
+from .file_cache import AnalysisFileCache
 
 
 class PortDetector(BaseAnalyzer):
     """Detects application ports from various configuration sources."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
         self.analysis = analysis
 
     def detect_port_from_sources(self, default_port: int) -> int:
@@ -131,7 +140,7 @@ class PortDetector(BaseAnalyzer):
                 continue
 
             for pattern in patterns:
-                matches = re.findall(pattern, content, re.MULTILINE)
+                matches = self._findall(entry_file, pattern, re.MULTILINE)
                 if matches:
                     # Return the first valid port found
                     for match in matches:
@@ -169,7 +178,7 @@ class PortDetector(BaseAnalyzer):
                 continue
 
             for pattern in patterns:
-                matches = re.findall(pattern, content, re.MULTILINE)
+                matches = self._findall(env_file, pattern, re.MULTILINE)
                 if matches:
                     try:
                         port = int(matches[0])
@@ -263,7 +272,7 @@ class PortDetector(BaseAnalyzer):
             ]
 
             for pattern in patterns:
-                matches = re.findall(pattern, content)
+                matches = self._findall(config_file, pattern)
                 if matches:
                     try:
                         port = int(matches[0])
@@ -323,7 +332,7 @@ class PortDetector(BaseAnalyzer):
                 continue
 
             for pattern in patterns:
-                matches = re.findall(pattern, content)
+                matches = self._findall(script_file, pattern)
                 if matches:
                     try:
                         port = int(matches[0])
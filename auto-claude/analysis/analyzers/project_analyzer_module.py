@@ -3,27 +3,125 @@ Project Analyzer Module
 =======================
 
 Analyzes entire projects, detecting monorepo structures, services, infrastructure, and conventions.
+
+Each service's entry in the index is paired with a fingerprint (hashes of
+its manifest files plus the path, size and mtime of every file in it). Given the previous
+index, ProjectAnalyzer re-runs ServiceAnalyzer only for services whose
+fingerprint changed and reuses the stored analysis for the rest.
+
+Services can be analyzed concurrently with a bounded thread pool; results
+are merged in discovery order, so the index does not depend on scheduling.
 """
 
+import copy
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS
+from .file_cache import AnalysisFileCache
 from .service_analyzer import ServiceAnalyzer
 
+# Files whose content feeds a service fingerprint (manifests and the config
+# files detectors read); other files contribute their path, size and mtime
+MANIFEST_FILES = sorted(
+    SERVICE_ROOT_FILES
+    | {
+        "setup.py",
+        "setup.cfg",
+        "Pipfile",
+        "tsconfig.json",
+        "docker-compose.yml",
+        "docker-compose.yaml",
+        ".env",
+        ".env.example",
+        ".env.local",
+    }
+)
+
+
+def service_fingerprint(
+    service_path: Path,
+    inventory: FileInventory,
+    file_cache: AnalysisFileCache | None = None,
+) -> str:
+    """
+    Fingerprint a service for incremental re-analysis.
+
+    Args:
+        service_path: Service directory
+        inventory: File inventory for the project
+        file_cache: Shared file cache, so manifests read here are not read
+            again by the detectors
+
+    Returns:
+        Hex digest of the manifest contents and the service's file stats
+    """
+    file_cache = file_cache or AnalysisFileCache()
+    hasher = hashlib.sha256()
+    for name in MANIFEST_FILES:
+        content = file_cache.read_text(service_path / name)
+        if content is None:
+            continue
+        hasher.update(
+            f"{name}:{hashlib.sha256(content.encode()).hexdigest()}\n".encode()
+        )
+
+    # Routes, models and env usage are read from source files, so any edit
+    # (seen as a new size or mtime) must trigger re-analysis
+    for file_path in inventory.iter_paths(service_path, skip_dirs=SKIP_DIRS):
+        try:
+            stat = file_path.stat()
+            signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            signature = "missing"
+        rel_path = file_path.relative_to(service_path).as_posix()
+        hasher.update(f"{rel_path}\0{signature}\0".encode())
+    return hasher.hexdigest()
+
 
 class ProjectAnalyzer:
     """Analyzes an entire project, detecting monorepo structure and all services."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(
+        self,
+        project_dir: Path,
+        previous_index: dict | None = None,
+        max_workers: int = 1,
+    ):
+        """
+        Initialize the project analyzer.
+
+        Args:
+            project_dir: Root directory of the project
+            previous_index: Index from an earlier run; services whose
+                fingerprint is unchanged reuse its analysis (incremental mode)
+            max_workers: Services analyzed concurrently (1 = sequential; the
+                index is identical either way, apart from analysis_timing)
+        """
         self.project_dir = project_dir.resolve()
+        self.max_workers = max(1, max_workers)
+        # One file listing shared by every service analyzer in this run
+        self.inventory = FileInventory(self.project_dir)
+        # File contents and parse results shared by every analyzer in this run
+        self.file_cache = AnalysisFileCache()
+        self.previous_index = previous_index or {}
         self.index = {
             "project_root": str(self.project_dir),
             "project_type": "single",  # or "monorepo"
             "services": {},
             "infrastructure": {},
             "conventions": {},
+            "service_fingerprints": {},
+            # Per-service, per-step analysis time, for spotting slow detectors
+            "analysis_timing": {},
         }
+        # Service names re-analyzed vs. reused from previous_index
+        self.analyzed_services: list[str] = []
+        self.reused_services: list[str] = []
 
     def analyze(self) -> dict[str, Any]:
         """Run full project analysis."""
@@ -76,8 +174,8 @@ class ProjectAnalyzer:
             self.index["project_type"] = "monorepo"
 
     def _find_and_analyze_services(self) -> None:
-        """Find all services and analyze each."""
-        services = {}
+        """Find all services and analyze each (in parallel if max_workers > 1)."""
+        candidates: list[tuple[Path, str]] = []
 
         if self.index["project_type"] == "monorepo":
             # Look for services in common locations
@@ -107,20 +205,79 @@ class ProjectAnalyzer:
                     if has_root_file or (
                         location == self.project_dir and is_service_name
                     ):
-                        analyzer = ServiceAnalyzer(item, item.name)
-                        service_info = analyzer.analyze()
-                        if service_info.get(
-                            "language"
-                        ):  # Only include if we detected something
-                            services[item.name] = service_info
+                        candidates.append((item, item.name))
         else:
             # Single project - analyze root
-            analyzer = ServiceAnalyzer(self.project_dir, "main")
-            service_info = analyzer.analyze()
-            if service_info.get("language"):
-                services["main"] = service_info
+            candidates.append((self.project_dir, "main"))
+
+        if self.max_workers > 1 and len(candidates) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(candidates))
+            ) as pool:
+                results = list(
+                    pool.map(lambda c: self._analyze_service(*c), candidates)
+                )
+        else:
+            results = [self._analyze_service(*candidate) for candidate in candidates]
+
+        # Merge in discovery order so the index matches a sequential run
+        services = {}
+        fingerprints = {}
+        timing = {}
+        for (_, service_name), (service_info, fingerprint, steps) in zip(
+            candidates, results
+        ):
+            if steps is None:
+                self.reused_services.append(service_name)
+            else:
+                self.analyzed_services.append(service_name)
+
+            if not service_info.get("language"):
+                continue  # Only include if we detected something
+            services[service_name] = service_info
+            fingerprints[service_name] = fingerprint
+            timing[service_name] = (
+                {"reused": True}
+                if steps is None
+                else {"total_ms": round(sum(steps.values()), 2), "steps": steps}
+            )
 
         self.index["services"] = services
+        self.index["service_fingerprints"] = fingerprints
+        self.index["analysis_timing"] = timing
+
+    def _analyze_service(
+        self, service_path: Path, service_name: str
+    ) -> tuple[dict[str, Any], str, dict[str, float] | None]:
+        """
+        Analyze one service, reusing the previous analysis if unchanged.
+
+        Safe to call from worker threads (only reads shared state).
+
+        Returns:
+            (service info, fingerprint, per-step milliseconds or None if reused)
+        """
+        fingerprint = service_fingerprint(service_path, self.inventory, self.file_cache)
+
+        previous = self.previous_index.get("services", {}).get(service_name)
+        previous_fingerprint = self.previous_index.get("service_fingerprints", {}).get(
+            service_name
+        )
+        if (
+            previous is not None
+            and previous_fingerprint == fingerprint
+            and previous.get("path") == str(service_path)
+        ):
+            service_info = copy.deepcopy(previous)
+            # Recomputed across all services by _map_dependencies()
+            service_info.pop("consumes", None)
+            return service_info, fingerprint, None
+
+        analyzer = ServiceAnalyzer(
+            service_path, service_name, self.inventory, self.file_cache
+        )
+        service_info = analyzer.analyze()
+        return service_info, fingerprint, analyzer.timings
 
     def _analyze_infrastructure(self) -> None:
         """Analyze infrastructure configuration."""
@@ -142,9 +299,9 @@ class ProjectAnalyzer:
         # Docker directory
         docker_dir = self.project_dir / "docker"
         if docker_dir.exists():
-            dockerfiles = list(docker_dir.glob("Dockerfile*")) + list(
-                docker_dir.glob("*.Dockerfile")
-            )
+            dockerfiles = self.inventory.glob(
+                "Dockerfile*", docker_dir
+            ) + self.inventory.glob("*.Dockerfile", docker_dir)
             if dockerfiles:
                 infra["docker_directory"] = "docker/"
                 infra["dockerfiles"] = [
@@ -154,7 +311,9 @@ class ProjectAnalyzer:
         # CI/CD
         if (self.project_dir / ".github" / "workflows").exists():
             infra["ci"] = "GitHub Actions"
-            workflows = list((self.project_dir / ".github" / "workflows").glob("*.yml"))
+            workflows = self.inventory.glob(
+                "*.yml", self.project_dir / ".github" / "workflows"
+            )
             infra["ci_workflows"] = [f.name for f in workflows]
         elif (self.project_dir / ".gitlab-ci.yml").exists():
             infra["ci"] = "GitLab CI"
@@ -284,7 +443,4 @@ class ProjectAnalyzer:
         return False
 
     def _read_file(self, path: str) -> str:
-        try:
-            return (self.project_dir / path).read_text()
-        except (OSError, UnicodeDecodeError):
-            return ""
+        return self.file_cache.read_text(self.project_dir / path) or ""
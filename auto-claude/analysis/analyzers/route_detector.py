@@ -12,7 +12,10 @@ Detects API routes and endpoints across different frameworks:
 import re
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
 from .base import BaseAnalyzer
+from .file_cache import AnalysisFileCache
 
 
 class RouteDetector(BaseAnalyzer):
@@ -21,8 +24,13 @@ class RouteDetector(BaseAnalyzer):
     # Directories to exclude from route detection
     EXCLUDED_DIRS = {"node_modules", ".venv", "venv", "__pycache__", ".git"}
 
-    def __init__(self, path: Path):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(path, inventory, file_cache)
 
     def _should_include_file(self, file_path: Path) -> bool:
         """Check if file should be included (not in excluded directories)."""
@@ -59,12 +67,12 @@ class RouteDetector(BaseAnalyzer):
         """Detect FastAPI routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f for f in self._glob("**/*.py") if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -123,12 +131,12 @@ class RouteDetector(BaseAnalyzer):
         """Detect Flask routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f for f in self._glob("**/*.py") if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -172,12 +180,12 @@ class RouteDetector(BaseAnalyzer):
         """Detect Django routes from urls.py files."""
         routes = []
         url_files = [
-            f for f in self.path.glob("**/urls.py") if self._should_include_file(f)
+            f for f in self._glob("**/urls.py") if self._should_include_file(f)
         ]
 
         for file_path in url_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -207,16 +215,12 @@ class RouteDetector(BaseAnalyzer):
     def _detect_express_routes(self) -> list[dict]:
         """Detect Express/Fastify/Koa routes."""
         routes = []
-        js_files = [
-            f for f in self.path.glob("**/*.js") if self._should_include_file(f)
-        ]
-        ts_files = [
-            f for f in self.path.glob("**/*.ts") if self._should_include_file(f)
-        ]
+        js_files = [f for f in self._glob("**/*.js") if self._should_include_file(f)]
+        ts_files = [f for f in self._glob("**/*.ts") if self._should_include_file(f)]
         files_to_check = js_files + ts_files
         for file_path in files_to_check:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -268,7 +272,7 @@ class RouteDetector(BaseAnalyzer):
             # Find all route.ts/js files
             route_files = [
                 f
-                for f in app_dir.glob("**/route.{ts,js,tsx,jsx}")
+                for f in self._glob("**/route.{ts,js,tsx,jsx}", app_dir)
                 if self._should_include_file(f)
             ]
             for route_file in route_files:
@@ -281,7 +285,7 @@ class RouteDetector(BaseAnalyzer):
                 route_path = re.sub(r"\[([^\]]+)\]", r":\1", route_path)
 
                 try:
-                    content = route_file.read_text()
+                    content = self._read_source(route_file)
                     # Detect exported methods: export async function GET(request)
                     methods = re.findall(
                         r"export\s+(?:async\s+)?function\s+(GET|POST|PUT|DELETE|PATCH)",
@@ -306,7 +310,7 @@ class RouteDetector(BaseAnalyzer):
         if pages_api.exists():
             api_files = [
                 f
-                for f in pages_api.glob("**/*.{ts,js,tsx,jsx}")
+                for f in self._glob("**/*.{ts,js,tsx,jsx}", pages_api)
                 if self._should_include_file(f)
             ]
             for api_file in api_files:
@@ -340,13 +344,11 @@ class RouteDetector(BaseAnalyzer):
     def _detect_go_routes(self) -> list[dict]:
         """Detect Go framework routes (Gin, Echo, Chi, Fiber)."""
         routes = []
-        go_files = [
-            f for f in self.path.glob("**/*.go") if self._should_include_file(f)
-        ]
+        go_files = [f for f in self._glob("**/*.go") if self._should_include_file(f)]
 
         for file_path in go_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -376,13 +378,11 @@ class RouteDetector(BaseAnalyzer):
     def _detect_rust_routes(self) -> list[dict]:
         """Detect Rust framework routes (Axum, Actix)."""
         routes = []
-        rust_files = [
-            f for f in self.path.glob("**/*.rs") if self._should_include_file(f)
-        ]
+        rust_files = [f for f in self._glob("**/*.rs") if self._should_include_file(f)]
 
         for file_path in rust_files:
             try:
-                content = file_path.read_text()
+                content = self._read_source(file_path)
             except (OSError, UnicodeDecodeError):
                 continue
 
@@ -7,12 +7,16 @@ Integrates framework detection, route analysis, database models, and context ext
 """
 
 import re
+import time
 from pathlib import Path
 from typing import Any
 
+from core.file_inventory import FileInventory
+
 from .base import BaseAnalyzer
 from .context_analyzer import ContextAnalyzer
 from .database_detector import DatabaseDetector
+from .file_cache import AnalysisFileCache
 from .framework_analyzer import FrameworkAnalyzer
 from .route_detector import RouteDetector
 
@@ -20,8 +24,14 @@ from .route_detector import RouteDetector
 class ServiceAnalyzer(BaseAnalyzer):
     """Analyzes a single service/package within a project."""
 
-    def __init__(self, service_path: Path, service_name: str):
-        super().__init__(service_path)
+    def __init__(
+        self,
+        service_path: Path,
+        service_name: str,
+        inventory: FileInventory | None = None,
+        file_cache: AnalysisFileCache | None = None,
+    ):
+        super().__init__(service_path, inventory, file_cache)
         self.name = service_name
         self.analysis = {
             "name": service_name,
@@ -30,33 +40,45 @@ class ServiceAnalyzer(BaseAnalyzer):
             "framework": None,
             "type": None,  # backend, frontend, worker, library, etc.
         }
+        # Milliseconds spent in each analysis step (filled by analyze())
+        self.timings: dict[str, float] = {}
 
     def analyze(self) -> dict[str, Any]:
-        """Run full analysis on this service."""
-        self._detect_language_and_framework()
-        self._detect_service_type()
-        self._find_key_directories()
-        self._find_entry_points()
-        self._detect_dependencies()
-        self._detect_testing()
-        self._find_dockerfile()
-
-        # Comprehensive context extraction
-        self._detect_environment_variables()
-        self._detect_api_routes()
-        self._detect_database_models()
-        self._detect_external_services()
-        self._detect_auth_patterns()
-        self._detect_migrations()
-        self._detect_background_jobs()
-        self._detect_api_documentation()
-        self._detect_monitoring()
+        """Run full analysis on this service, timing each step into self.timings."""
+        steps = [
+            self._detect_language_and_framework,
+            self._detect_service_type,
+            self._find_key_directories,
+            self._find_entry_points,
+            self._detect_dependencies,
+            self._detect_testing,
+            self._find_dockerfile,
+            # Comprehensive context extraction
+            self._detect_environment_variables,
+            self._detect_api_routes,
+            self._detect_database_models,
+            self._detect_external_services,
+            self._detect_auth_patterns,
+            self._detect_migrations,
+            self._detect_background_jobs,
+            self._detect_api_documentation,
+            self._detect_monitoring,
+        ]
+
+        for step in steps:
+            start = time.perf_counter()
+            step()
+            self.timings[step.__name__.lstrip("_")] = round(
+                (time.perf_counter() - start) * 1000, 2
+            )
 
         return self.analysis
 
     def _detect_language_and_framework(self) -> None:
         """Detect primary language and framework."""
-        framework_analyzer = FrameworkAnalyzer(self.path, self.analysis)
+        framework_analyzer = FrameworkAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         framework_analyzer.detect_language_and_framework()
 
     def _detect_service_type(self) -> None:
@@ -248,12 +270,14 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _detect_environment_variables(self) -> None:
         """Detect environment variables."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         context.detect_environment_variables()
 
     def _detect_api_routes(self) -> None:
         """Detect API routes."""
-        route_detector = RouteDetector(self.path)
+        route_detector = RouteDetector(self.path, self.inventory, self.file_cache)
         routes = route_detector.detect_all_routes()
 
         if routes:
@@ -270,7 +294,7 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _detect_database_models(self) -> None:
         """Detect database models."""
-        db_detector = DatabaseDetector(self.path)
+        db_detector = DatabaseDetector(self.path, self.inventory, self.file_cache)
         models = db_detector.detect_all_models()
 
         if models:
@@ -282,30 +306,42 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _detect_external_services(self) -> None:
         """Detect external services."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         context.detect_external_services()
 
     def _detect_auth_patterns(self) -> None:
         """Detect authentication patterns."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         context.detect_auth_patterns()
 
     def _detect_migrations(self) -> None:
         """Detect database migrations."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         context.detect_migrations()
 
     def _detect_background_jobs(self) -> None:
         """Detect background jobs."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         context.detect_background_jobs()
 
     def _detect_api_documentation(self) -> None:
         """Detect API documentation."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         context.detect_api_documentation()
 
     def _detect_monitoring(self) -> None:
         """Detect monitoring setup."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(
+            self.path, self.analysis, self.inventory, self.file_cache
+        )
         context.detect_monitoring()
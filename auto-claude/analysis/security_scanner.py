@@ -22,6 +22,7 @@ Usage:
 """
 
 import json
+import os
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -29,7 +30,12 @@ from typing import Any
 
 # Import the existing secrets scanner
 try:
-    from security.scan_secrets import SecretMatch, get_all_tracked_files, scan_files
+    from security.scan_secrets import (
+        SecretMatch,
+        SecretScanCache,
+        get_all_tracked_files,
+        scan_files,
+    )
 
     HAS_SECRETS_SCANNER = True
 except ImportError:
@@ -101,8 +107,15 @@ class SecurityScanner:
     - npm audit for JavaScript vulnerabilities (if applicable)
     """
 
-    def __init__(self) -> None:
-        """Initialize the security scanner."""
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Initialize the security scanner.
+
+        Args:
+            max_workers: Worker processes for secrets scanning
+                (default: min(4, CPU count))
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
         self._bandit_available: bool | None = None
         self._npm_available: bool | None = None
 
@@ -167,7 +180,12 @@ class SecurityScanner:
         changed_files: list[str] | None,
         result: SecurityScanResult,
     ) -> None:
-        """Run secrets scanning using scan_secrets.py."""
+        """
+        Run secrets scanning using scan_secrets.py.
+
+        Files found clean by an earlier pass (cached in .auto-claude/) are
+        not scanned again unless their content changed.
+        """
         if not HAS_SECRETS_SCANNER:
             result.scan_errors.append("scan_secrets module not available")
             return
@@ -180,7 +198,12 @@ class SecurityScanner:
                 files_to_scan = get_all_tracked_files()
 
             # Run scan
-            matches = scan_files(files_to_scan, project_dir)
+            matches = scan_files(
+                files_to_scan,
+                project_dir,
+                max_workers=self.max_workers,
+                cache=SecretScanCache.for_project(project_dir),
+            )
 
             # Convert matches to result format
             for match in matches:
@@ -6,12 +6,15 @@ Task context building for autonomous coding.
 """
 
 from .builder import ContextBuilder
+from .cache import ContextCache
 from .categorizer import FileCategorizer
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
 from .pattern_discovery import PatternDiscoverer
+from .ranking import BM25Scorer, CountScorer, Scorer, get_scorer
 from .search import CodeSearcher
+from .search_index import SearchIndex
 from .serialization import load_context, save_context, serialize_context
 from .service_matcher import ServiceMatcher
 
@@ -27,6 +30,13 @@ __all__ = [
     "KeywordExtractor",
     "FileCategorizer",
     "PatternDiscoverer",
+    "SearchIndex",
+    "ContextCache",
+    # Ranking
+    "Scorer",
+    "CountScorer",
+    "BM25Scorer",
+    "get_scorer",
     # Graphiti integration
     "fetch_graph_hints",
     "is_graphiti_enabled",
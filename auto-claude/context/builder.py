@@ -7,14 +7,17 @@ Main builder class that orchestrates context building for tasks.
 
 import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 
+from .cache import ContextCache
 from .categorizer import FileCategorizer
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
 from .pattern_discovery import PatternDiscoverer
+from .ranking import Scorer
 from .search import CodeSearcher
 from .service_matcher import ServiceMatcher
 
@@ -22,16 +25,44 @@ from .service_matcher import ServiceMatcher
 class ContextBuilder:
     """Builds task-specific context by searching the codebase."""
 
-    def __init__(self, project_dir: Path, project_index: dict | None = None):
+    def __init__(
+        self,
+        project_dir: Path,
+        project_index: dict | None = None,
+        max_workers: int = 1,
+        use_processes: bool = False,
+        scorer: str | Scorer | None = None,
+        use_cache: bool = True,
+    ):
+        """
+        Initialize the context builder.
+
+        Args:
+            project_dir: Root directory of the project
+            project_index: Project index (loaded or generated if None)
+            max_workers: Workers for searching services and files in parallel
+                (1 = sequential; results are identical either way)
+            use_processes: Score files in a process pool instead of threads
+            scorer: Relevance scorer name ("count", "bm25") or instance
+            use_cache: Reuse contexts built by earlier calls while the
+                searched services are unchanged (see ContextCache)
+        """
         self.project_dir = project_dir.resolve()
         self.project_index = project_index or self._load_project_index()
+        self.max_workers = max(1, max_workers)
 
         # Initialize components
-        self.searcher = CodeSearcher(self.project_dir)
+        self.searcher = CodeSearcher(
+            self.project_dir,
+            max_workers=self.max_workers,
+            use_processes=use_processes,
+            scorer=scorer,
+        )
         self.service_matcher = ServiceMatcher(self.project_index)
         self.keyword_extractor = KeywordExtractor()
         self.categorizer = FileCategorizer()
         self.pattern_discoverer = PatternDiscoverer(self.project_dir)
+        self.cache = ContextCache.for_project(self.project_dir) if use_cache else None
 
     def _load_project_index(self) -> dict:
         """Load project index from file or create new one (.auto-claude is the installed instance)."""
@@ -72,27 +103,20 @@ class ContextBuilder:
         if not keywords:
             keywords = self.keyword_extractor.extract_keywords(task)
 
-        # Search each service
-        all_matches: list[FileMatch] = []
-        service_contexts = {}
-
-        for service_name in services:
-            service_info = self.project_index.get("services", {}).get(service_name)
-            if not service_info:
-                continue
-
-            service_path = Path(service_info.get("path", service_name))
-            if not service_path.is_absolute():
-                service_path = self.project_dir / service_path
-
-            # Search this service
-            matches = self.searcher.search_service(service_path, service_name, keywords)
-            all_matches.extend(matches)
+        targets = self._resolve_services(services)
 
-            # Load or generate service context
-            service_contexts[service_name] = self._get_service_context(
-                service_path, service_name, service_info
+        # Reuse an earlier result if none of its services changed
+        cache_key, fingerprints = None, {}
+        if self.cache is not None:
+            cache_key = self._cache_key(task, targets, keywords, include_graph_hints)
+            cached, fingerprints = self.cache.lookup(
+                cache_key, {name: path for name, path, _ in targets}
             )
+            if cached is not None:
+                return cached
+
+        # Search each service
+        all_matches, service_contexts = self._search_services(targets, keywords)
 
         # Categorize matches
         files_to_modify, files_to_reference = self.categorizer.categorize_matches(
@@ -123,7 +147,7 @@ class ContextBuilder:
                 # Graphiti is optional - fail gracefully
                 graph_hints = []
 
-        return TaskContext(
+        context = TaskContext(
             task_description=task,
             scoped_services=services,
             files_to_modify=[
@@ -137,6 +161,10 @@ class ContextBuilder:
             graph_hints=graph_hints,
         )
 
+        if self.cache is not None:
+            self.cache.store(cache_key, fingerprints, context)
+        return context
+
     async def build_context_async(
         self,
         task: str,
@@ -167,27 +195,20 @@ class ContextBuilder:
         if not keywords:
             keywords = self.keyword_extractor.extract_keywords(task)
 
-        # Search each service
-        all_matches: list[FileMatch] = []
-        service_contexts = {}
-
-        for service_name in services:
-            service_info = self.project_index.get("services", {}).get(service_name)
-            if not service_info:
-                continue
-
-            service_path = Path(service_info.get("path", service_name))
-            if not service_path.is_absolute():
-                service_path = self.project_dir / service_path
-
-            # Search this service
-            matches = self.searcher.search_service(service_path, service_name, keywords)
-            all_matches.extend(matches)
+        targets = self._resolve_services(services)
 
-            # Load or generate service context
-            service_contexts[service_name] = self._get_service_context(
-                service_path, service_name, service_info
+        # Reuse an earlier result if none of its services changed
+        cache_key, fingerprints = None, {}
+        if self.cache is not None:
+            cache_key = self._cache_key(task, targets, keywords, include_graph_hints)
+            cached, fingerprints = self.cache.lookup(
+                cache_key, {name: path for name, path, _ in targets}
             )
+            if cached is not None:
+                return cached
+
+        # Search each service
+        all_matches, service_contexts = self._search_services(targets, keywords)
 
         # Categorize matches
         files_to_modify, files_to_reference = self.categorizer.categorize_matches(
@@ -204,7 +225,7 @@ class ContextBuilder:
         if include_graph_hints:
             graph_hints = await fetch_graph_hints(task, str(self.project_dir))
 
-        return TaskContext(
+        context = TaskContext(
             task_description=task,
             scoped_services=services,
             files_to_modify=[
@@ -218,6 +239,99 @@ class ContextBuilder:
             graph_hints=graph_hints,
         )
 
+        if self.cache is not None:
+            self.cache.store(cache_key, fingerprints, context)
+        return context
+
+    def _resolve_services(self, services: list[str]) -> list[tuple[str, Path, dict]]:
+        """Resolve service names to (name, directory, info), skipping unknown ones."""
+        targets = []
+        for service_name in services:
+            service_info = self.project_index.get("services", {}).get(service_name)
+            if not service_info:
+                continue
+
+            service_path = Path(service_info.get("path", service_name))
+            if not service_path.is_absolute():
+                service_path = self.project_dir / service_path
+            targets.append((service_name, service_path, service_info))
+        return targets
+
+    def _cache_key(
+        self,
+        task: str,
+        targets: list[tuple[str, Path, dict]],
+        keywords: list[str],
+        include_graph_hints: bool,
+    ) -> str:
+        """Cache key covering everything besides file content that shapes the result."""
+        scorer = self.searcher.scorer
+        return ContextCache.make_key(
+            task,
+            [name for name, _, _ in targets],
+            keywords,
+            {
+                "scorer": {"name": scorer.name, **vars(scorer)},
+                "service_info": {name: info for name, _, info in targets},
+                "graph_hints": include_graph_hints,
+            },
+        )
+
+    def _search_services(
+        self,
+        targets: list[tuple[str, Path, dict]],
+        keywords: list[str],
+    ) -> tuple[list[FileMatch], dict[str, dict]]:
+        """
+        Search every resolved service, in parallel when max_workers > 1.
+
+        Only one level of the search runs in a worker pool: index searches
+        refresh the index once (tokenizing files in the searcher's pool) and
+        then search services concurrently; full scans search services one
+        at a time, each scanning its files in the searcher's pool.
+
+        Per-service results are merged in the order services were given, so
+        the parallel and sequential paths produce the same output.
+
+        Args:
+            targets: Services from _resolve_services()
+            keywords: Keywords to search for
+
+        Returns:
+            (all matches, service contexts by service name)
+        """
+
+        def search(target: tuple[str, Path, dict]) -> list[FileMatch]:
+            service_name, service_path, _ = target
+            return self.searcher.search_service(service_path, service_name, keywords)
+
+        if (
+            self.max_workers > 1
+            and len(targets) > 1
+            and self.searcher.uses_index(keywords)
+        ):
+            self.searcher.refresh_index([path for _, path, _ in targets])
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(targets))
+            ) as pool:
+                results = list(pool.map(search, targets))
+        else:
+            results = [search(target) for target in targets]
+
+        all_matches: list[FileMatch] = []
+        service_contexts = {}
+        for (service_name, service_path, service_info), matches in zip(
+            targets, results
+        ):
+            all_matches.extend(matches)
+
+            # Load or generate service context
+            service_contexts[service_name] = self._get_service_context(
+                service_path, service_name, service_info
+            )
+
+        return all_matches, service_contexts
+
     def _get_service_context(
         self,
         service_path: Path,
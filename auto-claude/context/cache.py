@@ -0,0 +1,377 @@
+"""
+Context Cache
+=============
+
+Cross-call cache of ContextBuilder results.
+
+Entries are keyed by a hash of the task text, keywords, services and
+builder options. Each entry remembers a fingerprint of every service it
+searched - the service's git tree hash plus the state of any uncommitted
+files in it - so an entry is reused only while none of its services have
+changed, and a change in one service never invalidates entries for others.
+
+Validating an entry costs two git calls for the committed state plus a
+``git status`` walk of the searched services, so uncommitted edits are
+seen; no file content is read. A hit then returns the stored TaskContext
+without searching or fetching graph hints.
+
+Entries are kept in memory and, when .auto-claude/ is installed, as one
+JSON file per entry under .auto-claude/context_cache/, so concurrent spec
+runs add entries without overwriting each other's. Both layers use LRU
+eviction bounded by entry count and total size; on disk, a hit refreshes
+the entry file's mtime and eviction removes the oldest files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+
+from core.file_inventory import FileInventory
+from core.file_io import atomic_write_json
+
+from .constants import CODE_EXTENSIONS, SKIP_DIRS
+from .models import TaskContext
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "context_cache"
+CACHE_VERSION = 2
+
+# Changes under these directories never affect a built context
+IGNORED_DIRS = SKIP_DIRS | {".auto-claude"}
+
+
+class ContextCache:
+    """LRU cache of TaskContext results, validated per service."""
+
+    def __init__(
+        self,
+        project_dir: Path,
+        cache_dir: Path | None = None,
+        max_entries: int = 32,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        """
+        Initialize the context cache.
+
+        Args:
+            project_dir: Root directory of the project
+            cache_dir: Directory for persistent entries (None = in-memory only)
+            max_entries: Maximum number of cached contexts
+            max_bytes: Maximum total serialized size of cached contexts
+        """
+        self.project_dir = project_dir.resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_project(cls, project_dir: Path, **kwargs) -> ContextCache:
+        """Create a cache persisted under .auto-claude/ if it is installed."""
+        auto_claude_dir = project_dir / ".auto-claude"
+        cache_dir = (
+            auto_claude_dir / CACHE_DIRNAME if auto_claude_dir.is_dir() else None
+        )
+        return cls(project_dir, cache_dir, **kwargs)
+
+    @staticmethod
+    def make_key(
+        task: str,
+        services: list[str],
+        keywords: list[str],
+        options: dict | None = None,
+    ) -> str:
+        """
+        Build the cache key for a context request.
+
+        Args:
+            task: Task description
+            services: Services searched
+            keywords: Keywords searched
+            options: Builder options that affect the result (scorer, hints...)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "task": task,
+                "services": services,
+                "keywords": keywords,
+                "options": options or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(
+        self, key: str, service_paths: dict[str, Path]
+    ) -> tuple[TaskContext | None, dict[str, str]]:
+        """
+        Look up a cached context and validate it against the current tree.
+
+        Args:
+            key: Key from make_key()
+            service_paths: Service name -> directory for the searched services
+
+        Returns:
+            (cached TaskContext or None, current service fingerprints). Pass
+            the fingerprints to store() after building on a miss.
+        """
+        fingerprints = self.fingerprint_services(service_paths)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry["fingerprints"] != fingerprints:
+            # Another process may have stored a fresher entry
+            entry = self._load(key)
+        if entry is None or entry["fingerprints"] != fingerprints:
+            # Only this entry's services changed - drop just this entry
+            self._discard(key)
+            return None, fingerprints
+
+        with self._lock:
+            self._remember(key, entry)
+        self._touch(key)
+        return TaskContext(**entry["context"]), fingerprints
+
+    def store(
+        self, key: str, fingerprints: dict[str, str], context: TaskContext
+    ) -> None:
+        """
+        Store a freshly built context.
+
+        Args:
+            key: Key from make_key()
+            fingerprints: Service fingerprints returned by lookup()
+            context: The built context
+        """
+        data = asdict(context)
+        size = len(json.dumps(data))
+        if size > self.max_bytes:
+            return
+
+        entry = {"fingerprints": fingerprints, "context": data, "size": size}
+        with self._lock:
+            self._remember(key, entry)
+        self._save(key, entry)
+
+    def fingerprint_services(self, service_paths: dict[str, Path]) -> dict[str, str]:
+        """
+        Fingerprint each service's files without reading their content.
+
+        Uses git tree hashes plus the stat of uncommitted paths when the
+        project is a git repository, otherwise the stat of every code file.
+
+        Args:
+            service_paths: Service name -> directory
+
+        Returns:
+            Service name -> fingerprint
+        """
+        fingerprints = self._git_fingerprints(service_paths)
+        if fingerprints is not None:
+            return fingerprints
+
+        inventory = FileInventory(self.project_dir)
+        fingerprints = {}
+        for name, path in service_paths.items():
+            hasher = hashlib.sha256()
+            files = list(
+                inventory.iter_paths(
+                    path, extensions=CODE_EXTENSIONS, skip_dirs=SKIP_DIRS
+                )
+            )
+            files.append(path / "SERVICE_CONTEXT.md")
+            for file_path in files:
+                self._hash_stat(hasher, file_path)
+            fingerprints[name] = hasher.hexdigest()
+        return fingerprints
+
+    def _git_fingerprints(
+        self, service_paths: dict[str, Path]
+    ) -> dict[str, str] | None:
+        """Fingerprint services from git, or None if git is unavailable."""
+        rels = {}
+        for name, path in service_paths.items():
+            try:
+                rel = path.resolve().relative_to(self.project_dir).as_posix()
+            except ValueError:
+                return None
+            rels[name] = "" if rel == "." else rel
+
+        # Committed state: tree hash of each service directory
+        trees = {}
+        non_root = sorted({rel for rel in rels.values() if rel})
+        if non_root:
+            output = self._git(["ls-tree", "-z", "HEAD", "--", *non_root])
+            if output is None:
+                return None
+            for entry in output.split("\0"):
+                meta, _, entry_path = entry.partition("\t")
+                if entry_path:
+                    trees[entry_path] = meta.split()[-1]
+        # rev-parse also reports where the project sits in the repository,
+        # because status paths are relative to the repository root
+        output = self._git(["rev-parse", "--show-prefix", "HEAD:./"])
+        if output is None:
+            return None
+        repo_prefix, _, root_tree = output.partition("\n")
+        trees[""] = root_tree.strip()
+
+        # Uncommitted state (staged, modified, untracked): stat of each path.
+        # Renames are reported as a deletion plus an addition, which skips
+        # git's rename detection
+        pathspecs = non_root if "" not in rels.values() else ["."]
+        output = self._git(
+            [
+                "status",
+                "--porcelain",
+                "-z",
+                "--untracked-files=all",
+                "--no-renames",
+                "--",
+                *pathspecs,
+            ]
+        )
+        if output is None:
+            return None
+        dirty = []
+        for record in output.split("\0"):
+            if len(record) < 4:
+                continue
+            status, entry_path = record[:2], record[3:]
+            if not entry_path.startswith(repo_prefix):
+                continue
+            entry_path = entry_path[len(repo_prefix) :]
+            # Skip directories search never reads (including this cache's own)
+            if any(part in IGNORED_DIRS for part in entry_path.split("/")):
+                continue
+            dirty.append((entry_path, status))
+
+        fingerprints = {}
+        for name, rel in rels.items():
+            hasher = hashlib.sha256(f"{rel}:{trees.get(rel, '')}".encode())
+            prefix = f"{rel}/" if rel else ""
+            for entry_path, status in sorted(dirty):
+                if entry_path.startswith(prefix):
+                    hasher.update(f"{status}{entry_path}".encode())
+                    self._hash_stat(hasher, self.project_dir / entry_path)
+            fingerprints[name] = hasher.hexdigest()
+        return fingerprints
+
+    def _git(self, args: list[str]) -> str | None:
+        """Run a git command in the project, returning stdout or None."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="surrogateescape",
+            )
+        except (OSError, ValueError):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    @staticmethod
+    def _hash_stat(hasher, file_path: Path) -> None:
+        try:
+            stat = file_path.stat()
+            hasher.update(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        except OSError:
+            hasher.update(f"{file_path}:missing".encode())
+
+    def _remember(self, key: str, entry: dict) -> None:
+        """Insert under the lock, evicting least recently used entries."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        total = sum(e["size"] for e in self._entries.values())
+        while len(self._entries) > self.max_entries or total > self.max_bytes:
+            total -= self._entries.popitem(last=False)[1]["size"]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> dict | None:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return None
+            return data["entry"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable context cache entry {path}: {e}")
+            return None
+
+    def _save(self, key: str, entry: dict) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            atomic_write_json(
+                self._path(key),
+                {"version": CACHE_VERSION, "entry": entry},
+                indent=None,
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save context cache entry: {e}")
+            return
+        self._evict_files()
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry file as recently used."""
+        if self.cache_dir is None:
+            return
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.cache_dir is None:
+            return
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict_files(self) -> None:
+        """Drop least recently used entry files until within both limits."""
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        files.sort(reverse=True)
+
+        count = total = 0
+        for _, size, path in files:
+            if count < self.max_entries and total + size <= self.max_bytes:
+                count += 1
+                total += size
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                pass
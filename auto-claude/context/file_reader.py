@@ -0,0 +1,112 @@
+"""
+Bounded File Reading
+====================
+
+Streams code files for search with a fixed memory footprint.
+
+Files are read in newline-aligned chunks up to a per-file byte budget, so
+multi-MB fixtures and generated files cost no more than the budget. Binary
+files and minified bundles (which are one huge line of noise for keyword
+search) are detected from the first block and skipped entirely.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+# Maximum bytes read from any one file
+MAX_FILE_BYTES = 1024 * 1024
+
+# Size of each read
+CHUNK_BYTES = 64 * 1024
+
+# Bytes inspected for binary / minified detection
+SNIFF_BYTES = 8 * 1024
+
+# Average line length (in the sniffed block) above which a file is minified
+MINIFIED_LINE_LENGTH = 500
+
+MINIFIED_SUFFIXES = (".min.js", ".min.css", ".min.mjs", ".bundle.js")
+
+
+def is_binary(sample: bytes) -> bool:
+    """Whether a leading block of a file looks binary (contains NUL bytes)."""
+    return b"\0" in sample
+
+
+def is_minified(sample: bytes) -> bool:
+    """Whether a leading block of a file looks like minified code."""
+    if len(sample) < SNIFF_BYTES // 2:
+        return False
+    return len(sample) / (sample.count(b"\n") + 1) > MINIFIED_LINE_LENGTH
+
+
+def should_skip(file_path: Path, sample: bytes) -> bool:
+    """Whether a file is binary or minified and should not be searched."""
+    return (
+        file_path.name.endswith(MINIFIED_SUFFIXES)
+        or is_binary(sample)
+        or is_minified(sample)
+    )
+
+
+def iter_text_chunks(
+    file_path: Path,
+    max_bytes: int = MAX_FILE_BYTES,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> Iterator[str]:
+    """
+    Stream a text file in chunks that each end on a line boundary.
+
+    Yields nothing for binary and minified files. Since chunks never split
+    a line, keyword matches (which never contain newlines) are never split
+    across chunks either.
+
+    Args:
+        file_path: File to read
+        max_bytes: Stop reading after this many bytes
+        chunk_bytes: Bytes read per chunk
+
+    Yields:
+        Decoded chunks; joined, they form the file's first max_bytes
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    with open(file_path, "rb") as f:
+        data = f.read(min(max(chunk_bytes, SNIFF_BYTES), max_bytes))
+        if should_skip(file_path, data[:SNIFF_BYTES]):
+            return
+
+        remaining = max_bytes - len(data)
+        pending = b""
+        while data:
+            buffer = pending + data
+            cut = buffer.rfind(b"\n") + 1
+            if cut:
+                yield buffer[:cut].decode("utf-8", errors="ignore")
+            pending = buffer[cut:]
+
+            if remaining <= 0:
+                break
+            data = f.read(min(chunk_bytes, remaining))
+            remaining -= len(data)
+
+        if pending:
+            yield pending.decode("utf-8", errors="ignore")
+
+
+def read_text_bounded(file_path: Path, max_bytes: int = MAX_FILE_BYTES) -> str | None:
+    """
+    Read up to max_bytes of a text file.
+
+    Args:
+        file_path: File to read
+        max_bytes: Per-file byte budget
+
+    Returns:
+        File content ("" for binary or minified files), or None if unreadable
+    """
+    try:
+        return "".join(iter_text_chunks(file_path, max_bytes))
+    except OSError:
+        return None
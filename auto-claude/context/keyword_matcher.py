@@ -0,0 +1,207 @@
+"""
+Multi-Keyword Matcher
+=====================
+
+Finds many keywords in a file with a single pass over its content.
+
+One combined lookahead regex reports every position where any keyword
+starts. From that single pass we derive, for every keyword at once:
+- the occurrence count (same semantics as str.count: non-overlapping)
+- the first N line numbers containing it
+- snippet windows around the first matching line
+
+scan_chunks() does the same over a stream of newline-aligned chunks, keeping
+only the text of matching lines and stopping early once every keyword's
+count has reached a cap.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class KeywordScan:
+    """Per-keyword results of scanning one file."""
+
+    content: str | None
+    counts: dict[str, int]
+    line_numbers: dict[str, list[int]]
+    # Text of matching lines, for streamed scans that do not keep content
+    line_text: dict[int, str] = field(default_factory=dict, repr=False)
+    _lines: list[str] | None = field(default=None, repr=False)
+
+    @property
+    def lines(self) -> list[str]:
+        """Original content split into lines (computed once)."""
+        if self._lines is None:
+            self._lines = (self.content or "").split("\n")
+        return self._lines
+
+    def matched(self, keyword: str) -> bool:
+        """Whether the keyword occurs in the content."""
+        return self.counts.get(keyword, 0) > 0
+
+    def matching_lines(self, keyword: str, width: int = 100) -> list[tuple[int, str]]:
+        """First matching (line number, stripped line text) pairs for a keyword."""
+        if self.content is None:
+            return [
+                (line_no, self.line_text[line_no].strip()[:width])
+                for line_no in self.line_numbers.get(keyword, [])
+            ]
+        lines = self.lines
+        return [
+            (line_no, lines[line_no - 1].strip()[:width])
+            for line_no in self.line_numbers.get(keyword, [])
+        ]
+
+    def snippet(self, keyword: str, before: int = 3, after: int = 3) -> str | None:
+        """Lines around the first line containing a keyword, or None."""
+        numbers = self.line_numbers.get(keyword)
+        if not numbers:
+            return None
+        lines = self.lines
+        index = numbers[0] - 1
+        start = max(0, index - before)
+        end = min(len(lines), index + after + 1)
+        return "\n".join(lines[start:end])
+
+
+class KeywordMatcher:
+    """Compiled matcher for a fixed set of lowercase keywords."""
+
+    def __init__(self, keywords: list[str], max_lines: int = 3):
+        """
+        Initialize the matcher.
+
+        Args:
+            keywords: Keywords to find (matched against lowercased content)
+            max_lines: Line numbers to record per keyword
+        """
+        self.keywords = list(dict.fromkeys(k for k in keywords if k))
+        self.max_lines = max_lines
+        self._patterns: dict[tuple[str, ...], tuple[re.Pattern, dict]] = {}
+
+    def scan(self, content: str) -> KeywordScan:
+        """
+        Scan content once for all keywords.
+
+        Args:
+            content: Original file content
+
+        Returns:
+            KeywordScan with counts and line numbers for every keyword
+        """
+        counts = dict.fromkeys(self.keywords, 0)
+        line_numbers: dict[str, list[int]] = {k: [] for k in self.keywords}
+        self._scan_text(content, counts, line_numbers)
+        return KeywordScan(content, counts, line_numbers)
+
+    def scan_chunks(
+        self, chunks: Iterable[str], count_cap: int | None = None
+    ) -> KeywordScan:
+        """
+        Scan a stream of chunks without holding the whole content.
+
+        Counts and line numbers equal scan() over the joined chunks, as long
+        as every chunk ends on a line boundary (see file_reader). The result
+        has no content; matching_lines() uses the recorded line text.
+
+        Args:
+            chunks: Newline-aligned pieces of the content
+            count_cap: Stop reading once every keyword has at least this many
+                occurrences and all its line numbers (None = read everything)
+
+        Returns:
+            KeywordScan with content None
+        """
+        counts = dict.fromkeys(self.keywords, 0)
+        line_numbers: dict[str, list[int]] = {k: [] for k in self.keywords}
+        line_text: dict[int, str] = {}
+        line_offset = 0
+
+        for chunk in chunks:
+            recorded = self._scan_text(chunk, counts, line_numbers, line_offset)
+            if recorded:
+                lines = chunk.split("\n")
+                for line_no in recorded:
+                    line_text[line_no] = lines[line_no - line_offset - 1]
+            line_offset += chunk.count("\n")
+
+            if count_cap is not None and all(
+                counts[k] >= count_cap and len(line_numbers[k]) >= self.max_lines
+                for k in self.keywords
+            ):
+                break
+
+        return KeywordScan(None, counts, line_numbers, line_text)
+
+    def _scan_text(
+        self,
+        content: str,
+        counts: dict[str, int],
+        line_numbers: dict[str, list[int]],
+        line_offset: int = 0,
+    ) -> list[int]:
+        """
+        Add one piece of content's matches to counts and line_numbers.
+
+        Returns:
+            Line numbers newly recorded for any keyword
+        """
+        text = content.lower()
+        recorded: list[int] = []
+
+        # Cheap C-level prefilter: most files contain none of the keywords
+        present = tuple(k for k in self.keywords if k in text)
+        if not present:
+            return recorded
+
+        pattern, prefixes = self._compile(present)
+        last_end = dict.fromkeys(present, 0)
+        line_pos = 0
+        line_no = line_offset + 1
+
+        for match in pattern.finditer(text):
+            start = match.start()
+            # Advance the line cursor (matches arrive in increasing order)
+            line_no += text.count("\n", line_pos, start)
+            line_pos = start
+
+            for keyword in prefixes[match.group(1)]:
+                if start >= last_end[keyword]:
+                    counts[keyword] += 1
+                    last_end[keyword] = start + len(keyword)
+                numbers = line_numbers[keyword]
+                if len(numbers) < self.max_lines and (
+                    not numbers or numbers[-1] != line_no
+                ):
+                    numbers.append(line_no)
+                    if not recorded or recorded[-1] != line_no:
+                        recorded.append(line_no)
+
+        return recorded
+
+    def _compile(self, keywords: tuple[str, ...]) -> tuple[re.Pattern, dict]:
+        """
+        Build (and cache) the combined pattern for a set of keywords.
+
+        Alternatives are ordered longest first, so at each position the regex
+        reports the longest keyword starting there. Every other keyword that
+        starts at the same position is a prefix of it, so prefixes maps the
+        reported keyword to all keywords occurring at that position.
+        """
+        cached = self._patterns.get(keywords)
+        if cached is not None:
+            return cached
+
+        ordered = sorted(keywords, key=len, reverse=True)
+        pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+        prefixes = {
+            longest: [k for k in keywords if longest.startswith(k)]
+            for longest in keywords
+        }
+        self._patterns[keywords] = (pattern, prefixes)
+        return pattern, prefixes
@@ -34,6 +34,7 @@ from context import (
     FileMatch,
     TaskContext,
 )
+from context.ranking import SCORERS
 from context.serialization import serialize_context
 
 # Backward compatibility exports
@@ -51,6 +52,9 @@ def build_task_context(
     services: list[str] | None = None,
     keywords: list[str] | None = None,
     output_file: Path | None = None,
+    max_workers: int = 1,
+    scorer: str = "count",
+    use_cache: bool = True,
 ) -> dict:
     """
     Build context for a task and optionally save to file.
@@ -61,11 +65,16 @@ def build_task_context(
         services: Services to search (None = auto-detect)
         keywords: Keywords to search for (None = extract from task)
         output_file: Optional path to save JSON output
+        max_workers: Workers for parallel search (1 = sequential)
+        scorer: Relevance scorer ("count" or "bm25")
+        use_cache: Reuse a cached context while the searched services are unchanged
 
     Returns:
         Context as a dictionary
     """
-    builder = ContextBuilder(project_dir)
+    builder = ContextBuilder(
+        project_dir, max_workers=max_workers, scorer=scorer, use_cache=use_cache
+    )
     context = builder.build_context(task, services, keywords)
 
     result = serialize_context(context)
@@ -116,6 +125,23 @@ def main():
         default=None,
         help="Output file for JSON results",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel search workers (default: 1)",
+    )
+    parser.add_argument(
+        "--scorer",
+        choices=sorted(SCORERS),
+        default="count",
+        help="Relevance scorer for ranking files (default: count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always rebuild instead of reusing a cached context",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -134,6 +160,9 @@ def main():
         services,
         keywords,
         args.output,
+        args.workers,
+        args.scorer,
+        not args.no_cache,
     )
 
     if not args.quiet or not args.output:
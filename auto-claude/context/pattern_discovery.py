@@ -7,6 +7,8 @@ Discovers code patterns from reference files to guide implementation.
 
 from pathlib import Path
 
+from .file_reader import read_text_bounded
+from .keyword_matcher import KeywordMatcher
 from .models import FileMatch
 
 
@@ -34,32 +36,24 @@ class PatternDiscoverer:
             Dictionary mapping pattern keys to code snippets
         """
         patterns = {}
+        matcher = KeywordMatcher(keywords, max_lines=1)
 
         for match in reference_files[:max_files]:
-            try:
-                file_path = self.project_dir / match.path
-                content = file_path.read_text(errors="ignore")
-
-                # Look for common patterns
-                for keyword in keywords:
-                    if keyword in content.lower():
-                        # Extract a snippet around the keyword
-                        lines = content.split("\n")
-                        for i, line in enumerate(lines):
-                            if keyword in line.lower():
-                                # Get context (3 lines before and after)
-                                start = max(0, i - 3)
-                                end = min(len(lines), i + 4)
-                                snippet = "\n".join(lines[start:end])
-
-                                pattern_key = f"{keyword}_pattern"
-                                if pattern_key not in patterns:
-                                    patterns[pattern_key] = (
-                                        f"From {match.path}:\n{snippet[:300]}"
-                                    )
-                                break
-
-            except (OSError, UnicodeDecodeError):
+            # Bounded read; binary and minified files come back empty
+            content = read_text_bounded(self.project_dir / match.path)
+            if not content:
                 continue
 
+            # One pass finds the first matching line for every keyword
+            scan = matcher.scan(content)
+            for keyword in keywords:
+                pattern_key = f"{keyword}_pattern"
+                if pattern_key in patterns:
+                    continue
+
+                # Get context (3 lines before and after)
+                snippet = scan.snippet(keyword, before=3, after=3)
+                if snippet is not None:
+                    patterns[pattern_key] = f"From {match.path}:\n{snippet[:300]}"
+
         return patterns
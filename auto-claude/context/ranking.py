@@ -0,0 +1,129 @@
+"""
+Relevance Ranking
+=================
+
+Pluggable scorers that turn per-keyword occurrence counts into a file's
+relevance score.
+
+- CountScorer: the original scorer - raw occurrences, capped per keyword.
+- BM25Scorer: Okapi BM25 over corpus statistics (document frequencies and
+  file lengths), so huge generated files and common words stop crowding out
+  the files that are actually relevant.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CorpusStats:
+    """Corpus statistics for one search (one service's files)."""
+
+    documents: int
+    average_length: float
+    document_frequency: dict[str, int] = field(default_factory=dict)
+
+
+class Scorer:
+    """Base class for relevance scorers."""
+
+    name = ""
+
+    # Whether score() needs file lengths and document frequencies
+    uses_corpus_stats = False
+
+    # Occurrences per keyword beyond which the score cannot grow (None = no
+    # cap), letting search stop reading a file early
+    count_cap: int | None = None
+
+    def score(
+        self,
+        keywords: list[str],
+        counts: dict[str, int],
+        length: int,
+        stats: CorpusStats | None,
+    ) -> float:
+        """
+        Score one file.
+
+        Args:
+            keywords: Query keywords (duplicates count once each time listed)
+            counts: Occurrences of each keyword in the file
+            length: File length in tokens
+            stats: Corpus statistics (only provided if uses_corpus_stats)
+
+        Returns:
+            Relevance score (0 means not relevant)
+        """
+        raise NotImplementedError
+
+
+class CountScorer(Scorer):
+    """Capped raw occurrence count per keyword."""
+
+    name = "count"
+    CAP_PER_KEYWORD = 10
+    count_cap = CAP_PER_KEYWORD
+
+    def score(self, keywords, counts, length, stats):
+        return sum(min(counts.get(k, 0), self.CAP_PER_KEYWORD) for k in keywords)
+
+
+class BM25Scorer(Scorer):
+    """Okapi BM25 with a smoothed, always-positive IDF."""
+
+    name = "bm25"
+    uses_corpus_stats = True
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def score(self, keywords, counts, length, stats):
+        if stats is None or stats.documents == 0:
+            return 0.0
+
+        length_ratio = length / stats.average_length if stats.average_length else 1.0
+        norm = self.k1 * (1 - self.b + self.b * length_ratio)
+
+        total = 0.0
+        for keyword in keywords:
+            tf = counts.get(keyword, 0)
+            if tf <= 0:
+                continue
+            df = stats.document_frequency.get(keyword, 0)
+            idf = math.log(1 + (stats.documents - df + 0.5) / (df + 0.5))
+            total += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return round(total, 4)
+
+
+SCORERS: dict[str, type[Scorer]] = {
+    CountScorer.name: CountScorer,
+    BM25Scorer.name: BM25Scorer,
+}
+
+
+def get_scorer(scorer: str | Scorer | None = None) -> Scorer:
+    """
+    Resolve a scorer name (or instance) to a Scorer.
+
+    Args:
+        scorer: Scorer name from SCORERS, a Scorer instance, or None for "count"
+
+    Returns:
+        Scorer instance
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if isinstance(scorer, Scorer):
+        return scorer
+    name = scorer or CountScorer.name
+    if name not in SCORERS:
+        raise ValueError(
+            f"Unknown scorer '{name}'. Available: {', '.join(sorted(SCORERS))}"
+        )
+    return SCORERS[name]()
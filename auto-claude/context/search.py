@@ -5,17 +5,112 @@ Code Search Functionality
 Search codebase for relevant files based on keywords.
 """
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
 from .constants import CODE_EXTENSIONS, SKIP_DIRS
+from .file_reader import iter_text_chunks, read_text_bounded
+from .keyword_matcher import KeywordMatcher
 from .models import FileMatch
+from .ranking import CorpusStats, Scorer, get_scorer
+from .search_index import SearchIndex, count_tokens, is_indexable_keyword
+
+# Maximum matches returned per service
+MAX_MATCHES_PER_SERVICE = 20
+
+
+def _scan_file(
+    file_path: Path,
+    keywords: list[str],
+    matcher: KeywordMatcher,
+    with_length: bool = False,
+    count_cap: int | None = None,
+) -> tuple[dict[str, int], list[str], list[tuple[int, str]], int] | None:
+    """
+    Stream one file through a single pass of the keyword matcher.
+
+    Module-level so it can run in a process pool. Memory use is bounded by
+    the per-file byte budget; binary and minified files scan as empty.
+
+    Args:
+        file_path: File to scan
+        keywords: Keywords being searched
+        matcher: Matcher compiled for the keywords
+        with_length: Also compute the file length in tokens (reads the
+            whole budget, so disables early termination)
+        count_cap: Stop reading once every keyword reaches this count
+
+    Returns:
+        (keyword counts, matching_keywords, matching_lines, length in tokens),
+        or None if unreadable. Length is only computed if with_length is set.
+    """
+    length = 0
+
+    def chunks():
+        nonlocal length
+        for chunk in iter_text_chunks(file_path):
+            if with_length:
+                length += count_tokens(chunk)
+            yield chunk
+
+    try:
+        scan = matcher.scan_chunks(
+            chunks(), count_cap=None if with_length else count_cap
+        )
+    except OSError:
+        return None
+
+    matching_keywords = []
+    matching_lines = []
+    for keyword in keywords:
+        if scan.matched(keyword):
+            matching_keywords.append(keyword)
+            # First 3 matching lines per keyword
+            matching_lines.extend(scan.matching_lines(keyword))
+
+    return scan.counts, matching_keywords, matching_lines, length
+
+
+def _rank_key(match: FileMatch) -> tuple[float, str]:
+    """Sort key: highest score first, ties broken by path for determinism."""
+    return (-match.relevance_score, match.path)
 
 
 class CodeSearcher:
     """Searches code files for relevant matches."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(
+        self,
+        project_dir: Path,
+        use_index: bool = True,
+        max_workers: int = 1,
+        use_processes: bool = False,
+        scorer: str | Scorer | None = None,
+    ):
+        """
+        Initialize the code searcher.
+
+        Args:
+            project_dir: Root directory of the project
+            use_index: Answer searches from the persistent token index
+                (falls back to a full scan for keywords it cannot serve)
+            max_workers: Number of workers used to read and score files
+                (1 = sequential)
+            use_processes: Use a process pool instead of a thread pool, for
+                CPU-bound tokenizing and scoring
+            scorer: Relevance scorer name ("count", "bm25") or instance
+                (default: "count")
+        """
         self.project_dir = project_dir.resolve()
+        self.inventory = FileInventory(self.project_dir)
+        self.index = SearchIndex.for_project(self.project_dir) if use_index else None
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.scorer = get_scorer(scorer)
 
     def search_service(
         self,
@@ -34,54 +129,184 @@ class CodeSearcher:
         Returns:
             List of FileMatch objects sorted by relevance
         """
+        if not service_path.exists():
+            return []
+
+        if self.uses_index(keywords):
+            return self._search_indexed(service_path, service_name, keywords)
+
+        return self._search_scan(service_path, service_name, keywords)
+
+    def uses_index(self, keywords: list[str]) -> bool:
+        """Check whether search_service answers these keywords from the index."""
+        return self.index is not None and all(is_indexable_keyword(k) for k in keywords)
+
+    def refresh_index(self, service_paths: list[Path]) -> None:
+        """
+        Bring the index up to date for several services in one pass.
+
+        Changed files are tokenized with this searcher's worker pool, so
+        callers that then search the services concurrently only read the
+        index instead of each starting a pool of their own.
+
+        Args:
+            service_paths: Service directories about to be searched
+        """
+        if self.index is None:
+            return
+        for service_path in service_paths:
+            if service_path.exists():
+                self.index.refresh(
+                    service_path, self._iter_code_files(service_path), mapper=self._map
+                )
+        self.index.save()
+
+    def _map(self, fn: Callable, items: list) -> Iterable:
+        """Apply fn to items, in order, using the configured worker pool."""
+        if self.max_workers <= 1 or len(items) < 2:
+            return map(fn, items)
+
+        if self.use_processes:
+            chunksize = max(1, len(items) // (self.max_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                return list(pool.map(fn, items, chunksize=chunksize))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(fn, items))
+
+    def _search_indexed(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """
+        Search a service using the token index.
+
+        Produces the same matches as _search_scan, but only reads the
+        top-ranked files (to extract their matching lines).
+        """
+        rel_paths = self.index.refresh(
+            service_path, self._iter_code_files(service_path), mapper=self._map
+        )
+        self.index.save()
+
+        hits = {keyword: self.index.find(keyword) for keyword in keywords}
+
+        stats = None
+        if self.scorer.uses_corpus_stats:
+            # Statistics over this service's files, like the full-scan path
+            total_length = sum(self.index.document_length(p) for p in rel_paths)
+            in_service = set(rel_paths)
+            stats = CorpusStats(
+                documents=len(rel_paths),
+                average_length=total_length / len(rel_paths) if rel_paths else 0.0,
+                document_frequency={
+                    keyword: sum(1 for p in hits[keyword] if p in in_service)
+                    for keyword in keywords
+                },
+            )
+
+        scored = []
+        for rel_path in rel_paths:
+            counts = {}
+            matching_keywords = []
+            for keyword in keywords:
+                hit = hits[keyword].get(rel_path)
+                if hit:
+                    counts[keyword] = hit[0]
+                    matching_keywords.append(keyword)
+            if not matching_keywords:
+                continue
+            score = self.scorer.score(
+                keywords, counts, self.index.document_length(rel_path), stats
+            )
+            if score > 0:
+                scored.append((rel_path, score, matching_keywords))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+
         matches = []
+        for rel_path, score, matching_keywords in scored[:MAX_MATCHES_PER_SERVICE]:
+            content = read_text_bounded(self.project_dir / rel_path)
+            if content is None:
+                continue
+            lines = content.split("\n")
 
-        if not service_path.exists():
-            return matches
-
-        for file_path in self._iter_code_files(service_path):
-            try:
-                content = file_path.read_text(errors="ignore")
-                content_lower = content.lower()
-
-                # Score this file
-                score = 0
-                matching_keywords = []
-                matching_lines = []
-
-                for keyword in keywords:
-                    if keyword in content_lower:
-                        # Count occurrences
-                        count = content_lower.count(keyword)
-                        score += min(count, 10)  # Cap at 10 per keyword
-                        matching_keywords.append(keyword)
-
-                        # Find matching lines (first 3 per keyword)
-                        lines = content.split("\n")
-                        found = 0
-                        for i, line in enumerate(lines, 1):
-                            if keyword in line.lower() and found < 3:
-                                matching_lines.append((i, line.strip()[:100]))
-                                found += 1
-
-                if score > 0:
-                    rel_path = str(file_path.relative_to(self.project_dir))
-                    matches.append(
-                        FileMatch(
-                            path=rel_path,
-                            service=service_name,
-                            reason=f"Contains: {', '.join(matching_keywords)}",
-                            relevance_score=score,
-                            matching_lines=matching_lines[:5],  # Top 5 lines
+            matching_lines = []
+            for keyword in matching_keywords:
+                for line_no in hits[keyword][rel_path][1]:
+                    if line_no <= len(lines):
+                        matching_lines.append(
+                            (line_no, lines[line_no - 1].strip()[:100])
                         )
-                    )
 
-            except (OSError, UnicodeDecodeError):
+            matches.append(
+                FileMatch(
+                    path=rel_path,
+                    service=service_name,
+                    reason=f"Contains: {', '.join(matching_keywords)}",
+                    relevance_score=score,
+                    matching_lines=matching_lines[:5],  # Top 5 lines
+                )
+            )
+
+        return matches
+
+    def _search_scan(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """Search a service by reading and scanning every code file."""
+        files = list(self._iter_code_files(service_path))
+        matcher = KeywordMatcher(keywords)
+        scan = partial(
+            _scan_file,
+            keywords=keywords,
+            matcher=matcher,
+            with_length=self.scorer.uses_corpus_stats,
+            count_cap=self.scorer.count_cap,
+        )
+        results = [
+            (file_path, result)
+            for file_path, result in zip(files, self._map(scan, files))
+            if result is not None
+        ]
+
+        stats = None
+        if self.scorer.uses_corpus_stats:
+            total_length = sum(result[3] for _, result in results)
+            stats = CorpusStats(
+                documents=len(results),
+                average_length=total_length / len(results) if results else 0.0,
+                document_frequency={
+                    keyword: sum(1 for _, result in results if result[0].get(keyword))
+                    for keyword in keywords
+                },
+            )
+
+        matches = []
+        for file_path, (counts, matching_keywords, matching_lines, length) in results:
+            if not matching_keywords:
                 continue
+            score = self.scorer.score(keywords, counts, length, stats)
+            if score > 0:
+                rel_path = str(file_path.relative_to(self.project_dir))
+                matches.append(
+                    FileMatch(
+                        path=rel_path,
+                        service=service_name,
+                        reason=f"Contains: {', '.join(matching_keywords)}",
+                        relevance_score=score,
+                        matching_lines=matching_lines[:5],  # Top 5 lines
+                    )
+                )
 
         # Sort by relevance
-        matches.sort(key=lambda m: m.relevance_score, reverse=True)
-        return matches[:20]  # Top 20 per service
+        matches.sort(key=_rank_key)
+        return matches[:MAX_MATCHES_PER_SERVICE]
 
     def _iter_code_files(self, directory: Path):
         """
@@ -93,9 +318,6 @@ class CodeSearcher:
         Yields:
             Path objects for code files
         """
-        for item in directory.rglob("*"):
-            if item.is_file() and item.suffix in CODE_EXTENSIONS:
-                # Check if in skip directory
-                parts = item.relative_to(directory).parts
-                if not any(part in SKIP_DIRS for part in parts):
-                    yield item
+        yield from self.inventory.iter_paths(
+            directory, extensions=CODE_EXTENSIONS, skip_dirs=SKIP_DIRS
+        )
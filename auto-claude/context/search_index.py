@@ -0,0 +1,291 @@
+"""
+Persistent Search Index
+=======================
+
+Inverted keyword index used by CodeSearcher so context building does not
+re-read every file in a service on every call.
+
+The index maps lowercase identifier tokens to the files that contain them,
+together with an occurrence count and the first few line numbers per file.
+File entries are keyed by mtime and size, so only changed files are
+re-tokenized on refresh. When the project has an installed .auto-claude/
+directory the index is persisted there between runs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from core.file_io import atomic_write_json
+
+from .file_reader import read_text_bounded
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "search_index.json"
+INDEX_VERSION = 3
+
+# Tokens are maximal runs of identifier characters in the lowercased text.
+# Any keyword made only of these characters can never span two tokens, so
+# substring counts over tokens equal substring counts over the whole file.
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+# Line numbers remembered per (token, file)
+MAX_LINES_PER_TOKEN = 3
+
+
+def is_indexable_keyword(keyword: str) -> bool:
+    """Check whether a keyword can be answered from the token index."""
+    return bool(TOKEN_PATTERN.fullmatch(keyword))
+
+
+def tokenize_content(content: str) -> dict[str, list]:
+    """
+    Tokenize file content for the index.
+
+    Args:
+        content: Raw file content
+
+    Returns:
+        Dictionary mapping token -> [occurrence_count, [first line numbers]]
+    """
+    tokens: dict[str, list] = {}
+    for line_no, line in enumerate(content.lower().split("\n"), 1):
+        for token in TOKEN_PATTERN.findall(line):
+            entry = tokens.get(token)
+            if entry is None:
+                tokens[token] = [1, [line_no]]
+                continue
+            entry[0] += 1
+            lines = entry[1]
+            if lines[-1] != line_no and len(lines) < MAX_LINES_PER_TOKEN:
+                lines.append(line_no)
+    return tokens
+
+
+def count_tokens(content: str) -> int:
+    """File length in tokens, as stored in index records."""
+    return len(TOKEN_PATTERN.findall(content.lower()))
+
+
+def build_record(file_path: Path) -> dict | None:
+    """
+    Read and tokenize one file into an index record.
+
+    Module-level so refresh() can fan it out to a process pool.
+
+    Returns:
+        Index record, or None if the file could not be read
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    # Same bounded view of the file as a full scan (binary/minified -> "")
+    content = read_text_bounded(file_path)
+    if content is None:
+        return None
+    tokens = tokenize_content(content)
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        # File length in tokens, for length-normalized ranking
+        "length": sum(entry[0] for entry in tokens.values()),
+        "tokens": tokens,
+    }
+
+
+class SearchIndex:
+    """Token -> file inverted index with incremental, stat-based refresh."""
+
+    def __init__(self, project_dir: Path, index_file: Path | None = None):
+        """
+        Initialize the search index.
+
+        Args:
+            project_dir: Root directory of the project
+            index_file: Where to persist the index (None = in-memory only)
+        """
+        self.project_dir = project_dir.resolve()
+        self.index_file = index_file
+        self._files: dict[str, dict] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._loaded = False
+        self._dirty = False
+        # Services may be searched concurrently against one index
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> SearchIndex:
+        """Create an index persisted under .auto-claude/ if it is installed."""
+        auto_claude_dir = project_dir / ".auto-claude"
+        index_file = (
+            auto_claude_dir / INDEX_FILENAME if auto_claude_dir.is_dir() else None
+        )
+        return cls(project_dir, index_file)
+
+    def load(self) -> None:
+        """Load the persisted index from disk (once)."""
+        with self._lock:
+            self._load()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.index_file or not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable search index: {e}")
+            return
+
+        if data.get("version") != INDEX_VERSION:
+            return
+
+        self._files = data.get("files", {})
+        for rel_path, record in self._files.items():
+            self._add_postings(rel_path, record)
+
+    def save(self) -> None:
+        """Persist the index if it changed since the last save."""
+        with self._lock:
+            if not self._dirty or not self.index_file:
+                return
+            self._save()
+
+    def _save(self) -> None:
+        try:
+            atomic_write_json(
+                self.index_file,
+                {"version": INDEX_VERSION, "files": self._files},
+                indent=None,
+            )
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save search index: {e}")
+
+    def refresh(
+        self,
+        root: Path,
+        files: Iterable[Path],
+        mapper: Callable = map,
+    ) -> list[str]:
+        """
+        Bring the index up to date for every file under a root directory.
+
+        Files whose mtime and size are unchanged are not re-read. Indexed
+        files under the root that are no longer present are dropped.
+
+        Args:
+            root: Directory that the file listing covers
+            files: Current code files under root
+            mapper: Ordered map function used to read and tokenize changed
+                files (e.g. a thread or process pool's map)
+
+        Returns:
+            Relative paths of the indexed files, in listing order
+        """
+        with self._lock:
+            self._load()
+
+            listed = []
+            changed = []
+            for file_path in files:
+                rel_path = str(file_path.relative_to(self.project_dir))
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+
+                listed.append(rel_path)
+                record = self._files.get(rel_path)
+                if (
+                    record is None
+                    or record["mtime_ns"] != stat.st_mtime_ns
+                    or record["size"] != stat.st_size
+                ):
+                    changed.append((rel_path, file_path))
+
+        # Tokenize outside the lock so concurrent refreshes of other roots
+        # (and find() calls) are not serialized behind the mapper pool
+        records = list(mapper(build_record, [file_path for _, file_path in changed]))
+
+        with self._lock:
+            unreadable = set()
+            for (rel_path, _), record in zip(changed, records):
+                if record is None:
+                    unreadable.add(rel_path)
+                self._set_record(rel_path, record)
+
+            rel_paths = [p for p in listed if p not in unreadable]
+
+            # Drop entries for files under this root that have disappeared
+            root_rel = root.resolve().relative_to(self.project_dir)
+            prefix = "" if root_rel == Path(".") else f"{root_rel}{os.sep}"
+            seen = set(rel_paths)
+            stale = [p for p in self._files if p.startswith(prefix) and p not in seen]
+            for rel_path in stale:
+                self._set_record(rel_path, None)
+
+            return rel_paths
+
+    def find(self, keyword: str) -> dict[str, tuple[int, list[int]]]:
+        """
+        Find all indexed files containing a keyword as a substring.
+
+        Args:
+            keyword: Lowercase keyword (must satisfy is_indexable_keyword)
+
+        Returns:
+            Dictionary mapping relative path -> (occurrence count, first line numbers)
+        """
+        hits: dict[str, list] = {}
+        with self._lock:
+            self._load()
+            for token in [t for t in self._postings if keyword in t]:
+                per_token = token.count(keyword)
+                for rel_path in self._postings[token]:
+                    count, lines = self._files[rel_path]["tokens"][token]
+                    entry = hits.setdefault(rel_path, [0, set()])
+                    entry[0] += count * per_token
+                    entry[1].update(lines)
+
+        return {
+            rel_path: (count, sorted(lines)[:MAX_LINES_PER_TOKEN])
+            for rel_path, (count, lines) in hits.items()
+        }
+
+    def document_length(self, rel_path: str) -> int:
+        """File length in tokens (0 if the file is not indexed)."""
+        record = self._files.get(rel_path)
+        return record["length"] if record else 0
+
+    def _set_record(self, rel_path: str, record: dict | None) -> None:
+        """Replace (or remove, if record is None) the entry for a file."""
+        old = self._files.pop(rel_path, None)
+        if old is not None:
+            for token in old["tokens"]:
+                paths = self._postings.get(token)
+                if paths is not None:
+                    paths.discard(rel_path)
+                    if not paths:
+                        del self._postings[token]
+        if record is not None:
+            self._files[rel_path] = record
+            self._add_postings(rel_path, record)
+        self._dirty = True
+
+    def _add_postings(self, rel_path: str, record: dict) -> None:
+        for token in record["tokens"]:
+            self._postings.setdefault(token, set()).add(rel_path)
@@ -0,0 +1,299 @@
+"""
+Shared file inventory.
+
+Analyzers, context search and merge tracking all need "every file under this
+directory, filtered by extension". Instead of each of them walking the disk
+with rglob, they consume a FileInventory that snapshots the file list once
+and serves filtered views from memory:
+
+- Inside a git repository, tracked files come from ``git ls-files -z`` and are
+  cached process-wide, keyed by HEAD and the index mtime. Untracked (but not
+  ignored) files and deleted tracked files are picked up with a single extra
+  ``git ls-files`` call per snapshot.
+- Outside a git repository, the inventory falls back to a single os.walk.
+
+A snapshot lives as long as the FileInventory instance (call refresh() to
+take a new one), so share an instance across everything that runs as part
+of one analysis.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import subprocess
+from collections.abc import Iterable, Iterator
+from pathlib import Path, PurePosixPath
+
+# Directories pruned when walking a directory that is not a git repository
+WALK_SKIP_DIRS = {
+    ".git",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".worktrees",
+    ".auto-claude",
+    ".pytest_cache",
+    ".mypy_cache",
+}
+
+# (git_dir, root) -> (cache key, tracked relative paths)
+_tracked_cache: dict[tuple[str, str], tuple[tuple, list[str]]] = {}
+
+
+def _run_git(args: list[str], cwd: Path) -> str | None:
+    """Run a git command, returning stdout or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+        )
+    except (OSError, ValueError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _split_z(output: str) -> list[str]:
+    """Split NUL-separated git output, dropping directory entries."""
+    return [p for p in output.split("\0") if p and not p.endswith("/")]
+
+
+def _match_glob(pattern_parts: tuple[str, ...], path_parts: list[str]) -> bool:
+    """Match path segments against pathlib-style glob segments ("**" = any depth)."""
+    if not pattern_parts:
+        return not path_parts
+    head, rest = pattern_parts[0], pattern_parts[1:]
+    if head == "**":
+        return any(
+            _match_glob(rest, path_parts[i:]) for i in range(len(path_parts) + 1)
+        )
+    return (
+        bool(path_parts)
+        and fnmatch.fnmatchcase(path_parts[0], head)
+        and _match_glob(rest, path_parts[1:])
+    )
+
+
+class FileInventory:
+    """Cached listing of the files under a root directory."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize the inventory (no I/O happens until first use).
+
+        Args:
+            root: Directory whose files should be listed
+        """
+        self.root = Path(root).resolve()
+        self._git_dir: Path | None = None
+        self._git_checked = False
+        self._tracked: list[str] | None = None
+        self._files: list[str] | None = None
+        self._dirs: set[str] | None = None
+
+    @property
+    def is_git(self) -> bool:
+        """Whether the root is inside a git work tree."""
+        self._resolve_git()
+        return self._git_dir is not None
+
+    def refresh(self) -> None:
+        """Drop the snapshot so the next query re-lists files."""
+        self._tracked = None
+        self._files = None
+        self._dirs = None
+
+    def tracked_files(self) -> list[str]:
+        """
+        Get git-tracked files under the root.
+
+        Returns:
+            Sorted POSIX paths relative to root (empty outside git)
+        """
+        if self._tracked is None:
+            self._tracked = self._list_tracked() if self.is_git else []
+        return self._tracked
+
+    def files(self) -> list[str]:
+        """
+        Get all files under the root: tracked plus untracked, non-ignored.
+
+        Returns:
+            Sorted POSIX paths relative to root
+        """
+        if self._files is None:
+            if self.is_git:
+                self._files = self._list_git_worktree()
+            else:
+                self._files = self._walk()
+        return self._files
+
+    def iter_paths(
+        self,
+        base: Path | None = None,
+        extensions: Iterable[str] | None = None,
+        skip_dirs: Iterable[str] | None = None,
+        tracked_only: bool = False,
+    ) -> Iterator[Path]:
+        """
+        Iterate over files under a base directory.
+
+        Args:
+            base: Directory to restrict to (default: the inventory root)
+            extensions: Only yield files with one of these suffixes
+            skip_dirs: Skip files with any of these names in their path
+                (relative to base)
+            tracked_only: Only yield git-tracked files
+
+        Yields:
+            Absolute Path objects, in sorted order
+        """
+        prefix = self._prefix_for(base)
+        if prefix is None:
+            # Base lies outside this inventory - list it on its own
+            yield from FileInventory(base).iter_paths(
+                extensions=extensions, skip_dirs=skip_dirs, tracked_only=tracked_only
+            )
+            return
+
+        exts = set(extensions) if extensions is not None else None
+        skip = set(skip_dirs) if skip_dirs else None
+        for rel in self.tracked_files() if tracked_only else self.files():
+            if not rel.startswith(prefix):
+                continue
+            if exts is not None and PurePosixPath(rel).suffix not in exts:
+                continue
+            if skip and any(part in skip for part in rel[len(prefix) :].split("/")):
+                continue
+            yield self.root / rel
+
+    def glob(self, pattern: str, base: Path | None = None) -> list[Path]:
+        """
+        Match a pathlib-style glob pattern against the inventory.
+
+        Like Path.glob, directories match too (any directory that contains
+        at least one listed file).
+
+        Args:
+            pattern: Glob pattern relative to base (e.g. "**/*.py")
+            base: Directory the pattern is relative to (default: root)
+
+        Returns:
+            Sorted list of matching absolute paths
+        """
+        prefix = self._prefix_for(base)
+        if prefix is None:
+            return FileInventory(base).glob(pattern)
+
+        pattern_parts = PurePosixPath(pattern).parts
+        candidates = [*self.files(), *self._directories()]
+
+        if len(pattern_parts) == 2 and pattern_parts[0] == "**":
+            # Common "**/<name>" case: only the last segment matters
+            name_pattern = pattern_parts[1]
+            matches = [
+                rel
+                for rel in candidates
+                if rel.startswith(prefix)
+                and fnmatch.fnmatchcase(rel.rpartition("/")[2], name_pattern)
+            ]
+        else:
+            matches = [
+                rel
+                for rel in candidates
+                if rel.startswith(prefix)
+                and _match_glob(pattern_parts, rel[len(prefix) :].split("/"))
+            ]
+        return sorted(self.root / rel for rel in matches)
+
+    def _prefix_for(self, base: Path | None) -> str | None:
+        """Relative POSIX prefix for base, or None if base is outside root."""
+        if base is None:
+            return ""
+        try:
+            rel = Path(base).resolve().relative_to(self.root)
+        except ValueError:
+            return None
+        rel_posix = rel.as_posix()
+        return "" if rel_posix == "." else f"{rel_posix}/"
+
+    def _directories(self) -> set[str]:
+        if self._dirs is None:
+            dirs = set()
+            for rel in self.files():
+                parent = rel.rpartition("/")[0]
+                while parent and parent not in dirs:
+                    dirs.add(parent)
+                    parent = parent.rpartition("/")[0]
+            self._dirs = dirs
+        return self._dirs
+
+    def _resolve_git(self) -> None:
+        if self._git_checked:
+            return
+        self._git_checked = True
+        if not self.root.is_dir():
+            return
+        output = _run_git(["rev-parse", "--absolute-git-dir"], self.root)
+        if output and output.strip():
+            self._git_dir = Path(output.strip())
+
+    def _cache_key(self) -> tuple:
+        """Key that changes whenever HEAD or the index changes."""
+        key: list = []
+        head_file = self._git_dir / "HEAD"
+        try:
+            head = head_file.read_text().strip()
+        except OSError:
+            head = ""
+        key.append(head)
+        if head.startswith("ref: "):
+            ref_file = self._git_dir / head[5:]
+            key.append(ref_file.stat().st_mtime_ns if ref_file.exists() else 0)
+        index_file = self._git_dir / "index"
+        key.append(index_file.stat().st_mtime_ns if index_file.exists() else 0)
+        return tuple(key)
+
+    def _list_tracked(self) -> list[str]:
+        cache_id = (str(self._git_dir), str(self.root))
+        key = self._cache_key()
+        cached = _tracked_cache.get(cache_id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        output = _run_git(["ls-files", "-z"], self.root)
+        tracked = sorted(_split_z(output)) if output is not None else []
+        _tracked_cache[cache_id] = (key, tracked)
+        return tracked
+
+    def _list_git_worktree(self) -> list[str]:
+        files = set(self.tracked_files())
+        output = _run_git(
+            ["ls-files", "-z", "-t", "--others", "--deleted", "--exclude-standard"],
+            self.root,
+        )
+        for entry in _split_z(output or ""):
+            tag, _, rel = entry.partition(" ")
+            if tag == "?":
+                files.add(rel)
+            elif tag == "R":
+                files.discard(rel)
+        return sorted(files)
+
+    def _walk(self) -> list[str]:
+        files = []
+        if not self.root.is_dir():
+            return files
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in WALK_SKIP_DIRS]
+            rel_dir = Path(dirpath).relative_to(self.root).as_posix()
+            for name in filenames:
+                files.append(name if rel_dir == "." else f"{rel_dir}/{name}")
+        return sorted(files)
@@ -0,0 +1,384 @@
+"""
+Batched git object access.
+
+Merge refresh, the file timeline and workspace merges read many blobs
+(``git show <ref>:<path>``), commit headers and per-file diffs. Spawning one
+git process per file dominates refresh time on large task branches, so this
+module keeps a long-lived ``git cat-file --batch`` worker per repository and
+serves many objects through it in one round trip:
+
+- GitObjectReader.read_texts() resolves any number of ``<rev>:<path>`` specs
+  by streaming them to the worker and parsing the responses in order.
+- GitObjectReader.commit_info() reads commit metadata from the raw commit
+  object instead of one ``git log`` call per field.
+- diff_per_file() runs a single ``git diff`` and splits it by file.
+
+Readers are shared process-wide through get_object_reader(): at most
+MAX_OBJECT_READERS are kept (least recently used closed first), a reader is
+dropped when its worker fails twice in a row or its worktree is removed
+(close_object_reader()), and the rest are closed at interpreter exit. Decoded text matches what ``subprocess.run(..., text=True)``
+returned before (universal newlines), with undecodable bytes replaced.
+"""
+
+from __future__ import annotations
+
+import atexit
+import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+# Maximum number of repositories/worktrees with a live cat-file worker
+MAX_OBJECT_READERS = 16
+
+# Resolved repository path -> shared reader, least recently used first
+_readers: OrderedDict[str, GitObjectReader] = OrderedDict()
+_readers_lock = threading.Lock()
+
+
+def _decode(data: bytes) -> str:
+    """Decode git output the way text-mode subprocess pipes did."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class GitObjectReader:
+    """
+    Long-lived ``git cat-file --batch`` worker for one repository.
+
+    The worker is started on first use and restarted if it dies. All requests
+    are serialized by a lock, so one reader can be shared between threads.
+    """
+
+    def __init__(self, repo_path: Path):
+        """
+        Initialize the reader.
+
+        Args:
+            repo_path: Any directory inside the repository (or worktree)
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        # Number of cat-file processes started; normally 1 per reader
+        self.spawn_count = 0
+
+    def read_text(self, spec: str) -> str | None:
+        """
+        Read one object as text.
+
+        Args:
+            spec: Object name, usually ``<rev>:<path>``
+
+        Returns:
+            Object content, or None if it does not exist
+        """
+        return self.read_texts([spec])[spec]
+
+    def read_texts(self, specs: Iterable[str]) -> dict[str, str | None]:
+        """
+        Read many objects as text in one round trip.
+
+        Args:
+            specs: Object names, usually ``<rev>:<path>``
+
+        Returns:
+            Dictionary mapping each spec to its content (None if missing)
+        """
+        return {
+            spec: None if data is None else _decode(data)
+            for spec, data in self.read_objects(specs).items()
+        }
+
+    def read_objects(self, specs: Iterable[str]) -> dict[str, bytes | None]:
+        """
+        Read the raw content of many objects in one round trip.
+
+        Args:
+            specs: Object names accepted by ``git cat-file --batch``
+
+        Returns:
+            Dictionary mapping each spec to its raw content (None if missing)
+        """
+        return {
+            spec: None if obj is None else obj[2]
+            for spec, obj in self._batch(specs).items()
+        }
+
+    def resolve(self, rev: str) -> str | None:
+        """
+        Resolve a revision to a full object id (like ``git rev-parse``).
+
+        Returns:
+            Object id, or None if the revision does not exist
+        """
+        obj = self._batch([rev])[rev]
+        return obj[0] if obj else None
+
+    def commit_info(self, commits: Iterable[str]) -> dict[str, dict[str, str]]:
+        """
+        Read subject and author name for many commits in one round trip.
+
+        Args:
+            commits: Commit-ish revisions
+
+        Returns:
+            Dictionary mapping each found commit to {"message", "author"}
+        """
+        info: dict[str, dict[str, str]] = {}
+        for rev, obj in self._batch(commits).items():
+            if obj is None or obj[1] != "commit":
+                continue
+            headers, _, body = _decode(obj[2]).partition("\n\n")
+            author = ""
+            for line in headers.split("\n"):
+                if line.startswith("author "):
+                    # "author Name <email> timestamp tz"
+                    author = line[len("author ") :].rsplit("<", 1)[0].strip()
+                    break
+            # %s: the first paragraph of the message, joined into one line
+            subject = " ".join(
+                line.strip() for line in body.strip().split("\n\n")[0].split("\n")
+            )
+            info[rev] = {"message": subject.strip(), "author": author}
+        return info
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            self._stop()
+
+    def _batch(self, specs: Iterable[str]) -> dict[str, tuple[str, str, bytes] | None]:
+        """Send specs to the worker and parse (oid, type, content) per spec."""
+        unique = list(dict.fromkeys(specs))
+        if not unique:
+            return {}
+        # Newlines would desynchronize the request/response stream
+        results: dict[str, tuple[str, str, bytes] | None] = {
+            spec: None for spec in unique if "\n" in spec
+        }
+        pending = [spec for spec in unique if spec not in results]
+        if not pending:
+            return results
+
+        with self._lock:
+            try:
+                results.update(self._exchange(pending))
+            except (OSError, ValueError):
+                # Worker died (e.g. repository moved); retry once with a new one
+                self._stop()
+                try:
+                    results.update(self._exchange(pending))
+                except (OSError, ValueError):
+                    # Repository is gone or not a repository: stop sharing
+                    # this reader so a dead path does not keep a slot
+                    self._stop()
+                    _forget_reader(self)
+                    raise
+        return results
+
+    def _exchange(self, specs: list[str]) -> dict[str, tuple[str, str, bytes] | None]:
+        proc = self._ensure_started()
+        request = "".join(f"{spec}\n" for spec in specs).encode("utf-8")
+
+        # Feed the worker from a separate thread: with many specs, git blocks
+        # writing responses we have not read yet while we block writing input
+        errors: list[BaseException] = []
+
+        def feed() -> None:
+            try:
+                proc.stdin.write(request)
+                proc.stdin.flush()
+            except BaseException as e:  # reported to the reading thread
+                errors.append(e)
+
+        writer = None
+        if len(request) <= 4096:
+            feed()
+        else:
+            writer = threading.Thread(target=feed, daemon=True)
+            writer.start()
+
+        results: dict[str, tuple[str, str, bytes] | None] = {}
+        try:
+            for spec in specs:
+                header = proc.stdout.readline()
+                if not header:
+                    raise OSError("git cat-file exited unexpectedly")
+                text = header.decode("utf-8", errors="replace").rstrip("\n")
+                # "<spec> missing" (the spec itself may contain spaces)
+                parts = text.split(" ")
+                if len(parts) != 3 or not parts[2].isdigit():
+                    results[spec] = None
+                    continue
+                oid, obj_type, size = parts
+                content = proc.stdout.read(int(size))
+                proc.stdout.read(1)  # trailing newline
+                results[spec] = (oid, obj_type, content)
+        finally:
+            if writer is not None:
+                writer.join()
+        if errors:
+            raise OSError(f"git cat-file write failed: {errors[0]}")
+        return results
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self.spawn_count += 1
+        return self._proc
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        if proc.stdout:
+            proc.stdout.close()
+
+
+def get_object_reader(repo_path: Path) -> GitObjectReader:
+    """
+    Get the shared reader for a repository (or worktree) directory.
+
+    Args:
+        repo_path: Directory the git commands would run in
+
+    Returns:
+        GitObjectReader reused across calls for the same directory
+    """
+    key = str(Path(repo_path).resolve())
+    evicted = []
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = _readers[key] = GitObjectReader(Path(key))
+        _readers.move_to_end(key)
+        while len(_readers) > MAX_OBJECT_READERS:
+            evicted.append(_readers.popitem(last=False)[1])
+    for old in evicted:
+        old.close()
+    return reader
+
+
+def close_object_reader(repo_path: Path) -> None:
+    """
+    Stop and forget the shared reader for a directory, if there is one.
+
+    Call when a worktree is removed so its worker does not outlive it.
+    """
+    key = str(Path(repo_path).resolve())
+    with _readers_lock:
+        reader = _readers.pop(key, None)
+    if reader is not None:
+        reader.close()
+
+
+def _forget_reader(reader: GitObjectReader) -> None:
+    """Drop a reader from the shared map (its worker is already stopped)."""
+    key = str(reader.repo_path)
+    with _readers_lock:
+        if _readers.get(key) is reader:
+            del _readers[key]
+
+
+@atexit.register
+def close_object_readers() -> None:
+    """Stop every shared reader's worker process."""
+    with _readers_lock:
+        readers = list(_readers.values())
+        _readers.clear()
+    for reader in readers:
+        reader.close()
+
+
+def _diff_header_path(header: str) -> str | None:
+    """Extract the path from a ``diff --git a/<p> b/<p>`` header (no renames)."""
+    rest = header[len("diff --git ") :]
+    if rest.startswith('"'):
+        return None  # quoted (unusual characters): caller falls back
+    # Both sides name the same path: "a/" + p + " b/" + p
+    length = (len(rest) - len("a/ b/")) // 2
+    path = rest[2 : 2 + length]
+    if rest != f"a/{path} b/{path}":
+        return None
+    return path
+
+
+def diff_per_file(
+    cwd: Path, rev_range: str, paths: list[str] | None = None
+) -> dict[str, str]:
+    """
+    Run one ``git diff`` and split its output into per-file patches.
+
+    Equivalent to running ``git diff <rev_range> -- <path>`` for each path,
+    but with a single git process.
+
+    Args:
+        cwd: Directory to run git in
+        rev_range: Revision range, e.g. ``main...HEAD``
+        paths: Limit the diff to these paths (None = all changed files)
+
+    Returns:
+        Dictionary mapping each path to its patch text ("" if unchanged)
+
+    Raises:
+        subprocess.CalledProcessError: If git diff fails
+    """
+    # Rename detection would pair files the per-path form reports separately
+    cmd = ["git", "diff", "--no-renames", rev_range]
+    if paths is not None:
+        if not paths:
+            return {}
+        cmd += ["--", *paths]
+    result = subprocess.run(cmd, cwd=cwd, capture_output=True, check=True)
+    output = _decode(result.stdout)
+
+    diffs: dict[str, str] = {}
+    unparsed = False
+    current: str | None = None
+    chunk: list[str] = []
+
+    def flush() -> None:
+        if current is not None:
+            diffs[current] = "".join(chunk)
+
+    for line in output.splitlines(keepends=True):
+        if line.startswith("diff --git "):
+            flush()
+            current = _diff_header_path(line.rstrip("\n"))
+            chunk = [line]
+            unparsed = unparsed or current is None
+        else:
+            chunk.append(line)
+    flush()
+
+    if paths is None:
+        return diffs
+
+    # Paths git had to quote are diffed individually
+    if unparsed:
+        for path in paths:
+            if path not in diffs:
+                single = subprocess.run(
+                    ["git", "diff", "--no-renames", rev_range, "--", path],
+                    cwd=cwd,
+                    capture_output=True,
+                    check=True,
+                )
+                diffs[path] = _decode(single.stdout)
+    return {path: diffs.get(path, "") for path in paths}
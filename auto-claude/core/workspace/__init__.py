@@ -74,6 +74,7 @@ from .git_utils import (
     get_current_branch,
     get_existing_build_worktree,
     get_file_content_from_ref,
+    get_files_content_from_ref,
     has_uncommitted_changes,
     is_binary_file,
     is_lock_file,
@@ -117,6 +118,7 @@ __all__ = [
     "get_current_branch",
     "get_existing_build_worktree",
     "get_file_content_from_ref",
+    "get_files_content_from_ref",
     "get_changed_files_from_branch",
     "is_process_running",
     "is_binary_file",
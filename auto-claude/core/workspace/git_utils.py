@@ -10,6 +10,8 @@ import json
 import subprocess
 from pathlib import Path
 
+from core.git_batch import get_object_reader
+
 # Constants for merge limits
 MAX_FILE_LINES_FOR_AI = 5000  # Skip AI for files larger than this
 MAX_PARALLEL_AI_MERGES = 5  # Limit concurrent AI merge operations
@@ -127,15 +129,34 @@ def get_file_content_from_ref(
     project_dir: Path, ref: str, file_path: str
 ) -> str | None:
     """Get file content from a git ref (branch, commit, etc.)."""
-    result = subprocess.run(
-        ["git", "show", f"{ref}:{file_path}"],
-        cwd=project_dir,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        return result.stdout
-    return None
+    try:
+        return get_object_reader(project_dir).read_text(f"{ref}:{file_path}")
+    except OSError:
+        # Not a git repository (or git is unavailable)
+        return None
+
+
+def get_files_content_from_ref(
+    project_dir: Path, ref: str, file_paths: list[str]
+) -> dict[str, str | None]:
+    """
+    Get the content of many files at a git ref in one round trip.
+
+    Args:
+        project_dir: Project directory
+        ref: Branch, commit or other revision
+        file_paths: Paths relative to the repository root
+
+    Returns:
+        Dictionary mapping each path to its content (None if missing at ref)
+    """
+    try:
+        contents = get_object_reader(project_dir).read_texts(
+            f"{ref}:{path}" for path in file_paths
+        )
+    except OSError:
+        return dict.fromkeys(file_paths)
+    return {path: contents[f"{ref}:{path}"] for path in file_paths}
 
 
 def get_changed_files_from_branch(
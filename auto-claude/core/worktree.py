@@ -22,6 +22,8 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from core.git_batch import close_object_reader
+
 
 class WorktreeError(Exception):
     """Error during worktree operations."""
@@ -322,6 +324,7 @@ class WorktreeManager:
 
         # Remove existing if present (from crashed previous run)
         if worktree_path.exists():
+            close_object_reader(worktree_path)
             self._run_git(["worktree", "remove", "--force", str(worktree_path)])
 
         # Delete branch if it exists (from previous attempt)
@@ -375,6 +378,9 @@ class WorktreeManager:
         worktree_path = self.get_worktree_path(spec_name)
         branch_name = self.get_branch_name(spec_name)
 
+        # Stop any cat-file worker still serving this worktree
+        close_object_reader(worktree_path)
+
         if worktree_path.exists():
             result = self._run_git(
                 ["worktree", "remove", "--force", str(worktree_path)]
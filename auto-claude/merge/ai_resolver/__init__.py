@@ -10,6 +10,8 @@ minimal context to reduce token usage and cost.
 Components:
 - AIResolver: Main resolver class
 - ConflictContext: Minimal context for AI prompts
+- ResolutionCache: Reuse of resolutions by hash of their inputs
+- ResolutionRequest / pack_batches: Token-budgeted batching across files
 - create_claude_resolver: Factory for Claude-based resolver
 
 Usage:
@@ -25,12 +27,17 @@ Usage:
     result = resolver.resolve_conflict(conflict, baseline_code, task_snapshots)
 """
 
+from .cache import ResolutionCache
 from .claude_client import create_claude_resolver
 from .context import ConflictContext
 from .resolver import AIResolver
+from .scheduler import ResolutionRequest, pack_batches
 
 __all__ = [
     "AIResolver",
     "ConflictContext",
+    "ResolutionCache",
+    "ResolutionRequest",
     "create_claude_resolver",
+    "pack_batches",
 ]
@@ -0,0 +1,205 @@
+"""
+Resolution Cache
+================
+
+Cache of successful AI conflict resolutions.
+
+A resolution depends only on what the AI is shown: the baseline code at the
+conflict location, each task's intent and changed snippets, and the conflict
+description. Resolutions are stored under a hash of those inputs
+(ConflictContext.cache_key), so re-running a merge after a partial failure,
+or resolving the same conflict again, reuses the answer instead of paying
+for another call.
+
+Entries live in memory (an LRU bounded by entry count) and, when a cache
+directory is given, as one JSON file per entry so later merge runs reuse
+them. The directory is bounded the same way as the element cache: reads
+refresh an entry's mtime, and once the count is exceeded the least recently
+used files are deleted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from core.file_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Bump when prompts change in a way that invalidates stored resolutions
+CACHE_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 256
+
+DEFAULT_MAX_DISK_ENTRIES = 2048
+
+
+class ResolutionCache:
+    """Thread-safe LRU of context hash -> merged code, optionally on disk."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persistent entries (None = memory only)
+            max_entries: Maximum resolutions kept in memory
+            max_disk_entries: Maximum entry files kept in cache_dir
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        # Entry files in cache_dir, counted on the first save
+        self._disk_count: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a resolution.
+
+        Args:
+            key: ConflictContext.cache_key of the conflict
+
+        Returns:
+            Merged code, or None on a miss
+        """
+        with self._lock:
+            merged = self._entries.get(key)
+        if merged is None:
+            merged = self._load(key)
+        with self._lock:
+            if merged is None:
+                self.misses += 1
+                return None
+            self._remember(key, merged)
+            self.hits += 1
+        return merged
+
+    def put(self, key: str, merged_code: str) -> None:
+        """
+        Store a successful resolution.
+
+        Args:
+            key: ConflictContext.cache_key of the conflict
+            merged_code: Merged code the AI produced
+        """
+        with self._lock:
+            self._remember(key, merged_code)
+        self._save(key, merged_code)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        # Same validity check as get(): stale versions are not entries
+        return self._load(key) is not None
+
+    def prune_disk(self, keep: int | None = None) -> int:
+        """
+        Delete the least recently used entry files from cache_dir.
+
+        Args:
+            keep: Entry files to keep (default: three quarters of
+                max_disk_entries, so pruning is not repeated on every put)
+
+        Returns:
+            Number of files deleted
+        """
+        if self.cache_dir is None:
+            return 0
+        if keep is None:
+            keep = self.max_disk_entries * 3 // 4
+
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        files.sort(reverse=True)
+
+        removed = 0
+        for _, path in files[keep:]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_count = len(files) - removed
+        return removed
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def _remember(self, key: str, merged_code: str) -> None:
+        """Insert under the lock, evicting least recently used entries."""
+        self._entries[key] = merged_code
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> str | None:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return None
+            merged_code = data["merged_code"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable resolution cache entry {path}: {e}")
+            return None
+
+        # Mark the entry as recently used for prune_disk()
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return merged_code
+
+    def _save(self, key: str, merged_code: str) -> None:
+        if self.cache_dir is None:
+            return
+        data = {"version": CACHE_VERSION, "merged_code": merged_code}
+        try:
+            atomic_write_json(self._path(key), data, indent=None)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not persist resolution cache entry: {e}")
+            return
+
+        with self._lock:
+            if self._disk_count is None:
+                self._disk_count = sum(1 for _ in self.cache_dir.glob("*.json"))
+            else:
+                self._disk_count += 1
+            over_limit = self._disk_count > self.max_disk_entries
+        if over_limit:
+            self.prune_disk()
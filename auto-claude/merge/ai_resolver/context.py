@@ -11,6 +11,8 @@ optimized for minimal token usage.
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -77,3 +79,36 @@ class ConflictContext:
         text = self.to_prompt_context()
         # Rough estimate: 4 chars per token for code
         return len(text) // 4
+
+    @property
+    def cache_key(self) -> str:
+        """
+        Hash of everything a resolution depends on.
+
+        Covers the language, location, baseline code, each task's intent and
+        changed snippets, and the conflict description, but not the file
+        path, so identical conflicts share a resolution.
+        """
+        material = [
+            self.language,
+            self.location,
+            self.baseline_code,
+            self.conflict_description,
+            [
+                [
+                    intent,
+                    [
+                        [
+                            change.change_type.value,
+                            change.target,
+                            change.content_before,
+                            change.content_after,
+                        ]
+                        for change in changes
+                    ],
+                ]
+                for _, intent, changes in self.task_changes
+            ],
+        ]
+        payload = json.dumps(material, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -76,27 +76,19 @@ def looks_like_code(text: str, language: str) -> bool:
     )
 
 
-def extract_batch_code_blocks(
-    response: str,
-    location: str,
-    language: str,
-) -> str | None:
+def extract_batch_code_blocks(response: str) -> dict[int, str]:
     """
-    Extract code block for a specific location from a batch response.
+    Extract the code block of each numbered conflict from a batch response.
 
     Args:
         response: The batch AI response
-        location: The conflict location to extract
-        language: Programming language
 
     Returns:
-        Extracted code block for the location, or None if not found
+        Dictionary mapping conflict number to its code block (conflicts the
+        response does not answer are absent)
     """
-    # Try to find the resolution for this location
-    pattern = rf"## Location: {re.escape(location)}.*?```{language}\n(.*?)```"
-    match = re.search(pattern, response, re.DOTALL)
-
-    if match:
-        return match.group(1).strip()
-
-    return None
+    blocks: dict[int, str] = {}
+    pattern = r"## Conflict (\d+)[^\n]*\n\s*```[^\n]*\n(.*?)```"
+    for match in re.finditer(pattern, response, re.DOTALL):
+        blocks.setdefault(int(match.group(1)), match.group(2).strip())
+    return blocks
@@ -40,17 +40,17 @@ merged code here
 
 Merge the code now:"""
 
-# Batch merge prompt template for multiple conflicts in the same file
+# Batch merge prompt template for several conflicts (possibly in different files)
 BATCH_MERGE_PROMPT_TEMPLATE = """You are a code merge assistant. Your task is to merge changes from multiple development tasks.
 
-There are {num_conflicts} conflict regions in {file_path}. Resolve each one.
+There are {num_conflicts} independent conflict regions below, possibly from different files. Resolve each one.
 
 {combined_context}
 
-For each conflict region, output the merged code in a separate code block labeled with the location:
+For each conflict region, output the merged code in a separate code block labeled with its number, using that region's language:
 
-## Location: <location>
-```{language}
+## Conflict <number>
+```<language>
 merged code
 ```
 
@@ -71,27 +71,22 @@ def format_merge_prompt(context: str, language: str) -> str:
     return MERGE_PROMPT_TEMPLATE.format(context=context, language=language)
 
 
-def format_batch_merge_prompt(
-    file_path: str,
-    num_conflicts: int,
-    combined_context: str,
-    language: str,
-) -> str:
+def format_batch_merge_prompt(contexts: list[str]) -> str:
     """
-    Format the batch merge prompt for multiple conflicts.
+    Format the batch merge prompt for several conflicts.
 
     Args:
-        file_path: Path to the file with conflicts
-        num_conflicts: Number of conflicts to resolve
-        combined_context: Combined context from all conflicts
-        language: Programming language for code block formatting
+        contexts: Prompt context of each conflict, in order; conflict n is
+            labeled "## Conflict n" (1-based)
 
     Returns:
         Formatted batch prompt string
     """
+    combined_context = "\n\n---\n\n".join(
+        f"## Conflict {number}\n{context}"
+        for number, context in enumerate(contexts, start=1)
+    )
     return BATCH_MERGE_PROMPT_TEMPLATE.format(
-        file_path=file_path,
-        num_conflicts=num_conflicts,
+        num_conflicts=len(contexts),
         combined_context=combined_context,
-        language=language,
     )
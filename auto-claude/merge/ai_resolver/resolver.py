@@ -11,7 +11,9 @@ resolution of conflicts using AI with minimal context.
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 from ..types import (
     ConflictRegion,
@@ -21,6 +23,7 @@ from ..types import (
     MergeStrategy,
     TaskSnapshot,
 )
+from .cache import ResolutionCache
 from .context import ConflictContext
 from .language_utils import infer_language, locations_overlap
 from .parsers import extract_batch_code_blocks, extract_code_block
@@ -29,6 +32,7 @@ from .prompts import (
     format_batch_merge_prompt,
     format_merge_prompt,
 )
+from .scheduler import ResolutionRequest, pack_batches
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +62,7 @@ class AIResolver:
         self,
         ai_call_fn: AICallFunction | None = None,
         max_context_tokens: int = MAX_CONTEXT_TOKENS,
+        cache: ResolutionCache | None = None,
     ):
         """
         Initialize the AI resolver.
@@ -66,11 +71,15 @@ class AIResolver:
             ai_call_fn: Function that calls AI. Signature: (system_prompt, user_prompt) -> response
                         If None, uses a stub that requires explicit calls.
             max_context_tokens: Maximum tokens to include in context
+            cache: Optional cache of successful resolutions to reuse
         """
         self.ai_call_fn = ai_call_fn
         self.max_context_tokens = max_context_tokens
+        self.cache = cache
         self._call_count = 0
         self._total_tokens = 0
+        # Conflicts in different files may be resolved from worker threads
+        self._stats_lock = threading.Lock()
 
     def set_ai_function(self, ai_call_fn: AICallFunction) -> None:
         """Set the AI call function after initialization."""
@@ -86,8 +95,15 @@ class AIResolver:
 
     def reset_stats(self) -> None:
         """Reset usage statistics."""
-        self._call_count = 0
-        self._total_tokens = 0
+        with self._stats_lock:
+            self._call_count = 0
+            self._total_tokens = 0
+
+    def _record_call(self, tokens: int) -> None:
+        """Count one AI call and its estimated token usage."""
+        with self._stats_lock:
+            self._call_count += 1
+            self._total_tokens += tokens
 
     def build_context(
         self,
@@ -191,6 +207,10 @@ class AIResolver:
                 conflicts_remaining=[conflict],
             )
 
+        cached = self._cached_result(conflict, context)
+        if cached:
+            return cached
+
         # Build prompt
         prompt_context = context.to_prompt_context()
         prompt = format_merge_prompt(prompt_context, context.language)
@@ -199,13 +219,14 @@ class AIResolver:
         try:
             logger.info(f"Calling AI to resolve conflict in {conflict.file_path}")
             response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
-            self._call_count += 1
-            self._total_tokens += context.estimated_tokens + len(response) // 4
+            self._record_call(context.estimated_tokens + len(response) // 4)
 
             # Parse response
             merged_code = extract_code_block(response, context.language)
 
             if merged_code:
+                if self.cache is not None:
+                    self.cache.put(context.cache_key, merged_code)
                 return MergeResult(
                     decision=MergeDecision.AI_MERGED,
                     file_path=conflict.file_path,
@@ -238,171 +259,187 @@ class AIResolver:
     def resolve_multiple_conflicts(
         self,
         conflicts: list[ConflictRegion],
-        baseline_codes: dict[str, str],
+        baseline_codes: Mapping[str | tuple[str, str], str],
         task_snapshots: list[TaskSnapshot],
         batch: bool = True,
     ) -> list[MergeResult]:
         """
         Resolve multiple conflicts.
 
+        With batch=True, conflicts from all files are packed into token-
+        budgeted batches (see resolve_batched). The result shape is the same
+        either way: one MergeResult per conflict, in input order. Earlier
+        versions returned one combined result per file when batching; callers
+        that need that should group the results by file_path.
+
         Args:
             conflicts: List of conflicts to resolve
-            baseline_codes: Map of location -> baseline code
+            baseline_codes: Map of location (or (file_path, location) when
+                conflicts span files) -> baseline code
             task_snapshots: All task snapshots
             batch: Whether to batch conflicts (reduces API calls)
 
         Returns:
-            List of MergeResults
+            List of MergeResults, one per conflict, in order
         """
-        results = []
-
-        if batch and len(conflicts) > 1:
-            # Try to batch conflicts from the same file
-            by_file: dict[str, list[ConflictRegion]] = {}
-            for conflict in conflicts:
-                if conflict.file_path not in by_file:
-                    by_file[conflict.file_path] = []
-                by_file[conflict.file_path].append(conflict)
-
-            for file_path, file_conflicts in by_file.items():
-                if len(file_conflicts) == 1:
-                    # Single conflict, resolve individually
-                    baseline = baseline_codes.get(file_conflicts[0].location, "")
-                    results.append(
-                        self.resolve_conflict(
-                            file_conflicts[0], baseline, task_snapshots
-                        )
-                    )
-                else:
-                    # Multiple conflicts in same file - batch resolve
-                    result = self._resolve_file_batch(
-                        file_path, file_conflicts, baseline_codes, task_snapshots
-                    )
-                    results.append(result)
-        else:
-            # Resolve each individually
-            for conflict in conflicts:
-                baseline = baseline_codes.get(conflict.location, "")
-                results.append(
-                    self.resolve_conflict(conflict, baseline, task_snapshots)
-                )
-
-        return results
+        requests = [
+            ResolutionRequest(
+                conflict,
+                baseline_codes.get(
+                    (conflict.file_path, conflict.location),
+                    baseline_codes.get(conflict.location, ""),
+                ),
+                task_snapshots,
+            )
+            for conflict in conflicts
+        ]
+        if not batch:
+            return [self.resolve_conflict(*request) for request in requests]
+        return self.resolve_batched(requests)
 
-    def _resolve_file_batch(
+    def resolve_batched(
         self,
-        file_path: str,
-        conflicts: list[ConflictRegion],
-        baseline_codes: dict[str, str],
-        task_snapshots: list[TaskSnapshot],
-    ) -> MergeResult:
+        requests: list[ResolutionRequest],
+        max_parallel: int = 1,
+    ) -> list[MergeResult]:
         """
-        Resolve multiple conflicts in the same file with a single AI call.
+        Resolve conflicts from any number of files in packed batches.
 
-        This is more efficient but may be less precise.
+        Cached resolutions are reused without a call. The rest are packed
+        into batches whose estimated tokens fit max_context_tokens; a batch
+        of one is resolved with the single-conflict prompt.
+
+        Args:
+            requests: Conflicts with their baseline code and task snapshots
+            max_parallel: Maximum batches resolved concurrently
+
+        Returns:
+            List of MergeResults, one per request, in order
         """
-        if not self.ai_call_fn:
-            return MergeResult(
-                decision=MergeDecision.NEEDS_HUMAN_REVIEW,
-                file_path=file_path,
-                explanation="No AI function configured",
-                conflicts_remaining=conflicts,
+        results: list[MergeResult | None] = [None] * len(requests)
+        pending: list[tuple[int, ConflictContext]] = []
+
+        for i, (conflict, baseline_code, task_snapshots) in enumerate(requests):
+            context = self.build_context(conflict, baseline_code, task_snapshots)
+            cached = self._cached_result(conflict, context)
+            if cached:
+                results[i] = cached
+            elif (
+                not self.ai_call_fn
+                or context.estimated_tokens > self.max_context_tokens
+            ):
+                # resolve_conflict reports why it cannot resolve these
+                results[i] = self.resolve_conflict(*requests[i])
+            else:
+                pending.append((i, context))
+
+        batches = [
+            [pending[p] for p in batch]
+            for batch in pack_batches(
+                [context.estimated_tokens for _, context in pending],
+                self.max_context_tokens,
+            )
+        ]
+
+        def run(batch: list[tuple[int, ConflictContext]]) -> None:
+            if len(batch) == 1:
+                i = batch[0][0]
+                results[i] = self.resolve_conflict(*requests[i])
+                return
+            batch_results = self._resolve_batch(
+                [(requests[i].conflict, context) for i, context in batch]
             )
+            for (i, _), result in zip(batch, batch_results):
+                results[i] = result
 
-        # Combine contexts
-        all_contexts = []
-        for conflict in conflicts:
-            baseline = baseline_codes.get(conflict.location, "")
-            ctx = self.build_context(conflict, baseline, task_snapshots)
-            all_contexts.append(ctx)
-
-        # Check combined token limit
-        total_tokens = sum(ctx.estimated_tokens for ctx in all_contexts)
-        if total_tokens > self.max_context_tokens:
-            # Too big to batch, fall back to individual resolution
-            results = []
-            for conflict in conflicts:
-                baseline = baseline_codes.get(conflict.location, "")
-                results.append(
-                    self.resolve_conflict(conflict, baseline, task_snapshots)
-                )
+        if max_parallel > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+                list(pool.map(run, batches))
+        else:
+            for batch in batches:
+                run(batch)
+
+        return results
 
-            # Combine results
-            merged = results[0]
-            for r in results[1:]:
-                merged.conflicts_resolved.extend(r.conflicts_resolved)
-                merged.conflicts_remaining.extend(r.conflicts_remaining)
-                merged.ai_calls_made += r.ai_calls_made
-                merged.tokens_used += r.tokens_used
-            return merged
-
-        # Build combined prompt
-        combined_context = "\n\n---\n\n".join(
-            ctx.to_prompt_context() for ctx in all_contexts
+    def _cached_result(
+        self, conflict: ConflictRegion, context: ConflictContext
+    ) -> MergeResult | None:
+        """Result built from a cached resolution, if there is one."""
+        if self.cache is None:
+            return None
+        merged_code = self.cache.get(context.cache_key)
+        if merged_code is None:
+            return None
+        return MergeResult(
+            decision=MergeDecision.AI_MERGED,
+            file_path=conflict.file_path,
+            merged_content=merged_code,
+            conflicts_resolved=[conflict],
+            explanation=f"Reused AI resolution for conflict at {conflict.location}",
         )
 
-        language = all_contexts[0].language if all_contexts else "text"
+    def _resolve_batch(
+        self,
+        batch: list[tuple[ConflictRegion, ConflictContext]],
+    ) -> list[MergeResult]:
+        """
+        Resolve several conflicts with a single AI call.
 
-        batch_prompt = format_batch_merge_prompt(
-            file_path=file_path,
-            num_conflicts=len(conflicts),
-            combined_context=combined_context,
-            language=language,
+        The call is counted on the first result; each result carries its own
+        conflict's code and estimated tokens.
+        """
+        prompt = format_batch_merge_prompt(
+            [context.to_prompt_context() for _, context in batch]
         )
+        total_tokens = sum(context.estimated_tokens for _, context in batch)
 
         try:
-            response = self.ai_call_fn(SYSTEM_PROMPT, batch_prompt)
-            self._call_count += 1
-            self._total_tokens += total_tokens + len(response) // 4
-
-            # Parse batch response
-            # This is a simplified parser - production would be more robust
-            resolved = []
-            remaining = []
-
-            for conflict in conflicts:
-                # Try to find the resolution for this location
-                code_block = extract_batch_code_blocks(
-                    response, conflict.location, language
+            logger.info(f"Calling AI to resolve {len(batch)} conflicts in one batch")
+            response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
+            self._record_call(total_tokens + len(response) // 4)
+        except Exception as e:
+            logger.error(f"Batch AI call failed: {e}")
+            return [
+                MergeResult(
+                    decision=MergeDecision.FAILED,
+                    file_path=conflict.file_path,
+                    error=str(e),
+                    conflicts_remaining=[conflict],
                 )
+                for conflict, _ in batch
+            ]
 
-                if code_block:
-                    resolved.append(conflict)
-                else:
-                    remaining.append(conflict)
-
-            # Return combined result
-            if resolved:
-                return MergeResult(
-                    decision=MergeDecision.AI_MERGED
-                    if not remaining
-                    else MergeDecision.NEEDS_HUMAN_REVIEW,
-                    file_path=file_path,
-                    merged_content=response,  # Full response for manual extraction
-                    conflicts_resolved=resolved,
-                    conflicts_remaining=remaining,
-                    ai_calls_made=1,
-                    tokens_used=total_tokens,
-                    explanation=f"Batch resolved {len(resolved)}/{len(conflicts)} conflicts",
+        blocks = extract_batch_code_blocks(response)
+        results = []
+        for number, (conflict, context) in enumerate(batch, start=1):
+            merged_code = blocks.get(number)
+            calls = 1 if number == 1 else 0
+            if merged_code:
+                if self.cache is not None:
+                    self.cache.put(context.cache_key, merged_code)
+                results.append(
+                    MergeResult(
+                        decision=MergeDecision.AI_MERGED,
+                        file_path=conflict.file_path,
+                        merged_content=merged_code,
+                        conflicts_resolved=[conflict],
+                        ai_calls_made=calls,
+                        tokens_used=context.estimated_tokens,
+                        explanation=f"AI resolved conflict at {conflict.location} (batched)",
+                    )
                 )
             else:
-                return MergeResult(
-                    decision=MergeDecision.NEEDS_HUMAN_REVIEW,
-                    file_path=file_path,
-                    explanation="Could not parse batch AI response",
-                    conflicts_remaining=conflicts,
-                    ai_calls_made=1,
-                    tokens_used=total_tokens,
+                results.append(
+                    MergeResult(
+                        decision=MergeDecision.NEEDS_HUMAN_REVIEW,
+                        file_path=conflict.file_path,
+                        explanation="Could not parse batch AI response",
+                        conflicts_remaining=[conflict],
+                        ai_calls_made=calls,
+                        tokens_used=context.estimated_tokens,
+                    )
                 )
-
-        except Exception as e:
-            logger.error(f"Batch AI call failed: {e}")
-            return MergeResult(
-                decision=MergeDecision.FAILED,
-                file_path=file_path,
-                error=str(e),
-                conflicts_remaining=conflicts,
-            )
+        return results
 
     def can_resolve(self, conflict: ConflictRegion) -> bool:
         """
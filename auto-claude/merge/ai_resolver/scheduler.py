@@ -0,0 +1,65 @@
+"""
+Resolution Scheduler
+====================
+
+Packing of AI conflict resolutions into token-budgeted batches.
+
+Each AI call has a fixed overhead (system prompt, instructions, round trip),
+so small conflicts are resolved several per call. Conflicts from any number
+of files are packed into batches whose combined
+ConflictContext.estimated_tokens stays within the resolver's context budget,
+using first-fit decreasing bin packing.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from ..types import ConflictRegion, TaskSnapshot
+
+# Upper bound on conflicts per call, so one unparseable response costs little
+MAX_BATCH_CONFLICTS = 8
+
+
+class ResolutionRequest(NamedTuple):
+    """One conflict to resolve, with the inputs resolve_conflict() takes."""
+
+    conflict: ConflictRegion
+    baseline_code: str
+    task_snapshots: list[TaskSnapshot]
+
+
+def pack_batches(
+    sizes: list[int],
+    budget: int,
+    max_items: int = MAX_BATCH_CONFLICTS,
+) -> list[list[int]]:
+    """
+    Pack items into as few batches as fit the budget (first-fit decreasing).
+
+    Args:
+        sizes: Estimated tokens per item
+        budget: Maximum total tokens per batch
+        max_items: Maximum items per batch
+
+    Returns:
+        Batches of item indexes; every index appears exactly once (an item
+        larger than the budget gets a batch of its own)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True)
+    batches: list[list[int]] = []
+    remaining: list[int] = []
+
+    for i in order:
+        for b, batch in enumerate(batches):
+            if len(batch) < max_items and sizes[i] <= remaining[b]:
+                batch.append(i)
+                remaining[b] -= sizes[i]
+                break
+        else:
+            batches.append([i])
+            remaining.append(budget - sizes[i])
+
+    for batch in batches:
+        batch.sort()
+    return batches
@@ -9,14 +9,22 @@ This module contains:
 - Severity assessment logic
 - Implicit conflict detection
 - Range overlap checking
+
+Besides grouping changes by location, detection indexes every change of the
+file by line range (IntervalIndex), so edits of the same lines recorded under
+different locations (e.g. a class and one of its methods) are found without
+comparing every pair of changes across all tasks.
 """
 
 from __future__ import annotations
 
 import logging
+import re
 from collections import defaultdict
+from functools import cached_property
 
 from .compatibility_rules import CompatibilityRule
+from .interval_index import IntervalIndex
 from .types import (
     ChangeType,
     ConflictRegion,
@@ -44,6 +52,98 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.conflict_analysis"
 
+# Changes that rewrite existing code; two of these from different tasks on
+# overlapping lines conflict even when recorded under different locations
+EDIT_CHANGE_TYPES = frozenset(
+    {
+        ChangeType.MODIFY_FUNCTION,
+        ChangeType.REMOVE_FUNCTION,
+        ChangeType.RENAME_FUNCTION,
+        ChangeType.MODIFY_METHOD,
+        ChangeType.REMOVE_METHOD,
+        ChangeType.MODIFY_CLASS,
+        ChangeType.REMOVE_CLASS,
+        ChangeType.MODIFY_VARIABLE,
+        ChangeType.REMOVE_VARIABLE,
+        ChangeType.MODIFY_TYPE,
+        ChangeType.MODIFY_INTERFACE,
+        ChangeType.WRAP_JSX,
+        ChangeType.UNWRAP_JSX,
+        ChangeType.MODIFY_JSX_PROPS,
+    }
+)
+
+# Changes that take a name away from the file
+REMOVAL_CHANGE_TYPES = frozenset(
+    {
+        ChangeType.REMOVE_FUNCTION,
+        ChangeType.RENAME_FUNCTION,
+        ChangeType.REMOVE_METHOD,
+        ChangeType.REMOVE_CLASS,
+        ChangeType.REMOVE_VARIABLE,
+        ChangeType.REMOVE_IMPORT,
+    }
+)
+
+# A name, or a dotted attribute chain, not itself reached through a "."
+_REFERENCE = r"(?<![\w$.])[A-Za-z_$][\w$]*(?:\s*\.\s*[A-Za-z_$][\w$]*)*"
+
+# String literals (prefix kept so f-strings can be recognized)
+_STRING = (
+    r"(?P<prefix>[rRbBuUfF]{0,2})"
+    r'(?P<string>"""[\s\S]*?"""'
+    r"|'''[\s\S]*?'''"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r"|`(?:\\.|[^`\\])*`)"
+)
+_PYTHON_TOKENS = re.compile(rf"{_STRING}|(?P<comment>#[^\n]*)|(?P<ref>{_REFERENCE})")
+_C_STYLE_TOKENS = re.compile(
+    rf"{_STRING}|(?P<comment>//[^\n]*|/\*[\s\S]*?\*/)|(?P<ref>{_REFERENCE})"
+)
+
+# Receivers through which code reaches a method of its own class
+_SELF_RECEIVERS = ("self", "cls", "this")
+
+TaskChange = tuple[str, SemanticChange]
+
+
+class ChangeIndex:
+    """
+    Per-file index over every task's changes.
+
+    - ``lines``: IntervalIndex of (task_id, change) by line range
+    - ``references``: reference key (see code_references) -> changes whose
+      new code contains it. Built on first use, which only happens when some
+      task removes or renames a name, so other files pay only for ``lines``
+    """
+
+    def __init__(self, task_analyses: dict[str, FileAnalysis]):
+        self.task_analyses = task_analyses
+        self.changes: list[TaskChange] = [
+            (task_id, change)
+            for task_id, analysis in task_analyses.items()
+            for change in analysis.changes
+        ]
+        self.lines: IntervalIndex[TaskChange] = IntervalIndex(
+            (change.line_start, change.line_end, (task_id, change))
+            for task_id, change in self.changes
+        )
+
+    @cached_property
+    def references(self) -> dict[str, list[TaskChange]]:
+        references: dict[str, list[TaskChange]] = defaultdict(list)
+        for task_id, analysis in self.task_analyses.items():
+            for change in analysis.changes:
+                if (
+                    change.change_type in REMOVAL_CHANGE_TYPES
+                    or not change.content_after
+                ):
+                    continue
+                for key in code_references(change.content_after, analysis.file_path):
+                    references[key].append((task_id, change))
+        return references
+
 
 def detect_conflicts(
     task_analyses: dict[str, FileAnalysis],
@@ -112,8 +212,17 @@ def detect_conflicts(
             )
             conflicts.append(conflict)
 
+    file_path = next(iter(task_analyses.values())).file_path
+    index = ChangeIndex(task_analyses)
+
+    # Edits of the same lines recorded under different locations
+    overlap_conflicts = detect_overlapping_edits(file_path, index, rule_index)
+    if overlap_conflicts:
+        debug_detailed(MODULE, f"Found {len(overlap_conflicts)} overlapping edits")
+    conflicts.extend(overlap_conflicts)
+
     # Also check for implicit conflicts (e.g., changes to related code)
-    implicit_conflicts = detect_implicit_conflicts(task_analyses)
+    implicit_conflicts = detect_implicit_conflicts(task_analyses, index)
     if implicit_conflicts:
         debug_detailed(MODULE, f"Found {len(implicit_conflicts)} implicit conflicts")
     conflicts.extend(implicit_conflicts)
@@ -151,12 +260,48 @@ def analyze_location_conflict(
         return None
 
     # Check pairwise compatibility
+    all_compatible, final_strategy, reasons = check_pairwise_compatibility(
+        change_types, rule_index
+    )
+
+    # Determine severity
+    if all_compatible:
+        severity = ConflictSeverity.NONE
+    else:
+        severity = assess_severity(change_types, changes)
+
+    return ConflictRegion(
+        file_path=file_path,
+        location=location,
+        tasks_involved=tasks,
+        change_types=change_types,
+        severity=severity,
+        can_auto_merge=all_compatible,
+        merge_strategy=final_strategy if all_compatible else MergeStrategy.AI_REQUIRED,
+        reason=" | ".join(reasons) if reasons else "Changes are compatible",
+    )
+
+
+def check_pairwise_compatibility(
+    change_types: list[ChangeType],
+    rule_index: dict[tuple[ChangeType, ChangeType], CompatibilityRule],
+) -> tuple[bool, MergeStrategy | None, list[str]]:
+    """
+    Check every pair of change types against the compatibility rules.
+
+    Args:
+        change_types: Change types involved, one per change
+        rule_index: Indexed compatibility rules
+
+    Returns:
+        Tuple of (all_compatible, strategy, reasons)
+    """
     all_compatible = True
     final_strategy: MergeStrategy | None = None
     reasons = []
 
-    for i, (type_a, change_a) in enumerate(zip(change_types, changes)):
-        for type_b, change_b in zip(change_types[i + 1 :], changes[i + 1 :]):
+    for i, type_a in enumerate(change_types):
+        for type_b in change_types[i + 1 :]:
             rule = rule_index.get((type_a, type_b))
 
             if rule:
@@ -170,22 +315,91 @@ def analyze_location_conflict(
                 all_compatible = False
                 reasons.append(f"No rule for {type_a.value} + {type_b.value}")
 
-    # Determine severity
-    if all_compatible:
-        severity = ConflictSeverity.NONE
-    else:
-        severity = assess_severity(change_types, changes)
+    return all_compatible, final_strategy, reasons
 
-    return ConflictRegion(
-        file_path=file_path,
-        location=location,
-        tasks_involved=tasks,
-        change_types=change_types,
-        severity=severity,
-        can_auto_merge=all_compatible,
-        merge_strategy=final_strategy if all_compatible else MergeStrategy.AI_REQUIRED,
-        reason=" | ".join(reasons) if reasons else "Changes are compatible",
-    )
+
+def detect_overlapping_edits(
+    file_path: str,
+    index: ChangeIndex,
+    rule_index: dict[tuple[ChangeType, ChangeType], CompatibilityRule],
+) -> list[ConflictRegion]:
+    """
+    Detect edits by different tasks to overlapping lines at different locations.
+
+    Changes at the same location are handled by analyze_location_conflict();
+    this pass catches the rest (e.g. one task modifying a class while another
+    modifies one of its methods). Overlapping edits are grouped into clusters,
+    one conflict region per cluster, located at its widest change.
+
+    Args:
+        file_path: Path to the file being analyzed
+        index: Change index of the file
+        rule_index: Indexed compatibility rules
+
+    Returns:
+        List of conflict regions for incompatible overlapping edits
+    """
+    # Union-find over changes linked by an overlapping cross-location pair
+    parent: dict[int, int] = {}
+
+    def find(key: int) -> int:
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    members: dict[int, TaskChange] = {}
+    for pair in index.lines.overlapping_pairs():
+        (task_a, change_a), (task_b, change_b) = pair
+        if (
+            task_a == task_b
+            or change_a.location == change_b.location
+            or change_a.change_type not in EDIT_CHANGE_TYPES
+            or change_b.change_type not in EDIT_CHANGE_TYPES
+        ):
+            continue
+        for task_change in pair:
+            key = id(task_change[1])
+            members[key] = task_change
+            parent.setdefault(key, key)
+        parent[find(id(change_a))] = find(id(change_b))
+
+    clusters: dict[int, list[TaskChange]] = defaultdict(list)
+    for key, task_change in members.items():
+        clusters[find(key)].append(task_change)
+
+    conflicts = []
+    for cluster in clusters.values():
+        tasks = list(dict.fromkeys(task_id for task_id, _ in cluster))
+        changes = [change for _, change in cluster]
+        change_types = [c.change_type for c in changes]
+
+        all_compatible, _, reasons = check_pairwise_compatibility(
+            change_types, rule_index
+        )
+        if all_compatible:
+            continue
+
+        widest = max(changes, key=lambda c: c.line_end - c.line_start)
+        start = min(c.line_start for c in changes)
+        end = max(c.line_end for c in changes)
+        locations = ", ".join(dict.fromkeys(c.location for c in changes))
+        conflicts.append(
+            ConflictRegion(
+                file_path=file_path,
+                location=widest.location,
+                tasks_involved=tasks,
+                change_types=change_types,
+                severity=assess_severity(change_types, changes),
+                can_auto_merge=False,
+                merge_strategy=MergeStrategy.AI_REQUIRED,
+                reason=(
+                    f"Overlapping edits at lines {start}-{end} ({locations}): "
+                    + " | ".join(dict.fromkeys(reasons))
+                ),
+            )
+        )
+    return conflicts
 
 
 def assess_severity(
@@ -244,15 +458,12 @@ def ranges_overlap(ranges: list[tuple[int, int]]) -> bool:
     Returns:
         True if any ranges overlap, False otherwise
     """
-    sorted_ranges = sorted(ranges)
-    for i in range(len(sorted_ranges) - 1):
-        if sorted_ranges[i][1] >= sorted_ranges[i + 1][0]:
-            return True
-    return False
+    return IntervalIndex((start, end, None) for start, end in ranges).has_overlap()
 
 
 def detect_implicit_conflicts(
     task_analyses: dict[str, FileAnalysis],
+    index: ChangeIndex | None = None,
 ) -> list[ConflictRegion]:
     """
     Detect implicit conflicts not caught by location analysis.
@@ -260,30 +471,187 @@ def detect_implicit_conflicts(
     This includes conflicts like:
     - Function rename + function call changes
     - Import removal + usage
-    - Variable rename + references
+    - Variable/class/function removal + references
+
+    A task that removes or renames a name conflicts with another task whose
+    added or modified code still refers to that name outside strings and
+    comments. A removed method only matches access through self/cls/this or
+    its class. References are looked up in the change index's reference
+    table, so the pass is linear in the size of the changes rather than in
+    the number of task pairs.
 
     Args:
         task_analyses: Map of task_id -> FileAnalysis
+        index: Change index of the file (built if not given)
 
     Returns:
         List of implicit conflict regions
+    """
+    conflicts: list[ConflictRegion] = []
+    if len(task_analyses) <= 1:
+        return conflicts
+
+    index = index or ChangeIndex(task_analyses)
+    file_path = next(iter(task_analyses.values())).file_path
+    reported: set[tuple[str, str, str, str]] = set()
+
+    for task_id, change in index.changes:
+        if change.change_type not in REMOVAL_CHANGE_TYPES:
+            continue
+        for name in removed_names(change):
+            usages = [
+                usage
+                for key in reference_keys(name)
+                for usage in index.references.get(key, ())
+            ]
+            for other_task, usage in usages:
+                if other_task == task_id or usage.location == change.location:
+                    continue  # same-location edits are analyzed by location
+                key = (task_id, other_task, usage.location, name)
+                if key in reported:
+                    continue
+                reported.add(key)
+
+                verb = (
+                    "renames"
+                    if change.change_type == ChangeType.RENAME_FUNCTION
+                    else "removes"
+                )
+                conflicts.append(
+                    ConflictRegion(
+                        file_path=file_path,
+                        location=usage.location,
+                        tasks_involved=[task_id, other_task],
+                        change_types=[change.change_type, usage.change_type],
+                        severity=ConflictSeverity.HIGH,
+                        can_auto_merge=False,
+                        merge_strategy=MergeStrategy.AI_REQUIRED,
+                        reason=(
+                            f"{task_id} {verb} '{name}' which {other_task} "
+                            f"still uses at {usage.location}"
+                        ),
+                    )
+                )
 
-    Note:
-        These advanced checks are currently TODO.
-        The main location-based detection handles most cases.
+    return conflicts
+
+
+def removed_names(change: SemanticChange) -> list[str]:
     """
-    conflicts = []
+    Names a removal or rename takes away from the file.
 
-    # Check for function rename + function call changes
-    # (If task A renames a function and task B calls the old name)
+    Args:
+        change: A change whose type is in REMOVAL_CHANGE_TYPES
+
+    Returns:
+        Names no longer defined after the change (methods as "Parent.name")
+    """
+    if change.change_type == ChangeType.REMOVE_IMPORT:
+        return imported_names(change.target)
+    if change.change_type == ChangeType.RENAME_FUNCTION:
+        name = change.metadata.get("old_name") or change.target
+    else:
+        name = change.target
+    return [name] if name else []
 
-    # Check for import removal + usage
-    # (If task A removes an import and task B uses it)
 
-    # For now, these advanced checks are TODO
-    # The main location-based detection handles most cases
+def reference_keys(name: str) -> list[str]:
+    """
+    Reference keys (see code_references) that refer to a removed name.
 
-    return conflicts
+    A top-level name is referred to by itself. A member ("Parent.name") is
+    only referred to through self/cls/this or its class, so unrelated
+    attribute access such as ``d.get`` does not match ``Bar.get``.
+    """
+    parent, _, member = name.rpartition(".")
+    if not parent:
+        return [name]
+    owner = parent.rsplit(".", 1)[-1]
+    return [f"{receiver}.{member}" for receiver in (*_SELF_RECEIVERS, owner)]
+
+
+def code_references(source: str, file_path: str = "") -> set[str]:
+    """
+    Names and attribute accesses in code, ignoring strings and comments.
+
+    ``a.b.c(x)`` yields "a", "a.b" and "x": the name starting each chain and
+    its first attribute. Expressions interpolated into f-strings and
+    template literals count as code.
+
+    Args:
+        source: Code to scan
+        file_path: File the code belongs to (selects the comment syntax)
+
+    Returns:
+        Reference keys
+    """
+    python = file_path.endswith((".py", ".pyi"))
+    tokens = _PYTHON_TOKENS if python else _C_STYLE_TOKENS
+    references: set[str] = set()
+    for match in tokens.finditer(source):
+        ref = match.group("ref")
+        if ref:
+            parts = [part.strip() for part in ref.split(".")]
+            references.add(parts[0])
+            if len(parts) > 1:
+                references.add(f"{parts[0]}.{parts[1]}")
+            continue
+        string = match.group("string")
+        if string and ("f" in match.group("prefix").lower() or string[0] == "`"):
+            for expression in re.findall(r"\{([^{}]*)\}", string):
+                references |= code_references(expression, file_path)
+    return references
+
+
+def imported_names(statement: str) -> list[str]:
+    """
+    Names bound by a Python or JavaScript/TypeScript import statement.
+
+    Args:
+        statement: Import statement source (one line)
+
+    Returns:
+        Bound identifiers (empty for side-effect-only imports)
+    """
+    statement = statement.strip().rstrip(";")
+
+    # Python: from module import a, b as c
+    match = re.match(r"from\s+\S+\s+import\s+(.+)", statement)
+    if match:
+        clause = match.group(1).strip("() ")
+        return [_bound_name(part) for part in clause.split(",") if part.strip()]
+
+    # JavaScript/TypeScript: import X, { a as b } from '...' / import * as ns
+    match = re.match(r"import\s+(?:type\s+)?(.+?)\s+from\s+", statement)
+    if match:
+        names = []
+        clause = match.group(1)
+        braces = re.search(r"\{(.*)\}", clause)
+        if braces:
+            names += [_bound_name(p) for p in braces.group(1).split(",") if p.strip()]
+            clause = clause[: braces.start()] + clause[braces.end() :]
+        for part in clause.split(","):
+            if part.strip():
+                names.append(_bound_name(part))
+        return names
+
+    # Python: import a.b, c as d
+    match = re.match(r"import\s+([\w.,\s]+(?:\s+as\s+\w+)?)$", statement)
+    if match:
+        return [
+            _bound_name(part).split(".")[0]
+            for part in match.group(1).split(",")
+            if part.strip()
+        ]
+    return []
+
+
+def _bound_name(part: str) -> str:
+    """Name bound by one import item ("a", "a as b", "* as ns", "type T")."""
+    words = part.split()
+    if "as" in words:
+        return words[words.index("as") + 1]
+    return words[-1]
 
 
 def analyze_compatibility(
@@ -17,6 +17,7 @@ This is the main entry point that coordinates the conflict detection system.
 The actual logic is organized into specialized modules:
 - compatibility_rules: Rule definitions and indexing
 - conflict_analysis: Core conflict detection algorithms
+- interval_index: Line-range index for finding overlapping changes
 - conflict_explanation: Human-readable explanations
 """
 
@@ -78,6 +78,8 @@ class ConflictResolver:
         remaining: list[ConflictRegion] = []
         ai_calls = 0
         tokens_used = 0
+        # Resolutions reused from the AI resolver's cache cost no calls
+        ai_resolved = False
 
         for conflict in conflicts:
             # Try auto-merge first
@@ -121,6 +123,7 @@ class ConflictResolver:
                 tokens_used += ai_result.tokens_used
 
                 if ai_result.success:
+                    ai_resolved = True
                     # Apply AI-merged content
                     merged_content = apply_ai_merge(
                         merged_content,
@@ -136,7 +139,9 @@ class ConflictResolver:
         # Determine final decision
         if not remaining:
             decision = (
-                MergeDecision.AUTO_MERGED if ai_calls == 0 else MergeDecision.AI_MERGED
+                MergeDecision.AI_MERGED
+                if ai_calls or ai_resolved
+                else MergeDecision.AUTO_MERGED
             )
         elif remaining and resolved:
             decision = MergeDecision.NEEDS_HUMAN_REVIEW
@@ -5,7 +5,8 @@ File Evolution Package
 Modular file evolution tracking system.
 
 Components:
-- storage: File storage and persistence
+- storage: File storage and persistence (sharded, journaled evolution store)
+- blob_store: Content-addressed, deduplicated baseline snapshots
 - baseline_capture: Baseline state capture
 - modification_tracker: Modification recording and analysis
 - evolution_queries: Query and analysis methods
@@ -13,14 +14,17 @@ Components:
 """
 
 from .baseline_capture import DEFAULT_EXTENSIONS, BaselineCapture
+from .blob_store import BlobStore
 from .evolution_queries import EvolutionQueries
 from .modification_tracker import ModificationTracker
-from .storage import EvolutionStorage
+from .storage import EvolutionMap, EvolutionStorage
 from .tracker import FileEvolutionTracker
 
 __all__ = [
     "FileEvolutionTracker",
     "EvolutionStorage",
+    "EvolutionMap",
+    "BlobStore",
     "BaselineCapture",
     "ModificationTracker",
     "EvolutionQueries",
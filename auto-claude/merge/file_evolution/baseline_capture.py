@@ -11,10 +11,12 @@ Handles capturing baseline file states for task tracking:
 from __future__ import annotations
 
 import logging
-import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+from core.git_batch import get_object_reader
+
 from ..types import FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
 
@@ -87,35 +89,19 @@ class BaselineCapture:
         """
         Discover files that should be tracked for baselines.
 
-        Uses git ls-files to get tracked files, filtering by extension.
+        Uses the git-tracked files from the shared file inventory, filtering
+        by extension.
 
         Returns:
             List of absolute paths to trackable files
         """
-        try:
-            result = subprocess.run(
-                ["git", "ls-files"],
-                cwd=self.storage.project_dir,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            all_files = result.stdout.strip().split("\n")
-            trackable = []
-
-            for file_path in all_files:
-                if not file_path:
-                    continue
-                path = Path(file_path)
-                if path.suffix in self.extensions:
-                    trackable.append(self.storage.project_dir / path)
-
-            return trackable
-
-        except subprocess.CalledProcessError:
+        inventory = FileInventory(self.storage.project_dir)
+        if not inventory.is_git:
             logger.warning("Failed to list git files, returning empty list")
             return []
 
+        return list(inventory.iter_paths(extensions=self.extensions, tracked_only=True))
+
     def get_current_commit(self) -> str:
         """
         Get the current git commit hash.
@@ -124,16 +110,10 @@ class BaselineCapture:
             Git commit SHA, or "unknown" if not available
         """
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.storage.project_dir,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return "unknown"
+            commit = get_object_reader(self.storage.project_dir).resolve("HEAD")
+        except OSError:
+            commit = None
+        return commit or "unknown"
 
     def capture_baselines(
         self,
@@ -177,9 +157,10 @@ class BaselineCapture:
             )
             content_hash = compute_content_hash(content)
 
-            # Create or update evolution
-            if rel_path in evolutions:
-                evolution = evolutions[rel_path]
+            # Create or update evolution (an unreadable record reads as None
+            # and is replaced)
+            evolution = evolutions.get(rel_path)
+            if evolution is not None:
                 logger.debug(f"Updating existing evolution for {rel_path}")
             else:
                 evolution = FileEvolution(
@@ -202,6 +183,8 @@ class BaselineCapture:
             evolution.add_task_snapshot(snapshot)
             captured[rel_path] = evolution
 
+        self.storage.save_baseline_refs(task_id)
+
         debug_success(
             MODULE, f"Captured baselines for {len(captured)} files", task_id=task_id
         )
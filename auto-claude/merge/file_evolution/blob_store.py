@@ -0,0 +1,195 @@
+"""
+Content-Addressed Blob Store
+============================
+
+Deduplicated storage for baseline snapshots.
+
+Tasks that branch from the same commit capture identical baselines, so
+baseline content is stored once per distinct content, keyed by its SHA-256:
+
+- ``blobs/<id[:2]>/<id[2:]>.z``: zlib-compressed content (``.blob`` when
+  compression is off)
+- ``blobs/refs/<task_id>.json``: the blob each of a task's files references
+
+A blob's reference count is the number of task manifests (plus any extra
+live references the caller passes) that name it; collect_garbage() deletes
+blobs nobody references any more.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from pathlib import Path
+
+from core.file_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Prefix marking a baseline_snapshot_path that names a blob
+BLOB_REF_PREFIX = "blob:"
+
+COMPRESSION_LEVEL = 6
+
+
+class BlobStore:
+    """Content-addressed store with per-task reference manifests."""
+
+    def __init__(self, root: Path, compress: bool = True):
+        """
+        Initialize the blob store.
+
+        Args:
+            root: Directory holding blobs and reference manifests
+            compress: Whether new blobs are zlib-compressed
+        """
+        self.root = Path(root)
+        self.refs_dir = self.root / "refs"
+        self.compress = compress
+        # Task id -> {file path: blob id} not yet written to a manifest
+        self._pending: dict[str, dict[str, str]] = {}
+
+    @staticmethod
+    def blob_id(content: str) -> str:
+        """Identifier of a content (full SHA-256 hex digest)."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def put(self, content: str) -> str:
+        """
+        Store content unless an identical blob already exists.
+
+        Args:
+            content: Text to store
+
+        Returns:
+            Blob identifier
+        """
+        blob_id = self.blob_id(content)
+        if self._find(blob_id) is not None:
+            return blob_id
+
+        data = content.encode("utf-8")
+        suffix = ".z" if self.compress else ".blob"
+        if self.compress:
+            data = zlib.compress(data, COMPRESSION_LEVEL)
+
+        target = self._path(blob_id, suffix)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, target)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return blob_id
+
+    def get(self, blob_id: str) -> str | None:
+        """
+        Read a blob.
+
+        Args:
+            blob_id: Identifier returned by put()
+
+        Returns:
+            Stored text, or None if the blob does not exist
+        """
+        path = self._find(blob_id)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+            if path.suffix == ".z":
+                data = zlib.decompress(data)
+        except (OSError, zlib.error) as e:
+            logger.warning(f"Could not read blob {blob_id}: {e}")
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def add_ref(self, task_id: str, file_path: str, blob_id: str) -> None:
+        """
+        Record that a task's baseline for a file is a blob.
+
+        References are kept in memory until save_refs() is called.
+        """
+        self._pending.setdefault(task_id, {})[file_path] = blob_id
+
+    def save_refs(self, task_id: str) -> None:
+        """Merge a task's pending references into its manifest."""
+        pending = self._pending.pop(task_id, None)
+        if not pending:
+            return
+        refs = self.task_refs(task_id)
+        refs.update(pending)
+        atomic_write_json(self._manifest(task_id), refs, indent=None)
+
+    def task_refs(self, task_id: str) -> dict[str, str]:
+        """References held by a task (saved and pending)."""
+        refs: dict[str, str] = {}
+        try:
+            with open(self._manifest(task_id), encoding="utf-8") as f:
+                refs = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read blob references of {task_id}: {e}")
+        refs.update(self._pending.get(task_id, {}))
+        return refs
+
+    def release_task(self, task_id: str) -> None:
+        """Drop every reference held by a task."""
+        self._pending.pop(task_id, None)
+        self._manifest(task_id).unlink(missing_ok=True)
+
+    def refcounts(self) -> dict[str, int]:
+        """Number of task references per blob."""
+        counts: dict[str, int] = {}
+        task_ids = {p.stem for p in self.refs_dir.glob("*.json")} | set(self._pending)
+        for task_id in task_ids:
+            for blob_id in self.task_refs(task_id).values():
+                counts[blob_id] = counts.get(blob_id, 0) + 1
+        return counts
+
+    def collect_garbage(self, live: set[str] | None = None) -> int:
+        """
+        Delete blobs with no references.
+
+        Args:
+            live: Blob ids referenced from elsewhere (kept regardless)
+
+        Returns:
+            Number of blobs deleted
+        """
+        keep = set(self.refcounts()) | (live or set())
+        removed = 0
+        for path in self.root.glob("??/*"):
+            if path.suffix not in (".z", ".blob"):
+                continue
+            if path.parent.name + path.stem in keep:
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not delete blob {path.name}: {e}")
+        if removed:
+            logger.debug(f"Removed {removed} unreferenced baseline blobs")
+        return removed
+
+    def _path(self, blob_id: str, suffix: str) -> Path:
+        return self.root / blob_id[:2] / f"{blob_id[2:]}{suffix}"
+
+    def _find(self, blob_id: str) -> Path | None:
+        for suffix in (".z", ".blob"):
+            path = self._path(blob_id, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _manifest(self, task_id: str) -> Path:
+        return self.refs_dir / f"{task_id}.json"
@@ -13,7 +13,6 @@ Provides query and analysis methods for file evolution data:
 from __future__ import annotations
 
 import logging
-import shutil
 from pathlib import Path
 
 from ..types import FileEvolution, TaskSnapshot
@@ -273,7 +272,7 @@ class EvolutionQueries:
             remove_baselines: Whether to remove stored baseline files
 
         Returns:
-            Updated evolutions dictionary
+            The updated evolutions mapping (modified in place)
         """
         # Remove task snapshots from evolutions
         for evolution in evolutions.values():
@@ -281,19 +280,24 @@ class EvolutionQueries:
                 ts for ts in evolution.task_snapshots if ts.task_id != task_id
             ]
 
-        # Remove baseline directory if requested
-        if remove_baselines:
-            baseline_dir = self.storage.baselines_dir / task_id
-            if baseline_dir.exists():
-                shutil.rmtree(baseline_dir)
-                logger.debug(f"Removed baseline directory for task {task_id}")
-
-        # Clean up empty evolutions
-        evolutions = {
-            file_path: evolution
+        # Clean up empty evolutions (in place, so lazily loaded stores keep
+        # tracking what was deleted)
+        empty = [
+            file_path
             for file_path, evolution in evolutions.items()
-            if evolution.task_snapshots
-        }
+            if not evolution.task_snapshots
+        ]
+        for file_path in empty:
+            del evolutions[file_path]
+
+        # Drop the task's baseline references and garbage-collect blobs that
+        # neither another task nor a remaining evolution still uses
+        if remove_baselines:
+            live = {
+                evolution.baseline_snapshot_path for evolution in evolutions.values()
+            }
+            removed = self.storage.release_baselines(task_id, live)
+            logger.debug(f"Removed baselines for task {task_id} ({removed} blobs)")
 
         logger.info(f"Cleaned up data for task {task_id}")
         return evolutions
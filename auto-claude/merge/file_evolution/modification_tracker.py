@@ -15,6 +15,8 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from core.git_batch import diff_per_file, get_object_reader
+
 from ..semantic_analyzer import SemanticAnalyzer
 from ..types import FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
@@ -167,29 +169,16 @@ class ModificationTracker:
                 else changed_files,
             )
 
-            for file_path in changed_files:
-                # Get the diff for this file
-                diff_result = subprocess.run(
-                    ["git", "diff", "main...HEAD", "--", file_path],
-                    cwd=worktree_path,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+            # One diff split per file and one cat-file round trip for the
+            # main-side contents, instead of two git processes per file
+            diffs = diff_per_file(worktree_path, "main...HEAD", changed_files)
+            old_contents = get_object_reader(worktree_path).read_texts(
+                f"main:{file_path}" for file_path in changed_files
+            )
 
-                # Get content before (from main) and after (current)
-                try:
-                    show_result = subprocess.run(
-                        ["git", "show", f"main:{file_path}"],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    old_content = show_result.stdout
-                except subprocess.CalledProcessError:
-                    # File is new
-                    old_content = ""
+            for file_path in changed_files:
+                # Content before (from main); missing means the file is new
+                old_content = old_contents[f"main:{file_path}"] or ""
 
                 current_file = worktree_path / file_path
                 if current_file.exists():
@@ -210,14 +199,14 @@ class ModificationTracker:
                     old_content=old_content,
                     new_content=new_content,
                     evolutions=evolutions,
-                    raw_diff=diff_result.stdout,
+                    raw_diff=diffs[file_path],
                 )
 
             logger.info(
                 f"Refreshed {len(changed_files)} files from worktree for task {task_id}"
             )
 
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             logger.error(f"Failed to refresh from git: {e}")
 
     def mark_task_completed(
@@ -3,7 +3,7 @@ Storage and Persistence Module
 ================================
 
 Handles file system operations for evolution tracking:
-- Loading/saving evolution data from JSON
+- Loading/saving evolution data (sharded records plus an append-only journal)
 - Storing baseline content snapshots
 - Reading file contents from disk
 """
@@ -12,12 +12,172 @@ from __future__ import annotations
 
 import json
 import logging
+import shutil
+from collections.abc import ItemsView, Iterator, Mapping, MutableMapping, ValuesView
 from pathlib import Path
 
-from ..types import FileEvolution
+from core.file_io import atomic_write_json
+
+from ..types import FileEvolution, compute_content_hash
+from .blob_store import BLOB_REF_PREFIX, BlobStore
 
 logger = logging.getLogger(__name__)
 
+# Version of the index/record layout under file_evolution/
+STORE_VERSION = 1
+
+# The journal is compacted once it holds at least this many entries and at
+# least as many entries as there are tracked files
+COMPACT_MIN_ENTRIES = 256
+
+
+class EvolutionMap(MutableMapping[str, FileEvolution]):
+    """
+    Lazily loaded mapping of file paths to FileEvolution objects.
+
+    Layout under ``<storage_dir>/file_evolution/``:
+    - ``records/<hash of path>.json``: one serialized FileEvolution per file
+    - ``index.json``: paths that have a record, as of the last compaction
+    - ``journal.jsonl``: full records of files changed since then, appended
+      in order (a later line for a path supersedes earlier ones)
+
+    Keys are known up front; values are parsed on first access. On save only
+    entries whose serialized form differs from what was last persisted are
+    appended to the journal, so an event costs I/O for the files it touched
+    rather than for every tracked file. FileEvolution objects may be mutated
+    in place; changes are detected when the store is saved.
+    """
+
+    def __init__(self, storage: EvolutionStorage):
+        self._storage = storage
+        # Path -> FileEvolution (loaded), dict (journaled, not parsed yet)
+        # or None (only in its record file)
+        self._entries: dict[str, FileEvolution | dict | None] = {}
+        # Serialized form last persisted, for loaded entries
+        self._persisted: dict[str, str] = {}
+        # Paths whose record file is out of date / must be removed
+        self._stale: set[str] = set()
+        self._removed: set[str] = set()
+        # Paths deleted since the last save
+        self._deleted: set[str] = set()
+        self._journal_entries = 0
+
+    def __getitem__(self, file_path: str) -> FileEvolution:
+        entry = self._entries[file_path]
+        if isinstance(entry, FileEvolution):
+            return entry
+
+        data = entry if entry is not None else self._storage.read_record(file_path)
+        try:
+            evolution = FileEvolution.from_dict(data)
+        except Exception as e:
+            if data is not None:
+                logger.warning(f"Dropping unreadable evolution for {file_path}: {e}")
+            del self._entries[file_path]
+            raise KeyError(file_path) from None
+
+        self._entries[file_path] = evolution
+        self._persisted[file_path] = _serialize(evolution)
+        return evolution
+
+    def __setitem__(self, file_path: str, evolution: FileEvolution) -> None:
+        self._entries[file_path] = evolution
+        self._deleted.discard(file_path)
+
+    def __delitem__(self, file_path: str) -> None:
+        del self._entries[file_path]
+        self._persisted.pop(file_path, None)
+        self._deleted.add(file_path)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._entries
+
+    def load_all(self) -> None:
+        """Load every entry (dropping those whose record is unreadable)."""
+        for file_path in list(self._entries):
+            try:
+                self[file_path]
+            except KeyError:
+                pass
+
+    def items(self) -> ItemsView[str, FileEvolution]:
+        self.load_all()
+        return super().items()
+
+    def values(self) -> ValuesView[FileEvolution]:
+        self.load_all()
+        return super().values()
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of entries parsed so far."""
+        return sum(isinstance(e, FileEvolution) for e in self._entries.values())
+
+    # Hooks used by EvolutionStorage
+
+    def _add_stored(self, file_path: str) -> None:
+        self._entries[file_path] = None
+
+    def _add_journaled(self, file_path: str, data: dict) -> None:
+        self._entries[file_path] = data
+        self._stale.add(file_path)
+        self._removed.discard(file_path)
+
+    def _discard_stored(self, file_path: str) -> None:
+        self._entries.pop(file_path, None)
+        self._stale.discard(file_path)
+        self._removed.add(file_path)
+
+    def _collect_changes(self) -> list[str]:
+        """Journal lines for entries changed since the last save."""
+        lines = []
+        for file_path in self._deleted:
+            lines.append(json.dumps({"op": "delete", "file": file_path}) + "\n")
+            self._stale.discard(file_path)
+            self._removed.add(file_path)
+        self._deleted.clear()
+
+        for file_path, entry in self._entries.items():
+            if not isinstance(entry, FileEvolution):
+                continue
+            serialized = _serialize(entry)
+            if self._persisted.get(file_path) == serialized:
+                continue
+            lines.append(
+                f'{{"op": "put", "file": {json.dumps(file_path)}, '
+                f'"evolution": {serialized}}}\n'
+            )
+            self._persisted[file_path] = serialized
+            self._stale.add(file_path)
+            self._removed.discard(file_path)
+        return lines
+
+    def _stale_records(self) -> Iterator[tuple[str, dict]]:
+        for file_path in list(self._stale):
+            entry = self._entries.get(file_path)
+            if isinstance(entry, FileEvolution):
+                yield file_path, entry.to_dict()
+            elif entry is not None:
+                yield file_path, entry
+
+    def _removed_records(self) -> list[str]:
+        return [p for p in self._removed if p not in self._entries]
+
+    def _mark_compacted(self) -> None:
+        self._stale.clear()
+        self._removed.clear()
+        self._journal_entries = 0
+
+
+def _serialize(evolution: FileEvolution) -> str:
+    return json.dumps(evolution.to_dict(), sort_keys=True)
+
 
 class EvolutionStorage:
     """
@@ -25,7 +185,7 @@ class EvolutionStorage:
 
     Responsibilities:
     - Load/save evolution data to JSON
-    - Store baseline content snapshots
+    - Store baseline content snapshots (deduplicated in a BlobStore)
     - Read file contents safely
     """
 
@@ -33,6 +193,7 @@ class EvolutionStorage:
         self,
         project_dir: Path,
         storage_dir: Path,
+        compress_baselines: bool = True,
     ):
         """
         Initialize evolution storage.
@@ -40,61 +201,183 @@ class EvolutionStorage:
         Args:
             project_dir: Root directory of the project
             storage_dir: Directory for evolution data (.auto-claude/)
+            compress_baselines: Whether baseline blobs are zlib-compressed
         """
         self.project_dir = Path(project_dir).resolve()
         self.storage_dir = Path(storage_dir).resolve()
+        # Per-task baseline copies written by older versions
         self.baselines_dir = self.storage_dir / "baselines"
+        self.blob_store = BlobStore(
+            self.storage_dir / "blobs", compress=compress_baselines
+        )
+        # Legacy single-file store, migrated on first load
         self.evolution_file = self.storage_dir / "file_evolution.json"
+        self.evolution_dir = self.storage_dir / "file_evolution"
+        self.records_dir = self.evolution_dir / "records"
+        self.index_file = self.evolution_dir / "index.json"
+        self.journal_file = self.evolution_dir / "journal.jsonl"
 
         # Ensure directories exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.baselines_dir.mkdir(parents=True, exist_ok=True)
+        self.evolution_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_evolutions(self) -> dict[str, FileEvolution]:
+    def load_evolutions(self) -> EvolutionMap:
         """
-        Load evolution data from disk.
+        Open the evolution store.
+
+        Only the index and the journal are read here; each FileEvolution is
+        loaded from its record file on first access. A legacy single-file
+        ``file_evolution.json`` is migrated to the sharded layout.
 
         Returns:
-            Dictionary mapping file paths to FileEvolution objects
+            Mapping of file paths to FileEvolution objects
         """
-        if not self.evolution_file.exists():
-            return {}
+        evolutions = EvolutionMap(self)
+
+        if not self.index_file.exists() and self.evolution_file.exists():
+            self._migrate_legacy_file(evolutions)
+            return evolutions
 
         try:
-            with open(self.evolution_file) as f:
-                data = json.load(f)
+            if self.index_file.exists():
+                with open(self.index_file, encoding="utf-8") as f:
+                    index = json.load(f)
+                for file_path in index.get("files", []):
+                    evolutions._add_stored(file_path)
+        except Exception as e:
+            logger.error(f"Failed to load evolution index: {e}")
 
-            evolutions = {}
-            for file_path, evolution_data in data.items():
-                evolutions[file_path] = FileEvolution.from_dict(evolution_data)
+        self._replay_journal(evolutions)
+        logger.debug(f"Indexed evolution data for {len(evolutions)} files")
+        return evolutions
 
-            logger.debug(f"Loaded evolution data for {len(evolutions)} files")
-            return evolutions
+    def save_evolutions(self, evolutions: Mapping[str, FileEvolution]) -> None:
+        """
+        Persist evolution data to disk.
+
+        For an EvolutionMap only the entries that changed since the last save
+        are appended to the journal; the journal is folded into the record
+        files once it grows past the number of tracked files. Any other
+        mapping is taken as the complete state and written out in full.
+
+        Args:
+            evolutions: Mapping of file paths to FileEvolution objects
+        """
+        try:
+            if not isinstance(evolutions, EvolutionMap):
+                full = EvolutionMap(self)
+                for file_path, evolution in evolutions.items():
+                    full[file_path] = evolution
+                full._collect_changes()
+                self._compact(full, replace_all=True)
+                return
+
+            lines = evolutions._collect_changes()
+            if lines:
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+                evolutions._journal_entries += len(lines)
+                logger.debug(f"Journaled {len(lines)} evolution changes")
+
+            if evolutions._journal_entries >= max(COMPACT_MIN_ENTRIES, len(evolutions)):
+                self._compact(evolutions)
 
         except Exception as e:
-            logger.error(f"Failed to load evolution data: {e}")
-            return {}
+            logger.error(f"Failed to save evolution data: {e}")
 
-    def save_evolutions(self, evolutions: dict[str, FileEvolution]) -> None:
+    def compact(self, evolutions: EvolutionMap) -> None:
         """
-        Persist evolution data to disk.
+        Fold the journal into the record files and rewrite the index.
 
         Args:
-            evolutions: Dictionary mapping file paths to FileEvolution objects
+            evolutions: Store returned by load_evolutions()
         """
+        self.save_evolutions(evolutions)
+        self._compact(evolutions)
+
+    def record_path(self, file_path: str) -> Path:
+        """Record file holding one file's evolution."""
+        return self.records_dir / f"{compute_content_hash(file_path)}.json"
+
+    def read_record(self, file_path: str) -> dict | None:
+        """
+        Read one file's evolution record.
+
+        Returns:
+            Serialized FileEvolution, or None if missing or unreadable
+        """
+        path = self.record_path(file_path)
         try:
-            data = {
-                file_path: evolution.to_dict()
-                for file_path, evolution in evolutions.items()
-            }
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"Missing evolution record for {file_path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read evolution record for {file_path}: {e}")
+        return None
+
+    def _replay_journal(self, evolutions: EvolutionMap) -> None:
+        """Apply journaled changes on top of the indexed records."""
+        if not self.journal_file.exists():
+            return
+        try:
+            with open(self.journal_file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        file_path = entry["file"]
+                    except (ValueError, KeyError, TypeError):
+                        # Torn last line after a crash mid-append
+                        logger.warning("Skipping unreadable evolution journal entry")
+                        continue
+                    if entry.get("op") == "delete":
+                        evolutions._discard_stored(file_path)
+                    else:
+                        evolutions._add_journaled(file_path, entry["evolution"])
+                    evolutions._journal_entries += 1
+        except Exception as e:
+            logger.error(f"Failed to replay evolution journal: {e}")
+
+    def _compact(self, evolutions: EvolutionMap, replace_all: bool = False) -> None:
+        """Write stale records, drop deleted ones, rewrite index, clear journal."""
+        self.records_dir.mkdir(parents=True, exist_ok=True)
 
-            with open(self.evolution_file, "w") as f:
-                json.dump(data, f, indent=2)
+        for file_path, data in evolutions._stale_records():
+            atomic_write_json(self.record_path(file_path), data, indent=None)
 
-            logger.debug(f"Saved evolution data for {len(evolutions)} files")
+        for file_path in evolutions._removed_records():
+            self.record_path(file_path).unlink(missing_ok=True)
 
+        atomic_write_json(
+            self.index_file,
+            {"version": STORE_VERSION, "files": list(evolutions)},
+            indent=None,
+        )
+
+        if replace_all:
+            # Records of files no longer tracked by anyone
+            keep = {self.record_path(p).name for p in evolutions}
+            for path in self.records_dir.glob("*.json"):
+                if path.name not in keep:
+                    path.unlink(missing_ok=True)
+
+        self.journal_file.unlink(missing_ok=True)
+        evolutions._mark_compacted()
+        logger.debug(f"Compacted evolution data for {len(evolutions)} files")
+
+    def _migrate_legacy_file(self, evolutions: EvolutionMap) -> None:
+        """Move a single-file file_evolution.json into the sharded layout."""
+        try:
+            with open(self.evolution_file, encoding="utf-8") as f:
+                data = json.load(f)
+            for file_path, evolution_data in data.items():
+                evolutions._add_journaled(file_path, evolution_data)
+            self._compact(evolutions, replace_all=True)
+            self.evolution_file.unlink()
+            logger.info(f"Migrated evolution data for {len(evolutions)} files")
         except Exception as e:
-            logger.error(f"Failed to save evolution data: {e}")
+            logger.error(f"Failed to migrate evolution data: {e}")
 
     def store_baseline_content(
         self,
@@ -105,35 +388,76 @@ class EvolutionStorage:
         """
         Store baseline content to disk.
 
+        Identical content is stored once; the task gets a reference to it
+        (persisted by save_baseline_refs()).
+
         Args:
             file_path: Relative path to the file
             content: File content to store
             task_id: Task identifier
 
         Returns:
-            Path to the stored baseline file (relative to storage_dir)
+            Baseline snapshot reference ("blob:<id>")
         """
-        from ..types import sanitize_path_for_storage
+        blob_id = self.blob_store.put(content)
+        self.blob_store.add_ref(task_id, file_path, blob_id)
+        return f"{BLOB_REF_PREFIX}{blob_id}"
 
-        safe_name = sanitize_path_for_storage(file_path)
-        baseline_path = self.baselines_dir / task_id / f"{safe_name}.baseline"
-        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    def save_baseline_refs(self, task_id: str) -> None:
+        """
+        Persist the baseline references a task took since the last call.
 
-        with open(baseline_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        Args:
+            task_id: Task identifier
+        """
+        try:
+            self.blob_store.save_refs(task_id)
+        except Exception as e:
+            logger.error(f"Failed to save baseline references for {task_id}: {e}")
 
-        return str(baseline_path.relative_to(self.storage_dir))
+    def release_baselines(
+        self,
+        task_id: str,
+        live_snapshot_paths: set[str] | None = None,
+    ) -> int:
+        """
+        Drop a task's baselines and delete blobs nothing references.
+
+        Args:
+            task_id: Task identifier
+            live_snapshot_paths: Baseline references still in use elsewhere
+                (e.g. by remaining evolutions); their blobs are kept
+
+        Returns:
+            Number of blobs deleted
+        """
+        self.blob_store.release_task(task_id)
+
+        legacy_dir = self.baselines_dir / task_id
+        if legacy_dir.exists():
+            shutil.rmtree(legacy_dir)
+
+        live = {
+            ref[len(BLOB_REF_PREFIX) :]
+            for ref in live_snapshot_paths or ()
+            if ref.startswith(BLOB_REF_PREFIX)
+        }
+        return self.blob_store.collect_garbage(live)
 
     def read_baseline_content(self, baseline_snapshot_path: str) -> str | None:
         """
         Read baseline content from disk.
 
         Args:
-            baseline_snapshot_path: Path to baseline file (relative to storage_dir)
+            baseline_snapshot_path: Blob reference, or path to a baseline file
+                (relative to storage_dir) written by older versions
 
         Returns:
             Baseline content, or None if not available
         """
+        if baseline_snapshot_path.startswith(BLOB_REF_PREFIX):
+            return self.blob_store.get(baseline_snapshot_path[len(BLOB_REF_PREFIX) :])
+
         baseline_path = self.storage_dir / baseline_snapshot_path
         if baseline_path.exists():
             try:
@@ -19,7 +19,7 @@ from ..types import FileEvolution, TaskSnapshot
 from .baseline_capture import DEFAULT_EXTENSIONS, BaselineCapture
 from .evolution_queries import EvolutionQueries
 from .modification_tracker import ModificationTracker
-from .storage import EvolutionStorage
+from .storage import EvolutionMap, EvolutionStorage
 
 # Import debug utilities
 try:
@@ -93,8 +93,8 @@ class FileEvolutionTracker:
         )
         self.queries = EvolutionQueries(self.storage)
 
-        # Load existing evolution data
-        self._evolutions: dict[str, FileEvolution] = self.storage.load_evolutions()
+        # Open existing evolution data (entries are loaded on first access)
+        self._evolutions: EvolutionMap = self.storage.load_evolutions()
 
         debug_success(
             MODULE,
@@ -273,7 +273,7 @@ class FileEvolutionTracker:
             task_id: The task identifier
             remove_baselines: Whether to remove stored baseline files
         """
-        self._evolutions = self.queries.cleanup_task(
+        self.queries.cleanup_task(
             task_id=task_id,
             evolutions=self._evolutions,
             remove_baselines=remove_baselines,
@@ -15,6 +15,8 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+from core.git_batch import get_object_reader
+
 
 def find_worktree(project_dir: Path, task_id: str) -> Path | None:
     """
@@ -66,13 +68,7 @@ def get_file_from_branch(project_dir: Path, file_path: str, branch: str) -> str
         File content as string, or None if file doesn't exist on branch
     """
     try:
-        result = subprocess.run(
-            ["git", "show", f"{branch}:{file_path}"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
+        return get_object_reader(project_dir).read_text(f"{branch}:{file_path}")
+    except OSError:
+        # Not a git repository (or git is unavailable)
         return None
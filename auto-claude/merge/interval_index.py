@@ -0,0 +1,113 @@
+"""
+Interval Index
+==============
+
+Static interval index over inclusive integer ranges (line ranges).
+
+Used by conflict analysis to find changes whose line ranges overlap without
+comparing every pair of changes:
+- overlapping_pairs(): all overlapping pairs in O(n log n + k)
+- query(): all intervals overlapping a range in O(log n + k)
+
+The index is an augmented interval tree laid out implicitly over the
+intervals sorted by start: the node for a slice is its middle element, and
+each node stores the largest end in its slice so whole subtrees that end
+before the query are skipped.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """Overlap queries over inclusive ``[start, end]`` ranges."""
+
+    def __init__(self, intervals: Iterable[tuple[int, int, T]]):
+        """
+        Build the index.
+
+        Args:
+            intervals: (start, end, item) triples; ranges are inclusive and a
+                reversed range is treated as its normalized form
+        """
+        items = [
+            (min(start, end), max(start, end), item) for start, end, item in intervals
+        ]
+        # Sort by range only: items need not be comparable
+        items.sort(key=lambda iv: (iv[0], iv[1]))
+        self._items = items
+        self._starts = [iv[0] for iv in items]
+        self._max_end = list(self._starts)
+        self._build(0, len(items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[tuple[int, int, T]]:
+        return iter(self._items)
+
+    def _build(self, lo: int, hi: int) -> int:
+        """Fill the subtree maximum end for items[lo:hi]; returns it."""
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        max_end = max(
+            self._items[mid][1], self._build(lo, mid), self._build(mid + 1, hi)
+        )
+        self._max_end[mid] = max_end
+        return max_end
+
+    def query(self, start: int, end: int) -> list[tuple[int, int, T]]:
+        """
+        Find intervals overlapping ``[start, end]``.
+
+        Args:
+            start: First line of the range
+            end: Last line of the range (inclusive)
+
+        Returns:
+            Overlapping (start, end, item) triples, ordered by start
+        """
+        if start > end:
+            start, end = end, start
+        found: list[tuple[int, int, T]] = []
+        stack = [(0, len(self._items))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] < start:
+                continue  # everything in this slice ends before the range
+            # Right half starts at or after items[mid]; prune if past the end
+            if self._starts[mid] <= end:
+                stack.append((mid + 1, hi))
+                if self._items[mid][1] >= start:
+                    found.append(self._items[mid])
+            stack.append((lo, mid))
+        found.sort(key=lambda iv: (iv[0], iv[1]))
+        return found
+
+    def overlapping_pairs(self) -> Iterator[tuple[T, T]]:
+        """
+        Yield every pair of items whose ranges overlap.
+
+        Sweeps the intervals by start, keeping the ones still open in a heap
+        ordered by end. Each pair is yielded once, earlier start first.
+        """
+        active: list[tuple[int, int]] = []  # (end, position) of open intervals
+        for position, (start, end, item) in enumerate(self._items):
+            while active and active[0][0] < start:
+                heapq.heappop(active)
+            for _, other in active:
+                yield self._items[other][2], item
+            heapq.heappush(active, (end, position))
+
+    def has_overlap(self) -> bool:
+        """True if any two ranges overlap."""
+        return next(self.overlapping_pairs(), None) is not None
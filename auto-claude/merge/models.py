@@ -36,6 +36,8 @@ class MergeStats:
     ai_calls_made: int = 0
     estimated_tokens_used: int = 0
     duration_seconds: float = 0.0
+    # Wall-clock seconds per pipeline stage (refresh, baseline, merge, ai)
+    stage_durations: dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -51,6 +53,7 @@ class MergeStats:
             "ai_calls_made": self.ai_calls_made,
             "estimated_tokens_used": self.estimated_tokens_used,
             "duration_seconds": self.duration_seconds,
+            "stage_durations": dict(self.stage_durations),
         }
 
     @property
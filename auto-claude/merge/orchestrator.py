@@ -19,25 +19,38 @@ with maximum automation and minimum AI token usage.
 from __future__ import annotations
 
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .ai_resolver import AIResolver, create_claude_resolver
+from .ai_resolver import (
+    AIResolver,
+    ResolutionCache,
+    ResolutionRequest,
+    create_claude_resolver,
+)
 from .auto_merger import AutoMerger
 from .conflict_detector import ConflictDetector
 from .conflict_resolver import ConflictResolver
 from .file_evolution import FileEvolutionTracker
+from .file_merger import extract_location_content
 from .git_utils import find_worktree, get_file_from_branch
 from .merge_pipeline import MergePipeline
 
 # Re-export models for backwards compatibility
 from .models import MergeReport, MergeStats, TaskMergeRequest
+from .semantic_analysis.element_cache import ElementCache
 from .semantic_analyzer import SemanticAnalyzer
 from .types import (
     ConflictRegion,
+    ConflictSeverity,
     FileAnalysis,
     MergeDecision,
+    MergeResult,
+    TaskSnapshot,
 )
 
 # Import debug utilities
@@ -91,6 +104,45 @@ __all__ = [
 ]
 
 
+# Files below this count are merged in-process (pool startup costs more)
+PARALLEL_MIN_FILES = 8
+
+# Maximum concurrent AI resolution calls
+MAX_PARALLEL_AI_CALLS = 5
+
+# (file_path, baseline_content, task_snapshots)
+MergeJob = tuple[str, str, list[TaskSnapshot]]
+
+# Per-process pipeline used by deterministic merge workers
+_worker_pipeline: MergePipeline | None = None
+
+
+def _init_merge_worker(
+    conflict_detector: ConflictDetector, auto_merger: AutoMerger
+) -> None:
+    """Build the AI-free pipeline once per worker process."""
+    global _worker_pipeline
+    _worker_pipeline = _deterministic_pipeline(conflict_detector, auto_merger)
+
+
+def _merge_in_worker(job: MergeJob) -> MergeResult:
+    """Run detection and deterministic merging for one file in a worker."""
+    file_path, baseline_content, task_snapshots = job
+    return _worker_pipeline.merge_file(file_path, baseline_content, task_snapshots)
+
+
+def _deterministic_pipeline(
+    conflict_detector: ConflictDetector, auto_merger: AutoMerger
+) -> MergePipeline:
+    """Pipeline that detects conflicts and auto-merges, never calling AI."""
+    return MergePipeline(
+        conflict_detector=conflict_detector,
+        conflict_resolver=ConflictResolver(
+            auto_merger=auto_merger, ai_resolver=None, enable_ai=False
+        ),
+    )
+
+
 class MergeOrchestrator:
     """
     Orchestrates the complete merge pipeline.
@@ -119,6 +171,7 @@ class MergeOrchestrator:
         enable_ai: bool = True,
         ai_resolver: AIResolver | None = None,
         dry_run: bool = False,
+        max_workers: int | None = None,
     ):
         """
         Initialize the merge orchestrator.
@@ -129,6 +182,8 @@ class MergeOrchestrator:
             enable_ai: Whether to use AI for ambiguous conflicts
             ai_resolver: Optional pre-configured AI resolver
             dry_run: If True, don't write any files
+            max_workers: Worker processes for per-file merging
+                (default: CPU count, capped at 4; 1 = merge in-process)
         """
         debug_section(MODULE, "Initializing MergeOrchestrator")
         debug(
@@ -143,10 +198,17 @@ class MergeOrchestrator:
         self.storage_dir = storage_dir or (self.project_dir / ".auto-claude")
         self.enable_ai = enable_ai
         self.dry_run = dry_run
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
 
         # Initialize components
         debug_detailed(MODULE, "Initializing sub-components...")
-        self.analyzer = SemanticAnalyzer()
+        # Parsed elements persist across merge runs when storage already exists
+        element_cache = None
+        if Path(self.storage_dir).is_dir():
+            element_cache = ElementCache(
+                cache_dir=Path(self.storage_dir) / "semantic_cache"
+            )
+        self.analyzer = SemanticAnalyzer(element_cache=element_cache)
         self.conflict_detector = ConflictDetector()
         self.auto_merger = AutoMerger()
         self.evolution_tracker = FileEvolutionTracker(
@@ -177,6 +239,11 @@ class MergeOrchestrator:
         if not self._ai_resolver_initialized:
             if self.enable_ai:
                 self._ai_resolver = create_claude_resolver()
+                # Resolutions persist across merge runs when storage exists
+                cache_dir = None
+                if Path(self.storage_dir).is_dir():
+                    cache_dir = Path(self.storage_dir) / "ai_resolutions"
+                self._ai_resolver.cache = ResolutionCache(cache_dir=cache_dir)
             else:
                 self._ai_resolver = AIResolver()  # No AI function
             self._ai_resolver_initialized = True
@@ -246,7 +313,11 @@ class MergeOrchestrator:
 
             # Ensure evolution data is up to date
             debug(MODULE, "Refreshing evolution data from git...")
+            refresh_start = time.perf_counter()
             self.evolution_tracker.refresh_from_git(task_id, worktree_path)
+            report.stats.stage_durations["refresh"] = (
+                time.perf_counter() - refresh_start
+            )
 
             # Get files modified by this task
             modifications = self.evolution_tracker.get_task_modifications(task_id)
@@ -261,18 +332,13 @@ class MergeOrchestrator:
                 report.completed_at = datetime.now()
                 return report
 
-            # Process each modified file
-            for file_path, snapshot in modifications:
-                debug_detailed(
-                    MODULE,
-                    f"Processing file: {file_path}",
-                    changes=len(snapshot.semantic_changes),
-                )
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=[snapshot],
-                    target_branch=target_branch,
-                )
+            # Merge all modified files (concurrently; results keep file order)
+            results = self._merge_files(
+                [(file_path, [snapshot]) for file_path, snapshot in modifications],
+                target_branch=target_branch,
+                stats=report.stats,
+            )
+            for file_path, result in results.items():
                 report.file_results[file_path] = result
                 self._update_stats(report.stats, result)
                 debug_verbose(
@@ -339,17 +405,23 @@ class MergeOrchestrator:
             requests = sorted(requests, key=lambda r: -r.priority)
 
             # Refresh evolution data for all tasks
+            refresh_start = time.perf_counter()
             for request in requests:
                 if request.worktree_path and request.worktree_path.exists():
                     self.evolution_tracker.refresh_from_git(
                         request.task_id, request.worktree_path
                     )
 
+            report.stats.stage_durations["refresh"] = (
+                time.perf_counter() - refresh_start
+            )
+
             # Find all files modified by any task
             task_ids = [r.task_id for r in requests]
             file_tasks = self.evolution_tracker.get_files_modified_by_tasks(task_ids)
 
-            # Process each file
+            # Collect each file with the snapshots of the tasks that modified it
+            jobs: list[tuple[str, list[TaskSnapshot]]] = []
             for file_path, modifying_tasks in file_tasks.items():
                 # Get snapshots from all tasks that modified this file
                 evolution = self.evolution_tracker.get_file_evolution(file_path)
@@ -365,11 +437,12 @@ class MergeOrchestrator:
                 if not snapshots:
                     continue
 
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=snapshots,
-                    target_branch=target_branch,
-                )
+                jobs.append((file_path, snapshots))
+
+            results = self._merge_files(
+                jobs, target_branch=target_branch, stats=report.stats
+            )
+            for file_path, result in results.items():
                 report.file_results[file_path] = result
                 self._update_stats(report.stats, result)
 
@@ -417,7 +490,15 @@ class MergeOrchestrator:
             target_branch=target_branch,
         )
 
-        # Get baseline content
+        # Delegate to merge pipeline
+        return self.merge_pipeline.merge_file(
+            file_path=file_path,
+            baseline_content=self._get_baseline(file_path, target_branch),
+            task_snapshots=task_snapshots,
+        )
+
+    def _get_baseline(self, file_path: str, target_branch: str) -> str:
+        """Get the content tasks' changes are applied to ("" for new files)."""
         baseline_content = self.evolution_tracker.get_baseline_content(file_path)
         if baseline_content is None:
             # Try to get from target branch
@@ -429,11 +510,119 @@ class MergeOrchestrator:
             # File is new - created by task(s)
             baseline_content = ""
 
-        # Delegate to merge pipeline
-        return self.merge_pipeline.merge_file(
-            file_path=file_path,
-            baseline_content=baseline_content,
-            task_snapshots=task_snapshots,
+        return baseline_content
+
+    def _merge_files(
+        self,
+        files: list[tuple[str, list[TaskSnapshot]]],
+        target_branch: str,
+        stats: MergeStats,
+    ) -> dict[str, MergeResult]:
+        """
+        Merge many files, running independent files concurrently.
+
+        Stages (timed into stats.stage_durations):
+        1. baseline: load each file's baseline content
+        2. merge: conflict detection and deterministic merging, in worker
+           processes when there are enough files
+        3. ai: conflicts the AI resolver handles are resolved in packed
+           batches across files (when the resolver caches resolutions), then
+           those files are re-run through the full pipeline, at most
+           MAX_PARALLEL_AI_CALLS at a time
+
+        Args:
+            files: (file_path, task_snapshots) pairs
+            target_branch: Branch to merge into
+            stats: Stats to record stage durations into
+
+        Returns:
+            Dictionary mapping file paths to results, in the order of files
+        """
+        start = time.perf_counter()
+        jobs: list[MergeJob] = [
+            (file_path, self._get_baseline(file_path, target_branch), snapshots)
+            for file_path, snapshots in files
+        ]
+        stats.stage_durations["baseline"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = self._merge_deterministic(jobs)
+        stats.stage_durations["merge"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ai_indexes = [i for i, result in enumerate(results) if self._needs_ai(result)]
+        if ai_indexes:
+            debug(MODULE, f"Resolving {len(ai_indexes)} file(s) with AI")
+            for prefetched in self._prefetch_resolutions(
+                [(jobs[i], results[i]) for i in ai_indexes]
+            ):
+                # Calls made here are not repeated in the per-file results
+                stats.ai_calls_made += prefetched.ai_calls_made
+                stats.estimated_tokens_used += prefetched.tokens_used
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_AI_CALLS) as pool:
+                ai_results = pool.map(
+                    lambda job: self.merge_pipeline.merge_file(*job),
+                    [jobs[i] for i in ai_indexes],
+                )
+                for i, result in zip(ai_indexes, ai_results):
+                    results[i] = result
+        stats.stage_durations["ai"] = time.perf_counter() - start
+
+        return {job[0]: result for job, result in zip(jobs, results)}
+
+    def _prefetch_resolutions(
+        self, files: list[tuple[MergeJob, MergeResult]]
+    ) -> list[MergeResult]:
+        """
+        Resolve the AI-bound conflicts of all files in packed batches.
+
+        Answers land in the resolver's cache, so the per-file pipeline run
+        that follows reuses them instead of calling AI once per conflict.
+        Skipped when the resolver has no cache to carry the answers over.
+
+        Returns:
+            One result per prefetched conflict (for call and token counts)
+        """
+        resolver = self.ai_resolver
+        if resolver.cache is None or resolver.ai_call_fn is None:
+            return []
+
+        requests = [
+            ResolutionRequest(
+                conflict,
+                extract_location_content(baseline_content, conflict.location),
+                snapshots,
+            )
+            for (_, baseline_content, snapshots), result in files
+            for conflict in result.conflicts_remaining
+            if conflict.severity in {ConflictSeverity.MEDIUM, ConflictSeverity.HIGH}
+        ]
+        return resolver.resolve_batched(requests, max_parallel=MAX_PARALLEL_AI_CALLS)
+
+    def _merge_deterministic(self, jobs: list[MergeJob]) -> list[MergeResult]:
+        """Detect conflicts and auto-merge every job without calling AI."""
+        if self.max_workers > 1 and len(jobs) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(jobs)),
+                    initializer=_init_merge_worker,
+                    initargs=(self.conflict_detector, self.auto_merger),
+                ) as pool:
+                    chunksize = max(1, len(jobs) // (self.max_workers * 4))
+                    return list(pool.map(_merge_in_worker, jobs, chunksize=chunksize))
+            except Exception as e:
+                # Pool or pickling failure; a genuine merge error will be
+                # raised again by the in-process run below
+                debug_warning(MODULE, f"Parallel merge failed, merging in-process: {e}")
+
+        pipeline = _deterministic_pipeline(self.conflict_detector, self.auto_merger)
+        return [pipeline.merge_file(*job) for job in jobs]
+
+    def _needs_ai(self, result: MergeResult) -> bool:
+        """Whether the full pipeline would send a remaining conflict to AI."""
+        return self.enable_ai and any(
+            conflict.severity in {ConflictSeverity.MEDIUM, ConflictSeverity.HIGH}
+            for conflict in result.conflicts_remaining
         )
 
     def get_pending_conflicts(self) -> list[tuple[str, list[ConflictRegion]]]:
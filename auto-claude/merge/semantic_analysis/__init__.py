@@ -6,9 +6,19 @@ This package provides modular semantic analysis capabilities:
 - python_analyzer.py: Python-specific AST extraction
 - js_analyzer.py: JavaScript/TypeScript-specific AST extraction
 - comparison.py: Element comparison and change classification
+- element_cache.py: Content-hash cache of extracted elements
+- incremental.py: Edit computation and element reuse for incremental reparsing
+- line_index.py: Byte offset to line number lookup
 - regex_analyzer.py: Fallback regex-based analysis
 """
 
+from .element_cache import ElementCache, get_shared_element_cache
+from .line_index import LineIndex
 from .models import ExtractedElement
 
-__all__ = ["ExtractedElement"]
+__all__ = [
+    "ElementCache",
+    "ExtractedElement",
+    "LineIndex",
+    "get_shared_element_cache",
+]
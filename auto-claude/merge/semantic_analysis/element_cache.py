@@ -0,0 +1,240 @@
+"""
+Cache of extracted structural elements, keyed by content hash.
+
+The same file version is analyzed many times during a merge: a baseline is
+the "before" side of every task that touched the file, and refresh_from_git
+re-analyzes every changed file each time it runs. Parsing and element
+extraction depend only on the content and the language, so the resulting
+``ExtractedElement`` maps are cached under ``(compute_content_hash(content),
+extension)``:
+
+- In memory, as an LRU bounded by entry count (shared by default by every
+  SemanticAnalyzer in the process).
+- Optionally on disk, one JSON file per entry, so separate merge runs and
+  processes reuse each other's parses. The directory is bounded by entry
+  count: reads refresh an entry's mtime, and once the count is exceeded the
+  least recently used files are deleted.
+
+Cached element maps are shared: treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+
+from core.file_io import atomic_write_json
+
+from ..types import compute_content_hash
+from .models import ExtractedElement
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction output changes so stale disk entries are ignored
+CACHE_VERSION = 2
+
+DEFAULT_MAX_ENTRIES = 512
+
+DEFAULT_MAX_DISK_ENTRIES = 4096
+
+ElementMap = dict[str, ExtractedElement]
+
+
+class ElementCache:
+    """Thread-safe LRU of element maps with an optional on-disk layer."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Path | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum element maps kept in memory
+            cache_dir: Directory for persistent entries (None = memory only)
+            max_disk_entries: Maximum entry files kept in cache_dir
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_entries = max_disk_entries
+        self._entries: OrderedDict[tuple[str, str], ElementMap] = OrderedDict()
+        self._lock = threading.Lock()
+        # Entry files in cache_dir, counted on the first save
+        self._disk_count: int | None = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(content: str, ext: str) -> tuple[str, str]:
+        """Cache key for a file version in a language (by extension)."""
+        return compute_content_hash(content), ext
+
+    def get(self, content: str, ext: str) -> ElementMap | None:
+        """
+        Look up the elements extracted from content.
+
+        Args:
+            content: File content
+            ext: File extension selecting the language (e.g. ".py")
+
+        Returns:
+            Cached element map, or None on a miss
+        """
+        key = self.key_for(content, ext)
+        with self._lock:
+            elements = self._entries.get(key)
+            if elements is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return elements
+
+        elements = self._load(key)
+        with self._lock:
+            if elements is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, elements)
+        return elements
+
+    def put(self, content: str, ext: str, elements: ElementMap) -> None:
+        """
+        Store the elements extracted from content.
+
+        Args:
+            content: File content the elements were extracted from
+            ext: File extension selecting the language
+            elements: Extracted element map
+        """
+        key = self.key_for(content, ext)
+        with self._lock:
+            self._remember(key, elements)
+        self._save(key, elements)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def prune_disk(self, keep: int | None = None) -> int:
+        """
+        Delete the least recently used entry files from cache_dir.
+
+        Args:
+            keep: Entry files to keep (default: three quarters of
+                max_disk_entries, so pruning is not repeated on every save)
+
+        Returns:
+            Number of files deleted
+        """
+        if self.cache_dir is None:
+            return 0
+        if keep is None:
+            keep = self.max_disk_entries * 3 // 4
+
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        files.sort(reverse=True)
+
+        removed = 0
+        for _, path in files[keep:]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_count = len(files) - removed
+        return removed
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def _remember(self, key: tuple[str, str], elements: ElementMap) -> None:
+        """Insert under the lock, evicting least recently used entries."""
+        self._entries[key] = elements
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: tuple[str, str]) -> Path:
+        content_hash, ext = key
+        return self.cache_dir / f"{content_hash}{ext.replace('.', '_')}.json"
+
+    def _load(self, key: tuple[str, str]) -> ElementMap | None:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return None
+            elements = {
+                name: ExtractedElement(**fields)
+                for name, fields in data["elements"].items()
+            }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable element cache entry {path}: {e}")
+            return None
+
+        # Mark the entry as recently used for prune_disk()
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return elements
+
+    def _save(self, key: tuple[str, str], elements: ElementMap) -> None:
+        if self.cache_dir is None:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "elements": {name: asdict(elem) for name, elem in elements.items()},
+        }
+        try:
+            atomic_write_json(self._path(key), data, indent=None)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not persist element cache entry: {e}")
+            return
+
+        with self._lock:
+            if self._disk_count is None:
+                self._disk_count = sum(1 for _ in self.cache_dir.glob("*.json"))
+            else:
+                self._disk_count += 1
+            over_limit = self._disk_count > self.max_disk_entries
+        if over_limit:
+            self.prune_disk()
+
+
+# Process-wide cache used by analyzers that are not given one
+_shared_cache = ElementCache()
+
+
+def get_shared_element_cache() -> ElementCache:
+    """Get the in-memory cache shared by default across analyzers."""
+    return _shared_cache
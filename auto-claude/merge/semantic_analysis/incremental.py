@@ -0,0 +1,194 @@
+"""
+Incremental reparsing support.
+
+Task snapshots hold successive versions of the same file, and most versions
+differ from the previous one in a few places. Instead of parsing every
+version from scratch, SemanticAnalyzer keeps the syntax tree of recently
+parsed versions (ParseState), describes the next version as an edit of the
+previous one (compute_edit), lets tree-sitter reparse incrementally from the
+edited tree, and re-extracts elements only for top-level nodes that overlap
+the edit or tree-sitter's changed ranges. Elements of untouched top-level
+nodes are reused, with line numbers shifted when they sit below the edit.
+
+The edit is the single byte range between the longest common prefix and
+suffix of the two versions, so it is exact whatever the versions are (the
+stored raw diffs are taken against the merge-base, not necessarily against
+the analyzed "before" content).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any
+
+from ..types import compute_content_hash
+from .models import ExtractedElement
+
+ElementMap = dict[str, ExtractedElement]
+
+# (start_byte, end_byte) of a top-level node -> elements extracted from it
+ChunkMap = dict[tuple[int, int], ElementMap]
+
+
+@dataclass
+class ParseState:
+    """A parsed file version kept as the base for incremental reparsing."""
+
+    tree: Any
+    source_bytes: bytes
+    chunks: ChunkMap
+
+    def elements(self) -> ElementMap:
+        """All elements of this version, in source order."""
+        merged: ElementMap = {}
+        for chunk in self.chunks.values():
+            merged.update(chunk)
+        return merged
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """One edit in tree-sitter's terms (points are (row, byte column))."""
+
+    start_byte: int
+    old_end_byte: int
+    new_end_byte: int
+    start_point: tuple[int, int]
+    old_end_point: tuple[int, int]
+    new_end_point: tuple[int, int]
+
+    @property
+    def byte_delta(self) -> int:
+        return self.new_end_byte - self.old_end_byte
+
+    @property
+    def row_delta(self) -> int:
+        return self.new_end_point[0] - self.old_end_point[0]
+
+
+def _common_prefix_len(a: bytes, b: bytes) -> int:
+    """Length of the common prefix (binary search over C-level compares)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix, at most limit bytes."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point(source: bytes, byte_pos: int) -> tuple[int, int]:
+    """(row, byte column) of a byte offset."""
+    row = source.count(b"\n", 0, byte_pos)
+    line_start = source.rfind(b"\n", 0, byte_pos) + 1
+    return row, byte_pos - line_start
+
+
+def compute_edit(old: bytes, new: bytes) -> TextEdit | None:
+    """
+    Describe new as one edit of old.
+
+    Args:
+        old: Previous version (UTF-8)
+        new: Next version (UTF-8)
+
+    Returns:
+        The edit covering every difference, or None if the versions are equal
+    """
+    if old == new:
+        return None
+    prefix = _common_prefix_len(old, new)
+    suffix = _common_suffix_len(old, new, min(len(old), len(new)) - prefix)
+    old_end = len(old) - suffix
+    new_end = len(new) - suffix
+    return TextEdit(
+        start_byte=prefix,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point(old, prefix),
+        old_end_point=_point(old, old_end),
+        new_end_point=_point(new, new_end),
+    )
+
+
+def reusable_chunk(
+    previous: ParseState,
+    edit: TextEdit,
+    start_byte: int,
+    end_byte: int,
+    changed: list[tuple[int, int]],
+) -> ElementMap | None:
+    """
+    Elements of an unchanged top-level node, taken from the previous version.
+
+    Args:
+        previous: State of the previous version
+        edit: Edit from the previous version to this one
+        start_byte: Node start in the new version
+        end_byte: Node end in the new version
+        changed: Byte ranges (new version) tree-sitter reports as changed
+
+    Returns:
+        The previous elements (line-shifted if below the edit), or None if
+        the node must be extracted again
+    """
+    if start_byte <= edit.new_end_byte and end_byte >= edit.start_byte:
+        return None
+    if any(start_byte < c_end and end_byte > c_start for c_start, c_end in changed):
+        return None
+
+    if end_byte < edit.start_byte:
+        return previous.chunks.get((start_byte, end_byte))
+
+    old_span = (start_byte - edit.byte_delta, end_byte - edit.byte_delta)
+    elements = previous.chunks.get(old_span)
+    if elements is None or edit.row_delta == 0:
+        return elements
+    return {
+        key: replace(
+            element,
+            start_line=element.start_line + edit.row_delta,
+            end_line=element.end_line + edit.row_delta,
+        )
+        for key, element in elements.items()
+    }
+
+
+class ParseStateCache:
+    """Small thread-safe LRU of parse states keyed by content hash and extension."""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._states: OrderedDict[tuple[str, str], ParseState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, content: str, ext: str) -> ParseState | None:
+        key = (compute_content_hash(content), ext)
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+            return state
+
+    def put(self, content: str, ext: str, state: ParseState) -> None:
+        key = (compute_content_hash(content), ext)
+        with self._lock:
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
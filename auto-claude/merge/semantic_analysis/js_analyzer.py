@@ -29,7 +29,8 @@ def extract_js_elements(
         node: The tree-sitter node to extract from
         elements: Dictionary to populate with extracted elements
         get_text: Function to extract text from a node
-        get_line: Function to convert byte position to line number
+        get_line: Function to convert a UTF-8 byte offset to a line number
+            (LineIndex.line_of)
         ext: File extension (.js, .jsx, .ts, .tsx)
         parent: Parent element name for nested elements
     """
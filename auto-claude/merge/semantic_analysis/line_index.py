@@ -0,0 +1,56 @@
+"""
+Byte offset to line number mapping.
+
+tree-sitter reports node positions as byte offsets into the UTF-8 encoded
+source. Counting newlines in a prefix of the source for every node makes
+element extraction quadratic in file size (and slicing the decoded str by a
+byte offset is wrong as soon as the file contains non-ASCII text). LineIndex
+records where each line starts once, then answers lookups with a binary
+search.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Line-start table for a UTF-8 encoded source."""
+
+    def __init__(self, source_bytes: bytes):
+        """
+        Build the table.
+
+        Args:
+            source_bytes: Source encoded as UTF-8 (the bytes that were parsed)
+        """
+        starts = [0]
+        find = source_bytes.find
+        pos = find(b"\n")
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find(b"\n", pos + 1)
+        self._starts = starts
+
+    @classmethod
+    def from_text(cls, source: str) -> LineIndex:
+        """Build the table for a str source."""
+        return cls(source.encode("utf-8"))
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines (a trailing newline starts an empty last line)."""
+        return len(self._starts)
+
+    def line_of(self, byte_pos: int) -> int:
+        """
+        Convert a byte offset to a 1-indexed line number.
+
+        Args:
+            byte_pos: Offset into the UTF-8 encoded source
+
+        Returns:
+            Line containing the byte at byte_pos (offsets at or past the end
+            map to the last line)
+        """
+        return bisect_right(self._starts, byte_pos)
@@ -28,7 +28,8 @@ def extract_python_elements(
         node: The tree-sitter node to extract from
         elements: Dictionary to populate with extracted elements
         get_text: Function to extract text from a node
-        get_line: Function to convert byte position to line number
+        get_line: Function to convert a UTF-8 byte offset to a line number
+            (LineIndex.line_of)
         parent: Parent element name for nested elements
     """
     for child in node.children:
@@ -13,7 +13,9 @@ When tree-sitter is not available, falls back to regex-based heuristics.
 
 from __future__ import annotations
 
+import copy
 import logging
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -94,6 +96,15 @@ if TREE_SITTER_AVAILABLE:
 
 # Import our modular components
 from .semantic_analysis.comparison import compare_elements
+from .semantic_analysis.element_cache import ElementCache, get_shared_element_cache
+from .semantic_analysis.incremental import (
+    ChunkMap,
+    ParseState,
+    ParseStateCache,
+    compute_edit,
+    reusable_chunk,
+)
+from .semantic_analysis.line_index import LineIndex
 from .semantic_analysis.models import ExtractedElement
 from .semantic_analysis.regex_analyzer import analyze_with_regex
 
@@ -102,6 +113,13 @@ if TREE_SITTER_AVAILABLE:
     from .semantic_analysis.python_analyzer import extract_python_elements
 
 
+class _NodeGroup:
+    """Stand-in parent so extractors can run on selected top-level nodes."""
+
+    def __init__(self, children: list):
+        self.children = children
+
+
 class SemanticAnalyzer:
     """
     Analyzes code changes at a semantic level.
@@ -116,9 +134,24 @@ class SemanticAnalyzer:
             print(f"{change.change_type.value}: {change.target}")
     """
 
-    def __init__(self):
-        """Initialize the analyzer with available parsers."""
+    def __init__(
+        self,
+        element_cache: ElementCache | None = None,
+        incremental: bool = True,
+    ):
+        """
+        Initialize the analyzer with available parsers.
+
+        Args:
+            element_cache: Cache of extracted elements by content hash
+                (default: the process-wide in-memory cache)
+            incremental: Keep recent syntax trees and reparse later versions
+                of a file incrementally from them
+        """
         self._parsers: dict[str, Parser] = {}
+        self.element_cache = element_cache or get_shared_element_cache()
+        self.incremental = incremental
+        self._parse_states = ParseStateCache()
 
         debug(
             MODULE,
@@ -209,14 +242,9 @@ class SemanticAnalyzer:
         ext: str,
     ) -> FileAnalysis:
         """Analyze using tree-sitter AST parsing."""
-        parser = self._parsers[ext]
-
-        tree_before = parser.parse(bytes(before, "utf-8"))
-        tree_after = parser.parse(bytes(after, "utf-8"))
-
-        # Extract structural elements from both versions
-        elements_before = self._extract_elements(tree_before, before, ext)
-        elements_after = self._extract_elements(tree_after, after, ext)
+        # Extract structural elements from both versions (cached by content)
+        elements_before = self._get_elements(before, ext)
+        elements_after = self._get_elements(after, ext, base=before)
 
         # Compare and generate semantic changes
         changes = compare_elements(elements_before, elements_after, ext)
@@ -247,30 +275,123 @@ class SemanticAnalyzer:
 
         return analysis
 
-    def _extract_elements(
+    def _get_elements(
+        self, source: str, ext: str, base: str | None = None
+    ) -> dict[str, ExtractedElement]:
+        """
+        Parse source and extract its elements, reusing cached results.
+
+        Args:
+            source: File content
+            ext: File extension selecting the parser
+            base: Previous version of the file; if its tree is still held,
+                source is reparsed incrementally from it
+        """
+        elements = self.element_cache.get(source, ext)
+        if elements is None:
+            elements = self._parse(source, ext, base).elements()
+            self.element_cache.put(source, ext, elements)
+        return elements
+
+    def _parse(self, source: str, ext: str, base: str | None) -> ParseState:
+        """Parse source, incrementally from base's tree when available."""
+        source_bytes = bytes(source, "utf-8")
+        state = None
+
+        previous = None
+        if self.incremental and base is not None:
+            previous = self._parse_states.get(base, ext)
+        if previous is not None:
+            try:
+                state = self._reparse(previous, source_bytes, ext)
+            except Exception as e:
+                # Older bindings lack Tree.edit/changed_ranges or copying
+                debug_detailed(MODULE, f"Incremental reparse failed: {e}")
+
+        if state is None:
+            tree = self._parsers[ext].parse(source_bytes)
+            state = ParseState(
+                tree, source_bytes, self._extract_chunks(tree, source_bytes, ext)
+            )
+
+        if self.incremental:
+            self._parse_states.put(source, ext, state)
+        return state
+
+    def _reparse(
+        self, previous: ParseState, source_bytes: bytes, ext: str
+    ) -> ParseState:
+        """Reparse from the previous version's tree, re-extracting changed nodes."""
+        edit = compute_edit(previous.source_bytes, source_bytes)
+        if edit is None:
+            return previous
+
+        # Tree.edit() mutates: edit a copy so the base stays valid for the
+        # other tasks diffing against it
+        old_tree = copy.copy(previous.tree)
+        old_tree.edit(
+            start_byte=edit.start_byte,
+            old_end_byte=edit.old_end_byte,
+            new_end_byte=edit.new_end_byte,
+            start_point=edit.start_point,
+            old_end_point=edit.old_end_point,
+            new_end_point=edit.new_end_point,
+        )
+        tree = self._parsers[ext].parse(source_bytes, old_tree)
+        changed = [(r.start_byte, r.end_byte) for r in old_tree.changed_ranges(tree)]
+
+        chunks = self._extract_chunks(
+            tree,
+            source_bytes,
+            ext,
+            reuse=lambda start, end: reusable_chunk(
+                previous, edit, start, end, changed
+            ),
+        )
+        return ParseState(tree, source_bytes, chunks)
+
+    def _extract_chunks(
         self,
         tree: Tree,
-        source: str,
+        source_bytes: bytes,
         ext: str,
-    ) -> dict[str, ExtractedElement]:
-        """Extract structural elements from a syntax tree."""
-        elements: dict[str, ExtractedElement] = {}
-        source_bytes = bytes(source, "utf-8")
+        reuse: Callable[[int, int], dict[str, ExtractedElement] | None] | None = None,
+    ) -> ChunkMap:
+        """
+        Extract structural elements per top-level node of a syntax tree.
 
-        def get_text(node: Node) -> str:
-            return source_bytes[node.start_byte : node.end_byte].decode("utf-8")
+        Args:
+            tree: Parsed tree
+            source_bytes: The parsed source
+            ext: File extension selecting the extractor
+            reuse: Returns previously extracted elements for an unchanged
+                node span, or None to extract it
 
-        def get_line(byte_pos: int) -> int:
-            # Convert byte position to line number (1-indexed)
-            return source[:byte_pos].count("\n") + 1
+        Returns:
+            Elements keyed by the (start_byte, end_byte) of their top-level node
+        """
 
-        # Language-specific extraction
-        if ext == ".py":
-            extract_python_elements(tree.root_node, elements, get_text, get_line)
-        elif ext in {".js", ".jsx", ".ts", ".tsx"}:
-            extract_js_elements(tree.root_node, elements, get_text, get_line, ext)
+        def get_text(node: Node) -> str:
+            return source_bytes[node.start_byte : node.end_byte].decode("utf-8")
 
-        return elements
+        # Byte offset -> line number (1-indexed) via a line-start table
+        get_line = LineIndex(source_bytes).line_of
+
+        chunks: ChunkMap = {}
+        for child in tree.root_node.children:
+            span = (child.start_byte, child.end_byte)
+            elements = reuse(*span) if reuse else None
+            if elements is None:
+                elements = {}
+                group = _NodeGroup([child])
+                # Language-specific extraction
+                if ext == ".py":
+                    extract_python_elements(group, elements, get_text, get_line)
+                elif ext in {".js", ".jsx", ".ts", ".tsx"}:
+                    extract_js_elements(group, elements, get_text, get_line, ext)
+            chunks.setdefault(span, {}).update(elements)
+
+        return chunks
 
     def analyze_file(self, file_path: str, content: str) -> FileAnalysis:
         """
@@ -17,6 +17,8 @@ import logging
 import subprocess
 from pathlib import Path
 
+from core.git_batch import get_object_reader
+
 logger = logging.getLogger(__name__)
 
 # Import debug utilities
@@ -56,16 +58,10 @@ class TimelineGitHelper:
     def get_current_main_commit(self) -> str:
         """Get the current HEAD commit on main branch."""
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return "unknown"
+            commit = get_object_reader(self.project_path).resolve("HEAD")
+        except OSError:
+            commit = None
+        return commit or "unknown"
 
     def get_file_content_at_commit(
         self, file_path: str, commit_hash: str
@@ -80,18 +76,30 @@ class TimelineGitHelper:
         Returns:
             File content as string, or None if file doesn't exist at that commit
         """
+        return self.get_files_content_at_commit([file_path], commit_hash)[file_path]
+
+    def get_files_content_at_commit(
+        self, file_paths: list[str], commit_hash: str
+    ) -> dict[str, str | None]:
+        """
+        Get the content of many files at a commit in one round trip.
+
+        Args:
+            file_paths: Paths to the files (relative to project root)
+            commit_hash: Git commit hash
+
+        Returns:
+            Dictionary mapping each path to its content (None if it doesn't
+            exist at that commit)
+        """
         try:
-            result = subprocess.run(
-                ["git", "show", f"{commit_hash}:{file_path}"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
+            contents = get_object_reader(self.project_path).read_texts(
+                f"{commit_hash}:{path}" for path in file_paths
             )
-            if result.returncode == 0:
-                return result.stdout
-            return None
-        except Exception:
-            return None
+        except (OSError, ValueError) as e:
+            debug_warning(MODULE, f"Failed to read files at {commit_hash}: {e}")
+            return dict.fromkeys(file_paths)
+        return {path: contents[f"{commit_hash}:{path}"] for path in file_paths}
 
     def get_files_changed_in_commit(self, commit_hash: str) -> list[str]:
         """
@@ -134,25 +142,12 @@ class TimelineGitHelper:
         """
         info = {}
         try:
-            # Get commit message
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%s", commit_hash],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
+            # Message and author come from the commit object itself
+            info.update(
+                get_object_reader(self.project_path)
+                .commit_info([commit_hash])
+                .get(commit_hash, {})
             )
-            if result.returncode == 0:
-                info["message"] = result.stdout.strip()
-
-            # Get author
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%an", commit_hash],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                info["author"] = result.stdout.strip()
 
             # Get diff stat
             result = subprocess.run(
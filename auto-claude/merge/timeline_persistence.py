@@ -8,15 +8,24 @@ This module handles:
 - Saving/loading timelines to/from disk
 - Managing the timeline index
 - File path encoding for safe storage
+
+The index records, per tracked file, the size of its timeline file, the last
+main-branch commit seen and the tasks it has views for. Trackers open
+timelines through a TimelineMap, which reads only the index and parses a
+timeline file the first time that file is accessed, so a post-commit hook
+pays for the files in the commit rather than for the whole history.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+from collections.abc import ItemsView, Iterator, MutableMapping, ValuesView
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from core.file_io import atomic_write_json, atomic_write_text
 
 if TYPE_CHECKING:
     from .timeline_models import FileTimeline
@@ -34,6 +43,138 @@ except ImportError:
 
 MODULE = "merge.timeline_persistence"
 
+# Index format with per-file metadata (version 1 was a bare list of paths)
+INDEX_VERSION = 2
+
+
+class TimelineMap(MutableMapping[str, "FileTimeline"]):
+    """
+    Lazily loaded mapping of file paths to FileTimeline objects.
+
+    Keys and per-file index metadata are read up front; each timeline is
+    parsed from its own file on first access.
+    """
+
+    def __init__(self, persistence: TimelinePersistence, index: dict[str, dict]):
+        self._persistence = persistence
+        # Index metadata per file; None for files listed by an old index
+        self._meta: dict[str, dict[str, Any] | None] = index
+        self._loaded: dict[str, FileTimeline] = {}
+
+    def __getitem__(self, file_path: str) -> FileTimeline:
+        timeline = self._loaded.get(file_path)
+        if timeline is not None:
+            return timeline
+        if file_path not in self._meta:
+            raise KeyError(file_path)
+
+        timeline = self._persistence.load_timeline(file_path)
+        if timeline is None:
+            del self._meta[file_path]
+            raise KeyError(file_path)
+        self._loaded[file_path] = timeline
+        return timeline
+
+    def __setitem__(self, file_path: str, timeline: FileTimeline) -> None:
+        self._loaded[file_path] = timeline
+        self._meta.setdefault(file_path, None)
+
+    def __delitem__(self, file_path: str) -> None:
+        del self._meta[file_path]
+        self._loaded.pop(file_path, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._meta)
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._meta
+
+    def items(self) -> ItemsView[str, FileTimeline]:
+        self.load_all()
+        return super().items()
+
+    def values(self) -> ValuesView[FileTimeline]:
+        self.load_all()
+        return super().values()
+
+    def load_all(self) -> None:
+        """Load every timeline (dropping files whose timeline is unreadable)."""
+        for file_path in list(self._meta):
+            try:
+                self[file_path]
+            except KeyError:
+                pass
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of timelines parsed so far."""
+        return len(self._loaded)
+
+    def files_for_task(self, task_id: str) -> list[str]:
+        """
+        Files with a view for a task, answered from the index where possible.
+
+        Args:
+            task_id: Unique task identifier
+
+        Returns:
+            List of file paths, in index order
+        """
+        files = []
+        for file_path, meta in list(self._meta.items()):
+            timeline = self._loaded.get(file_path)
+            if timeline is None and meta is None:
+                # No metadata (old index): the timeline has to be read
+                try:
+                    timeline = self[file_path]
+                except KeyError:
+                    continue
+            if timeline is not None:
+                if task_id in timeline.task_views:
+                    files.append(file_path)
+            elif task_id in meta.get("tasks", ()):
+                files.append(file_path)
+        return files
+
+    def index_entry(self, file_path: str) -> dict[str, Any] | None:
+        """Index metadata for a file (None if unknown)."""
+        return self._meta.get(file_path)
+
+    def _set_index_entry(self, file_path: str, entry: dict[str, Any]) -> bool:
+        """Record metadata after a save; True if the index changed."""
+        changed = self._meta.get(file_path) != entry
+        self._meta[file_path] = entry
+        return changed
+
+    def _index(self) -> dict[str, dict[str, Any]]:
+        """Index contents, computing metadata for files saved by old versions."""
+        index = {}
+        for file_path, meta in self._meta.items():
+            if meta is None:
+                timeline = self._loaded.get(file_path)
+                if timeline is None:
+                    timeline = self._persistence.load_timeline(file_path)
+                if timeline is None:
+                    continue
+                meta = self._meta[file_path] = _index_entry(
+                    timeline, self._persistence.timeline_size(file_path)
+                )
+            index[file_path] = meta
+        return index
+
+
+def _index_entry(timeline: FileTimeline, size: int) -> dict[str, Any]:
+    """Compact index metadata for a timeline."""
+    history = timeline.main_branch_history
+    return {
+        "size": size,
+        "last_commit": history[-1].commit_hash if history else None,
+        "tasks": list(timeline.task_views),
+    }
+
 
 class TimelinePersistence:
     """
@@ -55,72 +196,143 @@ class TimelinePersistence:
         # Ensure storage directory exists
         self.timelines_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_all_timelines(self) -> dict[str, FileTimeline]:
+    @property
+    def index_path(self) -> Path:
+        """Path of the timeline index."""
+        return self.timelines_dir / "index.json"
+
+    def open_timelines(self) -> TimelineMap:
         """
-        Load all timelines from disk on startup.
+        Open stored timelines without parsing them.
 
         Returns:
-            Dictionary mapping file_path to FileTimeline objects
+            TimelineMap that loads each timeline on first access
         """
-        from .timeline_models import FileTimeline
+        index: dict[str, dict | None] = {}
+
+        if self.index_path.exists():
+            try:
+                with open(self.index_path) as f:
+                    data = json.load(f)
+                files = data.get("files", [])
+                if isinstance(files, dict):
+                    index = dict(files)
+                else:
+                    index = dict.fromkeys(files)
+            except Exception as e:
+                logger.error(f"Failed to load timeline index: {e}")
+
+        debug(MODULE, f"Indexed {len(index)} timelines from storage")
+        return TimelineMap(self, index)
 
-        timelines = {}
-        index_path = self.timelines_dir / "index.json"
+    def load_all_timelines(self) -> dict[str, FileTimeline]:
+        """
+        Load all timelines from disk.
 
-        if not index_path.exists():
-            return timelines
+        Returns:
+            Dictionary mapping file_path to FileTimeline objects
+        """
+        timelines = self.open_timelines()
+        timelines.load_all()
+        return dict(timelines.items())
 
-        try:
-            with open(index_path) as f:
-                index = json.load(f)
+    def load_timeline(self, file_path: str) -> FileTimeline | None:
+        """
+        Load a single timeline from disk.
 
-            for file_path in index.get("files", []):
-                timeline_file = self._get_timeline_file_path(file_path)
-                if timeline_file.exists():
-                    with open(timeline_file) as f:
-                        data = json.load(f)
-                    timelines[file_path] = FileTimeline.from_dict(data)
+        Args:
+            file_path: The file path (used as key)
 
-            debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
+        Returns:
+            FileTimeline object, or None if missing or unreadable
+        """
+        from .timeline_models import FileTimeline
 
+        timeline_file = self._get_timeline_file_path(file_path)
+        try:
+            with open(timeline_file) as f:
+                return FileTimeline.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Failed to load timelines: {e}")
+            logger.error(f"Failed to load timeline for {file_path}: {e}")
+            return None
 
-        return timelines
+    def timeline_size(self, file_path: str) -> int:
+        """Size in bytes of a stored timeline file (0 if missing)."""
+        try:
+            return self._get_timeline_file_path(file_path).stat().st_size
+        except OSError:
+            return 0
 
-    def save_timeline(self, file_path: str, timeline: FileTimeline) -> None:
+    def save_timeline(self, file_path: str, timeline: FileTimeline) -> int | None:
         """
         Save a single timeline to disk.
 
         Args:
             file_path: The file path (used as key)
             timeline: The FileTimeline object to save
+
+        Returns:
+            Size of the written timeline file, or None if saving failed
         """
         try:
-            # Save timeline file
-            timeline_file = self._get_timeline_file_path(file_path)
-            timeline_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(timeline_file, "w") as f:
-                json.dump(timeline.to_dict(), f, indent=2)
+            payload = json.dumps(timeline.to_dict(), indent=2)
+            atomic_write_text(self._get_timeline_file_path(file_path), payload)
+            return len(payload.encode("utf-8"))
 
         except Exception as e:
             logger.error(f"Failed to persist timeline for {file_path}: {e}")
+            return None
+
+    def record_saved(self, timelines: TimelineMap, file_path: str, size: int) -> bool:
+        """
+        Update a file's index metadata after its timeline was saved.
+
+        Args:
+            timelines: Map the timeline belongs to
+            file_path: The file path (used as key)
+            size: Size of the written timeline file
+
+        Returns:
+            True if the index needs to be rewritten
+        """
+        return timelines._set_index_entry(
+            file_path, _index_entry(timelines[file_path], size)
+        )
+
+    def save_index(self, timelines: TimelineMap) -> None:
+        """
+        Write the compact index for an open TimelineMap.
+
+        Args:
+            timelines: Map returned by open_timelines()
+        """
+        try:
+            atomic_write_json(
+                self.index_path,
+                {
+                    "version": INDEX_VERSION,
+                    "files": timelines._index(),
+                    "last_updated": datetime.now().isoformat(),
+                },
+                indent=None,
+            )
+        except Exception as e:
+            logger.error(f"Failed to save timeline index: {e}")
 
     def update_index(self, file_paths: list[str]) -> None:
         """
         Update the index file with all tracked files.
 
+        Metadata is computed from the stored timelines; trackers keep it up
+        to date incrementally through save_index() instead.
+
         Args:
             file_paths: List of all file paths being tracked
         """
-        index_path = self.timelines_dir / "index.json"
-        index = {
-            "files": file_paths,
-            "last_updated": datetime.now().isoformat(),
-        }
-        with open(index_path, "w") as f:
-            json.dump(index, f, indent=2)
+        timelines = TimelineMap(self, dict.fromkeys(file_paths))
+        self.save_index(timelines)
 
     def _get_timeline_file_path(self, file_path: str) -> Path:
         """
@@ -12,9 +12,12 @@ This service is the "brain" of the intent-aware merge system. It:
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from typing import TypeVar
 
 from .timeline_git import TimelineGitHelper
 from .timeline_models import (
@@ -26,7 +29,7 @@ from .timeline_models import (
     TaskIntent,
     WorktreeState,
 )
-from .timeline_persistence import TimelinePersistence
+from .timeline_persistence import TimelineMap, TimelinePersistence
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,25 @@ except ImportError:
 
 MODULE = "merge.timeline_tracker"
 
+_Handler = TypeVar("_Handler", bound=Callable)
+
+
+def _defers_index_writes(method: _Handler) -> _Handler:
+    """Write the timeline index once when the handler returns, not per file."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._defer_index_depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._defer_index_depth -= 1
+            if self._defer_index_depth == 0 and self._index_dirty:
+                self._index_dirty = False
+                self.persistence.save_index(self._timelines)
+
+    return wrapper
+
 
 class FileTimelineTracker:
     """
@@ -74,22 +96,24 @@ class FileTimelineTracker:
         self.git = TimelineGitHelper(self.project_path)
         self.persistence = TimelinePersistence(self.storage_path)
 
-        # In-memory cache of timelines
-        self._timelines: dict[str, FileTimeline] = {}
+        # Timelines, parsed from disk on first access
+        self._timelines: TimelineMap = self.persistence.open_timelines()
 
-        # Load existing timelines
-        self._timelines = self.persistence.load_all_timelines()
+        # Index writes are deferred while an event handler is running
+        self._defer_index_depth = 0
+        self._index_dirty = False
 
         debug_success(
             MODULE,
             "FileTimelineTracker initialized",
-            timelines_loaded=len(self._timelines),
+            timelines_indexed=len(self._timelines),
         )
 
     # =========================================================================
     # EVENT HANDLERS
     # =========================================================================
 
+    @_defers_index_writes
     def on_task_start(
         self,
         task_id: str,
@@ -127,14 +151,17 @@ class FileTimelineTracker:
 
         timestamp = datetime.now()
 
+        # Read every file at the branch point in one round trip
+        contents = self.git.get_files_content_at_commit(
+            files_to_modify, branch_point_commit
+        )
+
         for file_path in files_to_modify:
             # Get or create timeline for this file
             timeline = self._get_or_create_timeline(file_path)
 
             # Get file content at branch point
-            content = self.git.get_file_content_at_commit(
-                file_path, branch_point_commit
-            )
+            content = contents[file_path]
             if content is None:
                 # File doesn't exist at this commit - might be created by task
                 content = ""
@@ -163,6 +190,7 @@ class FileTimelineTracker:
             MODULE, f"Task {task_id} registered with {len(files_to_modify)} files"
         )
 
+    @_defers_index_writes
     def on_main_branch_commit(self, commit_hash: str) -> None:
         """
         Called via git post-commit hook when human commits to main.
@@ -178,20 +206,25 @@ class FileTimelineTracker:
         # Get list of files changed in this commit
         changed_files = self.git.get_files_changed_in_commit(commit_hash)
 
-        for file_path in changed_files:
-            # Only update existing timelines (we don't create new ones for random files)
-            if file_path not in self._timelines:
-                continue
+        # Only update existing timelines (we don't create new ones for random files)
+        tracked_files = [f for f in changed_files if f in self._timelines]
+        contents = self.git.get_files_content_at_commit(tracked_files, commit_hash)
+        commit_info = None
 
-            timeline = self._timelines[file_path]
+        for file_path in tracked_files:
+            # Indexed but unreadable timelines are skipped (and dropped)
+            timeline = self._timelines.get(file_path)
+            if timeline is None:
+                continue
 
             # Get file content at this commit
-            content = self.git.get_file_content_at_commit(file_path, commit_hash)
+            content = contents[file_path]
             if content is None:
                 continue
 
-            # Get commit metadata
-            commit_info = self.git.get_commit_info(commit_hash)
+            # Get commit metadata (once per commit)
+            if commit_info is None:
+                commit_info = self.git.get_commit_info(commit_hash)
 
             # Create main branch event
             event = MainBranchEvent(
@@ -250,6 +283,7 @@ class FileTimelineTracker:
 
         self._persist_timeline(file_path)
 
+    @_defers_index_writes
     def on_task_merged(self, task_id: str, merge_commit: str) -> None:
         """
         Called after a task is successfully merged to main.
@@ -297,6 +331,7 @@ class FileTimelineTracker:
 
         debug_success(MODULE, f"Task {task_id} marked as merged")
 
+    @_defers_index_writes
     def on_task_abandoned(self, task_id: str) -> None:
         """
         Called if a task is cancelled/abandoned.
@@ -422,11 +457,7 @@ class FileTimelineTracker:
         Returns:
             List of file paths
         """
-        files = []
-        for file_path, timeline in self._timelines.items():
-            if task_id in timeline.task_views:
-                files.append(file_path)
-        return files
+        return self._timelines.files_for_task(task_id)
 
     def get_pending_tasks_for_file(self, file_path: str) -> list[TaskFileView]:
         """
@@ -454,7 +485,10 @@ class FileTimelineTracker:
             Dictionary mapping file_path to commits_behind_main count
         """
         drift = {}
-        for file_path, timeline in self._timelines.items():
+        for file_path in self._timelines.files_for_task(task_id):
+            timeline = self._timelines.get(file_path)
+            if timeline is None:
+                continue
             task_view = timeline.get_task_view(task_id)
             if task_view and task_view.status == "active":
                 drift[file_path] = task_view.commits_behind_main
@@ -488,6 +522,7 @@ class FileTimelineTracker:
     # CAPTURE METHODS (for integration with existing code)
     # =========================================================================
 
+    @_defers_index_writes
     def capture_worktree_state(self, task_id: str, worktree_path: Path) -> None:
         """
         Capture the current state of all modified files in a worktree.
@@ -519,6 +554,7 @@ class FileTimelineTracker:
         except Exception as e:
             logger.error(f"Failed to capture worktree state: {e}")
 
+    @_defers_index_writes
     def initialize_from_worktree(
         self,
         task_id: str,
@@ -589,9 +625,10 @@ class FileTimelineTracker:
 
     def _get_or_create_timeline(self, file_path: str) -> FileTimeline:
         """Get existing timeline or create new one."""
-        if file_path not in self._timelines:
-            self._timelines[file_path] = FileTimeline(file_path=file_path)
-        return self._timelines[file_path]
+        timeline = self._timelines.get(file_path)
+        if timeline is None:
+            timeline = self._timelines[file_path] = FileTimeline(file_path=file_path)
+        return timeline
 
     def _persist_timeline(self, file_path: str) -> None:
         """Save a single timeline to disk."""
@@ -599,5 +636,11 @@ class FileTimelineTracker:
         if not timeline:
             return
 
-        self.persistence.save_timeline(file_path, timeline)
-        self.persistence.update_index(list(self._timelines.keys()))
+        size = self.persistence.save_timeline(file_path, timeline)
+        if size is None:
+            return
+        if self.persistence.record_saved(self._timelines, file_path, size):
+            if self._defer_index_depth:
+                self._index_dirty = True
+            else:
+                self.persistence.save_index(self._timelines)
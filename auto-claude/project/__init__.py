@@ -84,9 +84,13 @@ def is_command_allowed(
     Returns:
         (is_allowed, reason) tuple
     """
-    allowed = profile.get_all_allowed_commands()
-
-    if command in allowed:
+    # Membership per set avoids building the union on every call
+    if (
+        command in profile.base_commands
+        or command in profile.stack_commands
+        or command in profile.script_commands
+        or command in profile.custom_commands
+    ):
         return True, ""
 
     # Check for script commands (e.g., "./script.sh")
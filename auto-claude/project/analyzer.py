@@ -43,6 +43,30 @@ class ProjectAnalyzer:
 
     PROFILE_FILENAME = ".auto-claude-security.json"
 
+    # Manifest files whose changes trigger re-analysis
+    HASH_FILES = (
+        "package.json",
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "pyproject.toml",
+        "requirements.txt",
+        "Pipfile",
+        "poetry.lock",
+        "Cargo.toml",
+        "Cargo.lock",
+        "go.mod",
+        "go.sum",
+        "Gemfile",
+        "Gemfile.lock",
+        "composer.json",
+        "composer.lock",
+        "Makefile",
+        "Dockerfile",
+        "docker-compose.yml",
+        "docker-compose.yaml",
+    )
+
     def __init__(self, project_dir: Path, spec_dir: Path | None = None):
         """
         Initialize analyzer.
@@ -55,6 +79,8 @@ class ProjectAnalyzer:
         self.spec_dir = Path(spec_dir).resolve() if spec_dir else None
         self.profile = SecurityProfile()
         self.parser = ConfigParser(project_dir)
+        # One file listing shared by every detector in this analysis
+        self.inventory = self.parser.inventory
 
     def get_profile_path(self) -> Path:
         """Get the path where profile should be stored."""
@@ -89,33 +115,10 @@ class ProjectAnalyzer:
 
         This allows us to know when to re-analyze.
         """
-        hash_files = [
-            "package.json",
-            "package-lock.json",
-            "yarn.lock",
-            "pnpm-lock.yaml",
-            "pyproject.toml",
-            "requirements.txt",
-            "Pipfile",
-            "poetry.lock",
-            "Cargo.toml",
-            "Cargo.lock",
-            "go.mod",
-            "go.sum",
-            "Gemfile",
-            "Gemfile.lock",
-            "composer.json",
-            "composer.lock",
-            "Makefile",
-            "Dockerfile",
-            "docker-compose.yml",
-            "docker-compose.yaml",
-        ]
-
         hasher = hashlib.md5()
         files_found = 0
 
-        for filename in hash_files:
+        for filename in self.HASH_FILES:
             filepath = self.project_dir / filename
             if filepath.exists():
                 try:
@@ -125,12 +128,20 @@ class ProjectAnalyzer:
                 except OSError:
                     pass
 
+        # The custom allowlist feeds the profile's custom commands
+        allowlist = self.project_dir / StructureAnalyzer.CUSTOM_ALLOWLIST_FILENAME
+        try:
+            stat = allowlist.stat()
+            hasher.update(f"{allowlist.name}:{stat.st_mtime}:{stat.st_size}".encode())
+        except OSError:
+            pass
+
         # If no config files found, hash the project directory structure
         # to at least detect when files are added/removed
         if files_found == 0:
             # Count Python, JS, and other source files as a proxy for project structure
             for ext in ["*.py", "*.js", "*.ts", "*.go", "*.rs"]:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
+                count = len(self.parser.glob_files(f"**/{ext}"))
                 hasher.update(f"{ext}:{count}".encode())
             # Also include the project directory name for uniqueness
             hasher.update(self.project_dir.name.encode())
@@ -187,17 +198,17 @@ class ProjectAnalyzer:
 
     def _detect_stack(self) -> None:
         """Detect technology stack."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         self.profile.detected_stack = detector.detect_all()
 
     def _detect_frameworks(self) -> None:
         """Detect frameworks from dependencies."""
-        detector = FrameworkDetector(self.project_dir)
+        detector = FrameworkDetector(self.project_dir, self.inventory)
         self.profile.detected_stack.frameworks = detector.detect_all()
 
     def _detect_structure(self) -> None:
         """Detect project structure and custom scripts."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.inventory)
         scripts, script_commands, custom_commands = analyzer.analyze()
         self.profile.custom_scripts = scripts
         self.profile.script_commands = script_commands
@@ -206,37 +217,37 @@ class ProjectAnalyzer:
     # Public methods for backward compatibility with tests
     def _detect_languages(self) -> None:
         """Detect programming languages (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         detector.detect_languages()
         self.profile.detected_stack.languages = detector.stack.languages
 
     def _detect_package_managers(self) -> None:
         """Detect package managers (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         detector.detect_package_managers()
         self.profile.detected_stack.package_managers = detector.stack.package_managers
 
     def _detect_databases(self) -> None:
         """Detect databases (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         detector.detect_databases()
         self.profile.detected_stack.databases = detector.stack.databases
 
     def _detect_infrastructure(self) -> None:
         """Detect infrastructure (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         detector.detect_infrastructure()
         self.profile.detected_stack.infrastructure = detector.stack.infrastructure
 
     def _detect_cloud_providers(self) -> None:
         """Detect cloud providers (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         detector.detect_cloud_providers()
         self.profile.detected_stack.cloud_providers = detector.stack.cloud_providers
 
     def _detect_code_quality_tools(self) -> None:
         """Detect code quality tools (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         detector.detect_code_quality_tools()
         self.profile.detected_stack.code_quality_tools = (
             detector.stack.code_quality_tools
@@ -244,20 +255,20 @@ class ProjectAnalyzer:
 
     def _detect_version_managers(self) -> None:
         """Detect version managers (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         detector.detect_version_managers()
         self.profile.detected_stack.version_managers = detector.stack.version_managers
 
     def _detect_custom_scripts(self) -> None:
         """Detect custom scripts (backward compatibility)."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.inventory)
         scripts, script_commands, _ = analyzer.analyze()
         self.profile.custom_scripts = scripts
         self.profile.script_commands = script_commands
 
     def _load_custom_allowlist(self) -> None:
         """Load custom allowlist (backward compatibility)."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.inventory)
         _, _, custom_commands = analyzer.analyze()
         self.profile.custom_commands = custom_commands
 
@@ -10,6 +10,8 @@ import json
 import sys
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
 # tomllib is available in Python 3.11+, use tomli for older versions
 if sys.version_info >= (3, 11):
     import tomllib
@@ -26,14 +28,16 @@ else:
 class ConfigParser:
     """Parses project configuration files."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, inventory: FileInventory | None = None):
         """
         Initialize config parser.
 
         Args:
             project_dir: Root directory of the project
+            inventory: Shared file listing used for glob patterns
         """
         self.project_dir = Path(project_dir).resolve()
+        self.inventory = inventory or FileInventory(self.project_dir)
 
     def read_json(self, filename: str) -> dict | None:
         """Read a JSON file from project root."""
@@ -69,7 +73,7 @@ class ConfigParser:
         for p in paths:
             # Handle glob patterns
             if "*" in p:
-                if list(self.project_dir.glob(p)):
+                if self.inventory.glob(p):
                     return True
             else:
                 if (self.project_dir / p).exists():
@@ -78,4 +82,4 @@ class ConfigParser:
 
     def glob_files(self, pattern: str) -> list[Path]:
         """Find files matching a pattern."""
-        return list(self.project_dir.glob(pattern))
+        return self.inventory.glob(pattern)
@@ -9,21 +9,24 @@ Detects frameworks and libraries from package dependencies
 import re
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
 from .config_parser import ConfigParser
 
 
 class FrameworkDetector:
     """Detects frameworks from project dependencies."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, inventory: FileInventory | None = None):
         """
         Initialize framework detector.
 
         Args:
             project_dir: Root directory of the project
+            inventory: Shared file listing (created if not given)
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = ConfigParser(project_dir, inventory)
         self.frameworks = []
 
     def detect_all(self) -> list[str]:
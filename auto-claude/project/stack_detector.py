@@ -8,6 +8,8 @@ infrastructure tools, and cloud providers from project files.
 
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
 from .config_parser import ConfigParser
 from .models import TechnologyStack
 
@@ -15,15 +17,16 @@ from .models import TechnologyStack
 class StackDetector:
     """Detects technology stack from project structure."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, inventory: FileInventory | None = None):
         """
         Initialize stack detector.
 
         Args:
             project_dir: Root directory of the project
+            inventory: Shared file listing (created if not given)
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = ConfigParser(project_dir, inventory)
         self.stack = TechnologyStack()
 
     def detect_all(self) -> TechnologyStack:
@@ -10,6 +10,8 @@ command allowlists.
 import re
 from pathlib import Path
 
+from core.file_inventory import FileInventory
+
 from .config_parser import ConfigParser
 from .models import CustomScripts
 
@@ -19,15 +21,16 @@ class StructureAnalyzer:
 
     CUSTOM_ALLOWLIST_FILENAME = ".auto-claude-allowlist"
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, inventory: FileInventory | None = None):
         """
         Initialize structure analyzer.
 
         Args:
             project_dir: Root directory of the project
+            inventory: Shared file listing (created if not given)
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = ConfigParser(project_dir, inventory)
         self.custom_scripts = CustomScripts()
         self.custom_commands = set()
         self.script_commands = set()
@@ -17,8 +17,10 @@ Main functions:
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
 - reset_profile_cache: Reset cached security profile
+- get_compiled_allowlist: Frozen allowlist with memoized decisions
 
 Command parsing:
+- parse_command: Parse a shell string into a command AST
 - extract_commands: Extract command names from shell strings
 - split_command_segments: Split compound commands into segments
 
@@ -35,17 +37,20 @@ from project_analyzer import (
     needs_validation,
 )
 
+from .allowlist import CompiledAllowlist
 from .hooks import bash_security_hook, validate_command
 
 # Command parsing utilities
 from .parser import (
     extract_commands,
     get_command_for_validation,
+    parse_command,
     split_command_segments,
 )
 
 # Profile management
 from .profile import (
+    get_compiled_allowlist,
     get_security_profile,
     reset_profile_cache,
 )
@@ -75,7 +80,10 @@ __all__ = [
     "validate_command",
     "get_security_profile",
     "reset_profile_cache",
+    "get_compiled_allowlist",
+    "CompiledAllowlist",
     # Parsing utilities
+    "parse_command",
     "extract_commands",
     "split_command_segments",
     "get_command_for_validation",
@@ -0,0 +1,152 @@
+"""
+Compiled Allowlist
+==================
+
+Immutable lookup structure built once from a SecurityProfile.
+
+The security hook runs on every Bash tool call. Instead of rebuilding the
+union of the profile's command sets for each extracted command, the profile
+is compiled into frozensets and a read-only validator map, and decisions
+for whole command strings are memoized in a bounded LRU (agents repeat the
+same commands constantly).
+
+Validators listed in STATEFUL_VALIDATORS depend on more than the command
+string (git commit scans the staged files), so they run on every call even
+when the rest of the decision comes from the memo.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+
+from project_analyzer import SecurityProfile
+
+from .parser import parse_command
+from .validation_models import ValidationResult, ValidatorFunction
+from .validator import VALIDATORS
+
+# Number of distinct command strings whose decisions are remembered
+DECISION_CACHE_SIZE = 1024
+
+# Validators whose result can change between calls with the same command
+STATEFUL_VALIDATORS = frozenset({"git"})
+
+# Checks still to run for a memoized decision: (validator, command segment)
+DeferredChecks = tuple[tuple[ValidatorFunction, str], ...]
+
+
+@dataclass(frozen=True)
+class CompiledAllowlist:
+    """Frozen allowlist and validator lookup for one security profile."""
+
+    commands: frozenset[str]
+    shell_scripts: frozenset[str] = frozenset()
+    script_commands: frozenset[str] = frozenset()
+    validators: Mapping[str, ValidatorFunction] = field(
+        default_factory=lambda: MappingProxyType(dict(VALIDATORS))
+    )
+    _decide: Callable[[str], tuple[bool, str, DeferredChecks]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_decide", lru_cache(maxsize=DECISION_CACHE_SIZE)(self._evaluate)
+        )
+
+    @classmethod
+    def from_profile(cls, profile: SecurityProfile) -> CompiledAllowlist:
+        """
+        Compile a profile.
+
+        The result is a snapshot: later changes to the profile's sets are
+        not seen, so compile again after modifying a profile.
+        """
+        return cls(
+            commands=frozenset(profile.get_all_allowed_commands()),
+            shell_scripts=frozenset(profile.custom_scripts.shell_scripts),
+            script_commands=frozenset(profile.script_commands),
+        )
+
+    def is_allowed(self, command: str) -> ValidationResult:
+        """
+        Check a single command name (same rules as is_command_allowed).
+
+        Args:
+            command: Command name (ShellCommand.name)
+
+        Returns:
+            (is_allowed, reason) tuple
+        """
+        if command in self.commands:
+            return True, ""
+
+        # Script commands (e.g., "./script.sh")
+        if command.startswith("./") or command.startswith("/"):
+            if os.path.basename(command) in self.shell_scripts:
+                return True, ""
+            if command in self.script_commands:
+                return True, ""
+
+        return (
+            False,
+            f"Command '{command}' is not in the allowed commands for this project",
+        )
+
+    def check(self, command: str) -> ValidationResult:
+        """
+        Decide whether a full command string may run.
+
+        Args:
+            command: Full command string from the Bash tool
+
+        Returns:
+            (is_allowed, reason) tuple
+        """
+        allowed, reason, deferred = self._decide(command)
+        if not allowed:
+            return allowed, reason
+        for validator, segment in deferred:
+            allowed, reason = validator(segment)
+            if not allowed:
+                return allowed, reason
+        return True, ""
+
+    def cache_info(self):
+        """Hit/miss statistics of the decision memo."""
+        return self._decide.cache_info()
+
+    def _evaluate(self, command: str) -> tuple[bool, str, DeferredChecks]:
+        """Uncached decision; stateful validator checks are returned, not run."""
+        tree = parse_command(command)
+        commands = list(tree.iter_commands()) if tree is not None else []
+        if not commands:
+            return (
+                False,
+                f"Could not parse command for security validation: {command}",
+                (),
+            )
+
+        deferred: list[tuple[ValidatorFunction, str]] = []
+
+        for cmd in commands:
+            allowed, reason = self.is_allowed(cmd.name)
+            if not allowed:
+                return False, reason, ()
+
+            validator = self.validators.get(cmd.name)
+            if validator is None:
+                continue
+            # Validators see only this command's own words
+            if cmd.name in STATEFUL_VALIDATORS:
+                deferred.append((validator, cmd.text))
+                continue
+            allowed, reason = validator(cmd.text)
+            if not allowed:
+                return False, reason, ()
+
+        return True, "", tuple(deferred)
@@ -10,11 +10,7 @@ import os
 from pathlib import Path
 from typing import Any
 
-from project_analyzer import BASE_COMMANDS, SecurityProfile, is_command_allowed
-
-from .parser import extract_commands, get_command_for_validation, split_command_segments
-from .profile import get_security_profile
-from .validator import VALIDATORS
+from .profile import get_compiled_allowlist, get_fallback_allowlist
 
 
 async def bash_security_hook(
@@ -26,11 +22,14 @@ async def bash_security_hook(
     Pre-tool-use hook that validates bash commands using dynamic allowlist.
 
     This is the main security enforcement point. It:
-    1. Extracts command names from the command string
-    2. Checks each command against the project's security profile
-    3. Runs additional validation for sensitive commands
+    1. Parses the command string into a command AST (pipelines, lists,
+       subshells, substitutions)
+    2. Checks each command against the project's compiled allowlist
+    3. Runs additional validation for sensitive commands on their own words
     4. Blocks disallowed commands with clear error messages
 
+    Decisions are memoized per command string (see CompiledAllowlist).
+
     Args:
         input_data: Dict containing tool_name and tool_input
         tool_use_id: Optional tool use ID
@@ -52,53 +51,20 @@ async def bash_security_hook(
     if context and hasattr(context, "cwd"):
         cwd = context.cwd
 
-    # Get or create security profile
+    # Get or create the compiled allowlist for the project's security profile
     # Note: In actual use, spec_dir would be passed through context
     try:
-        profile = get_security_profile(Path(cwd))
+        allowlist = get_compiled_allowlist(Path(cwd))
     except Exception as e:
         # If profile creation fails, fall back to base commands only
         print(f"Warning: Could not load security profile: {e}")
-        profile = SecurityProfile()
-        profile.base_commands = BASE_COMMANDS.copy()
-
-    # Extract all commands from the command string
-    commands = extract_commands(command)
-
-    if not commands:
-        # Could not parse - fail safe by blocking
-        return {
-            "decision": "block",
-            "reason": f"Could not parse command for security validation: {command}",
-        }
-
-    # Split into segments for per-command validation
-    segments = split_command_segments(command)
-
-    # Get all allowed commands
-    allowed = profile.get_all_allowed_commands()
-
-    # Check each command against the allowlist
-    for cmd in commands:
-        # Check if command is allowed
-        is_allowed, reason = is_command_allowed(cmd, profile)
-
-        if not is_allowed:
-            return {
-                "decision": "block",
-                "reason": reason,
-            }
-
-        # Additional validation for sensitive commands
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return {"decision": "block", "reason": reason}
+        allowlist = get_fallback_allowlist()
+
+    # Check every command against the allowlist and run validators for
+    # sensitive ones (memoized per command string)
+    allowed, reason = allowlist.check(command)
+    if not allowed:
+        return {"decision": "block", "reason": reason}
 
     return {}
 
@@ -120,27 +86,4 @@ def validate_command(
     if project_dir is None:
         project_dir = Path.cwd()
 
-    profile = get_security_profile(project_dir)
-    commands = extract_commands(command)
-
-    if not commands:
-        return False, "Could not parse command"
-
-    segments = split_command_segments(command)
-
-    for cmd in commands:
-        is_allowed_result, reason = is_command_allowed(cmd, profile)
-        if not is_allowed_result:
-            return False, reason
-
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return False, reason
-
-    return True, ""
+    return get_compiled_allowlist(project_dir).check(command)
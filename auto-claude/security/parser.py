@@ -4,113 +4,702 @@ Command Parsing Utilities
 
 Functions for parsing and extracting commands from shell command strings.
 Handles compound commands, pipes, subshells, and various shell constructs.
+
+parse_command() reads a command string in a single pass into a small AST:
+- CommandList: pipelines joined by &&, ||, ; or &
+- Pipeline: commands joined by |
+- ShellCommand: a simple command's argv and its span in the source, plus
+  the command lists of any $(...), `...` or <(...) substitutions and the
+  bodies of its heredocs
+- CompoundCommand: ( subshell ) and case ... esac bodies
+
+Keywords of if/while/for/{ } constructs are skipped, so the commands inside
+them appear as ordinary commands. As in bash, $(( and (( start arithmetic
+only when they close with an adjacent )); otherwise they are read as a
+command substitution or subshell holding a subshell. Anything the lexer
+cannot read (unclosed quotes or substitutions, stray operators) makes the
+whole string unparseable, which callers treat as a block.
 """
 
+from __future__ import annotations
+
 import os
 import re
-import shlex
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 
+# Reserved words that precede commands rather than being commands
+_KEYWORDS = frozenset(
+    {
+        "if",
+        "then",
+        "else",
+        "elif",
+        "fi",
+        "while",
+        "until",
+        "do",
+        "done",
+        "esac",
+        "in",
+        "!",
+        "{",
+        "}",
+    }
+)
 
-def split_command_segments(command_string: str) -> list[str]:
-    """
-    Split a compound command into individual command segments.
+# Characters that end an unquoted word
+_PLAIN = re.compile(r"[^\s;&|()<>\\'\"$`]+")
+_DOUBLE_QUOTED_PLAIN = re.compile(r'[^"\\$`]+')
 
-    Handles command chaining (&&, ||, ;) but not pipes (those are single commands).
-    """
-    # Split on && and || while preserving the ability to handle each segment
-    segments = re.split(r"\s*(?:&&|\|\|)\s*", command_string)
+# Redirection operators, with an optional file descriptor prefix
+_REDIRECT = re.compile(r"(?:\d+|&)?(?:>>|>&|>\||<<<|<<-|<<|<&|<>|>|<)")
 
-    # Further split on semicolons
-    result = []
-    for segment in segments:
-        sub_segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', segment)
-        for sub in sub_segments:
-            sub = sub.strip()
-            if sub:
-                result.append(sub)
+# NAME=, NAME+= or NAME[index]= at the start of a word
+_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:\[[^\]]*\])?\+?=")
 
-    return result
+_FUNCTION_PARENS = re.compile(r"\(\s*\)")
+_CASE_TERMINATORS = (";;&", ";;", ";&")
 
 
-def extract_commands(command_string: str) -> list[str]:
-    """
-    Extract command names from a shell command string.
+class _ParseError(ValueError):
+    """The command string is not valid shell syntax (as far as we read it)."""
 
-    Handles pipes, command chaining (&&, ||, ;), and subshells.
-    Returns the base command names (without paths).
-    """
-    commands = []
 
-    # Split on semicolons that aren't inside quotes
-    segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', command_string)
+@dataclass
+class ShellCommand:
+    """A simple command: its argv and where it sits in the source."""
 
-    for segment in segments:
-        segment = segment.strip()
-        if not segment:
-            continue
+    name: str = ""
+    argv: list[str] = field(default_factory=list)
+    # Span from the command word to its last argument or redirection
+    start: int = 0
+    end: int = 0
+    text: str = ""
+    # Command lists run by $(...), `...` and <(...) in this command
+    substitutions: list[CommandList] = field(default_factory=list)
+    heredocs: list[str] = field(default_factory=list)
 
-        try:
-            tokens = shlex.split(segment)
-        except ValueError:
-            # Malformed command (unclosed quotes, etc.)
-            # Return empty to trigger block (fail-safe)
-            return []
-
-        if not tokens:
-            continue
-
-        # Track when we expect a command vs arguments
-        expect_command = True
-
-        for token in tokens:
-            # Shell operators indicate a new command follows
-            if token in ("|", "||", "&&", "&"):
-                expect_command = True
-                continue
 
-            # Skip shell keywords that precede commands
-            if token in (
-                "if",
-                "then",
-                "else",
-                "elif",
-                "fi",
-                "for",
-                "while",
-                "until",
-                "do",
-                "done",
-                "case",
-                "esac",
-                "in",
-                "!",
-                "{",
-                "}",
-                "(",
-                ")",
-                "function",
+@dataclass
+class CompoundCommand:
+    """A subshell or case statement."""
+
+    kind: str
+    bodies: list[CommandList]
+    start: int
+    end: int
+
+
+@dataclass
+class Pipeline:
+    """Commands joined by pipes."""
+
+    commands: list[ShellCommand | CompoundCommand]
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class CommandList:
+    """Pipelines with the separator that follows each ("" after the last)."""
+
+    pipelines: list[Pipeline] = field(default_factory=list)
+    operators: list[str] = field(default_factory=list)
+
+    def iter_commands(self) -> Iterator[ShellCommand]:
+        """Every simple command that runs, nested ones included, in order."""
+        for pipeline in self.pipelines:
+            for node in pipeline.commands:
+                if isinstance(node, CompoundCommand):
+                    for body in node.bodies:
+                        yield from body.iter_commands()
+                    continue
+                if node.argv:
+                    yield node
+                for substitution in node.substitutions:
+                    yield from substitution.iter_commands()
+
+
+class _Parser:
+    """Recursive descent over source[pos:end]."""
+
+    def __init__(self, source: str, start: int = 0, end: int | None = None):
+        self.source = source
+        self.pos = start
+        self.end = len(source) if end is None else end
+        # (delimiter, strip_tabs, expand, command) waiting for the next newline
+        self._heredocs: list[tuple[str, bool, bool, ShellCommand]] = []
+
+    def at(self, text: str) -> bool:
+        return (
+            self.source.startswith(text, self.pos) and self.pos + len(text) <= self.end
+        )
+
+    def _char(self) -> str:
+        return self.source[self.pos] if self.pos < self.end else ""
+
+    def _expect(self, text: str) -> None:
+        if not self.at(text):
+            raise _ParseError(f"expected {text!r} at {self.pos}")
+        self.pos += len(text)
+
+    def skip_blanks(self) -> None:
+        """Skip spaces, tabs, line continuations and comments."""
+        while self.pos < self.end:
+            c = self.source[self.pos]
+            if c in " \t":
+                self.pos += 1
+            elif self.at("\\\n"):
+                self.pos += 2
+            elif c == "#":
+                newline = self.source.find("\n", self.pos, self.end)
+                self.pos = self.end if newline < 0 else newline
+            else:
+                break
+
+    def _skip_newlines(self) -> None:
+        while True:
+            self.skip_blanks()
+            if self._char() != "\n":
+                return
+            self.pos += 1
+            self._read_heredocs()
+
+    def _at_closer(self, closers: tuple[str, ...], command_start: bool) -> bool:
+        for closer in closers:
+            if not self.at(closer):
+                continue
+            if not closer.isalpha():
+                return True
+            # Reserved words close only at a command position, as whole words
+            after = self.pos + len(closer)
+            if command_start and (
+                after >= self.end or self.source[after] in " \t\n;&|)"
             ):
+                return True
+        return False
+
+    # -- lists, pipelines and commands ------------------------------------
+
+    def parse_list(self, closers: tuple[str, ...] = ()) -> CommandList:
+        result = CommandList()
+        while True:
+            self.skip_blanks()
+            if self.pos >= self.end:
+                if closers:
+                    raise _ParseError("unterminated command list")
+                return result
+            if self._at_closer(closers, command_start=True):
+                return result
+
+            c = self.source[self.pos]
+            if c == "\n":
+                self.pos += 1
+                self._read_heredocs()
+                continue
+            if c == ";" or (c == "&" and not self.at("&&") and not self.at("&>")):
+                # Empty command before a separator
+                self.pos += 1
                 continue
+            if c == ")" or c == "|" or self.at("&&"):
+                raise _ParseError(f"unexpected {c!r} at {self.pos}")
+
+            result.pipelines.append(self._parse_pipeline(closers))
+            result.operators.append(self._separator(closers))
+
+    def _separator(self, closers: tuple[str, ...]) -> str:
+        self.skip_blanks()
+        if self.pos >= self.end or self._at_closer(closers, command_start=False):
+            return ""
+        if self.at("&&") or self.at("||"):
+            self.pos += 2
+            return self.source[self.pos - 2 : self.pos]
+        c = self.source[self.pos]
+        if c in ";&":
+            self.pos += 1
+            return c
+        if c == "\n":
+            return ";"  # consumed by parse_list, which reads heredoc bodies
+        raise _ParseError(f"unexpected {c!r} at {self.pos}")
+
+    def _parse_pipeline(self, closers: tuple[str, ...]) -> Pipeline:
+        start = self.pos
+        commands: list[ShellCommand | CompoundCommand] = []
+        while True:
+            node = self._parse_command(closers)
+            if node is not None:
+                commands.append(node)
+            self.skip_blanks()
+            if not self.at("|") or self.at("||"):
+                break
+            self.pos += 2 if self.at("|&") else 1
+            self._skip_newlines()
+        end = commands[-1].end if commands else start
+        return Pipeline(commands, start, end, self.source[start:end])
+
+    def _parse_command(
+        self, closers: tuple[str, ...]
+    ) -> ShellCommand | CompoundCommand | None:
+        self.skip_blanks()
+        if self.at("(") and not (self.at("((") and self._is_arithmetic()):
+            start = self.pos
+            self.pos += 1
+            node = CompoundCommand("subshell", [self.parse_list((")",))], start, 0)
+            self._expect(")")
+            node.end = self.pos
+            self._compound_redirections(node)
+            return node
+        return self._parse_simple(closers)
 
-            # Skip flags/options
-            if token.startswith("-"):
+    def _parse_simple(
+        self, closers: tuple[str, ...]
+    ) -> ShellCommand | CompoundCommand | None:
+        cmd = ShellCommand(start=self.pos, end=self.pos)
+        argv = cmd.argv
+        while True:
+            self.skip_blanks()
+            if self.pos >= self.end or self._at_closer(closers, not argv):
+                break
+            c = self.source[self.pos]
+            if c in "\n;|)" or (c == "&" and not self.at("&>")):
+                break
+
+            if not argv and self.at("((") and self._read_arithmetic(cmd):
+                cmd.end = self.pos
                 continue
 
-            # Skip variable assignments (VAR=value)
-            if "=" in token and not token.startswith("="):
+            if c == "(":
+                match = _FUNCTION_PARENS.match(self.source, self.pos, self.end)
+                if len(argv) != 1 or match is None:
+                    raise _ParseError(f"unexpected '(' at {self.pos}")
+                # name() { ... }: the body's commands follow as list items
+                self.pos = match.end()
+                argv.clear()
                 continue
 
-            # Skip here-doc markers
-            if token in ("<<", "<<<", ">>", ">", "<", "2>", "2>&1", "&>"):
+            if self.at("<(") or self.at(">("):
+                argv.append(self._read_process_substitution(cmd))
+                cmd.end = self.pos
                 continue
 
-            if expect_command:
-                # Extract the base command name (handle paths like /usr/bin/python)
-                cmd = os.path.basename(token)
-                commands.append(cmd)
-                expect_command = False
+            redirect = _REDIRECT.match(self.source, self.pos, self.end)
+            if redirect:
+                self._read_redirection(redirect, cmd)
+                cmd.end = self.pos
+                continue
 
-    return commands
+            word_start = self.pos
+            word, quoted = self.read_word(cmd)
+            cmd.end = self.pos
+            if argv:
+                argv.append(word)
+                continue
+
+            # Command position: skip assignments and reserved words
+            if _ASSIGNMENT.match(self.source, word_start, self.end):
+                continue
+            if not quoted:
+                if word in _KEYWORDS:
+                    continue
+                if word in ("for", "select"):
+                    self._skip_for_header(cmd)
+                    continue
+                if word == "function":
+                    self.skip_blanks()
+                    self.read_word(cmd)
+                    self.skip_blanks()
+                    match = _FUNCTION_PARENS.match(self.source, self.pos, self.end)
+                    if match:
+                        self.pos = match.end()
+                    continue
+                if word == "case":
+                    return self._parse_case(word_start, cmd)
+
+            cmd.start = word_start
+            argv.append(word)
+
+        if not argv:
+            if not cmd.substitutions and not any(
+                pending[3] is cmd for pending in self._heredocs
+            ):
+                return None
+            cmd.start = cmd.end
+        cmd.name = os.path.basename(argv[0]) if argv else ""
+        cmd.text = self.source[cmd.start : cmd.end]
+        return cmd
+
+    def _parse_case(self, start: int, holder: ShellCommand) -> CompoundCommand:
+        # Substitutions in the case word and patterns run too: they share
+        # the bodies list with the branches
+        node = CompoundCommand("case", holder.substitutions, start, 0)
+        self.skip_blanks()
+        self.read_word(holder)
+        self._skip_newlines()
+        word, quoted = self.read_word(holder)
+        if word != "in" or quoted:
+            raise _ParseError("expected 'in' after case word")
+
+        while True:
+            self._skip_newlines()
+            if self._at_closer(("esac",), command_start=True):
+                self.pos += len("esac")
+                break
+            if self.pos >= self.end:
+                raise _ParseError("unterminated case")
+            if self.at("("):
+                self.pos += 1
+            while True:
+                self.skip_blanks()
+                self.read_word(holder)
+                self.skip_blanks()
+                if not self.at("|"):
+                    break
+                self.pos += 1
+            self._expect(")")
+            node.bodies.append(self.parse_list((*_CASE_TERMINATORS, "esac")))
+            for terminator in _CASE_TERMINATORS:
+                if self.at(terminator):
+                    self.pos += len(terminator)
+                    break
+
+        node.end = self.pos
+        self._compound_redirections(node)
+        return node
+
+    def _compound_redirections(self, node: CompoundCommand) -> None:
+        """Consume redirections after ) or esac; their substitutions run too."""
+        holder = ShellCommand(start=self.pos, end=self.pos)
+        redirected = False
+        while True:
+            self.skip_blanks()
+            redirect = _REDIRECT.match(self.source, self.pos, self.end)
+            if redirect is None or self.at("<(") or self.at(">("):
+                break
+            self._read_redirection(redirect, holder)
+            redirected = True
+        if redirected:
+            # Heredoc bodies are read later, so keep the holder itself
+            pipeline = Pipeline([holder], holder.start, holder.start, "")
+            node.bodies.append(CommandList([pipeline], [""]))
+
+    def _read_redirection(self, redirect: re.Match, cmd: ShellCommand) -> None:
+        operator = redirect.group()
+        self.pos = redirect.end()
+        self.skip_blanks()
+        target_start = self.pos
+        if self.at("<(") or self.at(">("):
+            self._read_process_substitution(cmd)
+            return
+        target, quoted = self.read_word(cmd)
+        if self.pos == target_start:
+            raise _ParseError(f"missing redirection target at {self.pos}")
+        if operator.endswith(("<<", "<<-")):
+            self._heredocs.append((target, operator.endswith("-"), not quoted, cmd))
+
+    def _read_process_substitution(self, holder: ShellCommand) -> str:
+        start = self.pos
+        self.pos += 2
+        holder.substitutions.append(self.parse_list((")",)))
+        self._expect(")")
+        return self.source[start : self.pos]
+
+    def _skip_for_header(self, holder: ShellCommand) -> None:
+        """Skip 'NAME [in WORDS]' or '((...))' after for/select."""
+        self.skip_blanks()
+        if self.at("(("):
+            if not self._read_arithmetic(holder):
+                raise _ParseError("expected '))' after for ((")
+            return
+        self.read_word(holder)
+        self.skip_blanks()
+        if not (self.at("in") and self.source[self.pos + 2 : self.pos + 3] in " \t\n;"):
+            return
+        self.pos += 2
+        while True:
+            self.skip_blanks()
+            if self.pos >= self.end or self.source[self.pos] in "\n;&|)":
+                return
+            before = self.pos
+            self.read_word(holder)
+            if self.pos == before:
+                raise _ParseError(f"unexpected {self._char()!r} in for loop")
+
+    # -- words ------------------------------------------------------------
+
+    def read_word(self, holder: ShellCommand) -> tuple[str, bool]:
+        """
+        Read one word, recording substitutions in holder.
+
+        Returns:
+            (value with quotes removed, whether any part was quoted)
+        """
+        start = self.pos
+        parts: list[str] = []
+        quoted = False
+        while self.pos < self.end:
+            c = self.source[self.pos]
+            plain = _PLAIN.match(self.source, self.pos, self.end)
+            if plain:
+                parts.append(plain.group())
+                self.pos = plain.end()
+            elif c == "'":
+                close = self.source.find("'", self.pos + 1, self.end)
+                if close < 0:
+                    raise _ParseError("unterminated single quote")
+                parts.append(self.source[self.pos + 1 : close])
+                self.pos = close + 1
+                quoted = True
+            elif c == '"':
+                self.pos += 1
+                parts.append(self._read_double_quoted(holder))
+                quoted = True
+            elif c == "\\":
+                if self.at("\\\n"):
+                    self.pos += 2
+                    continue
+                parts.append(self.source[self.pos + 1 : self.pos + 2])
+                self.pos += 2
+                quoted = True
+            elif c == "$":
+                parts.append(self._read_dollar(holder))
+            elif c == "`":
+                parts.append(self._read_backticks(holder))
+            elif c == "(" and _ASSIGNMENT.fullmatch(self.source, start, self.pos):
+                parts.append(self._read_array(holder))
+            else:
+                break
+        return "".join(parts), quoted
+
+    def _read_double_quoted(
+        self, holder: ShellCommand, closing: str | None = '"'
+    ) -> str:
+        """Read up to the closing quote (or the end when closing is None)."""
+        parts: list[str] = []
+        while self.pos < self.end:
+            c = self.source[self.pos]
+            if c == closing:
+                self.pos += 1
+                return "".join(parts)
+            if c == "\\":
+                escaped = self.source[self.pos + 1 : self.pos + 2]
+                if escaped == "\n":
+                    self.pos += 2
+                elif escaped and escaped in '"\\$`':
+                    parts.append(escaped)
+                    self.pos += 2
+                else:
+                    parts.append(c)
+                    self.pos += 1
+            elif c == "$":
+                parts.append(self._read_dollar(holder))
+            elif c == "`":
+                parts.append(self._read_backticks(holder))
+            else:
+                plain = _DOUBLE_QUOTED_PLAIN.match(self.source, self.pos, self.end)
+                if plain:
+                    parts.append(plain.group())
+                    self.pos = plain.end()
+                else:
+                    parts.append(c)
+                    self.pos += 1
+        if closing is not None:
+            raise _ParseError("unterminated double quote")
+        return "".join(parts)
+
+    def _read_dollar(self, holder: ShellCommand) -> str:
+        start = self.pos
+        if self.at("$((") and self._read_arithmetic(holder):
+            pass
+        elif self.at("$("):
+            self.pos += 2
+            holder.substitutions.append(self.parse_list((")",)))
+            self._expect(")")
+        elif self.at("${"):
+            self.pos += 2
+            while True:
+                c = self._char()
+                if not c:
+                    raise _ParseError("unterminated parameter expansion")
+                if c == "}":
+                    self.pos += 1
+                    break
+                if c == "\\":
+                    self.pos += 2
+                elif c == "'":
+                    close = self.source.find("'", self.pos + 1, self.end)
+                    if close < 0:
+                        raise _ParseError("unterminated single quote")
+                    self.pos = close + 1
+                elif c == '"':
+                    self.pos += 1
+                    self._read_double_quoted(holder)
+                elif c == "$":
+                    self._read_dollar(holder)
+                elif c == "`":
+                    self._read_backticks(holder)
+                else:
+                    self.pos += 1
+        else:
+            self.pos += 1
+        return self.source[start : self.pos]
+
+    def _read_arithmetic(self, holder: ShellCommand) -> bool:
+        """
+        Skip $((...)) or ((...)), parsing command substitutions inside.
+
+        Returns False, leaving the position and holder unchanged, if the
+        parentheses do not close with an adjacent "))": bash then reads the
+        text as a command substitution or subshell instead.
+        """
+        start = self.pos
+        substitutions = len(holder.substitutions)
+        self.pos += 3 if self.at("$((") else 2
+        depth = 2
+        while depth:
+            c = self._char()
+            if not c:
+                raise _ParseError("unterminated arithmetic expression")
+            if c == "$" or c == "`":
+                if c == "`":
+                    self._read_backticks(holder)
+                elif self.at("$(") and not self.at("$(("):
+                    self._read_dollar(holder)
+                else:
+                    self.pos += 1
+                continue
+            if c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+                if depth == 1 and not self.at("))"):
+                    self.pos = start
+                    del holder.substitutions[substitutions:]
+                    return False
+            self.pos += 1
+        return True
+
+    def _is_arithmetic(self) -> bool:
+        """Whether the (( at the current position is an arithmetic command."""
+        start = self.pos
+        try:
+            return self._read_arithmetic(ShellCommand())
+        except _ParseError:
+            return False
+        finally:
+            self.pos = start
+
+    def _read_backticks(self, holder: ShellCommand) -> str:
+        start = self.pos
+        self.pos += 1
+        chunks: list[str] = []
+        escaped = False
+        while self.pos < self.end:
+            c = self.source[self.pos]
+            if c == "\\" and self.source[self.pos + 1 : self.pos + 2] in (
+                "`",
+                "\\",
+                "$",
+            ):
+                chunks.append(self.source[self.pos + 1])
+                self.pos += 2
+                escaped = True
+                continue
+            if c == "`":
+                close = self.pos
+                self.pos += 1
+                if escaped:
+                    inner = _Parser("".join(chunks))
+                else:
+                    inner = _Parser(self.source, start + 1, close)
+                holder.substitutions.append(inner.parse_list())
+                return self.source[start : self.pos]
+            chunks.append(c)
+            self.pos += 1
+        raise _ParseError("unterminated backquote")
+
+    def _read_array(self, holder: ShellCommand) -> str:
+        start = self.pos
+        self.pos += 1
+        while True:
+            self._skip_newlines()
+            if self.at(")"):
+                self.pos += 1
+                return self.source[start : self.pos]
+            if self.pos >= self.end:
+                raise _ParseError("unterminated array assignment")
+            before = self.pos
+            self.read_word(holder)
+            if self.pos == before:
+                raise _ParseError(f"unexpected {self._char()!r} in array")
+
+    def _read_heredocs(self) -> None:
+        """Read the bodies of heredocs started on the line just ended."""
+        pending, self._heredocs = self._heredocs, []
+        for delimiter, strip_tabs, expand, cmd in pending:
+            body_start = body_end = self.pos
+            while self.pos < self.end:
+                line_end = self.source.find("\n", self.pos, self.end)
+                if line_end < 0:
+                    line_end = self.end
+                line = self.source[self.pos : line_end]
+                if (line.lstrip("\t") if strip_tabs else line) == delimiter:
+                    body_end = self.pos
+                    self.pos = min(line_end + 1, self.end)
+                    break
+                self.pos = min(line_end + 1, self.end)
+                body_end = self.pos
+            cmd.heredocs.append(self.source[body_start:body_end])
+            if expand:
+                _Parser(self.source, body_start, body_end)._read_double_quoted(
+                    cmd, closing=None
+                )
+
+
+def parse_command(command_string: str) -> CommandList | None:
+    """
+    Parse a shell command string into a command AST in a single pass.
+
+    Args:
+        command_string: Full command string
+
+    Returns:
+        Top-level CommandList, or None if the string cannot be parsed
+        (callers should fail safe and block)
+    """
+    parser = _Parser(command_string)
+    try:
+        return parser.parse_list()
+    except _ParseError:
+        return None
+
+
+def split_command_segments(command_string: str) -> list[str]:
+    """
+    Split a compound command into individual command segments.
+
+    Handles command chaining (&&, ||, ;) but not pipes (those are single commands).
+    """
+    tree = parse_command(command_string)
+    if tree is None:
+        stripped = command_string.strip()
+        return [stripped] if stripped else []
+    return [pipeline.text for pipeline in tree.pipelines if pipeline.text]
+
+
+def extract_commands(command_string: str) -> list[str]:
+    """
+    Extract command names from a shell command string.
+
+    Handles pipes, command chaining (&&, ||, ;), subshells and command
+    substitutions. Returns the base command names (without paths), or an
+    empty list if the string cannot be parsed.
+    """
+    tree = parse_command(command_string)
+    if tree is None:
+        return []
+    return [cmd.name for cmd in tree.iter_commands()]
 
 
 def get_command_for_validation(cmd: str, segments: list[str]) -> str:
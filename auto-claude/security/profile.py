@@ -4,22 +4,234 @@ Security Profile Management
 
 Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
+
+Profiles are cached per (project_dir, spec_dir), so several builds or
+worktrees in one process do not re-analyze each other's projects:
+- An entry is trusted for PROFILE_REVALIDATE_SECONDS, then revalidated by
+  stat'ing the project's manifest files and custom allowlist; only a
+  changed file reloads it
+- At most MAX_CACHED_PROFILES entries are kept (least recently used evicted)
+- A git worktree whose manifests and allowlist match its parent's shares
+  the parent's profile instead of being analyzed on its own
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
+from project.structure_analyzer import StructureAnalyzer
 from project_analyzer import (
+    BASE_COMMANDS,
+    ProjectAnalyzer,
     SecurityProfile,
     get_or_create_profile,
 )
 
+from .allowlist import CompiledAllowlist
+
+# Seconds an entry is used without checking the project's manifest files
+PROFILE_REVALIDATE_SECONDS = 5.0
+
+# Maximum number of projects whose profiles are kept in memory
+MAX_CACHED_PROFILES = 16
+
+# Files whose content determines a project's profile: the manifests plus
+# the user's custom command allowlist
+PROFILE_INPUT_FILES = (
+    *ProjectAnalyzer.HASH_FILES,
+    StructureAnalyzer.CUSTOM_ALLOWLIST_FILENAME,
+)
+
+# (file name, mtime_ns, size) of each manifest file present
+ManifestSignature = tuple[tuple[str, int, int], ...]
+
+
+def manifest_signature(project_dir: Path) -> ManifestSignature:
+    """Stat signature of the files that drive profile analysis."""
+    signature = []
+    for filename in PROFILE_INPUT_FILES:
+        try:
+            stat = (project_dir / filename).stat()
+        except OSError:
+            continue
+        signature.append((filename, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def manifest_digest(project_dir: Path) -> str:
+    """Content hash of the profile input files (comparable across checkouts)."""
+    hasher = hashlib.sha256()
+    for filename in PROFILE_INPUT_FILES:
+        try:
+            content = (project_dir / filename).read_bytes()
+        except OSError:
+            continue
+        hasher.update(f"{filename}:{len(content)}:".encode())
+        hasher.update(content)
+    return hasher.hexdigest()
+
+
+def find_parent_repo(project_dir: Path) -> Path | None:
+    """
+    Find the main working tree of a git worktree.
+
+    Args:
+        project_dir: Directory that may be a linked worktree
+
+    Returns:
+        Main working tree directory, or None if project_dir is not a worktree
+    """
+    git_file = project_dir / ".git"
+    if not git_file.is_file():
+        return None
+    try:
+        content = git_file.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+
+    git_dir = Path(content[len("gitdir:") :].strip())
+    if not git_dir.is_absolute():
+        git_dir = project_dir / git_dir
+
+    # <repo>/.git/worktrees/<name>/commondir points at <repo>/.git
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        common_dir = (git_dir / common).resolve()
+    except OSError:
+        common_dir = git_dir.parent.parent.resolve()
+
+    if common_dir.name != ".git":
+        return None
+    return common_dir.parent
+
+
+@dataclass
+class _ProfileEntry:
+    """A cached profile and what is needed to revalidate it."""
+
+    profile: SecurityProfile
+    signature: ManifestSignature
+    checked_at: float
+    allowlist: CompiledAllowlist | None = None
+    digest: str | None = None
+
+
+class ProfileCache:
+    """LRU cache of security profiles keyed by project and spec directory."""
+
+    def __init__(
+        self,
+        max_entries: int = MAX_CACHED_PROFILES,
+        revalidate_seconds: float = PROFILE_REVALIDATE_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached profiles
+            revalidate_seconds: Seconds between manifest checks of an entry
+        """
+        self.max_entries = max_entries
+        self.revalidate_seconds = revalidate_seconds
+        self._entries: OrderedDict[tuple[Path, Path | None], _ProfileEntry] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def get(self, project_dir: Path, spec_dir: Path | None = None) -> SecurityProfile:
+        """Profile for a project (see get_security_profile)."""
+        return self._entry(project_dir, spec_dir).profile
+
+    def get_allowlist(
+        self, project_dir: Path, spec_dir: Path | None = None
+    ) -> CompiledAllowlist:
+        """Compiled allowlist for a project (see get_compiled_allowlist)."""
+        with self._lock:
+            entry = self._entry(project_dir, spec_dir)
+            if entry.allowlist is None:
+                entry.allowlist = CompiledAllowlist.from_profile(entry.profile)
+            return entry.allowlist
+
+    def clear(self) -> None:
+        """Drop every cached profile."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, project_dir: Path, spec_dir: Path | None) -> _ProfileEntry:
+        project_dir = Path(project_dir).resolve()
+        spec_dir = Path(spec_dir).resolve() if spec_dir else None
+        key = (project_dir, spec_dir)
+
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if now - entry.checked_at < self.revalidate_seconds:
+                    return entry
+                signature = manifest_signature(project_dir)
+                if signature == entry.signature:
+                    entry.checked_at = now
+                    return entry
+            else:
+                signature = manifest_signature(project_dir)
+
+            entry = self._shared_with_parent(project_dir, signature, now)
+            if entry is None:
+                entry = _ProfileEntry(
+                    profile=get_or_create_profile(project_dir, spec_dir),
+                    signature=signature,
+                    checked_at=now,
+                )
+
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return entry
+
+    def _shared_with_parent(
+        self, project_dir: Path, signature: ManifestSignature, now: float
+    ) -> _ProfileEntry | None:
+        """Entry reusing the parent repository's profile, if manifests match."""
+        parent = find_parent_repo(project_dir)
+        if parent is None or not parent.is_dir():
+            return None
+
+        parent_entry = self._entry(parent, None)
+        if parent_entry.digest is None:
+            parent_entry.digest = manifest_digest(parent)
+        if manifest_digest(project_dir) != parent_entry.digest:
+            return None
+
+        if parent_entry.allowlist is None:
+            parent_entry.allowlist = CompiledAllowlist.from_profile(
+                parent_entry.profile
+            )
+        return _ProfileEntry(
+            profile=parent_entry.profile,
+            signature=signature,
+            checked_at=now,
+            allowlist=parent_entry.allowlist,
+            digest=parent_entry.digest,
+        )
+
+
 # =============================================================================
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: SecurityProfile | None = None
-_cached_project_dir: Path | None = None
+# Cache security profiles to avoid re-analyzing on every command
+_profile_cache = ProfileCache()
+_fallback_allowlist: CompiledAllowlist | None = None
 
 
 def get_security_profile(
@@ -35,23 +247,36 @@ def get_security_profile(
     Returns:
         SecurityProfile for the project
     """
-    global _cached_profile, _cached_project_dir
+    return _profile_cache.get(project_dir, spec_dir)
+
+
+def get_compiled_allowlist(
+    project_dir: Path, spec_dir: Path | None = None
+) -> CompiledAllowlist:
+    """
+    Get the compiled allowlist for a project's security profile.
 
-    project_dir = Path(project_dir).resolve()
+    Compiled once per cached profile, so its decision memo survives across
+    commands.
 
-    # Return cached profile if same project
-    if _cached_profile is not None and _cached_project_dir == project_dir:
-        return _cached_profile
+    Args:
+        project_dir: Project root directory
+        spec_dir: Optional spec directory
+
+    Returns:
+        CompiledAllowlist for the project
+    """
+    return _profile_cache.get_allowlist(project_dir, spec_dir)
 
-    # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
 
-    return _cached_profile
+def get_fallback_allowlist() -> CompiledAllowlist:
+    """Allowlist of base commands only, for when no profile can be loaded."""
+    global _fallback_allowlist
+    if _fallback_allowlist is None:
+        _fallback_allowlist = CompiledAllowlist(commands=frozenset(BASE_COMMANDS))
+    return _fallback_allowlist
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile, _cached_project_dir
-    _cached_profile = None
-    _cached_project_dir = None
+    """Reset the cached profiles (useful for testing or re-analysis)."""
+    _profile_cache.clear()
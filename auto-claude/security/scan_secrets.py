@@ -16,10 +16,19 @@ Exit codes:
 """
 
 import argparse
+import bisect
+import hashlib
+import json
+import os
 import re
+import stat
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
 # =============================================================================
@@ -251,6 +260,280 @@ FALSE_POSITIVE_PATTERNS = [
 ]
 
 
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+
+# Line boundaries as str.splitlines() sees them
+_LINE_BREAK_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_BREAK_CLASS = "".join(
+    f"\\x{ord(c):02x}" if ord(c) < 256 else f"\\u{ord(c):04x}"
+    for c in _LINE_BREAK_CHARS
+)
+_LINE_BREAK_RE = re.compile(f"\r\n|[{_LINE_BREAK_CLASS}]")
+
+# Escapes matching characters a single line cannot contain, outside a class
+_UNBOUNDED_ESCAPES = {
+    "s": f"[^\\S{_LINE_BREAK_CLASS}]",
+    "W": f"[^\\w{_LINE_BREAK_CLASS}]",
+    "D": f"[^\\d{_LINE_BREAK_CLASS}]",
+}
+
+# Constructs whose meaning differs between a line and a whole buffer
+_LINE_SENSITIVE = re.compile(r"\\[AZnrfvxuUN]|\(\?<?[=!]|(?<!\[)\^|(?<!\\)\$")
+
+# Shortest literal worth a substring check before running a pattern
+MIN_PREFILTER_LITERAL = 3
+
+# Characters re.IGNORECASE matches with i that str.casefold() does not fold to i
+_FOLD_EXTRA = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """A secret pattern prepared for whole-buffer scanning."""
+
+    index: int
+    name: str
+    regex: re.Pattern
+    # True when regex cannot match across lines (scanned over the buffer)
+    line_bounded: bool
+    # Case-folded literals, one of which occurs in every match (empty = none known)
+    literals: tuple[str, ...]
+
+
+def _fold(text: str) -> str:
+    return text.translate(_FOLD_EXTRA).casefold()
+
+
+def _line_bounded(pattern: str) -> str | None:
+    """
+    Rewrite a pattern so that no match can span a line break.
+
+    Returns:
+        The rewritten pattern, or None if it uses constructs that behave
+        differently on a whole buffer (anchors, lookarounds, explicit line
+        break escapes, whitespace inside a positive character class)
+    """
+    if _LINE_SENSITIVE.search(pattern):
+        return None
+
+    out: list[str] = []
+    i = 0
+    in_class = False
+    negated = False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            escape = pattern[i : i + 2]
+            if in_class:
+                if not negated and escape[1:] in _UNBOUNDED_ESCAPES:
+                    return None
+                out.append(escape)
+            else:
+                out.append(_UNBOUNDED_ESCAPES.get(escape[1:], escape))
+            i += 2
+            continue
+        if in_class:
+            if c == "]":
+                in_class = False
+            out.append(c)
+            i += 1
+            continue
+        if c == "[":
+            in_class = True
+            negated = pattern.startswith("[^", i)
+            i += 2 if negated else 1
+            out.append("[^" + _LINE_BREAK_CLASS if negated else "[")
+            if pattern.startswith("]", i):  # a leading ] is literal
+                out.append("]")
+                i += 1
+            continue
+        out.append(f"[^{_LINE_BREAK_CLASS}]" if c == "." else c)
+        i += 1
+    return "".join(out)
+
+
+def _skip_group(pattern: str, i: int, opening: str, closing: str) -> int:
+    """Index just past the bracket closing the one at pattern[i] (-1 if none)."""
+    depth = 0
+    in_class = False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = c != "]"
+        elif c == "[" and opening != "[":
+            in_class = True
+            if pattern.startswith("]", i + 1) or pattern.startswith("^]", i + 1):
+                i += 2 if pattern[i + 1] == "]" else 3
+                continue
+        elif c == opening:
+            depth += 1
+        elif c == closing:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def _split_alternatives(body: str) -> list[str]:
+    """Split a group body on its top-level | separators."""
+    parts, start, i = [], 0, 0
+    while i < len(body):
+        c = body[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c in "([":
+            end = _skip_group(body, i, c, ")" if c == "(" else "]")
+            if end < 0:
+                return []
+            i = end
+            continue
+        if c == "|":
+            parts.append(body[start:i])
+            start = i + 1
+        i += 1
+    parts.append(body[start:])
+    return parts
+
+
+_QUANTIFIER = re.compile(r"(?:[?*+]|\{(\d*)(?:,\d*)?\})[?+]?")
+
+
+def required_literals(pattern: str) -> tuple[str, ...]:
+    """
+    Find literals of which at least one occurs in every match of a pattern.
+
+    Used as a prefilter: a pattern none of whose literals occur in a buffer
+    cannot match it. Literals are case-folded (patterns run with
+    re.IGNORECASE).
+
+    Args:
+        pattern: Regular expression source
+
+    Returns:
+        Alternative literals, or () when no literal of MIN_PREFILTER_LITERAL
+        characters is known to be required
+    """
+    candidates: list[tuple[str, ...]] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            candidates.append(("".join(run),))
+            run.clear()
+
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        literal: str | None = None
+        group: tuple[str, ...] = ()
+        if c == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if escaped and not escaped.isalnum():
+                literal = escaped
+            i += 2
+        elif c == "[":
+            end = _skip_group(pattern, i, "[", "]")
+            if end < 0:
+                return ()
+            members = pattern[i + 1 : end - 1]
+            folded = {_fold(m) for m in members}
+            if (
+                members[:1] not in ("^", "")
+                and "\\" not in members
+                and "-" not in members
+                and len(folded) == 1
+            ):
+                literal = folded.pop()
+            i = end
+        elif c == "(":
+            end = _skip_group(pattern, i, "(", ")")
+            if end < 0:
+                return ()
+            body = pattern[i + 1 : end - 1]
+            if body.startswith("?:"):
+                body = body[2:]
+            if not body.startswith("?"):
+                alternatives = [
+                    required_literals(alt) for alt in _split_alternatives(body)
+                ]
+                if alternatives and all(alternatives):
+                    group = tuple(lit for alt in alternatives for lit in alt)
+            i = end
+        elif c == "|":
+            return ()
+        elif c in ".^$":
+            i += 1
+        else:
+            literal = c
+            i += 1
+
+        quantifier = _QUANTIFIER.match(pattern, i)
+        optional = False
+        if quantifier:
+            i = quantifier.end()
+            minimum = quantifier.group(1)
+            optional = quantifier.group(0)[0] in "?*" or minimum in ("", "0")
+            if quantifier.group(0)[0] == "+":
+                optional = False
+
+        if literal is not None and not optional:
+            run.append(_fold(literal))
+            if not quantifier:
+                continue
+        flush()
+        if group and not optional:
+            candidates.append(group)
+    flush()
+
+    usable = [
+        candidate
+        for candidate in candidates
+        if min(len(lit) for lit in candidate) >= MIN_PREFILTER_LITERAL
+    ]
+    if not usable:
+        return ()
+    return max(usable, key=lambda candidate: min(len(lit) for lit in candidate))
+
+
+def compile_patterns(patterns: list[tuple[str, str]]) -> list[CompiledPattern]:
+    """
+    Prepare (pattern, name) pairs for scan_content().
+
+    Invalid patterns are skipped.
+    """
+    compiled = []
+    for index, (pattern, name) in enumerate(patterns):
+        bounded = _line_bounded(pattern)
+        try:
+            regex = re.compile(bounded or pattern, re.IGNORECASE)
+        except re.error:
+            continue
+        compiled.append(
+            CompiledPattern(
+                index=index,
+                name=name,
+                regex=regex,
+                line_bounded=bounded is not None,
+                literals=required_literals(pattern),
+            )
+        )
+    return compiled
+
+
+COMPILED_PATTERNS = compile_patterns(ALL_PATTERNS)
+
+_FALSE_POSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in FALSE_POSITIVE_PATTERNS))
+_TYPE_HINT_RE = re.compile(r"^[a-z_]+:\s*str\s*$", re.IGNORECASE)
+_LONG_KEY_RE = re.compile(r"[a-zA-Z0-9_-]{40,}")
+
+
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
@@ -301,12 +584,11 @@ def is_false_positive(line: str, matched_text: str) -> bool:
     """Check if a match is likely a false positive."""
     line_lower = line.lower()
 
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, line_lower):
-            return True
+    if _FALSE_POSITIVE_RE.search(line_lower):
+        return True
 
     # Check if it's just a variable name or type hint
-    if re.match(r"^[a-z_]+:\s*str\s*$", line.strip(), re.IGNORECASE):
+    if _TYPE_HINT_RE.match(line.strip()):
         return True
 
     # Check if it's in a comment
@@ -317,7 +599,7 @@ def is_false_positive(line: str, matched_text: str) -> bool:
         or stripped.startswith("*")
     ):
         # But still flag if there's an actual long key-like string
-        if not re.search(r"[a-zA-Z0-9_-]{40,}", matched_text):
+        if not _LONG_KEY_RE.search(matched_text):
             return True
 
     return False
@@ -331,32 +613,66 @@ def mask_secret(text: str, visible_chars: int = 8) -> str:
 
 
 def scan_content(content: str, file_path: str) -> list[SecretMatch]:
-    """Scan file content for potential secrets."""
+    """
+    Scan file content for potential secrets.
+
+    Patterns whose required literals do not occur in the content are
+    skipped; the rest run once over the whole buffer and line numbers are
+    recovered from match offsets. Results (and their order: by line, then
+    pattern, then position) are the same as matching line by line.
+    """
+    folded = _fold(content)
+    # (line index, pattern index, offset, matched text)
+    hits: list[tuple[int, int, int, str]] = []
+    line_starts: list[int] | None = None
+    lines: list[str] | None = None
+
+    for pattern in COMPILED_PATTERNS:
+        if pattern.literals and not any(lit in folded for lit in pattern.literals):
+            continue
+        if pattern.line_bounded:
+            for match in pattern.regex.finditer(content):
+                if line_starts is None:
+                    line_starts = [0]
+                    line_starts.extend(
+                        m.end() for m in _LINE_BREAK_RE.finditer(content)
+                    )
+                offset = match.start()
+                line_index = bisect.bisect_right(line_starts, offset) - 1
+                hits.append((line_index, pattern.index, offset, match.group(0)))
+        else:
+            if lines is None:
+                lines = content.splitlines()
+            for line_index, line in enumerate(lines):
+                for match in pattern.regex.finditer(line):
+                    hits.append(
+                        (line_index, pattern.index, match.start(), match.group(0))
+                    )
+
+    if not hits:
+        return []
+
+    if lines is None:
+        lines = content.splitlines()
+    hits.sort(key=lambda hit: hit[:3])
+
     matches = []
-    lines = content.splitlines()
+    for line_index, pattern_index, _, matched_text in hits:
+        line = lines[line_index]
 
-    for line_num, line in enumerate(lines, 1):
-        for pattern, pattern_name in ALL_PATTERNS:
-            try:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    matched_text = match.group(0)
-
-                    # Skip false positives
-                    if is_false_positive(line, matched_text):
-                        continue
-
-                    matches.append(
-                        SecretMatch(
-                            file_path=file_path,
-                            line_number=line_num,
-                            pattern_name=pattern_name,
-                            matched_text=matched_text,
-                            line_content=line.strip()[:100],  # Truncate long lines
-                        )
-                    )
-            except re.error:
-                # Invalid regex, skip
-                continue
+        # Skip false positives
+        if is_false_positive(line, matched_text):
+            continue
+
+        matches.append(
+            SecretMatch(
+                file_path=file_path,
+                line_number=line_index + 1,
+                pattern_name=ALL_PATTERNS[pattern_index][1],
+                matched_text=matched_text,
+                line_content=line.strip()[:100],  # Truncate long lines
+            )
+        )
 
     return matches
 
@@ -391,16 +707,199 @@ def get_all_tracked_files() -> list[str]:
         return []
 
 
+# =============================================================================
+# INCREMENTAL SCANNING
+# =============================================================================
+
+# Cache file inside the project's .auto-claude/ directory
+SCAN_CACHE_FILENAME = "secrets_scan_cache.json"
+
+# Bump when the cache layout or the scanning logic changes
+SCAN_CACHE_VERSION = 1
+
+# Minimum number of files to scan before a process pool is worth starting
+PARALLEL_SCAN_MIN_FILES = 32
+
+# A file modified this recently may change again without its mtime moving,
+# so its stat signature is not trusted on the next run
+RACY_MTIME_SECONDS = 2.0
+
+
+def git_blob_sha(data: bytes) -> str:
+    """SHA-1 of data as git names a blob (same as `git hash-object`)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _rules_fingerprint() -> str:
+    """Hash of the patterns a cached verdict depends on."""
+    hasher = hashlib.sha256()
+    for pattern, name in ALL_PATTERNS:
+        hasher.update(f"{name}\0{pattern}\0".encode())
+    for pattern in FALSE_POSITIVE_PATTERNS:
+        hasher.update(f"{pattern}\0".encode())
+    return hasher.hexdigest()
+
+
+class SecretScanCache:
+    """
+    Blobs known to contain no secrets, and the blob each path last held.
+
+    Only clean verdicts are stored: files with findings are scanned again on
+    every run, so matched secrets are never copied into the cache file. A
+    path whose mtime and size are unchanged is skipped without being read;
+    otherwise its content is hashed and only scanned if that blob is new.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file to load and save (None = memory only)
+        """
+        self.path = Path(path) if path else None
+        # path -> (mtime_ns, size, blob sha, stat signature trusted)
+        self.files: dict[str, tuple[int, int, str, bool]] = {}
+        self.clean: set[str] = set()
+        self._modified = False
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> "SecretScanCache | None":
+        """Cache stored under project_dir/.auto-claude/, if that directory exists."""
+        directory = Path(project_dir) / ".auto-claude"
+        if not directory.is_dir():
+            return None
+        return cls(directory / SCAN_CACHE_FILENAME)
+
+    def is_clean(self, file_path: str, st: os.stat_result) -> bool:
+        """True if the file is unchanged since it was last found clean."""
+        entry = self.files.get(file_path)
+        return (
+            entry is not None
+            and entry[3]
+            and entry[0] == st.st_mtime_ns
+            and entry[1] == st.st_size
+            and entry[2] in self.clean
+        )
+
+    def record(
+        self, file_path: str, st: os.stat_result, blob: str, clean: bool
+    ) -> None:
+        """Remember the blob a file held when scanned, and whether it was clean."""
+        trusted = time.time() - st.st_mtime_ns / 1e9 >= RACY_MTIME_SECONDS
+        self.files[file_path] = (st.st_mtime_ns, st.st_size, blob, trusted)
+        if clean:
+            self.clean.add(blob)
+        else:
+            self.clean.discard(blob)
+        self._modified = True
+
+    def forget(self, file_path: str) -> None:
+        """Drop a path that no longer exists."""
+        if self.files.pop(file_path, None) is not None:
+            self._modified = True
+
+    def save(self) -> None:
+        """Write the cache if it changed, keeping only blobs still in use."""
+        if self.path is None or not self._modified:
+            return
+        in_use = {entry[2] for entry in self.files.values()}
+        self.clean &= in_use
+        data = {
+            "version": SCAN_CACHE_VERSION,
+            "rules": _rules_fingerprint(),
+            "files": {path: list(entry) for path, entry in self.files.items()},
+            "clean": sorted(self.clean),
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        except OSError:
+            return  # The cache is only an optimization
+        self._modified = False
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                data.get("version") != SCAN_CACHE_VERSION
+                or data.get("rules") != _rules_fingerprint()
+            ):
+                return
+            files = {
+                path: (int(mtime), int(size), str(blob), bool(trusted))
+                for path, (mtime, size, blob, trusted) in data["files"].items()
+            }
+            clean = {str(blob) for blob in data["clean"]}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return  # Missing or unreadable: start empty
+        self.files, self.clean = files, clean
+
+
+def _scan_file(
+    job: tuple[str, str], clean_blobs: frozenset[str] = frozenset()
+) -> tuple[str, str | None, list[SecretMatch]]:
+    """
+    Read and scan one file (runs in a worker process for large scans).
+
+    Returns:
+        (file_path, blob sha or None if unreadable, matches)
+    """
+    file_path, full_path = job
+    try:
+        with open(full_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return file_path, None, []
+
+    blob = git_blob_sha(data)
+    if blob in clean_blobs:
+        return file_path, blob, []
+
+    # Same text Path.read_text() produces (universal newlines)
+    content = data.decode("utf-8", errors="ignore")
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return file_path, blob, scan_content(content, file_path)
+
+
 def scan_files(
     files: list[str],
     project_dir: Path | None = None,
+    max_workers: int = 1,
+    cache: SecretScanCache | None = None,
 ) -> list[SecretMatch]:
-    """Scan a list of files for secrets."""
+    """
+    Scan a list of files for secrets.
+
+    Args:
+        files: Paths relative to project_dir
+        project_dir: Project root (defaults to the current directory)
+        max_workers: Worker processes for large scans (1 = scan in-process)
+        cache: Verdicts of earlier scans; unchanged clean files are skipped
+            and the cache is saved afterwards
+
+    Returns:
+        Matches, in the order of files
+    """
     if project_dir is None:
         project_dir = Path.cwd()
 
     custom_ignores = load_secretsignore(project_dir)
-    all_matches = []
+    jobs = []
+    stats = {}
 
     for file_path in files:
         # Skip files based on ignore patterns
@@ -410,17 +909,46 @@ def scan_files(
         full_path = project_dir / file_path
 
         # Skip if file doesn't exist or is a directory
-        if not full_path.exists() or full_path.is_dir():
+        try:
+            st = full_path.stat()
+        except OSError:
+            if cache is not None:
+                cache.forget(file_path)
+            continue
+        if stat.S_ISDIR(st.st_mode):
             continue
 
+        if cache is not None and cache.is_clean(file_path, st):
+            continue
+        stats[file_path] = st
+        jobs.append((file_path, str(full_path)))
+
+    scan = partial(
+        _scan_file,
+        clean_blobs=frozenset(cache.clean) if cache is not None else frozenset(),
+    )
+    results = None
+    if max_workers > 1 and len(jobs) >= PARALLEL_SCAN_MIN_FILES:
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
-            matches = scan_content(content, file_path)
-            all_matches.extend(matches)
-        except (OSError, UnicodeDecodeError):
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+                chunksize = max(1, len(jobs) // (max_workers * 4))
+                results = list(pool.map(scan, jobs, chunksize=chunksize))
+        except Exception:
+            results = None  # Pool unavailable: scan in-process below
+    if results is None:
+        results = [scan(job) for job in jobs]
+
+    all_matches = []
+    for file_path, blob, matches in results:
+        if blob is None:
             # Skip files that can't be read
             continue
+        all_matches.extend(matches)
+        if cache is not None:
+            cache.record(file_path, stats[file_path], blob, clean=not matches)
 
+    if cache is not None:
+        cache.save()
     return all_matches
 
 
@@ -514,6 +1042,18 @@ def main() -> int:
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Only output if secrets are found"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes to scan with (default: 1)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip files found clean by earlier scans (cached in .auto-claude/)",
+    )
 
     args = parser.parse_args()
 
@@ -545,7 +1085,8 @@ def main() -> int:
         print(f"Scanning {len(files)} file(s) for secrets...")
 
     # Scan files
-    matches = scan_files(files, project_dir)
+    cache = SecretScanCache.for_project(project_dir) if args.cache else None
+    matches = scan_files(files, project_dir, max_workers=args.jobs, cache=cache)
 
     # Output results
     if args.json:
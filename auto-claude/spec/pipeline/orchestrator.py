@@ -204,8 +204,8 @@ class SpecOrchestrator:
                 print_status("Generating project index...", "progress")
 
             try:
-                # Regenerate project index
-                analyze_project(self.project_dir, index_file)
+                # Regenerate project index (only services that changed)
+                analyze_project(self.project_dir, index_file, incremental=True)
                 print_status("Project index updated", "success")
             except Exception as e:
                 print_status(f"Project index refresh failed: {e}", "warning")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the Analysis File Cache
+=================================
+
+Tests the per-run file cache shared by the analysis detectors:
+- Text, JSON, TOML, YAML and regex results computed once per file
+- Hit/miss counters
+- Every file read from disk once across a full project analysis
+"""
+
+import json
+import re
+from pathlib import Path
+
+from analysis.analyzers import ProjectAnalyzer
+from analysis.analyzers.file_cache import AnalysisFileCache
+
+
+class TestAnalysisFileCache:
+    """Tests for AnalysisFileCache."""
+
+    def test_text_read_once(self, temp_dir: Path):
+        """Repeated reads are served from memory."""
+        path = temp_dir / "requirements.txt"
+        path.write_text("flask\nrequests\n")
+        cache = AnalysisFileCache()
+
+        assert cache.read_text(path) == "flask\nrequests\n"
+        path.write_text("changed\n")
+        assert cache.read_text(path) == "flask\nrequests\n"
+
+        assert cache.disk_reads[str(path.resolve())] == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_parse_results(self, temp_dir: Path):
+        """JSON files are parsed once and share one disk read."""
+        (temp_dir / "package.json").write_text(json.dumps({"name": "web"}))
+        (temp_dir / "broken.json").write_text("{not json")
+        cache = AnalysisFileCache()
+
+        assert cache.read_json(temp_dir / "package.json") == {"name": "web"}
+        assert cache.read_json(temp_dir / "package.json") is cache.read_json(
+            temp_dir / "package.json"
+        )
+        assert cache.read_json(temp_dir / "broken.json") is None
+        assert cache.read_json(temp_dir / "missing.json") is None
+
+        assert cache.stats()["reread"] == {}
+
+    def test_findall_cached(self, temp_dir: Path):
+        """Regex results are cached per (file, pattern, flags)."""
+        path = temp_dir / "requirements.txt"
+        path.write_text("flask==2.0\nrequests\n")
+        cache = AnalysisFileCache()
+
+        first = cache.findall(path, r"^([a-z]+)", re.MULTILINE)
+        second = cache.findall(path, r"^([a-z]+)", re.MULTILINE)
+
+        assert first == second == ["flask", "requests"]
+        assert cache.findall(path, r"^([a-z]+)") == ["flask"]
+        assert cache.findall(temp_dir / "missing.txt", r".") == []
+
+
+class TestSharedAcrossDetectors:
+    """Tests that one cache serves a whole analysis run."""
+
+    def test_each_file_read_once(self, temp_dir: Path):
+        """A full analysis reads every file from disk at most once."""
+        (temp_dir / "requirements.txt").write_text("fastapi\nsqlalchemy\ncelery\n")
+        (temp_dir / "main.py").write_text(
+            "from fastapi import FastAPI\n"
+            "app = FastAPI()\n\n"
+            "@app.get('/items')\n"
+            "def items():\n"
+            "    return []\n\n"
+            "if __name__ == '__main__':\n"
+            "    uvicorn.run(app, port=8050)\n"
+        )
+        (temp_dir / ".env").write_text("PORT=8050\nDATABASE_URL=postgres://db\n")
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        index = analyzer.analyze()
+
+        stats = analyzer.file_cache.stats()
+        assert index["services"]["main"]["language"] == "Python"
+        assert stats["reread"] == {}
+        assert stats["hits"] > 0
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the Context Cache
+===========================
+
+Tests the context.cache module including:
+- Reusing a built context across ContextBuilder instances
+- Per-service invalidation on uncommitted and committed changes
+- The stat-based fallback outside git
+- LRU eviction, in memory and of the per-entry files on disk
+- Entry files shared by concurrent processes
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from context.builder import ContextBuilder
+from context.cache import CACHE_DIRNAME, ContextCache
+from context.models import TaskContext
+from context.serialization import serialize_context
+
+PROJECT_INDEX = {
+    "services": {
+        "backend": {"path": "backend", "language": "python"},
+        "frontend": {"path": "frontend", "language": "typescript"},
+    }
+}
+
+
+def _write_services(root: Path) -> None:
+    (root / "backend").mkdir()
+    (root / "backend" / "retry.py").write_text("def retry():\n    return retry\n")
+    (root / "frontend").mkdir()
+    (root / "frontend" / "retry.ts").write_text("export const retry = 1;\n")
+    (root / ".auto-claude").mkdir()
+
+
+def _commit(repo: Path, message: str) -> None:
+    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, capture_output=True, check=True
+    )
+
+
+@pytest.fixture
+def project(temp_git_repo: Path) -> Path:
+    """Git project with two services and an installed .auto-claude/."""
+    _write_services(temp_git_repo)
+    (temp_git_repo / ".gitignore").write_text(".auto-claude/\n")
+    _commit(temp_git_repo, "Add services")
+    return temp_git_repo
+
+
+def _as_json(context: TaskContext) -> dict:
+    return json.loads(json.dumps(serialize_context(context)))
+
+
+def _build(project_dir: Path, services: list[str], fail_on_search: bool = False):
+    builder = ContextBuilder(project_dir, PROJECT_INDEX)
+    if fail_on_search:
+
+        def search_service(*args, **kwargs):
+            raise AssertionError("cache hit should not search")
+
+        builder.searcher.search_service = search_service
+    return builder.build_context(
+        "Add retry", services=services, keywords=["retry"], include_graph_hints=False
+    )
+
+
+class TestContextCache:
+    """Tests for ContextBuilder result caching."""
+
+    def test_hit_across_builders(self, project: Path):
+        """A second builder (e.g. another CLI call) reuses the stored context."""
+        first = _build(project, ["backend", "frontend"])
+
+        assert list((project / ".auto-claude" / CACHE_DIRNAME).glob("*.json"))
+        second = _build(project, ["backend", "frontend"], fail_on_search=True)
+        assert _as_json(second) == _as_json(first)
+
+    def test_change_invalidates_only_affected_service(self, project: Path):
+        """Editing one service keeps entries for other services valid."""
+        _build(project, ["backend"])
+        _build(project, ["frontend"])
+
+        (project / "frontend" / "retry.ts").write_text("export const retry = 2;\n")
+
+        _build(project, ["backend"], fail_on_search=True)
+        with pytest.raises(AssertionError):
+            _build(project, ["frontend"], fail_on_search=True)
+
+    def test_untracked_file_invalidates(self, project: Path):
+        """New untracked files in a service invalidate its entries."""
+        first = _build(project, ["backend"])
+
+        (project / "backend" / "retry_helpers.py").write_text("retry = True\n")
+        second = _build(project, ["backend"])
+
+        assert _as_json(second) != _as_json(first)
+        assert any(
+            f["path"].endswith("retry_helpers.py")
+            for f in second.files_to_modify + second.files_to_reference
+        )
+
+    def test_commit_invalidates(self, project: Path):
+        """Committed changes are picked up through the service tree hash."""
+        _build(project, ["backend"])
+
+        (project / "backend" / "retry.py").write_text("retry = None\n")
+        _commit(project, "Change backend")
+
+        with pytest.raises(AssertionError):
+            _build(project, ["backend"], fail_on_search=True)
+
+    def test_outside_git(self, temp_dir: Path):
+        """Without git, service files are fingerprinted by stat."""
+        _write_services(temp_dir)
+        _build(temp_dir, ["backend"])
+        _build(temp_dir, ["backend"], fail_on_search=True)
+
+        (temp_dir / "backend" / "retry.py").write_text("retry = 'changed'\n")
+        with pytest.raises(AssertionError):
+            _build(temp_dir, ["backend"], fail_on_search=True)
+
+    def test_lru_eviction(self, temp_dir: Path):
+        """The least recently used entry is evicted first."""
+        cache = ContextCache(temp_dir, max_entries=2)
+        context = TaskContext("task", [], [], [], {}, {})
+
+        cache.store("a", {}, context)
+        cache.store("b", {}, context)
+        assert cache.lookup("a", {})[0] == context  # "b" is now the oldest
+        cache.store("c", {}, context)
+
+        assert cache.lookup("b", {})[0] is None
+        assert cache.lookup("a", {})[0] == context
+        assert cache.lookup("c", {})[0] == context
+
+    def test_hit_does_not_rewrite_entry(self, temp_dir: Path):
+        """A hit reads one entry file and leaves its content untouched."""
+        cache = ContextCache(temp_dir, temp_dir / CACHE_DIRNAME)
+        context = TaskContext("task", [], [], [], {}, {})
+        cache.store("a", {}, context)
+        entry_file = temp_dir / CACHE_DIRNAME / "a.json"
+        saved = entry_file.read_bytes()
+
+        assert ContextCache(temp_dir, temp_dir / CACHE_DIRNAME).lookup("a", {})[0]
+        assert entry_file.read_bytes() == saved
+
+    def test_concurrent_caches_keep_each_others_entries(self, temp_dir: Path):
+        """Caches in separate processes add entries without overwriting."""
+        cache_dir = temp_dir / CACHE_DIRNAME
+        first = ContextCache(temp_dir, cache_dir)
+        second = ContextCache(temp_dir, cache_dir)
+        first.lookup("a", {})
+        second.lookup("b", {})
+
+        first.store("a", {}, TaskContext("a", [], [], [], {}, {}))
+        second.store("b", {}, TaskContext("b", [], [], [], {}, {}))
+
+        reopened = ContextCache(temp_dir, cache_dir)
+        assert reopened.lookup("a", {})[0].task_description == "a"
+        assert reopened.lookup("b", {})[0].task_description == "b"
+
+    def test_disk_lru_eviction(self, temp_dir: Path):
+        """Entry files beyond max_entries are evicted oldest first."""
+        cache_dir = temp_dir / CACHE_DIRNAME
+        cache = ContextCache(temp_dir, cache_dir, max_entries=2)
+        context = TaskContext("task", [], [], [], {}, {})
+        cache.store("a", {}, context)
+        cache.store("b", {}, context)
+        os.utime(cache_dir / "a.json", (1000, 1000))
+        os.utime(cache_dir / "b.json", (2000, 2000))
+
+        # A hit from another process refreshes "a"
+        assert ContextCache(temp_dir, cache_dir).lookup("a", {})[0] == context
+        cache.store("c", {}, context)
+
+        assert sorted(p.stem for p in cache_dir.glob("*.json")) == ["a", "c"]
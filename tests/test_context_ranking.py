@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for Context Relevance Ranking
+===================================
+
+Tests the context.ranking module including:
+- Scorer resolution
+- BM25 scoring behaviour and index/scan equivalence
+- Benchmark of recall@20 and latency against the count scorer
+"""
+
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from context.ranking import BM25Scorer, CorpusStats, CountScorer, get_scorer
+from context.search import CodeSearcher
+
+
+class TestGetScorer:
+    """Tests for scorer resolution."""
+
+    def test_default_is_count(self):
+        assert isinstance(get_scorer(None), CountScorer)
+
+    def test_by_name_and_instance(self):
+        scorer = BM25Scorer(k1=2.0)
+        assert get_scorer(scorer) is scorer
+        assert isinstance(get_scorer("bm25"), BM25Scorer)
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown scorer"):
+            get_scorer("nope")
+
+
+class TestBM25Scorer:
+    """Tests for BM25 scoring."""
+
+    def test_rare_terms_and_short_files_win(self):
+        """Rare keywords outweigh common ones; long files are normalized down."""
+        stats = CorpusStats(
+            documents=100,
+            average_length=200,
+            document_frequency={"retry": 2, "import": 90},
+        )
+        scorer = BM25Scorer()
+        keywords = ["retry", "import"]
+
+        rare = scorer.score(keywords, {"retry": 2}, 200, stats)
+        common = scorer.score(keywords, {"import": 2}, 200, stats)
+        long_file = scorer.score(keywords, {"retry": 2}, 20000, stats)
+
+        assert rare > common > 0
+        assert rare > long_file > 0
+        assert scorer.score(keywords, {}, 200, stats) == 0
+
+    def test_index_and_scan_paths_agree(self, temp_dir: Path):
+        """BM25 scores are identical whether served from the index or a scan."""
+        service = temp_dir / "svc"
+        service.mkdir()
+        (service / "a.py").write_text("retry = 1\nretry()\n")
+        (service / "b.py").write_text("def proxy(): return retry\n" * 5)
+        (service / "c.py").write_text("unrelated = True\n")
+
+        def run(use_index: bool):
+            searcher = CodeSearcher(temp_dir, use_index=use_index, scorer="bm25")
+            return [
+                (m.path, m.relevance_score)
+                for m in searcher.search_service(service, "svc", ["retry", "proxy"])
+            ]
+
+        assert run(True) == run(False)
+
+
+def _build_benchmark_corpus(root: Path, seed: int = 7) -> set[str]:
+    """
+    Create a service with a few relevant files among many distractors.
+
+    Distractors are large generated files that mention the query words
+    often, and ordinary files that use the common query word.
+
+    Returns:
+        Relative paths of the relevant files
+    """
+    rng = random.Random(seed)
+    service = root / "svc"
+    service.mkdir()
+    filler = ["value", "result", "item", "data", "config", "handler", "index"]
+
+    relevant = set()
+    for i in range(15):
+        body = "\n".join(rng.choice(filler) + f"_{j} = None" for j in range(30))
+        (service / f"proxy_retry_{i}.py").write_text(
+            "def retry_with_backoff(proxy):\n"
+            "    # retry through the next proxy when the current one fails\n"
+            f"    return retry(pick_proxy())\n{body}\n"
+        )
+        relevant.add(f"svc/proxy_retry_{i}.py")
+
+    # Large generated bundles: many hits, but spread over a huge file
+    for i in range(10):
+        lines = [f"generated_{j} = {rng.choice(filler)}_{j}" for j in range(5000)]
+        for j in range(0, 5000, 100):
+            lines[j] = f"generated_{j} = 'proxy retry request'"
+        (service / f"bundle_{i}.js").write_text("\n".join(lines))
+
+    # Ordinary modules that use the common query word a lot
+    for i in range(200):
+        body = "\n".join(
+            f"request_{j} = {rng.choice(filler)}" for j in range(rng.randint(10, 60))
+        )
+        (service / f"module_{i}.py").write_text(body)
+
+    return relevant
+
+
+@pytest.mark.slow
+def test_benchmark_recall_and_latency(temp_dir: Path):
+    """BM25 recall@20 beats the count scorer at comparable latency."""
+    relevant = _build_benchmark_corpus(temp_dir)
+    keywords = ["retry", "proxy", "request"]
+
+    results = {}
+    for name in ("count", "bm25"):
+        searcher = CodeSearcher(temp_dir, scorer=name)
+        searcher.search_service(temp_dir / "svc", "svc", keywords)  # warm index
+
+        start = time.perf_counter()
+        matches = searcher.search_service(temp_dir / "svc", "svc", keywords)
+        elapsed = time.perf_counter() - start
+
+        top = {m.path.replace("\\", "/") for m in matches[:20]}
+        results[name] = (len(top & relevant) / len(relevant), elapsed)
+
+    for name, (recall, elapsed) in results.items():
+        print(f"{name:>5}: recall@20={recall:.2f} latency={elapsed * 1000:.1f}ms")
+
+    assert results["bm25"][0] == 1.0
+    assert results["bm25"][0] > results["count"][0]
+    assert results["bm25"][1] < max(1.0, results["count"][1] * 5)
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Tests for Context Code Search
+=============================
+
+Tests the context.search and context.search_index modules including:
+- Indexed search producing the same matches as a full scan
+- Incremental index refresh on file changes and deletions
+- Persistence of the index under .auto-claude/
+- Parallel search matching the sequential path
+- Single-pass multi-keyword matching and pattern discovery
+- Bounded, streaming file reads (byte budget, binary/minified skipping)
+"""
+
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from context.builder import ContextBuilder
+from context.file_reader import iter_text_chunks, read_text_bounded
+from context.keyword_matcher import KeywordMatcher
+from context.models import FileMatch
+from context.pattern_discovery import PatternDiscoverer
+from context.search import CodeSearcher
+from context.search_index import INDEX_FILENAME, SearchIndex, tokenize_content
+
+
+@pytest.fixture
+def service_dir(temp_dir: Path) -> Path:
+    """Create a small service with a few code files."""
+    service = temp_dir / "backend"
+    (service / "app").mkdir(parents=True)
+    (service / "node_modules" / "lib").mkdir(parents=True)
+
+    (service / "app" / "retry.py").write_text(
+        "import time\n"
+        "\n"
+        "def retry_request(proxy):\n"
+        "    # Retry when the proxy fails\n"
+        "    for attempt in range(3):\n"
+        "        proxy.retry()\n"
+        "    return RetryError\n"
+    )
+    (service / "app" / "proxy.py").write_text(
+        "class ProxyPool:\n    def next_proxy(self):\n        return self.proxies[0]\n"
+    )
+    (service / "app" / "unrelated.py").write_text("print('hello')\n")
+    (service / "node_modules" / "lib" / "retry.js").write_text("retry();\n")
+    return service
+
+
+def _as_tuples(matches):
+    return [(m.path, m.relevance_score, m.reason, m.matching_lines) for m in matches]
+
+
+class TestTokenizeContent:
+    """Tests for content tokenization."""
+
+    def test_counts_and_lines(self):
+        """Counts token occurrences and records first line numbers."""
+        tokens = tokenize_content("a_b foo\nFoo foo\n\nfoo\nfoo\n")
+        assert tokens["foo"][0] == 5
+        assert tokens["foo"][1] == [1, 2, 4]
+        assert tokens["a_b"] == [1, [1]]
+
+
+class TestIndexedSearch:
+    """Tests for index-backed CodeSearcher."""
+
+    def test_matches_full_scan(self, temp_dir: Path, service_dir: Path):
+        """Indexed search returns exactly what a full scan returns."""
+        keywords = ["retry", "proxy", "error", "missing"]
+
+        indexed = CodeSearcher(temp_dir).search_service(
+            service_dir, "backend", keywords
+        )
+        scanned = CodeSearcher(temp_dir, use_index=False).search_service(
+            service_dir, "backend", keywords
+        )
+
+        assert _as_tuples(indexed) == _as_tuples(scanned)
+        assert {m.path for m in indexed} == {
+            os.path.join("backend", "app", "retry.py"),
+            os.path.join("backend", "app", "proxy.py"),
+        }
+
+    def test_falls_back_for_non_token_keywords(self, temp_dir: Path, service_dir: Path):
+        """Keywords with non-identifier characters use the full scan."""
+        searcher = CodeSearcher(temp_dir)
+        matches = searcher.search_service(service_dir, "backend", ["proxy.retry"])
+
+        assert [m.path for m in matches] == [os.path.join("backend", "app", "retry.py")]
+
+    def test_refresh_picks_up_changes(self, temp_dir: Path, service_dir: Path):
+        """Modified, added and deleted files are reflected on the next search."""
+        searcher = CodeSearcher(temp_dir)
+        assert searcher.search_service(service_dir, "backend", ["hello"])
+
+        (service_dir / "app" / "unrelated.py").unlink()
+        (service_dir / "app" / "new.py").write_text("hello = 'world'\nhello\n")
+
+        # The file listing is snapshotted per run; take a new one
+        searcher.inventory.refresh()
+        matches = searcher.search_service(service_dir, "backend", ["hello"])
+        assert [m.path for m in matches] == [os.path.join("backend", "app", "new.py")]
+        assert matches[0].relevance_score == 2
+
+
+class TestIndexPersistence:
+    """Tests for persisting the index under .auto-claude/."""
+
+    def test_in_memory_without_auto_claude_dir(self, temp_dir: Path):
+        """No index file is written unless .auto-claude/ is installed."""
+        index = SearchIndex.for_project(temp_dir)
+        assert index.index_file is None
+
+    def test_persists_and_reuses_index(self, temp_dir: Path, service_dir: Path):
+        """A second searcher loads the saved index instead of re-reading files."""
+        (temp_dir / ".auto-claude").mkdir()
+        CodeSearcher(temp_dir).search_service(service_dir, "backend", ["retry"])
+
+        index_file = temp_dir / ".auto-claude" / INDEX_FILENAME
+        assert index_file.exists()
+
+        index = SearchIndex.for_project(temp_dir)
+        index.load()
+        rel_paths = index.refresh(
+            service_dir, CodeSearcher(temp_dir)._iter_code_files(service_dir)
+        )
+        assert len(rel_paths) == 3
+        assert index._dirty is False
+        assert os.path.join("backend", "app", "retry.py") in index.find("retry")
+
+
+class TestParallelSearch:
+    """Tests for the parallel search mode."""
+
+    @pytest.mark.parametrize("use_index", [True, False])
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_parallel_matches_sequential(
+        self, temp_dir: Path, service_dir: Path, use_index: bool, use_processes: bool
+    ):
+        """Thread and process pools return the same ranking as sequential search."""
+        for i in range(6):
+            (service_dir / "app" / f"tie_{i}.py").write_text("retry\n")
+        keywords = ["retry", "proxy"]
+
+        sequential = CodeSearcher(temp_dir, use_index=use_index).search_service(
+            service_dir, "backend", keywords
+        )
+        parallel = CodeSearcher(
+            temp_dir, use_index=use_index, max_workers=4, use_processes=use_processes
+        ).search_service(service_dir, "backend", keywords)
+
+        assert _as_tuples(parallel) == _as_tuples(sequential)
+
+    def test_builder_parallel_services(self, temp_dir: Path, service_dir: Path):
+        """ContextBuilder merges per-service results in service order."""
+        frontend = temp_dir / "frontend"
+        frontend.mkdir()
+        (frontend / "retry.ts").write_text("export const retry = () => retry;\n")
+        project_index = {
+            "services": {
+                "backend": {"path": "backend", "language": "python"},
+                "frontend": {"path": "frontend", "language": "typescript"},
+            }
+        }
+
+        def build(workers: int):
+            builder = ContextBuilder(temp_dir, project_index, max_workers=workers)
+            return builder.build_context(
+                "Add retry logic",
+                services=["frontend", "backend"],
+                keywords=["retry"],
+                include_graph_hints=False,
+            )
+
+        sequential = build(1)
+        parallel = build(4)
+
+        assert parallel.files_to_modify == sequential.files_to_modify
+        assert parallel.files_to_reference == sequential.files_to_reference
+        assert list(parallel.service_contexts) == ["frontend", "backend"]
+
+    def test_refresh_tokenizes_outside_lock(self, temp_dir: Path, service_dir: Path):
+        """Other threads can use the index while a refresh is tokenizing."""
+        index = SearchIndex(temp_dir)
+        files = list(CodeSearcher(temp_dir)._iter_code_files(service_dir))
+        finished = []
+
+        def mapper(fn, items):
+            worker = threading.Thread(target=lambda: finished.append(index.find("x")))
+            worker.start()
+            worker.join(timeout=5)
+            return map(fn, items)
+
+        index.refresh(service_dir, files, mapper=mapper)
+
+        assert finished == [{}]
+        assert os.path.join("backend", "app", "retry.py") in index.find("retry")
+
+    def test_builder_refreshes_index_before_fan_out(
+        self, temp_dir: Path, service_dir: Path
+    ):
+        """Concurrent service searches do not each start a file-level pool."""
+        frontend = temp_dir / "frontend"
+        frontend.mkdir()
+        (frontend / "retry.ts").write_text("export const retry = () => retry;\n")
+        project_index = {
+            "services": {
+                "backend": {"path": "backend", "language": "python"},
+                "frontend": {"path": "frontend", "language": "typescript"},
+            }
+        }
+        builder = ContextBuilder(
+            temp_dir, project_index, max_workers=4, use_cache=False
+        )
+        pooled = []
+        original_map = builder.searcher._map
+
+        def counting_map(fn, items):
+            items = list(items)
+            if len(items) >= 2:
+                pooled.append(threading.current_thread().name)
+            return original_map(fn, items)
+
+        builder.searcher._map = counting_map
+        builder.build_context(
+            "Add retry logic",
+            services=["frontend", "backend"],
+            keywords=["retry"],
+            include_graph_hints=False,
+        )
+
+        # Only the up-front refresh of the backend files used the pool
+        assert pooled == [threading.main_thread().name]
+
+
+class TestKeywordMatcher:
+    """Tests for the single-pass keyword matcher."""
+
+    def _naive(self, content: str, keyword: str):
+        lower = content.lower()
+        lines = [
+            i
+            for i, line in enumerate(content.split("\n"), 1)
+            if keyword in line.lower()
+        ][:3]
+        return lower.count(keyword), lines
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "user username\nUSER_ID users\n\nuser",
+            "aaaa\naa a aaa\n",
+            "abcde cde abc\nxcdex\n",
+            "nothing to see here",
+        ],
+    )
+    def test_matches_naive_counts_and_lines(self, content: str):
+        """Counts and line numbers equal per-keyword str.count and line scans."""
+        keywords = ["user", "username", "aa", "a", "abc", "cde", "missing"]
+        scan = KeywordMatcher(keywords).scan(content)
+
+        for keyword in keywords:
+            count, lines = self._naive(content, keyword)
+            assert scan.counts[keyword] == count, keyword
+            assert scan.line_numbers[keyword] == lines, keyword
+
+    def test_snippet_window(self):
+        """Snippets span the lines around the first match."""
+        content = "\n".join(f"line {i}" for i in range(1, 11)) + "\nretry here\n"
+        scan = KeywordMatcher(["retry"]).scan(content)
+
+        assert (
+            scan.snippet("retry", before=2, after=1) == "line 9\nline 10\nretry here\n"
+        )
+        assert scan.snippet("missing") is None
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64])
+    def test_scan_chunks_matches_scan(self, chunk_size: int):
+        """Streaming over line-aligned chunks gives the same result as scan()."""
+        content = "".join(f"line {i} user{'name' * (i % 3)} aa\n" for i in range(40))
+        keywords = ["user", "username", "aa", "missing"]
+        matcher = KeywordMatcher(keywords)
+
+        lines = content.splitlines(keepends=True)
+        chunks = [
+            "".join(lines[i : i + chunk_size]) for i in range(0, len(lines), chunk_size)
+        ]
+        streamed = matcher.scan_chunks(chunks)
+        whole = matcher.scan(content)
+
+        assert streamed.counts == whole.counts
+        assert streamed.line_numbers == whole.line_numbers
+        for keyword in keywords:
+            assert streamed.matching_lines(keyword) == whole.matching_lines(keyword)
+
+    def test_scan_chunks_stops_at_cap(self):
+        """Once every keyword is capped, no further chunks are read."""
+        consumed = []
+
+        def chunks():
+            for i in range(100):
+                consumed.append(i)
+                yield f"retry {i}\n"
+
+        scan = KeywordMatcher(["retry"]).scan_chunks(chunks(), count_cap=5)
+
+        assert scan.counts["retry"] == 5
+        assert len(consumed) == 5
+
+
+class TestPatternDiscovery:
+    """Tests for pattern discovery from reference files."""
+
+    def test_discovers_first_snippet_per_keyword(
+        self, temp_dir: Path, service_dir: Path
+    ):
+        """Each keyword yields a snippet from the first file that contains it."""
+        refs = [
+            FileMatch(path="backend/app/proxy.py", service="backend", reason=""),
+            FileMatch(path="backend/app/retry.py", service="backend", reason=""),
+        ]
+
+        patterns = PatternDiscoverer(temp_dir).discover_patterns(
+            refs, ["proxy", "retry"]
+        )
+
+        assert patterns["proxy_pattern"].startswith(
+            "From backend/app/proxy.py:\nclass ProxyPool:"
+        )
+        assert patterns["retry_pattern"].startswith(
+            "From backend/app/retry.py:\nimport time"
+        )
+
+
+class TestBoundedReading:
+    """Tests for streaming reads with a byte budget."""
+
+    def test_chunks_are_line_aligned(self, temp_dir: Path):
+        """Chunks join back to the content and never split a line."""
+        path = temp_dir / "big.py"
+        content = "".join(f"value_{i} = {i}\n" for i in range(5000)) + "tail"
+        path.write_text(content)
+
+        chunks = list(iter_text_chunks(path, chunk_bytes=1000))
+
+        assert "".join(chunks) == content
+        assert len(chunks) > 1
+        assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+
+    def test_byte_budget(self, temp_dir: Path):
+        """Reads stop at the per-file budget."""
+        path = temp_dir / "fixture.py"
+        path.write_text("x = 1\n" * 100_000)
+
+        content = read_text_bounded(path, max_bytes=10_000)
+
+        assert 0 < len(content) <= 10_000
+
+    def test_skips_binary_and_minified(self, temp_dir: Path):
+        """Binary files and minified bundles read as empty."""
+        (temp_dir / "data.py").write_bytes(b"retry\0\x01\x02" * 100)
+        (temp_dir / "bundle.js").write_text("var retry=1;" * 2000)
+        (temp_dir / "app.min.js").write_text("var retry = 1;\n")
+        (temp_dir / "unreadable.py").mkdir()
+
+        assert read_text_bounded(temp_dir / "data.py") == ""
+        assert read_text_bounded(temp_dir / "bundle.js") == ""
+        assert read_text_bounded(temp_dir / "app.min.js") == ""
+        assert read_text_bounded(temp_dir / "unreadable.py") is None
+
+    @pytest.mark.parametrize("use_index", [False, True])
+    def test_search_ignores_minified_bundle(
+        self, temp_dir: Path, service_dir: Path, use_index: bool
+    ):
+        """Minified bundles never show up as matches."""
+        (service_dir / "app" / "vendor.js").write_text("retry();" * 5000)
+
+        matches = CodeSearcher(temp_dir, use_index=use_index).search_service(
+            service_dir, "backend", ["retry"]
+        )
+
+        assert matches
+        assert all(not m.path.endswith("vendor.js") for m in matches)
+
+    @pytest.mark.slow
+    def test_benchmark_memory_flat_in_file_size(
+        self, temp_dir: Path, service_dir: Path
+    ):
+        """Peak memory and latency of a scan do not grow with file size."""
+        line = "def handler(request):  # retry the proxy request on failure\n"
+
+        def measure(size_bytes: int) -> tuple[int, float]:
+            path = service_dir / "app" / "fixture.py"
+            path.write_text(line * (size_bytes // len(line)))
+            searcher = CodeSearcher(temp_dir, use_index=False, scorer="bm25")
+            tracemalloc.start()
+            start = time.perf_counter()
+            searcher.search_service(service_dir, "backend", ["retry", "proxy"])
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak, elapsed
+
+        small_peak, small_time = measure(2 * 1024 * 1024)
+        large_peak, large_time = measure(32 * 1024 * 1024)
+
+        # Bounded by the per-file budget, not by file size
+        assert large_peak < small_peak * 1.5
+        assert large_time < small_time * 3 + 0.5
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared file inventory.
+"""
+
+import subprocess
+
+from core.file_inventory import FileInventory
+
+
+def _make_files(root, *paths):
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x\n")
+
+
+def test_git_inventory_lists_tracked_and_untracked(temp_git_repo):
+    _make_files(temp_git_repo, "src/app.py", "node_modules/pkg/index.js")
+    (temp_git_repo / ".gitignore").write_text("node_modules/\n")
+    subprocess.run(["git", "add", "src/app.py"], cwd=temp_git_repo, check=True)
+    _make_files(temp_git_repo, "src/new.py")
+
+    inventory = FileInventory(temp_git_repo)
+
+    assert inventory.is_git
+    assert "src/app.py" in inventory.tracked_files()
+    assert "src/new.py" not in inventory.tracked_files()
+    assert "src/new.py" in inventory.files()
+    assert "node_modules/pkg/index.js" not in inventory.files()
+
+
+def test_git_inventory_drops_deleted_files(temp_git_repo):
+    (temp_git_repo / "README.md").unlink()
+    assert "README.md" not in FileInventory(temp_git_repo).files()
+
+
+def test_walk_fallback_prunes_skip_dirs(tmp_path):
+    _make_files(tmp_path, "a.py", "pkg/b.py", "node_modules/c.py", ".venv/d.py")
+
+    inventory = FileInventory(tmp_path)
+
+    assert not inventory.is_git
+    assert inventory.files() == ["a.py", "pkg/b.py"]
+    assert inventory.tracked_files() == []
+
+
+def test_iter_paths_filters(tmp_path):
+    _make_files(tmp_path, "svc/a.py", "svc/b.ts", "svc/dist/c.py", "other/d.py")
+    inventory = FileInventory(tmp_path)
+
+    paths = list(
+        inventory.iter_paths(tmp_path / "svc", extensions={".py"}, skip_dirs={"dist"})
+    )
+
+    assert paths == [tmp_path.resolve() / "svc" / "a.py"]
+
+
+def test_glob_matches_pathlib(tmp_path):
+    _make_files(
+        tmp_path,
+        "app.py",
+        "pkg/models.py",
+        "pkg/models/user.py",
+        "pkg/migrations/0001.py",
+        "Dockerfile.web",
+    )
+    inventory = FileInventory(tmp_path)
+
+    for pattern in [
+        "**/*.py",
+        "**/models/*.py",
+        "**/migrations",
+        "*.py",
+        "Dockerfile*",
+    ]:
+        expected = sorted(p.resolve() for p in tmp_path.glob(pattern))
+        assert inventory.glob(pattern) == expected, pattern
+
+    assert inventory.glob("*.py", tmp_path / "pkg") == [
+        tmp_path.resolve() / "pkg" / "models.py"
+    ]
+
+
+def test_refresh_takes_new_snapshot(tmp_path):
+    _make_files(tmp_path, "a.py")
+    inventory = FileInventory(tmp_path)
+    assert inventory.files() == ["a.py"]
+
+    _make_files(tmp_path, "b.py")
+    assert inventory.files() == ["a.py"]
+
+    inventory.refresh()
+    assert inventory.files() == ["a.py", "b.py"]
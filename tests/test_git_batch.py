@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Tests for Batched Git Object Access
+===================================
+
+Tests the long-lived ``git cat-file --batch`` reader and per-file diff split:
+- Many blobs served by one worker process, matching ``git show`` output
+- Missing objects, commit metadata and revision resolution
+- One ``git diff`` split per file, matching per-file ``git diff -- <path>``
+- ModificationTracker.refresh_from_git using the batched path
+"""
+
+import subprocess
+from pathlib import Path
+
+import core.git_batch as git_batch
+import pytest
+from core.git_batch import (
+    GitObjectReader,
+    close_object_reader,
+    diff_per_file,
+    get_object_reader,
+)
+from core.workspace.git_utils import (
+    get_file_content_from_ref,
+    get_files_content_from_ref,
+)
+from merge.file_evolution.modification_tracker import ModificationTracker
+from merge.file_evolution.storage import EvolutionStorage
+from merge.git_utils import get_file_from_branch
+from merge.timeline_git import TimelineGitHelper
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _commit_files(repo: Path, files: dict[str, str], message: str) -> None:
+    for rel, content in files.items():
+        path = repo / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", message)
+
+
+class TestGitObjectReader:
+    """Tests for GitObjectReader."""
+
+    def test_reads_match_git_show(self, temp_git_repo: Path):
+        """Batched reads return exactly what git show returns."""
+        files = {f"src/mod_{i}.py": f"value = {i}\n" * (i + 1) for i in range(50)}
+        files["name with spaces.txt"] = "spaced\n"
+        files["crlf.txt"] = "a\r\nb\r\n"
+        _commit_files(temp_git_repo, files, "Add files")
+
+        reader = GitObjectReader(temp_git_repo)
+        try:
+            specs = [f"HEAD:{p}" for p in files] + ["HEAD:missing.py"]
+            contents = reader.read_texts(specs)
+
+            for rel in files:
+                assert contents[f"HEAD:{rel}"] == _git(
+                    temp_git_repo, "show", f"HEAD:{rel}"
+                )
+            assert contents["HEAD:missing.py"] is None
+            assert reader.read_text("HEAD:name with spaces.txt") == "spaced\n"
+            assert reader.spawn_count == 1
+        finally:
+            reader.close()
+
+    def test_large_batch(self, temp_git_repo: Path):
+        """Large requests do not deadlock on full pipes."""
+        big = "x" * 200_000 + "\n"
+        _commit_files(temp_git_repo, {f"big_{i}.txt": big for i in range(20)}, "Big")
+
+        reader = GitObjectReader(temp_git_repo)
+        try:
+            specs = [f"HEAD:big_{i}.txt" for i in range(20)] * 50
+            contents = reader.read_texts(specs)
+            assert len(contents) == 20
+            assert all(content == big for content in contents.values())
+        finally:
+            reader.close()
+
+    def test_resolve_and_commit_info(self, temp_git_repo: Path):
+        """Revisions resolve like rev-parse and commit headers are parsed."""
+        _commit_files(temp_git_repo, {"a.txt": "a\n"}, "Add a\n\nLonger body")
+        head = _git(temp_git_repo, "rev-parse", "HEAD").strip()
+
+        reader = GitObjectReader(temp_git_repo)
+        try:
+            assert reader.resolve("HEAD") == head
+            assert reader.resolve("no-such-branch") is None
+            info = reader.commit_info(["HEAD", "no-such-branch"])
+            assert info == {"HEAD": {"message": "Add a", "author": "Test User"}}
+        finally:
+            reader.close()
+
+    def test_sees_new_commits(self, temp_git_repo: Path):
+        """A running worker picks up commits made after it started."""
+        reader = GitObjectReader(temp_git_repo)
+        try:
+            assert reader.read_text("HEAD:later.txt") is None
+            _commit_files(temp_git_repo, {"later.txt": "later\n"}, "Later")
+            assert reader.read_text("HEAD:later.txt") == "later\n"
+        finally:
+            reader.close()
+
+    def test_shared_reader(self, temp_git_repo: Path):
+        """get_object_reader returns one reader per directory."""
+        assert get_object_reader(temp_git_repo) is get_object_reader(
+            temp_git_repo / "."
+        )
+
+    def test_readers_bounded(self, temp_dir: Path, monkeypatch):
+        """Least recently used readers are closed beyond the limit."""
+        monkeypatch.setattr(git_batch, "MAX_OBJECT_READERS", 2)
+        dirs = []
+        for name in ("a", "b", "c"):
+            (temp_dir / name).mkdir()
+            dirs.append(temp_dir / name)
+
+        first = get_object_reader(dirs[0])
+        get_object_reader(dirs[1])
+        get_object_reader(dirs[0])
+        get_object_reader(dirs[2])
+
+        assert get_object_reader(dirs[0]) is first
+        assert str(dirs[1].resolve()) not in git_batch._readers
+        for path in dirs:
+            close_object_reader(path)
+
+    def test_close_object_reader(self, temp_git_repo: Path):
+        """A closed reader is replaced by a fresh one on next use."""
+        reader = get_object_reader(temp_git_repo)
+        reader.resolve("HEAD")
+
+        close_object_reader(temp_git_repo)
+
+        assert reader._proc is None
+        assert get_object_reader(temp_git_repo) is not reader
+
+    def test_outside_repository(self, temp_dir: Path):
+        """Outside a repository reads fail and the reader is dropped."""
+        reader = get_object_reader(temp_dir)
+
+        with pytest.raises(OSError):
+            reader.read_text("HEAD:a.txt")
+
+        assert get_object_reader(temp_dir) is not reader
+        close_object_reader(temp_dir)
+
+    def test_callers_fall_back_outside_repository(self, temp_dir: Path):
+        """Callers return their old fallbacks instead of raising."""
+        assert get_file_from_branch(temp_dir, "a.txt", "main") is None
+        assert get_file_content_from_ref(temp_dir, "main", "a.txt") is None
+        assert get_files_content_from_ref(temp_dir, "main", ["a.txt"]) == {
+            "a.txt": None
+        }
+        assert TimelineGitHelper(temp_dir).get_current_main_commit() == "unknown"
+        close_object_reader(temp_dir)
+
+
+class TestDiffPerFile:
+    """Tests for diff_per_file."""
+
+    def test_matches_per_file_diff(self, temp_git_repo: Path):
+        """Split output equals running git diff once per path."""
+        _commit_files(
+            temp_git_repo, {"keep.py": "k = 1\n", "old.py": "o = 1\n"}, "Base"
+        )
+        _git(temp_git_repo, "checkout", "-b", "task")
+        (temp_git_repo / "old.py").unlink()
+        _commit_files(
+            temp_git_repo,
+            {
+                "keep.py": "k = 2\n",
+                "new dir/new.py": "n = 1\n",
+                "renamed.py": "o = 1\n",
+            },
+            "Task changes",
+        )
+
+        paths = ["keep.py", "new dir/new.py", "old.py", "renamed.py", "README.md"]
+        diffs = diff_per_file(temp_git_repo, "main...HEAD", paths)
+
+        for path in paths:
+            assert diffs[path] == _git(temp_git_repo, "diff", "main...HEAD", "--", path)
+        assert diffs["README.md"] == ""
+
+
+class TestBatchedRefresh:
+    """Tests for the batched merge refresh paths."""
+
+    def test_refresh_from_git(self, temp_git_repo: Path):
+        """refresh_from_git records old content and per-file diffs."""
+        _commit_files(temp_git_repo, {"app.py": "def a():\n    pass\n"}, "Base")
+        _git(temp_git_repo, "checkout", "-b", "task")
+        _commit_files(
+            temp_git_repo,
+            {"app.py": "def a():\n    return 1\n", "util.py": "X = 1\n"},
+            "Task",
+        )
+
+        storage = EvolutionStorage(temp_git_repo, temp_git_repo / ".auto-claude")
+        tracker = ModificationTracker(storage)
+        recorded = {}
+        tracker.record_modification = lambda **kw: recorded.__setitem__(
+            kw["file_path"], kw
+        )
+
+        tracker.refresh_from_git("task-1", temp_git_repo, {})
+
+        assert set(recorded) == {"app.py", "util.py"}
+        assert recorded["app.py"]["old_content"] == "def a():\n    pass\n"
+        assert recorded["util.py"]["old_content"] == ""
+        assert recorded["app.py"]["raw_diff"] == _git(
+            temp_git_repo, "diff", "main...HEAD", "--", "app.py"
+        )
+
+    def test_timeline_helper(self, temp_git_repo: Path):
+        """TimelineGitHelper serves contents and commit info via the reader."""
+        _commit_files(temp_git_repo, {"a.py": "a\n", "b.py": "b\n"}, "Add a and b")
+        helper = TimelineGitHelper(temp_git_repo)
+        head = _git(temp_git_repo, "rev-parse", "HEAD").strip()
+
+        assert helper.get_current_main_commit() == head
+        assert helper.get_files_content_at_commit(["a.py", "c.py"], head) == {
+            "a.py": "a\n",
+            "c.py": None,
+        }
+        info = helper.get_commit_info(head)
+        assert info["message"] == "Add a and b"
+        assert info["author"] == "Test User"
+        assert "2 files changed" in info["diff_summary"]
@@ -11,13 +11,16 @@ Covers:
 - Conflict resolution attempts
 - Statistics tracking (AI calls, token estimates)
 - can_resolve filtering logic
+- Batching conflicts across files and caching resolutions
 """
 
+import re
 from datetime import datetime
 
 import pytest
 
 from merge import (
+    AIResolver,
     ChangeType,
     SemanticChange,
     TaskSnapshot,
@@ -26,6 +29,7 @@ from merge import (
     MergeStrategy,
     MergeDecision,
 )
+from merge.ai_resolver import ResolutionCache, ResolutionRequest, pack_batches
 
 
 class TestAIResolverBasics:
@@ -207,3 +211,182 @@ class TestStatsTracking:
 
         stats = mock_ai_resolver.stats
         assert stats["calls_made"] == 3
+
+
+def _request(file_path: str, name: str) -> ResolutionRequest:
+    conflict = ConflictRegion(
+        file_path=file_path,
+        location=f"function:{name}",
+        tasks_involved=["task-001", "task-002"],
+        change_types=[ChangeType.MODIFY_FUNCTION, ChangeType.MODIFY_FUNCTION],
+        severity=ConflictSeverity.MEDIUM,
+        can_auto_merge=False,
+        merge_strategy=MergeStrategy.AI_REQUIRED,
+    )
+    snapshot = TaskSnapshot(
+        task_id="task-001",
+        task_intent=f"Change {name}",
+        started_at=datetime.now(),
+        semantic_changes=[],
+    )
+    return ResolutionRequest(conflict, f"def {name}(): pass", [snapshot])
+
+
+def _batch_ai(prompts: list[str], skip: int | None = None):
+    """AI stub answering every numbered conflict (except skip) in a prompt."""
+
+    def call(system: str, user: str) -> str:
+        prompts.append(user)
+        numbers = sorted({int(n) for n in re.findall(r"## Conflict (\d+)\n", user)})
+        if not numbers:
+            return "```python\nsingle = True\n```"
+        return "\n".join(
+            f"## Conflict {n}\n```python\nmerged_{n} = True\n```"
+            for n in numbers
+            if n != skip
+        )
+
+    return call
+
+
+class TestBatchedResolution:
+    """Tests for packing conflicts into batches and caching resolutions."""
+
+    def test_pack_batches_respects_budget(self):
+        """Batches stay within the token budget and the item limit."""
+        sizes = [60, 50, 40, 30, 20, 10, 10, 10]
+        batches = pack_batches(sizes, budget=100, max_items=3)
+
+        assert sorted(i for batch in batches for i in batch) == list(range(8))
+        for batch in batches:
+            assert len(batch) <= 3
+            assert sum(sizes[i] for i in batch) <= 100
+        assert len(batches) == 3
+
+    def test_oversized_item_gets_own_batch(self):
+        """An item larger than the budget is still scheduled, alone."""
+        assert pack_batches([500, 10], budget=100) == [[0], [1]]
+
+    def test_conflicts_from_several_files_share_calls(self):
+        """Conflicts across files are resolved with fewer calls than conflicts."""
+        prompts: list[str] = []
+        resolver = AIResolver(ai_call_fn=_batch_ai(prompts))
+        requests = [
+            _request(f"file_{f}.py", f"func_{f}_{n}")
+            for f in range(3)
+            for n in range(2)
+        ]
+
+        results = resolver.resolve_batched(requests)
+
+        assert len(prompts) == 1
+        assert all(r.decision == MergeDecision.AI_MERGED for r in results)
+        assert [r.file_path for r in results] == [
+            r.conflict.file_path for r in requests
+        ]
+        assert len({r.merged_content for r in results}) == len(requests)
+        assert sum(r.ai_calls_made for r in results) == 1
+        assert resolver.stats["calls_made"] == 1
+
+    def test_unanswered_conflict_remains(self):
+        """A conflict missing from the batch response is left for review."""
+        prompts: list[str] = []
+        resolver = AIResolver(ai_call_fn=_batch_ai(prompts, skip=2))
+        requests = [_request("a.py", "one"), _request("b.py", "two")]
+
+        results = resolver.resolve_batched(requests)
+
+        assert results[0].decision == MergeDecision.AI_MERGED
+        assert results[1].decision == MergeDecision.NEEDS_HUMAN_REVIEW
+        assert results[1].conflicts_remaining == [requests[1].conflict]
+
+    def test_cached_resolutions_skip_calls(self, tmp_path):
+        """Resolved conflicts are reused, across resolvers when persisted."""
+        prompts: list[str] = []
+        requests = [_request("a.py", "one"), _request("b.py", "two")]
+        resolver = AIResolver(
+            ai_call_fn=_batch_ai(prompts), cache=ResolutionCache(tmp_path)
+        )
+        first = resolver.resolve_batched(requests)
+        assert len(prompts) == 1
+
+        again = resolver.resolve_conflict(*requests[1])
+        assert again.ai_calls_made == 0
+        assert again.merged_content == first[1].merged_content
+
+        reopened = AIResolver(
+            ai_call_fn=_batch_ai(prompts), cache=ResolutionCache(tmp_path)
+        )
+        results = reopened.resolve_batched(requests)
+        assert len(prompts) == 1
+        assert [r.merged_content for r in results] == [r.merged_content for r in first]
+
+    def test_partial_batch_retries_only_missing(self, tmp_path):
+        """Re-running after a partly answered batch calls AI for the rest only."""
+        prompts: list[str] = []
+        cache = ResolutionCache(tmp_path)
+        requests = [_request("a.py", "one"), _request("b.py", "two")]
+
+        AIResolver(ai_call_fn=_batch_ai(prompts, skip=2), cache=cache).resolve_batched(
+            requests
+        )
+        results = AIResolver(
+            ai_call_fn=_batch_ai(prompts), cache=cache
+        ).resolve_batched(requests)
+
+        assert len(prompts) == 2
+        assert "def two()" in prompts[1] and "def one()" not in prompts[1]
+        assert all(r.decision == MergeDecision.AI_MERGED for r in results)
+
+    def test_multiple_conflicts_one_result_per_conflict(self):
+        """resolve_multiple_conflicts returns one result per conflict."""
+        prompts: list[str] = []
+        resolver = AIResolver(ai_call_fn=_batch_ai(prompts))
+        requests = [_request("a.py", "one"), _request("a.py", "two")]
+        conflicts = [r.conflict for r in requests]
+        baselines = {r.conflict.location: r.baseline_code for r in requests}
+
+        results = resolver.resolve_multiple_conflicts(
+            conflicts, baselines, requests[0].task_snapshots
+        )
+
+        assert len(results) == len(conflicts)
+        assert len(prompts) == 1
+
+
+class TestResolutionCache:
+    """Tests for the bounded resolution cache."""
+
+    def test_memory_lru(self):
+        """The least recently used resolution is evicted from memory."""
+        cache = ResolutionCache(max_entries=2)
+        cache.put("a", "merged_a")
+        cache.put("b", "merged_b")
+        assert cache.get("a") == "merged_a"
+        cache.put("c", "merged_c")
+
+        assert cache.get("b") is None
+        assert cache.stats["entries"] == 2
+
+    def test_disk_entries_bounded(self, tmp_path):
+        """Past max_disk_entries, the least recently used files are pruned."""
+        import os
+
+        cache = ResolutionCache(tmp_path, max_disk_entries=4)
+        for i, key in enumerate("abcd"):
+            cache.put(key, f"merged_{key}")
+            os.utime(tmp_path / f"{key}.json", (1000 * (i + 1), 1000 * (i + 1)))
+
+        # A disk hit refreshes "a", leaving "b" the least recently used
+        assert ResolutionCache(tmp_path).get("a") == "merged_a"
+        cache.put("e", "merged_e")
+
+        assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["a", "d", "e"]
+
+    def test_contains_matches_get(self, tmp_path):
+        """Entries from another cache version are neither found nor hits."""
+        (tmp_path / "old.json").write_text('{"version": 0, "merged_code": "x"}')
+        cache = ResolutionCache(tmp_path)
+
+        assert "old" not in cache
+        assert cache.get("old") is None
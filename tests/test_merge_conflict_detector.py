@@ -12,8 +12,11 @@ Covers:
 - Conflict severity assessment
 - Merge strategy suggestion
 - Human-readable conflict explanations
+- Line-range interval index and overlapping edits at different locations
+- Implicit conflicts (removal/rename + usage)
 """
 
+import random
 import sys
 from pathlib import Path
 
@@ -473,3 +476,275 @@ class TestMergeStrategySelection:
                 MergeStrategy.AI_REQUIRED,
                 MergeStrategy.HUMAN_REQUIRED
             }
+
+
+def _change(change_type, target, location, start, end, content_after=None, **meta):
+    return SemanticChange(
+        change_type=change_type,
+        target=target,
+        location=location,
+        line_start=start,
+        line_end=end,
+        content_after=content_after,
+        metadata=meta,
+    )
+
+
+class TestIntervalIndex:
+    """Tests for the line-range interval index."""
+
+    def test_matches_brute_force(self):
+        """Queries and overlapping pairs agree with pairwise comparison."""
+        from merge.interval_index import IntervalIndex
+
+        rng = random.Random(7)
+        ranges = []
+        for i in range(300):
+            start = rng.randint(1, 2000)
+            ranges.append((start, start + rng.randint(0, 40), i))
+        index = IntervalIndex(ranges)
+
+        def overlaps(a, b):
+            return a[0] <= b[1] and b[0] <= a[1]
+
+        for _ in range(200):
+            start = rng.randint(1, 2000)
+            query = (start, start + rng.randint(0, 60))
+            expected = sorted(r[2] for r in ranges if overlaps(r, query))
+            assert sorted(r[2] for r in index.query(*query)) == expected
+
+        pairs = {frozenset(p) for p in index.overlapping_pairs()}
+        expected_pairs = {
+            frozenset((a[2], b[2]))
+            for i, a in enumerate(ranges)
+            for b in ranges[i + 1 :]
+            if overlaps(a, b)
+        }
+        assert pairs == expected_pairs
+
+    def test_ranges_overlap(self):
+        """Inclusive ranges touching at one line overlap."""
+        from merge.conflict_analysis import ranges_overlap
+
+        assert ranges_overlap([(10, 20), (1, 5), (20, 25)])
+        assert not ranges_overlap([(10, 19), (1, 5), (20, 25)])
+
+
+class TestOverlappingEdits:
+    """Tests for overlapping edits recorded under different locations."""
+
+    def test_class_and_method_edits_conflict(self, conflict_detector):
+        """Modifying a class and one of its methods conflicts."""
+        conflicts = conflict_detector.detect_conflicts({
+            "task-001": FileAnalysis(
+                file_path="models.py",
+                changes=[
+                    _change(
+                        ChangeType.MODIFY_CLASS, "User", "class:User", 10, 60
+                    )
+                ],
+            ),
+            "task-002": FileAnalysis(
+                file_path="models.py",
+                changes=[
+                    _change(
+                        ChangeType.MODIFY_METHOD,
+                        "User.save",
+                        "method:User.save",
+                        30,
+                        40,
+                    )
+                ],
+            ),
+        })
+
+        assert len(conflicts) == 1
+        conflict = conflicts[0]
+        assert conflict.location == "class:User"
+        assert conflict.tasks_involved == ["task-001", "task-002"]
+        assert not conflict.can_auto_merge
+
+    def test_overlapping_additions_compatible(self, conflict_detector):
+        """Additions landing on the same lines in each task do not conflict."""
+        conflicts = conflict_detector.detect_conflicts({
+            f"task-{i}": FileAnalysis(
+                file_path="utils.py",
+                changes=[
+                    _change(
+                        ChangeType.ADD_FUNCTION, f"f{i}", f"function:f{i}", 50, 60
+                    )
+                ],
+            )
+            for i in range(10)
+        })
+
+        assert conflicts == []
+
+
+class TestImplicitConflicts:
+    """Tests for removal/rename + usage conflicts."""
+
+    def test_removed_function_still_called(self, conflict_detector):
+        """Removing a function another task now calls is a conflict."""
+        conflicts = conflict_detector.detect_conflicts({
+            "task-001": FileAnalysis(
+                file_path="app.py",
+                changes=[
+                    _change(
+                        ChangeType.REMOVE_FUNCTION, "helper", "function:helper", 1, 5
+                    )
+                ],
+            ),
+            "task-002": FileAnalysis(
+                file_path="app.py",
+                changes=[
+                    _change(
+                        ChangeType.ADD_FUNCTION,
+                        "main",
+                        "function:main",
+                        20,
+                        25,
+                        content_after="def main():\n    return helper()\n",
+                    )
+                ],
+            ),
+        })
+
+        assert len(conflicts) == 1
+        assert conflicts[0].location == "function:main"
+        assert conflicts[0].severity == ConflictSeverity.HIGH
+        assert "helper" in conflicts[0].reason
+
+    def test_rename_and_import_removal(self):
+        """Renamed functions and removed imports are matched by bound name."""
+        from merge.conflict_analysis import detect_implicit_conflicts
+
+        usage = _change(
+            ChangeType.MODIFY_FUNCTION,
+            "run",
+            "function:run",
+            30,
+            40,
+            content_after="def run():\n    load(np.zeros(3))\n",
+        )
+        conflicts = detect_implicit_conflicts({
+            "task-001": FileAnalysis(
+                file_path="app.py",
+                changes=[
+                    _change(
+                        ChangeType.RENAME_FUNCTION,
+                        "load_data",
+                        "function:load",
+                        1,
+                        3,
+                        old_name="load",
+                    ),
+                    _change(
+                        ChangeType.REMOVE_IMPORT,
+                        "import numpy as np",
+                        "file_top",
+                        1,
+                        1,
+                    ),
+                ],
+            ),
+            "task-002": FileAnalysis(file_path="app.py", changes=[usage]),
+        })
+
+        reasons = sorted(c.reason for c in conflicts)
+        assert len(reasons) == 2
+        assert "renames 'load'" in reasons[1]
+        assert "removes 'np'" in reasons[0]
+
+    def _method_removal_conflicts(self, content_after):
+        from merge.conflict_analysis import detect_implicit_conflicts
+
+        return detect_implicit_conflicts({
+            "task-001": FileAnalysis(
+                file_path="app.py",
+                changes=[
+                    _change(
+                        ChangeType.REMOVE_METHOD, "Bar.get", "method:Bar.get", 1, 5
+                    )
+                ],
+            ),
+            "task-002": FileAnalysis(
+                file_path="app.py",
+                changes=[
+                    _change(
+                        ChangeType.MODIFY_FUNCTION,
+                        "load",
+                        "function:load",
+                        20,
+                        25,
+                        content_after=content_after,
+                    )
+                ],
+            ),
+        })
+
+    def test_unrelated_attribute_access_not_a_conflict(self):
+        """Removing Bar.get does not conflict with d.get, strings or comments."""
+        conflicts = self._method_removal_conflicts(
+            "def load(d):\n"
+            "    # Bar.get() used to do this\n"
+            "    log('self.get is gone')\n"
+            "    return d.get('k')\n"
+        )
+
+        assert conflicts == []
+
+    def test_removed_method_used_through_receiver(self):
+        """Calls through self or the class still conflict with the removal."""
+        for usage in ("self.get()", "Bar.get(x)", "f'{self.get()}'"):
+            conflicts = self._method_removal_conflicts(
+                f"def load(self, x):\n    return {usage}\n"
+            )
+
+            assert len(conflicts) == 1, usage
+            assert "removes 'Bar.get'" in conflicts[0].reason
+
+    def test_references_built_only_for_removals(self):
+        """Files where no task removes a name never tokenize new code."""
+        from merge.conflict_analysis import ChangeIndex, detect_implicit_conflicts
+
+        def analyses(first_type):
+            return {
+                "task-001": FileAnalysis(
+                    file_path="app.py",
+                    changes=[_change(first_type, "helper", "function:helper", 1, 5)],
+                ),
+                "task-002": FileAnalysis(
+                    file_path="app.py",
+                    changes=[
+                        _change(
+                            ChangeType.ADD_FUNCTION,
+                            "main",
+                            "function:main",
+                            20,
+                            25,
+                            content_after="def main():\n    return helper()\n",
+                        )
+                    ],
+                ),
+            }
+
+        index = ChangeIndex(analyses(ChangeType.MODIFY_FUNCTION))
+        assert detect_implicit_conflicts(index.task_analyses, index) == []
+        assert "references" not in vars(index)
+
+        index = ChangeIndex(analyses(ChangeType.REMOVE_FUNCTION))
+        assert len(detect_implicit_conflicts(index.task_analyses, index)) == 1
+        assert "helper" in index.references
+
+    def test_imported_names(self):
+        """Bound names are extracted from Python and JS import statements."""
+        from merge.conflict_analysis import imported_names
+
+        assert imported_names("from os import path, sep as s") == ["path", "s"]
+        assert imported_names("import os.path, json as j") == ["os", "j"]
+        assert imported_names(
+            "import React, { useState as useS } from 'react';"
+        ) == ["useS", "React"]
+        assert imported_names("import * as api from './api'") == ["api"]
+        assert imported_names("import './styles.css'") == []
@@ -13,8 +13,11 @@ Covers:
 - Detecting conflicting files
 - Task cleanup
 - Evolution summaries
+- Sharded, journaled persistence with lazy loading
+- Deduplicated baseline blobs and their garbage collection
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -242,3 +245,177 @@ class TestEvolutionSummary:
         summary = file_tracker.get_evolution_summary()
 
         assert summary["total_tasks"] >= 2
+
+
+class TestEvolutionPersistence:
+    """Tests for the sharded evolution store."""
+
+    @staticmethod
+    def _track(tracker, project, names):
+        for name in names:
+            (project / name).write_text(f"# {name}\n")
+        tracker.capture_baselines("task-001", [project / n for n in names])
+
+    def test_reload_is_lazy(self, temp_git_repo):
+        """Reopening reads the index only; entries load on first access."""
+        from merge import FileEvolutionTracker
+
+        tracker = FileEvolutionTracker(temp_git_repo)
+        self._track(tracker, temp_git_repo, ["a.py", "b.py", "c.py"])
+        tracker.record_modification("task-001", "a.py", "# a.py\n", "x = 1\n")
+
+        reopened = FileEvolutionTracker(temp_git_repo)
+        assert len(reopened._evolutions) == 3
+        assert reopened._evolutions.loaded_count == 0
+
+        evolution = reopened.get_file_evolution("a.py")
+        assert evolution.task_snapshots[0].content_hash_after
+        assert reopened._evolutions.loaded_count == 1
+
+    def test_save_journals_only_changed_files(self, temp_git_repo):
+        """A modification appends one journal entry, not the whole store."""
+        from merge import FileEvolutionTracker
+
+        tracker = FileEvolutionTracker(temp_git_repo)
+        names = [f"m{i}.py" for i in range(5)]
+        self._track(tracker, temp_git_repo, names)
+        journal = tracker.storage.journal_file
+        before = journal.read_text().splitlines()
+
+        tracker.record_modification("task-001", "m3.py", "# m3.py\n", "y = 2\n")
+
+        added = journal.read_text().splitlines()[len(before) :]
+        assert [json.loads(line)["file"] for line in added] == ["m3.py"]
+
+    def test_compaction(self, temp_git_repo):
+        """Compaction writes records, rewrites the index and clears the journal."""
+        from merge import FileEvolutionTracker
+
+        tracker = FileEvolutionTracker(temp_git_repo)
+        self._track(tracker, temp_git_repo, ["a.py", "b.py"])
+        tracker.storage.compact(tracker._evolutions)
+
+        storage = tracker.storage
+        assert not storage.journal_file.exists()
+        index = json.loads(storage.index_file.read_text())
+        assert sorted(index["files"]) == ["a.py", "b.py"]
+        assert storage.read_record("b.py")["file_path"] == "b.py"
+
+        tracker.cleanup_task("task-001")
+        storage.compact(tracker._evolutions)
+        assert not storage.record_path("a.py").exists()
+        assert len(FileEvolutionTracker(temp_git_repo)._evolutions) == 0
+
+    def test_cleanup_survives_reload(self, temp_git_repo):
+        """Deletions are journaled like updates."""
+        from merge import FileEvolutionTracker
+
+        tracker = FileEvolutionTracker(temp_git_repo)
+        self._track(tracker, temp_git_repo, ["a.py"])
+        tracker.cleanup_task("task-001")
+
+        assert FileEvolutionTracker(temp_git_repo).get_file_evolution("a.py") is None
+
+    def test_corrupt_record_recaptured(self, temp_git_repo):
+        """An unreadable record is replaced by the next baseline capture."""
+        from merge import FileEvolutionTracker
+
+        tracker = FileEvolutionTracker(temp_git_repo)
+        self._track(tracker, temp_git_repo, ["a.py", "b.py"])
+        tracker.storage.compact(tracker._evolutions)
+        tracker.storage.record_path("a.py").write_text("{not json")
+        tracker.storage.record_path("b.py").unlink()
+
+        reopened = FileEvolutionTracker(temp_git_repo)
+        files = [temp_git_repo / "a.py", temp_git_repo / "b.py"]
+        captured = reopened.capture_baselines("task-002", files)
+
+        assert sorted(captured) == ["a.py", "b.py"]
+        evolution = reopened.get_file_evolution("a.py")
+        assert [s.task_id for s in evolution.task_snapshots] == ["task-002"]
+
+    def test_torn_journal_line_ignored(self, temp_git_repo):
+        """A partial last journal line (crash mid-append) is skipped."""
+        from merge import FileEvolutionTracker
+
+        tracker = FileEvolutionTracker(temp_git_repo)
+        self._track(tracker, temp_git_repo, ["a.py"])
+        with open(tracker.storage.journal_file, "a") as f:
+            f.write('{"op": "put", "file": "b.py", "evol')
+
+        reopened = FileEvolutionTracker(temp_git_repo)
+        assert list(reopened._evolutions) == ["a.py"]
+
+    def test_migrates_legacy_file(self, temp_git_repo):
+        """A single-file file_evolution.json is converted on load."""
+        from merge import FileEvolutionTracker
+
+        tracker = FileEvolutionTracker(temp_git_repo)
+        self._track(tracker, temp_git_repo, ["a.py"])
+        legacy = {"a.py": tracker.get_file_evolution("a.py").to_dict()}
+
+        storage_dir = temp_git_repo / "legacy-store"
+        storage_dir.mkdir()
+        (storage_dir / "file_evolution.json").write_text(json.dumps(legacy))
+
+        migrated = FileEvolutionTracker(temp_git_repo, storage_dir=storage_dir)
+        assert migrated.get_file_evolution("a.py").to_dict() == legacy["a.py"]
+        assert not (storage_dir / "file_evolution.json").exists()
+        assert migrated.storage.index_file.exists()
+
+
+class TestBaselineBlobStore:
+    """Tests for content-addressed baseline storage."""
+
+    @staticmethod
+    def _blobs(tracker):
+        return [p for p in (tracker.storage_dir / "blobs").glob("??/*.z")]
+
+    def test_identical_baselines_stored_once(self, file_tracker, temp_project):
+        """Tasks branching from the same content share one compressed blob."""
+        files = [temp_project / "src" / "utils.py"]
+        for i in range(5):
+            file_tracker.capture_baselines(f"task-{i}", files)
+
+        blobs = self._blobs(file_tracker)
+        assert len(blobs) == 1
+        content = (temp_project / "src" / "utils.py").read_text()
+        assert blobs[0].read_bytes() != content.encode()
+        assert file_tracker.get_baseline_content("src/utils.py") == content
+
+        refcounts = file_tracker.storage.blob_store.refcounts()
+        assert list(refcounts.values()) == [5]
+
+    def test_cleanup_collects_unreferenced_blobs(self, file_tracker, temp_project):
+        """A blob survives until its last referencing task is cleaned up."""
+        files = [temp_project / "src" / "utils.py"]
+        file_tracker.capture_baselines("task-001", files)
+        file_tracker.capture_baselines("task-002", files)
+
+        file_tracker.cleanup_task("task-001")
+        assert len(self._blobs(file_tracker)) == 1
+        assert file_tracker.get_baseline_content("src/utils.py") is not None
+
+        file_tracker.cleanup_task("task-002")
+        assert self._blobs(file_tracker) == []
+
+    def test_uncompressed_and_legacy_baselines(self, temp_project):
+        """Plain blobs and per-task baseline files from older versions read back."""
+        from merge.file_evolution import EvolutionStorage
+
+        storage = EvolutionStorage(
+            temp_project, temp_project / ".auto-claude", compress_baselines=False
+        )
+        ref = storage.store_baseline_content("a.py", "x = 1\n", "task-001")
+        assert ref.startswith("blob:")
+        assert list((storage.storage_dir / "blobs").glob("??/*.blob"))
+        assert storage.read_baseline_content(ref) == "x = 1\n"
+
+        legacy = storage.baselines_dir / "task-000" / "a.py.baseline"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text("old\n")
+        rel = str(legacy.relative_to(storage.storage_dir))
+        assert storage.read_baseline_content(rel) == "old\n"
+
+        storage.release_baselines("task-000")
+        assert not legacy.parent.exists()
@@ -248,3 +248,119 @@ class TestErrorHandling:
 
         assert report is not None
         assert len(report.tasks_merged) == 0
+
+
+class TestParallelMerge:
+    """Tests for concurrent per-file merging."""
+
+    @staticmethod
+    def _setup_files(orchestrator, project, count, task_1_content, task_2_content):
+        files = []
+        for i in range(count):
+            path = project / "src" / f"mod_{i:02d}.py"
+            path.write_text(SAMPLE_PYTHON_MODULE)
+            files.append(path)
+        tracker = orchestrator.evolution_tracker
+        tracker.capture_baselines("task-001", files, intent="Add logging")
+        tracker.capture_baselines("task-002", files, intent="Change module")
+        for path in files:
+            rel = str(path.relative_to(project))
+            tracker.record_modification(
+                "task-001", rel, SAMPLE_PYTHON_MODULE, task_1_content
+            )
+            tracker.record_modification(
+                "task-002", rel, SAMPLE_PYTHON_MODULE, task_2_content
+            )
+        return [
+            TaskMergeRequest(task_id="task-001", worktree_path=project),
+            TaskMergeRequest(task_id="task-002", worktree_path=project),
+        ]
+
+    def test_parallel_matches_sequential(self, temp_project):
+        """Worker processes produce the same results, in the same order."""
+        reports = []
+        for workers in (1, 2):
+            orchestrator = MergeOrchestrator(
+                temp_project, dry_run=True, enable_ai=False, max_workers=workers
+            )
+            requests = self._setup_files(
+                orchestrator,
+                temp_project,
+                10,
+                SAMPLE_PYTHON_WITH_NEW_IMPORT,
+                SAMPLE_PYTHON_WITH_NEW_FUNCTION,
+            )
+            reports.append(orchestrator.merge_tasks(requests))
+
+        sequential, parallel = reports
+        assert list(parallel.file_results) == list(sequential.file_results)
+        assert len(parallel.file_results) == 10
+        for path, result in sequential.file_results.items():
+            assert parallel.file_results[path].to_dict() == result.to_dict()
+        assert set(parallel.stats.stage_durations) == {
+            "refresh",
+            "baseline",
+            "merge",
+            "ai",
+        }
+        assert "stage_durations" in parallel.stats.to_dict()
+
+    def test_ai_calls_bounded(self, temp_project):
+        """AI resolution runs concurrently, at most MAX_PARALLEL_AI_CALLS at once."""
+        import threading
+        import time
+
+        from merge import AIResolver
+        from merge.orchestrator import MAX_PARALLEL_AI_CALLS
+        from merge.types import ChangeType, SemanticChange
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow_ai_call(system: str, user: str) -> str:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return "```python\ndef hello():\n    print('merged')\n```"
+
+        orchestrator = MergeOrchestrator(
+            temp_project,
+            dry_run=True,
+            ai_resolver=AIResolver(ai_call_fn=slow_ai_call),
+        )
+        requests = self._setup_files(
+            orchestrator,
+            temp_project,
+            12,
+            SAMPLE_PYTHON_WITH_NEW_IMPORT,
+            SAMPLE_PYTHON_WITH_NEW_FUNCTION,
+        )
+        # Overlapping edits to hello(): a conflict only AI can resolve
+        for i in range(12):
+            evolution = orchestrator.evolution_tracker.get_file_evolution(
+                f"src/mod_{i:02d}.py"
+            )
+            for task_id, change_type in (
+                ("task-001", ChangeType.ADD_IMPORT),
+                ("task-002", ChangeType.MODIFY_FUNCTION),
+            ):
+                evolution.get_task_snapshot(task_id).semantic_changes = [
+                    SemanticChange(
+                        change_type=change_type,
+                        target="hello",
+                        location="function:hello",
+                        line_start=5,
+                        line_end=7,
+                    )
+                ]
+
+        report = orchestrator.merge_tasks(requests)
+
+        assert report.stats.ai_calls_made == 12
+        assert list(report.file_results) == [f"src/mod_{i:02d}.py" for i in range(12)]
+        assert 1 < peak <= MAX_PARALLEL_AI_CALLS
@@ -233,3 +233,269 @@ class TestEdgeCases:
         # Should complete without issues
         assert analysis is not None
         assert len(analysis.changes) > 0
+
+
+class TestElementCache:
+    """Tests for the content-hash cache of extracted elements."""
+
+    @staticmethod
+    def _elements():
+        from merge.semantic_analysis import ExtractedElement
+
+        return {
+            "function:hello": ExtractedElement(
+                element_type="function",
+                name="hello",
+                start_line=5,
+                end_line=7,
+                content='def hello():\n    print("Hello")',
+            )
+        }
+
+    def test_memory_lru(self):
+        """Entries are keyed by content and language, evicting the oldest."""
+        from merge.semantic_analysis import ElementCache
+
+        cache = ElementCache(max_entries=2)
+        cache.put("a = 1\n", ".py", self._elements())
+
+        assert cache.get("a = 1\n", ".py") is not None
+        assert cache.get("a = 1\n", ".js") is None
+        cache.put("b = 1\n", ".py", {})
+        cache.put("c = 1\n", ".py", {})
+        assert cache.get("a = 1\n", ".py") is None
+        assert cache.stats["entries"] == 2
+
+    def test_disk_round_trip(self, tmp_path):
+        """Persisted entries are reused by a fresh cache."""
+        from merge.semantic_analysis import ElementCache
+
+        cache = ElementCache(cache_dir=tmp_path)
+        cache.put(SAMPLE_PYTHON_MODULE, ".py", self._elements())
+
+        fresh = ElementCache(cache_dir=tmp_path)
+        assert fresh.get(SAMPLE_PYTHON_MODULE, ".py") == self._elements()
+        assert fresh.stats["disk_hits"] == 1
+
+    def test_disk_entries_bounded(self, tmp_path):
+        """Past max_disk_entries, the least recently used files are pruned."""
+        import os
+
+        from merge.semantic_analysis import ElementCache
+
+        cache = ElementCache(cache_dir=tmp_path, max_disk_entries=4)
+        for i, name in enumerate("abcd"):
+            cache.put(f"{name} = 1\n", ".py", {})
+            path = cache._path(cache.key_for(f"{name} = 1\n", ".py"))
+            os.utime(path, (1000 * (i + 1), 1000 * (i + 1)))
+
+        # A disk hit refreshes "a", leaving "b" the least recently used
+        assert ElementCache(cache_dir=tmp_path).get("a = 1\n", ".py") == {}
+        cache.put("e = 1\n", ".py", {})
+
+        assert len(list(tmp_path.glob("*.json"))) == 3
+        fresh = ElementCache(cache_dir=tmp_path)
+        assert fresh.get("a = 1\n", ".py") == {}
+        assert fresh.get("d = 1\n", ".py") == {}
+        assert fresh.get("b = 1\n", ".py") is None
+        assert fresh.get("c = 1\n", ".py") is None
+
+    def test_baseline_parsed_once(self):
+        """N tasks changing one file parse the shared baseline once."""
+        from merge import SemanticAnalyzer
+        from merge.semantic_analysis import ElementCache
+
+        analyzer = SemanticAnalyzer(element_cache=ElementCache(), incremental=False)
+        parsed = []
+
+        class CountingParser:
+            def parse(self, source: bytes):
+                parsed.append(source)
+                return source
+
+        analyzer._parsers = {".py": CountingParser()}
+        analyzer._extract_chunks = lambda tree, source_bytes, ext: {}
+
+        for variant in (
+            SAMPLE_PYTHON_WITH_NEW_IMPORT,
+            SAMPLE_PYTHON_WITH_NEW_FUNCTION,
+            SAMPLE_PYTHON_WITH_NEW_IMPORT,
+        ):
+            analyzer.analyze_diff("src/utils.py", SAMPLE_PYTHON_MODULE, variant)
+
+        assert parsed.count(SAMPLE_PYTHON_MODULE.encode()) == 1
+        assert len(parsed) == 3
+
+
+class TestLineIndex:
+    """Tests for byte offset to line number mapping."""
+
+    @staticmethod
+    def _reference_line(source_bytes: bytes, byte_pos: int) -> int:
+        return source_bytes[:byte_pos].count(b"\n") + 1
+
+    def test_matches_prefix_count_for_utf8(self):
+        """Byte offsets map to lines correctly when the source has non-ASCII text."""
+        from merge.semantic_analysis import LineIndex
+
+        source = (
+            "# 说明：问候\n"
+            "def hello():\n"
+            '    print("héllo ✓")\n'
+            "\n"
+            "def bye():\n"
+            "    pass\n"
+        )
+        source_bytes = source.encode("utf-8")
+        index = LineIndex(source_bytes)
+
+        for pos in range(len(source_bytes) + 1):
+            assert index.line_of(pos) == self._reference_line(source_bytes, pos)
+        assert index.line_of(source_bytes.index(b"def bye")) == 5
+        assert LineIndex.from_text(source).line_count == 7
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("line_count", [5_000, 50_000])
+    def test_benchmark_lookup_vs_prefix_count(self, line_count):
+        """Table lookups stay fast where prefix counting grows quadratically."""
+        import time
+
+        from merge.semantic_analysis import LineIndex
+
+        source_bytes = "".join(
+            f"def função_{i}():\n    return {i}  # ✓\n"
+            for i in range(line_count // 2)
+        ).encode("utf-8")
+        # One lookup per extracted node (every function start)
+        offsets = list(range(0, len(source_bytes), len(source_bytes) // 2000))
+
+        start = time.perf_counter()
+        index = LineIndex(source_bytes)
+        fast = [index.line_of(pos) for pos in offsets]
+        fast_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        slow = [self._reference_line(source_bytes, pos) for pos in offsets]
+        slow_time = time.perf_counter() - start
+
+        assert fast == slow
+        assert fast_time < slow_time
+
+
+class _FakeNode:
+    def __init__(self, start_byte: int, end_byte: int):
+        self.start_byte = start_byte
+        self.end_byte = end_byte
+
+
+class _FakeRange(_FakeNode):
+    pass
+
+
+class _FakeTree:
+    """Tree whose top-level nodes are blank-line separated blocks."""
+
+    def __init__(self, source: bytes):
+        self.edits = []
+        children = []
+        start = 0
+        for block in source.split(b"\n\n"):
+            children.append(_FakeNode(start, start + len(block)))
+            start += len(block) + 2
+        self.root_node = type("Root", (), {"children": children})()
+
+    def edit(self, **edit):
+        self.edits.append(edit)
+
+    def changed_ranges(self, new_tree):
+        return []
+
+
+class TestIncrementalReparse:
+    """Tests for incremental reparsing from a previous version's tree."""
+
+    V0 = (
+        "def a():\n    return 1\n\n"
+        "def b():\n    return 2\n\n"
+        "def c():\n    return 3\n"
+    )
+    V1 = V0.replace("return 2", "x = 2\n    return x")
+
+    @pytest.fixture
+    def fake_tree_sitter(self, monkeypatch):
+        import merge.semantic_analyzer as sa
+
+        calls = {"parse": [], "extracted": []}
+
+        class FakeParser:
+            def parse(self, source: bytes, old_tree=None):
+                calls["parse"].append(old_tree is not None)
+                return _FakeTree(source)
+
+        def extract(node, elements, get_text, get_line, parent=None):
+            from merge.semantic_analysis import ExtractedElement
+
+            for child in node.children:
+                text = get_text(child)
+                name = text.split("(")[0].replace("def ", "")
+                calls["extracted"].append(name)
+                elements[f"function:{name}"] = ExtractedElement(
+                    element_type="function",
+                    name=name,
+                    start_line=get_line(child.start_byte),
+                    end_line=get_line(child.end_byte),
+                    content=text,
+                )
+
+        monkeypatch.setattr(sa, "extract_python_elements", extract, raising=False)
+        return FakeParser, calls
+
+    def _analyzer(self, parser_cls, incremental: bool):
+        from merge import SemanticAnalyzer
+        from merge.semantic_analysis import ElementCache
+
+        analyzer = SemanticAnalyzer(
+            element_cache=ElementCache(), incremental=incremental
+        )
+        analyzer._parsers = {".py": parser_cls()}
+        return analyzer
+
+    def test_only_changed_nodes_reextracted(self, fake_tree_sitter):
+        """The next version reuses the previous tree and untouched elements."""
+        parser_cls, calls = fake_tree_sitter
+        analyzer = self._analyzer(parser_cls, incremental=True)
+
+        before = analyzer._get_elements(self.V0, ".py")
+        calls["extracted"].clear()
+        after = analyzer._get_elements(self.V1, ".py", base=self.V0)
+
+        assert calls["parse"] == [False, True]
+        assert calls["extracted"] == ["b"]
+        assert after["function:a"] is before["function:a"]
+        # Below the edit: same content, lines shifted by the inserted line
+        assert after["function:c"].content == before["function:c"].content
+        assert after["function:c"].start_line == before["function:c"].start_line + 1
+
+    def test_matches_full_parse(self, fake_tree_sitter):
+        """Incremental extraction gives the same elements as a full parse."""
+        parser_cls, _ = fake_tree_sitter
+        incremental = self._analyzer(parser_cls, incremental=True)
+        full = self._analyzer(parser_cls, incremental=False)
+
+        incremental._get_elements(self.V0, ".py")
+        assert incremental._get_elements(
+            self.V1, ".py", base=self.V0
+        ) == full._get_elements(self.V1, ".py")
+
+    def test_compute_edit(self):
+        """The edit spans exactly the differing bytes, with row/column points."""
+        from merge.semantic_analysis.incremental import compute_edit
+
+        old, new = self.V0.encode(), self.V1.encode()
+        edit = compute_edit(old, new)
+
+        assert old[: edit.start_byte] == new[: edit.start_byte]
+        assert old[edit.old_end_byte :] == new[edit.new_end_byte :]
+        assert edit.start_point == (4, 4)
+        assert edit.row_delta == 1
+        assert compute_edit(b"same", b"same") is None
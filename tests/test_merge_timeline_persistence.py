@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for Timeline Persistence
+==============================
+
+Tests lazy timeline loading behind the compact timeline index:
+- Reopening a tracker reads the index only
+- Task lookups are answered from index metadata
+- Post-commit handling loads only the timelines of committed files
+- Indexes written by older versions (bare list of paths) still load
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge.timeline_persistence import TimelinePersistence
+from merge.timeline_tracker import FileTimelineTracker
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> str:
+    for rel, content in files.items():
+        (repo / rel).write_text(content)
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, check=True, capture_output=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _setup(repo: Path) -> list[str]:
+    files = [f"mod_{i}.py" for i in range(6)]
+    _commit(repo, {name: f"v = {i}\n" for i, name in enumerate(files)}, "Base")
+    tracker = FileTimelineTracker(repo)
+    tracker.on_task_start("task-a", files[:4], task_title="A")
+    tracker.on_task_start("task-b", files[3:], task_title="B")
+    return files
+
+
+class TestLazyTimelines:
+    """Tests for on-demand timeline loading."""
+
+    def test_reopen_reads_index_only(self, temp_git_repo: Path):
+        """A new tracker knows every file without parsing any timeline."""
+        files = _setup(temp_git_repo)
+
+        tracker = FileTimelineTracker(temp_git_repo)
+        assert sorted(tracker._timelines) == files
+        assert tracker._timelines.loaded_count == 0
+
+        assert tracker.get_files_for_task("task-b") == files[3:]
+        assert tracker.has_timeline("mod_0.py")
+        assert tracker._timelines.loaded_count == 0
+
+        timeline = tracker.get_timeline("mod_3.py")
+        assert set(timeline.task_views) == {"task-a", "task-b"}
+        assert tracker._timelines.loaded_count == 1
+
+    def test_main_commit_loads_committed_files(self, temp_git_repo: Path):
+        """Post-commit handling touches only the files in the commit."""
+        _setup(temp_git_repo)
+        commit = _commit(temp_git_repo, {"mod_1.py": "v = 100\n"}, "Human edit")
+
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_main_branch_commit(commit)
+        assert tracker._timelines.loaded_count == 1
+
+        reopened = FileTimelineTracker(temp_git_repo)
+        entry = reopened._timelines.index_entry("mod_1.py")
+        assert entry["last_commit"] == commit
+        assert entry["tasks"] == ["task-a"]
+        history = reopened.get_timeline("mod_1.py").main_branch_history
+        assert history[-1].content == "v = 100\n"
+
+    def test_index_is_compact(self, temp_git_repo: Path):
+        """The index carries per-file metadata matching the timeline files."""
+        _setup(temp_git_repo)
+        persistence = TimelinePersistence(temp_git_repo / ".auto-claude")
+
+        index = json.loads(persistence.index_path.read_text())
+        assert index["version"] == 2
+        entry = index["files"]["mod_3.py"]
+        assert entry["tasks"] == ["task-a", "task-b"]
+        assert entry["size"] == persistence.timeline_size("mod_3.py")
+
+    def test_old_index_format(self, temp_git_repo: Path):
+        """A bare list of paths is still read, and upgraded on the next save."""
+        files = _setup(temp_git_repo)
+        persistence = TimelinePersistence(temp_git_repo / ".auto-claude")
+        persistence.index_path.write_text(json.dumps({"files": files}))
+
+        tracker = FileTimelineTracker(temp_git_repo)
+        assert tracker.get_files_for_task("task-a") == files[:4]
+
+        tracker.on_task_abandoned("task-a")
+        index = json.loads(persistence.index_path.read_text())
+        assert index["files"]["mod_5.py"]["tasks"] == ["task-b"]
+        assert len(persistence.load_all_timelines()) == len(files)
+
+    def test_missing_timeline_file_skipped(self, temp_git_repo: Path):
+        """Indexed files whose timeline is gone are skipped, not fatal."""
+        _setup(temp_git_repo)
+        persistence = TimelinePersistence(temp_git_repo / ".auto-claude")
+        persistence._get_timeline_file_path("mod_1.py").unlink()
+        persistence._get_timeline_file_path("mod_2.py").write_text("{not json")
+        commit = _commit(
+            temp_git_repo, {"mod_1.py": "v = 1\n", "mod_2.py": "v = 2\n"}, "Edit"
+        )
+
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_main_branch_commit(commit)
+        drift = tracker.get_task_drift("task-a")
+
+        assert set(drift) == {"mod_0.py", "mod_3.py"}
+        assert "mod_1.py" not in tracker._timelines
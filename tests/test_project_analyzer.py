@@ -452,6 +452,17 @@ another-command
         assert "my-custom-tool" in analyzer.profile.custom_commands
         assert "another-command" in analyzer.profile.custom_commands
 
+    def test_allowlist_edit_reanalyzes(self, temp_dir: Path):
+        """Editing the allowlist invalidates the stored profile."""
+        (temp_dir / "requirements.txt").write_text("flask\n")
+        (temp_dir / ".auto-claude-allowlist").write_text("my-custom-tool\n")
+        get_or_create_profile(temp_dir)
+
+        (temp_dir / ".auto-claude-allowlist").write_text("my-custom-tool\nmy-other\n")
+        profile = get_or_create_profile(temp_dir)
+
+        assert "my-other" in profile.custom_commands
+
 
 class TestSecurityProfileGeneration:
     """Tests for complete security profile generation."""
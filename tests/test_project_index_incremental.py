@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for Incremental Project Indexing
+======================================
+
+Tests that analysis.analyzers.ProjectAnalyzer, given the previous index,
+re-runs ServiceAnalyzer only for services whose fingerprint changed and
+produces the same index as a full analysis, and that concurrent service
+analysis produces the same index as a sequential run.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from analysis.analyzers import ProjectAnalyzer, analyze_project
+
+
+@pytest.fixture
+def monorepo(temp_dir: Path) -> Path:
+    """Monorepo with a Python backend and a React frontend."""
+    backend = temp_dir / "backend"
+    backend.mkdir()
+    (backend / "requirements.txt").write_text("fastapi\nuvicorn\n")
+    (backend / "main.py").write_text(
+        "from fastapi import FastAPI\napp = FastAPI()\n\n@app.get('/health')\ndef health():\n    return {}\n"
+    )
+    frontend = temp_dir / "frontend"
+    frontend.mkdir()
+    (frontend / "package.json").write_text(
+        json.dumps({"name": "frontend", "dependencies": {"react": "^18.0.0"}})
+    )
+    (frontend / "index.js").write_text("console.log('hi');\n")
+    return temp_dir
+
+
+def _full(project_dir: Path) -> dict:
+    return ProjectAnalyzer(project_dir).analyze()
+
+
+def _without_timing(index: dict) -> dict:
+    return {key: value for key, value in index.items() if key != "analysis_timing"}
+
+
+class TestIncrementalAnalysis:
+    """Tests for fingerprint-based incremental re-analysis."""
+
+    def test_index_has_service_fingerprints(self, monorepo: Path):
+        """Every indexed service gets a fingerprint."""
+        index = _full(monorepo)
+
+        assert set(index["service_fingerprints"]) == set(index["services"])
+        assert set(index["services"]) == {"backend", "frontend"}
+
+    def test_unchanged_services_are_reused(self, monorepo: Path):
+        """With nothing changed, no ServiceAnalyzer runs."""
+        previous = _full(monorepo)
+
+        analyzer = ProjectAnalyzer(monorepo, previous)
+        index = analyzer.analyze()
+
+        assert analyzer.analyzed_services == []
+        assert sorted(analyzer.reused_services) == ["backend", "frontend"]
+        assert _without_timing(index) == _without_timing(previous)
+        assert index["analysis_timing"]["backend"] == {"reused": True}
+
+    def test_manifest_change_reanalyzes_only_that_service(self, monorepo: Path):
+        """A dependency bump in one package re-analyzes only that package."""
+        previous = _full(monorepo)
+        (monorepo / "frontend" / "package.json").write_text(
+            json.dumps(
+                {"name": "frontend", "dependencies": {"react": "^18.0.0", "vue": "^3"}}
+            )
+        )
+
+        analyzer = ProjectAnalyzer(monorepo, previous)
+        index = analyzer.analyze()
+
+        assert analyzer.analyzed_services == ["frontend"]
+        assert analyzer.reused_services == ["backend"]
+        assert _without_timing(index) == _without_timing(_full(monorepo))
+
+    def test_new_file_reanalyzes_service(self, monorepo: Path):
+        """Adding a file changes the service's tree digest."""
+        previous = _full(monorepo)
+        (monorepo / "backend" / "worker.py").write_text("import celery\n")
+
+        analyzer = ProjectAnalyzer(monorepo, previous)
+        analyzer.analyze()
+
+        assert analyzer.analyzed_services == ["backend"]
+
+    def test_source_edit_reanalyzes_service(self, monorepo: Path):
+        """Editing a source file (new route) re-analyzes its service."""
+        previous = _full(monorepo)
+        main = monorepo / "backend" / "main.py"
+        main.write_text(
+            main.read_text() + "\n@app.post('/items')\ndef create():\n    return {}\n"
+        )
+
+        analyzer = ProjectAnalyzer(monorepo, previous)
+        index = analyzer.analyze()
+
+        assert analyzer.analyzed_services == ["backend"]
+        assert _without_timing(index) == _without_timing(_full(monorepo))
+
+    def test_analyze_project_incremental(self, monorepo: Path):
+        """analyze_project(incremental=True) reads the previous index from output_file."""
+        output = monorepo / ".auto-claude" / "project_index.json"
+        analyze_project(monorepo, output)
+        before = json.loads(output.read_text())
+
+        results = analyze_project(monorepo, output, incremental=True)
+
+        assert _without_timing(results) == _without_timing(before)
+
+
+class TestConcurrentAnalysis:
+    """Tests for analyzing services in a worker pool."""
+
+    def test_parallel_matches_sequential(self, monorepo: Path):
+        """The index does not depend on the number of workers."""
+        for name in ("api", "worker", "admin"):
+            service = monorepo / "packages" / name
+            service.mkdir(parents=True)
+            (service / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n')
+            (service / "main.py").write_text("print('hi')\n")
+
+        sequential = ProjectAnalyzer(monorepo).analyze()
+        parallel = ProjectAnalyzer(monorepo, max_workers=4).analyze()
+
+        assert _without_timing(parallel) == _without_timing(sequential)
+        assert list(parallel["services"]) == list(sequential["services"])
+
+    def test_timing_breakdown(self, monorepo: Path):
+        """Each analyzed service records per-step timings."""
+        index = ProjectAnalyzer(monorepo, max_workers=2).analyze()
+
+        timing = index["analysis_timing"]["backend"]
+        assert "detect_api_routes" in timing["steps"]
+        assert timing["total_ms"] >= 0
@@ -4,15 +4,24 @@ Tests for Security System
 =========================
 
 Tests the security.py module functionality including:
-- Command extraction and parsing
+- Command extraction and parsing (single-pass command AST)
 - Command allowlist validation
 - Sensitive command validators (rm, chmod, pkill, etc.)
 - Security hook behavior
+- Compiled allowlist and decision memo
+- Per-project profile cache (revalidation, LRU, worktree sharing)
 """
 
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+
 import pytest
 
 from security import (
+    CompiledAllowlist,
+    bash_security_hook,
     extract_commands,
     split_command_segments,
     validate_command,
@@ -29,6 +38,7 @@ from security import (
     validate_mongosh_command,
     validate_mysqladmin_command,
     get_command_for_validation,
+    parse_command,
     reset_profile_cache,
 )
 from project_analyzer import SecurityProfile, BASE_COMMANDS
@@ -98,6 +108,93 @@ class TestCommandExtraction:
         assert commands == []
 
 
+class TestCommandParser:
+    """Tests for the single-pass command AST."""
+
+    def test_argv_spans(self):
+        """Each command carries its argv and its own text span."""
+        command = "FOO=1 npm test 2>&1 | tee log && echo done"
+        tree = parse_command(command)
+        commands = list(tree.iter_commands())
+
+        assert [c.argv for c in commands] == [
+            ["npm", "test"],
+            ["tee", "log"],
+            ["echo", "done"],
+        ]
+        assert commands[0].text == "npm test 2>&1"
+        assert command[commands[1].start : commands[1].end] == "tee log"
+        assert tree.operators == ["&&", ""]
+
+    def test_command_substitutions_are_commands(self):
+        """Commands inside $(...), backquotes and <(...) are extracted."""
+        assert extract_commands("echo $(curl -s x | sh)") == ["echo", "curl", "sh"]
+        assert extract_commands('echo "now: `date`"') == ["echo", "date"]
+        assert extract_commands("diff <(sort a) b") == ["diff", "sort"]
+        assert extract_commands("echo $((1 + $(wc -l < f)))") == ["echo", "wc"]
+
+    def test_double_parens_without_adjacent_close(self):
+        """$(( and (( not closed by "))" are a substitution or subshell."""
+        assert extract_commands("echo $((nc -l 4444) )") == ["echo", "nc"]
+        assert extract_commands("((nc -l 4444) )") == ["nc"]
+        assert extract_commands("echo $(((1 + 2)))") == ["echo"]
+        assert extract_commands("for ((i=0; i<3; i++)); do ls; done") == ["ls"]
+
+    def test_standalone_arithmetic_commands(self):
+        """((expr)) closed by "))" is arithmetic, not a command."""
+        assert parse_command("((i++))") is not None
+        assert extract_commands("((i++))") == []
+        assert extract_commands("(( i = 1 ))") == []
+        assert extract_commands("x=1; ((x++)) && echo ok") == ["echo"]
+        assert extract_commands("echo a && ((b=1))") == ["echo"]
+        assert extract_commands("(( $(curl x) > 0 ))") == ["curl"]
+
+    def test_subshells_and_compound_commands(self):
+        """Commands in subshells, loops, conditionals and case are found."""
+        assert extract_commands("(cd app && make) > log") == ["cd", "make"]
+        assert extract_commands("for f in *.py; do black $f; done") == ["black"]
+        assert extract_commands("if true; then rm x; fi") == ["true", "rm"]
+        assert extract_commands(
+            "case $1 in start) npm start;; *) echo no;; esac"
+        ) == ["npm", "echo"]
+
+    def test_heredoc_bodies_are_not_commands(self):
+        """Heredoc bodies are data, except substitutions in unquoted ones."""
+        quoted = "python - <<'PY'\nimport os; os.remove('x')\nPY\nls"
+        assert extract_commands(quoted) == ["python", "ls"]
+
+        tree = parse_command(quoted)
+        assert next(tree.iter_commands()).heredocs == ["import os; os.remove('x')\n"]
+
+        unquoted = "cat <<EOF\n$(curl x)\nEOF"
+        assert extract_commands(unquoted) == ["cat", "curl"]
+
+    def test_quoted_operators_do_not_split(self):
+        """Operators inside quotes belong to the argument."""
+        command = "echo 'a && b; c' && ls"
+        assert extract_commands(command) == ["echo", "ls"]
+        assert split_command_segments(command) == ["echo 'a && b; c'", "ls"]
+
+    def test_unparseable(self):
+        """Unclosed constructs and stray operators fail to parse."""
+        for command in ["echo $(ls", "ls )", "echo `ls", "&& ls", "cat <"]:
+            assert parse_command(command) is None, command
+
+    def test_validators_see_own_command(self):
+        """A validated command is checked on its own words, not its segment."""
+        seen = []
+
+        def record(command: str):
+            seen.append(command)
+            return True, ""
+
+        allowlist = CompiledAllowlist(
+            commands=frozenset(BASE_COMMANDS), validators={"git": record}
+        )
+        allowlist.check("echo msg | git commit -F -")
+        assert seen == ["git commit -F -"]
+
+
 class TestSplitCommandSegments:
     """Tests for splitting command strings into segments."""
 
@@ -284,6 +381,22 @@ class TestValidateCommand:
         allowed, reason = validate_command("format c:", temp_dir)
         assert allowed is False
 
+    def test_substitution_disguised_as_arithmetic_blocked(self, temp_dir):
+        """$((cmd) ) runs cmd in bash, so cmd is validated."""
+        reset_profile_cache()
+
+        allowed, reason = validate_command("echo $((nc -l 4444) )", temp_dir)
+        assert allowed is False
+        assert "nc" in reason
+
+    def test_arithmetic_command_allowed(self, temp_dir):
+        """((expr)) commands in a chain are not blocked as unparseable."""
+        reset_profile_cache()
+
+        for command in ("x=1; ((x++)) && echo ok", "echo a && (( i = 1 ))"):
+            allowed, reason = validate_command(command, temp_dir)
+            assert allowed is True, reason
+
     def test_rm_safe_usage_allowed(self, temp_dir):
         """rm with safe arguments is allowed."""
         reset_profile_cache()
@@ -688,3 +801,238 @@ class TestMysqladminValidator:
         """Blocks kill."""
         allowed, reason = validate_mysqladmin_command("mysqladmin kill 123")
         assert allowed is False
+
+
+class TestCompiledAllowlist:
+    """Tests for the frozen allowlist and its decision memo."""
+
+    def _allowlist(self, *extra: str) -> CompiledAllowlist:
+        profile = SecurityProfile(base_commands=BASE_COMMANDS.copy())
+        profile.custom_commands = set(extra)
+        return CompiledAllowlist.from_profile(profile)
+
+    def test_is_frozen(self):
+        """The compiled structure cannot be modified."""
+        allowlist = self._allowlist()
+        assert isinstance(allowlist.commands, frozenset)
+        with pytest.raises(TypeError):
+            allowlist.validators["evil"] = lambda cmd: (True, "")
+
+    def test_matches_profile_decisions(self):
+        """Compiled decisions match is_command_allowed for each name."""
+        from project_analyzer import is_command_allowed
+
+        profile = SecurityProfile(base_commands=BASE_COMMANDS.copy())
+        profile.stack_commands = {"npm"}
+        allowlist = CompiledAllowlist.from_profile(profile)
+        for cmd in ["ls", "npm", "curlx", "python"]:
+            assert allowlist.is_allowed(cmd) == is_command_allowed(cmd, profile)
+
+    def test_decisions_are_memoized(self):
+        """Repeated command strings are answered from the memo."""
+        allowlist = self._allowlist()
+        for _ in range(3):
+            assert allowlist.check("ls -la | grep foo") == (True, "")
+        assert allowlist.check("rm -rf /")[0] is False
+        assert allowlist.check("rm -rf /")[0] is False
+
+        info = allowlist.cache_info()
+        assert info.misses == 2
+        assert info.hits == 3
+
+    def test_stateful_validator_runs_every_call(self):
+        """git validation is not memoized (it depends on staged files)."""
+        import security.allowlist as allowlist_module
+
+        calls = []
+
+        def fake_git(command: str):
+            calls.append(command)
+            return len(calls) == 1, "secrets staged"
+
+        allowlist = CompiledAllowlist(
+            commands=frozenset(BASE_COMMANDS),
+            validators={"git": fake_git},
+        )
+        assert "git" in allowlist_module.STATEFUL_VALIDATORS
+        assert allowlist.check("git commit -m x") == (True, "")
+        assert allowlist.check("git commit -m x") == (False, "secrets staged")
+        assert len(calls) == 2
+
+    def test_hook_uses_compiled_allowlist(self, temp_dir, monkeypatch):
+        """The hook blocks and allows through the compiled allowlist."""
+        reset_profile_cache()
+        monkeypatch.chdir(temp_dir)
+
+        def run(command: str) -> dict:
+            data = {"tool_name": "Bash", "tool_input": {"command": command}}
+            return asyncio.run(bash_security_hook(data))
+
+        assert run("ls -la") == {}
+        assert run("format c:")["decision"] == "block"
+        assert run("echo 'unterminated")["decision"] == "block"
+        reset_profile_cache()
+
+    @pytest.mark.slow
+    def test_benchmark_hook_latency(self):
+        """p99 decision latency on typical agent commands is under 50us."""
+        allowlist = self._allowlist("npm", "pytest")
+        commands = [
+            "ls -la",
+            "cat src/app.py | grep -n handler",
+            "cd frontend && npm run build",
+            "pytest -q tests/test_api.py",
+            "rm -rf build/ && mkdir build",
+            "git status",
+            "chmod +x scripts/run.sh",
+            "find . -name '*.py' | xargs wc -l",
+        ]
+        for command in commands:
+            allowlist.check(command)
+
+        samples = []
+        for _ in range(500):
+            for command in commands:
+                start = time.perf_counter()
+                allowlist.check(command)
+                samples.append(time.perf_counter() - start)
+        samples.sort()
+        p99 = samples[int(len(samples) * 0.99)]
+        assert p99 < 50e-6, f"p99 {p99 * 1e6:.1f}us"
+
+
+class TestProfileCache:
+    """Tests for the multi-project security profile cache."""
+
+    @pytest.fixture
+    def analyses(self, monkeypatch) -> list[Path]:
+        """Replace project analysis with a stub recording analyzed dirs."""
+        import security.profile as profile_module
+
+        analyzed = []
+
+        def fake_analysis(project_dir, spec_dir=None):
+            analyzed.append(Path(project_dir))
+            return SecurityProfile(project_dir=str(project_dir))
+
+        monkeypatch.setattr(profile_module, "get_or_create_profile", fake_analysis)
+        return analyzed
+
+    def _project(self, root: Path, name: str) -> Path:
+        project = root / name
+        project.mkdir()
+        (project / "requirements.txt").write_text("flask\n")
+        return project
+
+    def test_several_projects_stay_cached(self, temp_dir, analyses):
+        """Switching between projects does not re-analyze them."""
+        from security.profile import ProfileCache
+
+        cache = ProfileCache()
+        one = self._project(temp_dir, "one")
+        two = self._project(temp_dir, "two")
+        for _ in range(3):
+            assert cache.get(one).project_dir == str(one)
+            assert cache.get(two).project_dir == str(two)
+        assert analyses == [one, two]
+
+    def test_revalidates_on_manifest_change(self, temp_dir, analyses):
+        """Entries are reloaded only when a manifest file changed."""
+        from security.profile import ProfileCache
+
+        cache = ProfileCache(revalidate_seconds=0)
+        project = self._project(temp_dir, "app")
+        first = cache.get(project)
+        assert cache.get(project) is first
+
+        (project / "requirements.txt").write_text("flask\nrequests\n")
+        assert cache.get(project) is not first
+        assert len(analyses) == 2
+
+    def test_manifest_change_unseen_within_interval(self, temp_dir, analyses):
+        """Manifests are not stat'ed again before the interval elapses."""
+        from security.profile import ProfileCache
+
+        cache = ProfileCache(revalidate_seconds=3600)
+        project = self._project(temp_dir, "app")
+        first = cache.get(project)
+        (project / "requirements.txt").write_text("django\n")
+        assert cache.get(project) is first
+
+    def test_lru_eviction(self, temp_dir, analyses):
+        """The least recently used project is evicted first."""
+        from security.profile import ProfileCache
+
+        cache = ProfileCache(max_entries=2)
+        a, b, c = (self._project(temp_dir, name) for name in "abc")
+        cache.get(a)
+        cache.get(b)
+        cache.get(a)
+        cache.get(c)
+        assert len(cache) == 2
+
+        cache.get(a)
+        assert analyses == [a, b, c]
+        cache.get(b)
+        assert analyses == [a, b, c, b]
+
+    def test_worktree_shares_parent_profile(self, temp_git_repo, analyses):
+        """A worktree with unchanged manifests reuses the repo's profile."""
+        from security.profile import ProfileCache, find_parent_repo
+
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        subprocess.run(["git", "add", "-A"], cwd=temp_git_repo, check=True)
+        subprocess.run(
+            ["git", "commit", "-qm", "deps"], cwd=temp_git_repo, check=True
+        )
+        worktree = temp_git_repo / ".worktrees" / "spec-1"
+        subprocess.run(
+            ["git", "worktree", "add", "-q", "-b", "spec-1", str(worktree)],
+            cwd=temp_git_repo,
+            check=True,
+        )
+        assert find_parent_repo(worktree) == temp_git_repo.resolve()
+        assert find_parent_repo(temp_git_repo) is None
+
+        cache = ProfileCache(revalidate_seconds=0)
+        shared = cache.get(worktree)
+        assert shared is cache.get(temp_git_repo)
+        assert cache.get_allowlist(worktree) is cache.get_allowlist(temp_git_repo)
+        assert analyses == [temp_git_repo.resolve()]
+
+        (worktree / "requirements.txt").write_text("flask\ncelery\n")
+        assert cache.get(worktree) is not shared
+        assert analyses[-1] == worktree.resolve()
+
+    def test_revalidates_on_allowlist_change(self, temp_dir, analyses):
+        """Editing the custom allowlist reloads the profile."""
+        from security.profile import ProfileCache
+
+        cache = ProfileCache(revalidate_seconds=0)
+        project = self._project(temp_dir, "app")
+        first = cache.get(project)
+
+        (project / ".auto-claude-allowlist").write_text("my-custom-tool\n")
+        assert cache.get(project) is not first
+        assert len(analyses) == 2
+
+    def test_worktree_without_parent_allowlist(self, temp_git_repo, analyses):
+        """An untracked allowlist in the repo is not shared with worktrees."""
+        from security.profile import ProfileCache
+
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        subprocess.run(["git", "add", "-A"], cwd=temp_git_repo, check=True)
+        subprocess.run(
+            ["git", "commit", "-qm", "deps"], cwd=temp_git_repo, check=True
+        )
+        (temp_git_repo / ".auto-claude-allowlist").write_text("my-custom-tool\n")
+        worktree = temp_git_repo / ".worktrees" / "spec-1"
+        subprocess.run(
+            ["git", "worktree", "add", "-q", "-b", "spec-1", str(worktree)],
+            cwd=temp_git_repo,
+            check=True,
+        )
+
+        cache = ProfileCache()
+        assert cache.get(worktree) is not cache.get(temp_git_repo)
+        assert analyses == [temp_git_repo.resolve(), worktree.resolve()]